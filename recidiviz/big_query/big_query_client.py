@@ -41,6 +41,10 @@ from google.cloud.bigquery_datatransfer import (
 from google.protobuf import timestamp_pb2
 from more_itertools import one
 
+from recidiviz.big_query.big_query_page_reader import (
+    QueryJobPageReader,
+    prefetching_paged_read_and_process,
+)
 from recidiviz.big_query.big_query_view import BigQueryView
 from recidiviz.big_query.export.export_query_config import ExportQueryConfig
 from recidiviz.utils import metadata
@@ -226,8 +230,9 @@ class BigQueryClient:
         destination_table_schema: List[bigquery.SchemaField],
         write_disposition: bigquery.WriteDisposition,
         skip_leading_rows: int = 0,
+        source_format: str = bigquery.SourceFormat.CSV,
     ) -> bigquery.job.LoadJob:
-        """Loads a table from CSV data in GCS to BigQuery.
+        """Loads a table from CSV (or other |source_format|) data in GCS to BigQuery.
 
         Given a desired table name, source data URI(s) and destination schema, loads the
         table into BigQuery.
@@ -250,7 +255,9 @@ class BigQueryClient:
                 completely (WRITE_TRUNCATE) or adds to the table with new rows
                 (WRITE_APPEND). By default, WRITE_APPEND is used.
             skip_leading_rows: Optional number of leading rows to skip on each input
-                file. Defaults to zero
+                file. Defaults to zero. Only applies to CSV files.
+            source_format: The bigquery.SourceFormat of the source files. Defaults to
+                CSV.
         Returns:
             The LoadJob object containing job details.
         """
@@ -380,12 +387,24 @@ class BigQueryClient:
             A QueryJob which will contain the results once the query is complete.
         """
 
+    @abc.abstractmethod
+    def dry_run_query(self, query_str: str) -> bigquery.QueryJob:
+        """Validates the given query without running it. Dry runs are not billed.
+
+        Args:
+            query_str: The query to validate
+
+        Returns:
+            A completed QueryJob whose total_bytes_processed is the number of bytes the query would process if run.
+        """
+
     @abc.abstractmethod
     def paged_read_and_process(
         self,
         query_job: bigquery.QueryJob,
         page_size: int,
         process_page_fn: Callable[[List[bigquery.table.Row]], None],
+        num_prefetch_pages: int = 0,
     ) -> None:
         """Reads the given result set from the given query job in pages to limit how many rows are read into memory at
         any given time, processing the results of each row with the given callable.
@@ -394,6 +413,8 @@ class BigQueryClient:
             query_job: the query job from which to process results.
             page_size: the maximum number of rows to read in at a time.
             process_page_fn: a callable function which takes in the paged rows and performs some operation.
+            num_prefetch_pages: if positive, the number of upcoming pages to fetch in parallel in the background
+                while the current page is processed. Pages are always processed in order.
         """
 
     @abc.abstractmethod
@@ -927,6 +948,7 @@ class BigQueryClientImpl(BigQueryClient):
         destination_table_schema: List[bigquery.SchemaField],
         write_disposition: bigquery.WriteDisposition,
         skip_leading_rows: int = 0,
+        source_format: str = bigquery.SourceFormat.CSV,
     ) -> bigquery.job.LoadJob:
         """Triggers a load job, i.e. a job that will copy all of the data from the given
         Cloud Storage source into the given BigQuery destination. Returns once the job
@@ -939,10 +961,11 @@ class BigQueryClientImpl(BigQueryClient):
 
         job_config = bigquery.LoadJobConfig()
         job_config.schema = destination_table_schema
-        job_config.source_format = bigquery.SourceFormat.CSV
-        job_config.allow_quoted_newlines = True
+        job_config.source_format = source_format
         job_config.write_disposition = write_disposition
-        job_config.skip_leading_rows = skip_leading_rows
+        if source_format == bigquery.SourceFormat.CSV:
+            job_config.allow_quoted_newlines = True
+            job_config.skip_leading_rows = skip_leading_rows
 
         load_job = self.client.load_table_from_uri(
             source_uris, destination_table_ref, job_config=job_config
@@ -1132,17 +1155,36 @@ class BigQueryClientImpl(BigQueryClient):
             job_config=job_config,
         )
 
+    def dry_run_query(self, query_str: str) -> bigquery.QueryJob:
+        job_config = bigquery.QueryJobConfig(dry_run=True, use_query_cache=False)
+
+        return self.client.query(
+            query=query_str,
+            location=self.region,
+            job_config=job_config,
+        )
+
     def paged_read_and_process(
         self,
         query_job: bigquery.QueryJob,
         page_size: int,
         process_page_fn: Callable[[List[bigquery.table.Row]], None],
+        num_prefetch_pages: int = 0,
     ) -> None:
         logging.debug(
             "Querying for first page of results to perform %s...",
             process_page_fn.__name__,
         )
 
+        if num_prefetch_pages > 0:
+            prefetching_paged_read_and_process(
+                QueryJobPageReader(query_job),
+                page_size,
+                process_page_fn,
+                num_prefetch_pages=num_prefetch_pages,
+            )
+            return
+
         start_index = 0
 
         while True:
@@ -0,0 +1,138 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2022 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Helpers for reading the results of a BigQuery query in pages, fetching upcoming
+pages in the background while earlier pages are being processed."""
+import abc
+import logging
+import time
+from collections import deque
+from concurrent import futures
+from typing import Callable, Deque, List
+
+import attr
+from google.cloud import bigquery
+
+
+class BigQueryPageReader:
+    """Reads fixed-size pages of rows from a query result set. Pages are addressed by
+    row index so that any page can be read independently of the others."""
+
+    @abc.abstractmethod
+    def read_page(self, start_index: int, page_size: int) -> List[bigquery.table.Row]:
+        """Returns up to |page_size| rows, starting at row |start_index|. Returns
+        fewer than |page_size| rows only if the end of the result set is reached."""
+
+
+class QueryJobPageReader(BigQueryPageReader):
+    """Reads pages of rows from the results of a BigQuery query job."""
+
+    def __init__(self, query_job: bigquery.QueryJob) -> None:
+        self.query_job = query_job
+
+    def read_page(self, start_index: int, page_size: int) -> List[bigquery.table.Row]:
+        return list(
+            self.query_job.result(max_results=page_size, start_index=start_index)
+        )
+
+
+@attr.s(frozen=True)
+class PagedReadStats:
+    """Summary statistics for a paged read of a query result set."""
+
+    num_rows: int = attr.ib()
+    num_pages: int = attr.ib()
+    elapsed_seconds: float = attr.ib()
+
+    @property
+    def rows_per_second(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return float(self.num_rows)
+        return self.num_rows / self.elapsed_seconds
+
+
+def prefetching_paged_read_and_process(
+    page_reader: BigQueryPageReader,
+    page_size: int,
+    process_page_fn: Callable[[List[bigquery.table.Row]], None],
+    num_prefetch_pages: int,
+) -> PagedReadStats:
+    """Reads all rows from |page_reader| in pages of |page_size| rows, calling
+    |process_page_fn| on each page in order.
+
+    Up to |num_prefetch_pages| pages are fetched in parallel on background threads
+    while the current page is processed on the calling thread, so at most
+    |num_prefetch_pages| + 1 pages are held in memory at any given time. Reading
+    stops at the first page with fewer than |page_size| rows.
+    """
+    if page_size <= 0:
+        raise ValueError(f"Page size must be positive, found [{page_size}].")
+    if num_prefetch_pages <= 0:
+        raise ValueError(
+            f"Number of prefetch pages must be positive, found [{num_prefetch_pages}]."
+        )
+
+    start = time.perf_counter()
+    num_rows = 0
+    num_pages = 0
+
+    with futures.ThreadPoolExecutor(max_workers=num_prefetch_pages) as executor:
+        next_start_index = 0
+        # Pages that have been requested but not yet processed, in result set order.
+        # This is bounded by the number of prefetch pages.
+        pending_pages: Deque[futures.Future] = deque()
+
+        def request_next_page() -> None:
+            nonlocal next_start_index
+            pending_pages.append(
+                executor.submit(page_reader.read_page, next_start_index, page_size)
+            )
+            next_start_index += page_size
+
+        for _ in range(num_prefetch_pages):
+            request_next_page()
+
+        while pending_pages:
+            page_rows: List[bigquery.table.Row] = pending_pages.popleft().result()
+            is_last_page = len(page_rows) < page_size
+            if is_last_page:
+                # Any pages requested past the end of the result set are empty.
+                for pending_page in pending_pages:
+                    pending_page.cancel()
+                pending_pages.clear()
+            else:
+                request_next_page()
+
+            if page_rows:
+                process_page_fn(page_rows)
+                num_rows += len(page_rows)
+                num_pages += 1
+                logging.info("Processed [%d] rows...", num_rows)
+
+    stats = PagedReadStats(
+        num_rows=num_rows,
+        num_pages=num_pages,
+        elapsed_seconds=time.perf_counter() - start,
+    )
+    logging.info(
+        "Read and processed [%d] rows in [%d] pages in [%.2f] seconds "
+        "([%.1f] rows/sec).",
+        stats.num_rows,
+        stats.num_pages,
+        stats.elapsed_seconds,
+        stats.rows_per_second,
+    )
+    return stats
@@ -16,9 +16,11 @@
 # =============================================================================
 """Implements a class that allows us to walk across a DAG of BigQueryViews
 and perform actions on each of them in some order."""
+import heapq
 import logging
+import time
 from concurrent import futures
-from typing import Callable, Dict, List, Optional, Set, Tuple, TypeVar
+from typing import Callable, Dict, Generic, List, Optional, Set, Tuple, TypeVar
 
 import attr
 
@@ -67,6 +69,60 @@ ViewResultT = TypeVar("ViewResultT")
 ParentResultsT = Dict[BigQueryView, ViewResultT]
 
 
+@attr.s(frozen=True, kw_only=True)
+class ViewProcessingStats:
+    """Timing information for a single view processed by process_dag(). All times are
+    in seconds, relative to the start of the process_dag() call."""
+
+    # The time when all of this view's parents had been processed
+    ready_time: float = attr.ib()
+    # The time when view_process_fn started running for this view
+    start_time: float = attr.ib()
+    # The time when view_process_fn finished running for this view
+    end_time: float = attr.ib()
+
+    @property
+    def queue_wait_seconds(self) -> float:
+        """How long the view was ready to process but waiting for a free worker."""
+        return self.start_time - self.ready_time
+
+    @property
+    def execution_seconds(self) -> float:
+        return self.end_time - self.start_time
+
+
+@attr.s(frozen=True, kw_only=True)
+class ProcessDagResult(Generic[ViewResultT]):
+    """The results of a process_dag_with_stats() call, along with timing information
+    for every view processed."""
+
+    # The result of view_process_fn for each view
+    view_results: Dict[BigQueryView, ViewResultT] = attr.ib()
+    # Timing information for each view
+    view_processing_stats: Dict[BigQueryView, ViewProcessingStats] = attr.ib()
+    # Total wall-clock time spent processing the DAG
+    total_runtime_seconds: float = attr.ib()
+    # The chain of views that determined the total runtime, starting from a root:
+    # each view is the parent that finished last before the next view became ready.
+    critical_path: List[BigQueryView] = attr.ib()
+
+    def critical_path_report(self) -> str:
+        """Returns a human-readable summary of the time spent on each view along the
+        critical path."""
+        lines = [
+            f"Processed [{len(self.view_results)}] views in "
+            f"[{self.total_runtime_seconds:.2f}] seconds. Critical path:"
+        ]
+        for view in self.critical_path:
+            stats = self.view_processing_stats[view]
+            lines.append(
+                f"  {view.dataset_id}.{view.view_id}: "
+                f"waited [{stats.queue_wait_seconds:.2f}] seconds, "
+                f"ran [{stats.execution_seconds:.2f}] seconds"
+            )
+        return "\n".join(lines)
+
+
 class BigQueryViewDagNode:
     """A single node in a BigQuery view DAG, i.e. a single view with relationships to other views."""
 
@@ -159,6 +215,15 @@ class BigQueryViewDagWalker:
         self.roots = [node for node in self.nodes_by_key.values() if node.is_root]
         self._check_for_cycles()
 
+        # All node keys, ordered so that every node comes after all of its parents.
+        self._topological_order: List[DagKey] = self._get_topological_order()
+        # The length of the longest path from any root to each node.
+        self._depth_by_key: Dict[DagKey, int] = self._get_depth_by_key()
+
+        # Full ancestor / descendant sets for each node, built on first use.
+        self._ancestor_keys_by_key: Optional[Dict[DagKey, Set[DagKey]]] = None
+        self._descendant_keys_by_key: Optional[Dict[DagKey, Set[DagKey]]] = None
+
     def _get_materialized_addresss_map(self) -> Dict[BigQueryAddress, DagKey]:
         """For every view, if it has an associated materialized table, returns a
         dictionary the addresss of those tables to the DagKey for the original view.
@@ -204,30 +269,132 @@ class BigQueryViewDagWalker:
                     self.nodes_by_key[parent_key].add_child_key(key)
 
     def _check_for_cycles(self) -> None:
-        """Raises a ValueError if there are any cycles in the provided DAG."""
+        """Raises a ValueError if there are any cycles in the provided DAG. Does a
+        single depth-first pass over the graph, marking each node as visited once
+        every path out of it has been explored, so that no node is explored twice.
+        """
         if not self.nodes_by_key:
             return
 
         if not self.roots:
             raise ValueError("No roots detected. Input views contain a cycle.")
 
-        for node_key in self.nodes_by_key:
-            self._check_for_cycles_reachable_from_node(node_key)
+        fully_explored: Set[DagKey] = set()
+        for start_key in self.nodes_by_key:
+            if start_key in fully_explored:
+                continue
+            self._check_for_cycles_reachable_from_node(start_key, fully_explored)
 
-    def _check_for_cycles_reachable_from_node(self, start_key: DagKey) -> None:
-        """Throws if there is a cycle that can be reached from the provided start node."""
-        paths_to_explore: List[Tuple[DagKey, List[DagKey]]] = [(start_key, [])]
-        while paths_to_explore:
-            key, path = paths_to_explore.pop()
+    def _check_for_cycles_reachable_from_node(
+        self, start_key: DagKey, fully_explored: Set[DagKey]
+    ) -> None:
+        """Throws if there is a cycle that can be reached from the provided start node.
+        Nodes in |fully_explored| are known not to lead to a cycle and are skipped.
+        Every node explored from |start_key| is added to |fully_explored|.
+        """
+        # The keys on the current path from start_key, in order, alongside the
+        # children of each that still need to be explored.
+        path: List[DagKey] = [start_key]
+        on_path: Set[DagKey] = {start_key}
+        children_to_explore: List[List[DagKey]] = [
+            list(self.nodes_by_key[start_key].child_node_keys)
+        ]
+        while path:
+            if not children_to_explore[-1]:
+                key = path.pop()
+                children_to_explore.pop()
+                on_path.remove(key)
+                fully_explored.add(key)
+                continue
+
+            child_key = children_to_explore[-1].pop()
+            if child_key in fully_explored:
+                continue
+
+            if child_key in on_path:
+                cycle_path = path[1:]
+                if child_key == start_key:
+                    cycle_path.append(start_key)
+                raise ValueError(
+                    f"Detected cycle in graph reachable from "
+                    f"{start_key.as_tuple()}: {[k.as_tuple() for k in cycle_path]}"
+                )
 
-            for child_key in self.nodes_by_key[key].child_node_keys:
-                if child_key in path:
-                    raise ValueError(
-                        f"Detected cycle in graph reachable from "
-                        f"{start_key.as_tuple()}: {[k.as_tuple() for k in path]}"
-                    )
+            path.append(child_key)
+            on_path.add(child_key)
+            children_to_explore.append(
+                list(self.nodes_by_key[child_key].child_node_keys)
+            )
+
+    def _get_topological_order(self) -> List[DagKey]:
+        """Returns all node keys in an order where each node comes after all of its
+        parents. Nodes are ordered level by level, starting with the roots."""
+        num_unprocessed_parents: Dict[DagKey, int] = {
+            key: sum(1 for p in node.parent_keys if p in self.nodes_by_key)
+            for key, node in self.nodes_by_key.items()
+        }
+        topological_order = [node.dag_key for node in self.roots]
+        i = 0
+        while i < len(topological_order):
+            for child_key in self.nodes_by_key[topological_order[i]].child_node_keys:
+                num_unprocessed_parents[child_key] -= 1
+                if not num_unprocessed_parents[child_key]:
+                    topological_order.append(child_key)
+            i += 1
+        return topological_order
+
+    def _get_depth_by_key(self) -> Dict[DagKey, int]:
+        """Returns the length of the longest path from any root to each node. Roots
+        have depth 0."""
+        depth_by_key: Dict[DagKey, int] = {}
+        for key in self._topological_order:
+            depth_by_key[key] = max(
+                (
+                    depth_by_key[p] + 1
+                    for p in self.nodes_by_key[key].parent_keys
+                    if p in self.nodes_by_key
+                ),
+                default=0,
+            )
+        return depth_by_key
 
-                paths_to_explore.append((child_key, path + [child_key]))
+    @property
+    def topological_order(self) -> List[DagKey]:
+        """All node keys, ordered so that every node comes after all of its parents."""
+        return self._topological_order
+
+    def depth_for_key(self, dag_key: DagKey) -> int:
+        """Returns the length of the longest path from any root to the given node."""
+        return self._depth_by_key[dag_key]
+
+    def ancestor_keys_for_key(self, dag_key: DagKey) -> Set[DagKey]:
+        """Returns the keys for all views and source tables the given node depends
+        on, directly or indirectly. The returned set should not be modified."""
+        if self._ancestor_keys_by_key is None:
+            ancestor_keys_by_key: Dict[DagKey, Set[DagKey]] = {}
+            for key in self._topological_order:
+                ancestor_keys: Set[DagKey] = set()
+                for parent_key in self.nodes_by_key[key].parent_keys:
+                    ancestor_keys.add(parent_key)
+                    if parent_key in ancestor_keys_by_key:
+                        ancestor_keys |= ancestor_keys_by_key[parent_key]
+                ancestor_keys_by_key[key] = ancestor_keys
+            self._ancestor_keys_by_key = ancestor_keys_by_key
+        return self._ancestor_keys_by_key[dag_key]
+
+    def descendant_keys_for_key(self, dag_key: DagKey) -> Set[DagKey]:
+        """Returns the keys for all nodes that depend on the given node, directly or
+        indirectly. The returned set should not be modified."""
+        if self._descendant_keys_by_key is None:
+            descendant_keys_by_key: Dict[DagKey, Set[DagKey]] = {}
+            for key in reversed(self._topological_order):
+                descendant_keys: Set[DagKey] = set()
+                for child_key in self.nodes_by_key[key].child_node_keys:
+                    descendant_keys.add(child_key)
+                    descendant_keys |= descendant_keys_by_key[child_key]
+                descendant_keys_by_key[key] = descendant_keys
+            self._descendant_keys_by_key = descendant_keys_by_key
+        return self._descendant_keys_by_key[dag_key]
 
     def view_for_key(self, dag_key: DagKey) -> BigQueryView:
         return self.nodes_by_key[dag_key].view
@@ -236,21 +403,98 @@ class BigQueryViewDagWalker:
         return self.nodes_by_key[DagKey.for_view(view)]
 
     def process_dag(
-        self, view_process_fn: Callable[[BigQueryView, ParentResultsT], ViewResultT]
+        self,
+        view_process_fn: Callable[[BigQueryView, ParentResultsT], ViewResultT],
+        prioritize_critical_path: bool = False,
+        runtime_estimates_seconds: Optional[Dict[BigQueryAddress, float]] = None,
     ) -> Dict[BigQueryView, ViewResultT]:
         """This method provides a level-by-level "breadth-first" traversal of a DAG and executes
-        view_process_fn on every node in level order."""
+        view_process_fn on every node in level order. See process_dag_with_stats() for
+        a description of the scheduling arguments."""
+        return self.process_dag_with_stats(
+            view_process_fn,
+            prioritize_critical_path=prioritize_critical_path,
+            runtime_estimates_seconds=runtime_estimates_seconds,
+        ).view_results
+
+    def process_dag_with_stats(
+        self,
+        view_process_fn: Callable[[BigQueryView, ParentResultsT], ViewResultT],
+        prioritize_critical_path: bool = False,
+        runtime_estimates_seconds: Optional[Dict[BigQueryAddress, float]] = None,
+    ) -> ProcessDagResult[ViewResultT]:
+        """Executes view_process_fn on every node in the DAG, processing a node only
+        once all of its parents have been processed. Returns the result for each view,
+        along with how long each view waited for a worker and took to process.
+
+        By default, views whose parents have all been processed are dispatched in the
+        order they became ready. If |prioritize_critical_path| is set, ready views are
+        instead dispatched in order of the length of the longest chain of views that
+        depend on them, so that deep chains are not stuck behind shallow leaf views.
+        Chain lengths are measured using |runtime_estimates_seconds| where provided,
+        with views that have no estimate counted as taking the average estimated time
+        (or one second if no estimates are provided).
+        """
+        priority_by_key: Dict[DagKey, float] = (
+            self._get_downstream_path_weights(runtime_estimates_seconds)
+            if prioritize_critical_path
+            else {}
+        )
+
+        def timed_view_process_fn(
+            view: BigQueryView, parent_results: ParentResultsT
+        ) -> Tuple[ViewResultT, float, float]:
+            start = time.perf_counter()
+            view_result = view_process_fn(view, parent_results)
+            return view_result, start, time.perf_counter()
+
+        dag_start = time.perf_counter()
         processed: Set[DagKey] = set()
-        queue: Set[BigQueryViewDagNode] = set(self.roots)
         result: Dict[BigQueryView, ViewResultT] = {}
+        stats: Dict[BigQueryView, ViewProcessingStats] = {}
+        ready_time_by_key: Dict[DagKey, float] = {}
+
+        # Heap of nodes whose parents have all been processed, ordered by priority,
+        # then by the order in which they became ready.
+        ready_queue: List[Tuple[float, int, DagKey]] = []
+        num_nodes_made_ready = 0
+
+        def mark_ready(key: DagKey) -> None:
+            nonlocal num_nodes_made_ready
+            ready_time_by_key[key] = time.perf_counter()
+            heapq.heappush(
+                ready_queue,
+                (-priority_by_key.get(key, 0), num_nodes_made_ready, key),
+            )
+            num_nodes_made_ready += 1
+
+        for node in self.roots:
+            mark_ready(node.dag_key)
+
         with futures.ThreadPoolExecutor(max_workers=DAG_WALKER_MAX_WORKERS) as executor:
-            future_to_view = {
-                executor.submit(
-                    structured_logging.with_context(view_process_fn), node.view, {}
-                ): node
-                for node in self.roots
-            }
-            processing = {node.dag_key for node in future_to_view.values()}
+            future_to_view: Dict[futures.Future, BigQueryViewDagNode] = {}
+            processing: Set[DagKey] = set()
+
+            def dispatch_ready_nodes() -> None:
+                # Only hand the executor as many nodes as it can start right away, so
+                # that nodes that become ready later can still jump the queue.
+                while ready_queue and len(future_to_view) < DAG_WALKER_MAX_WORKERS:
+                    _, _, key = heapq.heappop(ready_queue)
+                    node = self.nodes_by_key[key]
+                    parent_results = {}
+                    for parent_key in node.parent_keys:
+                        if parent_key in self.nodes_by_key:
+                            parent_view = self.nodes_by_key[parent_key].view
+                            parent_results[parent_view] = result[parent_view]
+                    future = executor.submit(
+                        structured_logging.with_context(timed_view_process_fn),
+                        node.view,
+                        parent_results,
+                    )
+                    future_to_view[future] = node
+                    processing.add(key)
+
+            dispatch_ready_nodes()
             while processing:
                 completed, _not_completed = futures.wait(
                     future_to_view.keys(), return_when="FIRST_COMPLETED"
@@ -258,7 +502,7 @@ class BigQueryViewDagWalker:
                 for future in completed:
                     node = future_to_view.pop(future)
                     try:
-                        view_result: ViewResultT = future.result()
+                        view_result, start, end = future.result()
                     except Exception as e:
                         logging.error(
                             "Exception found fetching result for view_key: %s",
@@ -266,39 +510,82 @@ class BigQueryViewDagWalker:
                         )
                         raise e
                     result[node.view] = view_result
+                    stats[node.view] = ViewProcessingStats(
+                        ready_time=ready_time_by_key[node.dag_key] - dag_start,
+                        start_time=start - dag_start,
+                        end_time=end - dag_start,
+                    )
                     processing.remove(node.dag_key)
                     processed.add(node.dag_key)
 
                     for child_key in node.child_node_keys:
-                        child_node = self.nodes_by_key[child_key]
-                        if child_node in processed or child_node in queue:
+                        if child_key in processed or child_key in ready_time_by_key:
                             raise ValueError(
                                 f"Unexpected situation where child node has already been processed: {child_key}"
                             )
-                        if child_node in processing:
-                            continue
-
-                        parents_all_processed = True
-                        parent_results = {}
-                        for parent_key in child_node.parent_keys:
-                            if (
-                                parent_key in self.nodes_by_key
-                                and parent_key not in processed
-                            ):
-                                parents_all_processed = False
-                                break
-                            if parent_key in self.nodes_by_key:
-                                parent_view = self.nodes_by_key[parent_key].view
-                                parent_results[parent_view] = result[parent_view]
+
+                        parents_all_processed = all(
+                            parent_key not in self.nodes_by_key
+                            or parent_key in processed
+                            for parent_key in self.nodes_by_key[child_key].parent_keys
+                        )
                         if parents_all_processed:
-                            future = executor.submit(
-                                structured_logging.with_context(view_process_fn),
-                                child_node.view,
-                                parent_results,
-                            )
-                            future_to_view[future] = child_node
-                            processing.add(child_node.dag_key)
-        return result
+                            mark_ready(child_key)
+                dispatch_ready_nodes()
+
+        return ProcessDagResult(
+            view_results=result,
+            view_processing_stats=stats,
+            total_runtime_seconds=time.perf_counter() - dag_start,
+            critical_path=self._get_observed_critical_path(stats),
+        )
+
+    def _get_downstream_path_weights(
+        self, runtime_estimates_seconds: Optional[Dict[BigQueryAddress, float]]
+    ) -> Dict[DagKey, float]:
+        """Returns, for each node, the total weight of the heaviest chain of views
+        starting at that node, where each view is weighted by its estimated runtime.
+        """
+        runtime_estimates_seconds = runtime_estimates_seconds or {}
+        default_weight = (
+            sum(runtime_estimates_seconds.values()) / len(runtime_estimates_seconds)
+            if runtime_estimates_seconds
+            else 1.0
+        )
+
+        weight_by_key: Dict[DagKey, float] = {}
+        for key in reversed(self._topological_order):
+            weight_by_key[key] = runtime_estimates_seconds.get(
+                key.view_address, default_weight
+            ) + max(
+                (
+                    weight_by_key[child_key]
+                    for child_key in self.nodes_by_key[key].child_node_keys
+                ),
+                default=0,
+            )
+        return weight_by_key
+
+    def _get_observed_critical_path(
+        self, stats: Dict[BigQueryView, ViewProcessingStats]
+    ) -> List[BigQueryView]:
+        """Returns the chain of views that determined when processing finished,
+        walking back from the last view to finish through the parent of each view
+        that finished last."""
+        if not stats:
+            return []
+
+        critical_path = [max(stats, key=lambda v: stats[v].end_time)]
+        while True:
+            parent_views = [
+                self.nodes_by_key[parent_key].view
+                for parent_key in self.node_for_view(critical_path[-1]).parent_keys
+                if parent_key in self.nodes_by_key
+            ]
+            if not parent_views:
+                break
+            critical_path.append(max(parent_views, key=lambda v: stats[v].end_time))
+        return list(reversed(critical_path))
 
     def _check_sub_dag_input_views(self, *, input_views: List[BigQueryView]) -> None:
         missing_views = set(input_views).difference(self.views)
@@ -323,24 +610,11 @@ class BigQueryViewDagWalker:
         """
         self._check_sub_dag_input_views(input_views=views)
 
-        sub_dag_views: Set[BigQueryView] = set()
-
-        def collect_descendants(
-            v: BigQueryView, parent_results: Dict[BigQueryView, bool]
-        ) -> bool:
-            is_target_view_or_descendant = (
-                any(
-                    is_parent_target_view_or_descendant
-                    for is_parent_target_view_or_descendant in parent_results.values()
-                )
-                or v in views
-            )
-            if is_target_view_or_descendant:
-                sub_dag_views.add(v)
-
-            return is_target_view_or_descendant
+        sub_dag_views: Set[BigQueryView] = set(views)
+        for view in views:
+            for descendant_key in self.descendant_keys_for_key(DagKey.for_view(view)):
+                sub_dag_views.add(self.nodes_by_key[descendant_key].view)
 
-        self.process_dag(collect_descendants)
         self._check_sub_dag_views(input_views=views, sub_dag_views=sub_dag_views)
         return BigQueryViewDagWalker(list(sub_dag_views))
 
@@ -353,25 +627,12 @@ class BigQueryViewDagWalker:
         """
         self._check_sub_dag_input_views(input_views=views)
 
-        sub_dag_views: Set[BigQueryView] = set()
-
-        def collect_ancestors(
-            v: BigQueryView, parent_results: Dict[BigQueryView, Set[BigQueryView]]
-        ) -> Set[BigQueryView]:
-            # Ancestors of this view are comprised of all ancestors of each parent...
-            all_ancestors: Set[BigQueryView] = set().union(*parent_results.values())
-
-            # ...plus the parents themselves
-            all_ancestors |= parent_results.keys()
+        sub_dag_views: Set[BigQueryView] = set(views)
+        for view in views:
+            for ancestor_key in self.ancestor_keys_for_key(DagKey.for_view(view)):
+                if ancestor_key in self.nodes_by_key:
+                    sub_dag_views.add(self.nodes_by_key[ancestor_key].view)
 
-            if v in views:
-                sub_dag_views.add(v)
-                for ancestor in all_ancestors:
-                    sub_dag_views.add(ancestor)
-
-            return all_ancestors
-
-        self.process_dag(collect_ancestors)
         self._check_sub_dag_views(input_views=views, sub_dag_views=sub_dag_views)
         return BigQueryViewDagWalker(list(sub_dag_views))
 
@@ -399,7 +660,8 @@ class BigQueryViewDagWalker:
             descendants: bool = False,
         ) -> Tuple[Set[DagKey], str]:
             """Returns a set of all dependent DagKeys in one direction, and a string
-             representation of that tree.
+             representation of that tree. The set is only collected while walking the
+             tree when it cannot be read from the cached ancestor / descendant sets.
 
             If |descendants| is True, returns info about the tree of views that are
             dependent on the view. If |descendants| is False, returns info about the
@@ -415,6 +677,7 @@ class BigQueryViewDagWalker:
                 )
             ]
             tree = ""
+            collect_dependencies = not descendants and bool(view_source_table_datasets)
             full_dependencies: Set[DagKey] = set()
             while len(stack) > 0:
                 dag_key, tabs = stack.pop()
@@ -445,7 +708,8 @@ class BigQueryViewDagWalker:
                         key=lambda key: (key.dataset_id, key.table_id),
                         reverse=descendants,
                     ):
-                        full_dependencies.add(related_key)
+                        if collect_dependencies:
+                            full_dependencies.add(related_key)
                         stack.append(
                             (
                                 related_key,
@@ -456,6 +720,12 @@ class BigQueryViewDagWalker:
                                 else tabs + 1,
                             )
                         )
+            if not collect_dependencies:
+                full_dependencies = set(
+                    self.descendant_keys_for_key(node.dag_key)
+                    if descendants
+                    else self.ancestor_keys_for_key(node.dag_key)
+                )
             return full_dependencies, tree
 
         full_parentage, parent_tree = _get_one_way_dependencies()
@@ -0,0 +1,160 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2022 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Persists a hash of the definition of each deployed view to BQ, so that view deploys
+can skip views that have not changed since they were last deployed."""
+import datetime
+import hashlib
+import json
+from typing import Dict
+
+import pytz
+from google.cloud import bigquery
+
+from recidiviz.big_query.big_query_address import BigQueryAddress
+from recidiviz.big_query.big_query_client import BigQueryClient
+from recidiviz.big_query.big_query_view_dag_walker import BigQueryViewDagWalker
+from recidiviz.big_query.rematerialization_success_persister import (
+    VIEW_UPDATE_METADATA_DATASET,
+)
+
+# Table that holds the hash of each view at the time it was last deployed
+VIEW_DEPLOY_MANIFEST_TABLE_ID = "view_deploy_manifest"
+
+DATASET_ID_COL = "dataset_id"
+VIEW_ID_COL = "view_id"
+VIEW_HASH_COL = "view_hash"
+DEPLOY_TIMESTAMP_COL = "deploy_timestamp"
+
+
+def compute_view_deploy_hashes(
+    dag_walker: BigQueryViewDagWalker,
+) -> Dict[BigQueryAddress, str]:
+    """Returns a hash for every view in the DAG that changes whenever the view's
+    query, description, clustering fields or materialized table change, or when the
+    hash of any of its parent views changes. Parents that are source tables only
+    contribute their address, so changes to source table schemas are not reflected.
+    """
+    hashes: Dict[BigQueryAddress, str] = {}
+    for key in dag_walker.topological_order:
+        node = dag_walker.nodes_by_key[key]
+        view = node.view
+        parent_hashes = sorted(
+            hashes[parent_key.view_address]
+            if parent_key in dag_walker.nodes_by_key
+            else f"{parent_key.dataset_id}.{parent_key.table_id}"
+            for parent_key in node.parent_keys
+        )
+        view_definition = {
+            "view_query": view.view_query,
+            "description": view.description,
+            "clustering_fields": view.clustering_fields,
+            "materialized_address": (
+                f"{view.materialized_address.dataset_id}."
+                f"{view.materialized_address.table_id}"
+                if view.materialized_address
+                else None
+            ),
+            "parent_hashes": parent_hashes,
+        }
+        hashes[view.address] = hashlib.sha256(
+            json.dumps(view_definition, sort_keys=True).encode()
+        ).hexdigest()
+    return hashes
+
+
+class ViewDeployManifest:
+    """Reads and writes the hash of each view as of its most recent deploy."""
+
+    def __init__(self, bq_client: BigQueryClient) -> None:
+        self.bq_client = bq_client
+
+    def load_deployed_hashes(self) -> Dict[BigQueryAddress, str]:
+        """Returns the hash recorded for each view the last time it was deployed.
+        Returns an empty dictionary if no deploys have been recorded."""
+        dataset_ref = self.bq_client.dataset_ref_for_id(VIEW_UPDATE_METADATA_DATASET)
+        if not self.bq_client.table_exists(dataset_ref, VIEW_DEPLOY_MANIFEST_TABLE_ID):
+            return {}
+
+        query_job = self.bq_client.run_query_async(
+            f"""
+            SELECT {DATASET_ID_COL}, {VIEW_ID_COL}, {VIEW_HASH_COL}
+            FROM `{self.bq_client.project_id}.{VIEW_UPDATE_METADATA_DATASET}.{VIEW_DEPLOY_MANIFEST_TABLE_ID}`
+            WHERE TRUE
+            QUALIFY ROW_NUMBER() OVER (
+                PARTITION BY {DATASET_ID_COL}, {VIEW_ID_COL}
+                ORDER BY {DEPLOY_TIMESTAMP_COL} DESC
+            ) = 1
+            """
+        )
+        return {
+            BigQueryAddress(
+                dataset_id=row[DATASET_ID_COL], table_id=row[VIEW_ID_COL]
+            ): row[VIEW_HASH_COL]
+            for row in query_job
+        }
+
+    def record_deployed_hashes(self, view_hashes: Dict[BigQueryAddress, str]) -> None:
+        """Records the provided hashes as the latest deployed version of each view."""
+        if not view_hashes:
+            return
+
+        self._create_manifest_table_if_necessary()
+        deploy_timestamp = datetime.datetime.now(tz=pytz.UTC).isoformat()
+        self.bq_client.stream_into_table(
+            self.bq_client.dataset_ref_for_id(VIEW_UPDATE_METADATA_DATASET),
+            VIEW_DEPLOY_MANIFEST_TABLE_ID,
+            [
+                {
+                    DATASET_ID_COL: address.dataset_id,
+                    VIEW_ID_COL: address.table_id,
+                    VIEW_HASH_COL: view_hash,
+                    DEPLOY_TIMESTAMP_COL: deploy_timestamp,
+                }
+                for address, view_hash in sorted(view_hashes.items())
+            ],
+        )
+
+    def _create_manifest_table_if_necessary(self) -> None:
+        dataset_ref = self.bq_client.dataset_ref_for_id(VIEW_UPDATE_METADATA_DATASET)
+        self.bq_client.create_dataset_if_necessary(dataset_ref)
+        if not self.bq_client.table_exists(dataset_ref, VIEW_DEPLOY_MANIFEST_TABLE_ID):
+            self.bq_client.create_table_with_schema(
+                dataset_ref.dataset_id,
+                VIEW_DEPLOY_MANIFEST_TABLE_ID,
+                schema_fields=[
+                    bigquery.SchemaField(
+                        name=DATASET_ID_COL,
+                        field_type=bigquery.enums.SqlTypeNames.STRING.value,
+                        mode="REQUIRED",
+                    ),
+                    bigquery.SchemaField(
+                        name=VIEW_ID_COL,
+                        field_type=bigquery.enums.SqlTypeNames.STRING.value,
+                        mode="REQUIRED",
+                    ),
+                    bigquery.SchemaField(
+                        name=VIEW_HASH_COL,
+                        field_type=bigquery.enums.SqlTypeNames.STRING.value,
+                        mode="REQUIRED",
+                    ),
+                    bigquery.SchemaField(
+                        name=DEPLOY_TIMESTAMP_COL,
+                        field_type=bigquery.enums.SqlTypeNames.TIMESTAMP.value,
+                        mode="REQUIRED",
+                    ),
+                ],
+            )
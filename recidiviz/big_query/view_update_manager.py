@@ -35,6 +35,10 @@ from recidiviz.big_query.big_query_view_dag_walker import BigQueryViewDagWalker
 from recidiviz.big_query.rematerialization_success_persister import (
     RematerializationSuccessPersister,
 )
+from recidiviz.big_query.view_deploy_manifest import (
+    ViewDeployManifest,
+    compute_view_deploy_hashes,
+)
 from recidiviz.big_query.view_update_manager_utils import (
     cleanup_datasets_and_delete_unmanaged_views,
     get_managed_view_and_materialized_table_addresses_by_dataset,
@@ -220,7 +224,10 @@ def rematerialize_views_for_view_builders(
 
             bq_client.materialize_view_to_table(v)
 
-        views_to_rematerialize_dag.process_dag(_materialize_view)
+        processing_result = views_to_rematerialize_dag.process_dag_with_stats(
+            _materialize_view, prioritize_critical_path=True
+        )
+        logging.info(processing_result.critical_path_report())
     except Exception as e:
         with monitoring.measurements() as measurements:
             measurements.measure_int_put(m_failed_view_update, 1)
@@ -235,6 +242,8 @@ def create_managed_dataset_and_deploy_views_for_view_builders(
     bq_region_override: Optional[str] = None,
     force_materialize: bool = False,
     default_table_expiration_for_new_datasets: Optional[int] = None,
+    skip_unchanged_views: bool = False,
+    dry_run: bool = False,
 ) -> None:
     """Creates or updates all the views in the provided list with the view query in the
     provided view builder list. If any materialized view has been updated (or if an
@@ -244,6 +253,11 @@ def create_managed_dataset_and_deploy_views_for_view_builders(
     If a |historically_managed_datasets_to_clean| set is provided,
     then cleans up unmanaged views and datasets by deleting them from BigQuery.
 
+    If |skip_unchanged_views| is set, views whose definition and ancestor definitions
+    match the deploy manifest from the last deploy are not touched at all. If
+    |dry_run| is set, only logs which views would be updated given the deploy
+    manifest, without making any changes.
+
     Should only be called if we expect the views to have changed (either the view query
     or schema from querying underlying tables), e.g. at deploy time.
     """
@@ -268,6 +282,8 @@ def create_managed_dataset_and_deploy_views_for_view_builders(
             force_materialize,
             historically_managed_datasets_to_clean=historically_managed_datasets_to_clean,
             default_table_expiration_for_new_datasets=default_table_expiration_for_new_datasets,
+            skip_unchanged_views=skip_unchanged_views,
+            dry_run=dry_run,
         )
     except Exception as e:
         with monitoring.measurements() as measurements:
@@ -358,6 +374,8 @@ def _create_managed_dataset_and_deploy_views(
     force_materialize: bool,
     historically_managed_datasets_to_clean: Optional[Set[str]] = None,
     default_table_expiration_for_new_datasets: Optional[int] = None,
+    skip_unchanged_views: bool = False,
+    dry_run: bool = False,
 ) -> None:
     """Create and update the given views and their parent datasets. Cleans up unmanaged views and datasets
 
@@ -379,10 +397,43 @@ def _create_managed_dataset_and_deploy_views(
             process. If null, does not perform the cleanup step. If provided,
             will error if any dataset required for the |views_to_update| is not
             included in this set.
+        skip_unchanged_views: If True, views whose hash (see
+            compute_view_deploy_hashes()) matches the one recorded in the deploy
+            manifest are skipped without any BigQuery API calls, and the hashes of
+            updated views are recorded once the deploy succeeds.
+        dry_run: If True, logs the views that would be updated when skipping
+            unchanged views and returns without making any changes.
     """
     bq_client = BigQueryClientImpl(region_override=bq_region_override)
     dag_walker = BigQueryViewDagWalker(views_to_update)
 
+    deploy_manifest = ViewDeployManifest(bq_client)
+    view_hashes: Dict[BigQueryAddress, str] = {}
+    unchanged_view_addresses: Set[BigQueryAddress] = set()
+    if skip_unchanged_views or dry_run:
+        view_hashes = compute_view_deploy_hashes(dag_walker)
+        if not force_materialize:
+            deployed_hashes = deploy_manifest.load_deployed_hashes()
+            unchanged_view_addresses = {
+                address
+                for address, view_hash in view_hashes.items()
+                if deployed_hashes.get(address) == view_hash
+            }
+
+    if dry_run:
+        views_to_touch = sorted(
+            f"{v.dataset_id}.{v.view_id}"
+            for v in views_to_update
+            if v.address not in unchanged_view_addresses
+        )
+        logging.info(
+            "[DRY RUN] Would update [%s] of [%s] views:\n%s",
+            len(views_to_touch),
+            len(views_to_update),
+            "\n".join(views_to_touch),
+        )
+        return
+
     managed_views_map = get_managed_view_and_materialized_table_addresses_by_dataset(
         dag_walker
     )
@@ -407,11 +458,36 @@ def _create_managed_dataset_and_deploy_views(
         v: BigQueryView, parent_results: Dict[BigQueryView, CreateOrUpdateViewStatus]
     ) -> CreateOrUpdateViewStatus:
         """Returns True if this view or any of its parents were updated."""
+        if (
+            v.address in unchanged_view_addresses
+            and CreateOrUpdateViewStatus.SUCCESS_WITH_CHANGES
+            not in parent_results.values()
+            and v.should_deploy()
+        ):
+            logging.info(
+                "Skipping view [%s.%s] which is unchanged since the last deploy.",
+                v.dataset_id,
+                v.view_id,
+            )
+            return CreateOrUpdateViewStatus.SUCCESS_WITHOUT_CHANGES
         return _create_or_update_view_and_materialize_if_necessary(
             bq_client, v, parent_results, force_materialize
         )
 
-    dag_walker.process_dag(process_fn)
+    processing_result = dag_walker.process_dag_with_stats(
+        process_fn, prioritize_critical_path=True
+    )
+    logging.info(processing_result.critical_path_report())
+
+    if skip_unchanged_views:
+        deploy_manifest.record_deployed_hashes(
+            {
+                v.address: view_hashes[v.address]
+                for v, status in processing_result.view_results.items()
+                if v.address not in unchanged_view_addresses
+                and status != CreateOrUpdateViewStatus.SKIPPED
+            }
+        )
 
 
 def _create_or_update_view_and_materialize_if_necessary(
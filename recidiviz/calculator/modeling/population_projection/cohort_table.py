@@ -15,7 +15,9 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 # =============================================================================
 """Encapsulate the population data per cohort and time step"""
+from typing import Dict
 
+import numpy as np
 import pandas as pd
 
 from recidiviz.calculator.modeling.population_projection.utils.transitions_utils import (
@@ -24,71 +26,184 @@ from recidiviz.calculator.modeling.population_projection.utils.transitions_utils
 
 
 class CohortTable:
-    """Store population counts for one cohort of people that enter one category in the same year"""
-
-    def __init__(self) -> None:
-        self.cohort_df = pd.DataFrame(dtype=float)
-        self.cohort_df.index.name = "start_ts"
-        self.cohort_df.columns.name = "simulation_ts"
+    """Store population counts for one cohort of people that enter one category in the same year
+
+    The counts are stored in a preallocated 2-D array with one row per cohort (in the order the
+    cohorts were added) and one column per simulation time step. The array grows geometrically,
+    so appending a time step or a cohort does not copy the cohort history on every step.
+    DataFrames are only built when the table is read out.
+    """
+
+    def __init__(self, num_time_steps: int = 0) -> None:
+        """`num_time_steps`: expected number of simulation time steps, used to preallocate the table"""
+        # population counts indexed by [cohort, simulation ts]
+        self._populations = np.zeros((num_time_steps, num_time_steps), dtype=float)
+        self._start_ts = np.zeros(num_time_steps, dtype=int)
+        self._simulation_ts = np.zeros(num_time_steps, dtype=int)
+        self._num_cohorts = 0
+        self._num_ts = 0
+
+        # position of each cohort start_ts and simulation_ts in the arrays above
+        self._cohort_index: Dict[int, int] = {}
+        self._ts_index: Dict[int, int] = {}
+
+    @property
+    def cohort_df(self) -> pd.DataFrame:
+        """Population counts with one row per cohort start_ts and one column per simulation_ts"""
+        return pd.DataFrame(
+            self._populations[: self._num_cohorts, : self._num_ts].copy(),
+            index=pd.Index(self.get_cohort_start_ts().copy(), name="start_ts"),
+            columns=pd.Index(
+                self._simulation_ts[: self._num_ts].copy(), name="simulation_ts"
+            ),
+        )
+
+    def _reserve(self, num_cohorts: int, num_ts: int) -> None:
+        """Grow the arrays so they can hold at least `num_cohorts` cohorts and `num_ts` time steps"""
+        cohort_capacity, ts_capacity = self._populations.shape
+        if num_cohorts <= cohort_capacity and num_ts <= ts_capacity:
+            return
+        if num_cohorts > cohort_capacity:
+            cohort_capacity = max(num_cohorts, 2 * cohort_capacity)
+        if num_ts > ts_capacity:
+            ts_capacity = max(num_ts, 2 * ts_capacity)
+
+        populations = np.zeros((cohort_capacity, ts_capacity), dtype=float)
+        populations[: self._num_cohorts, : self._num_ts] = self._populations[
+            : self._num_cohorts, : self._num_ts
+        ]
+        self._populations = populations
+        self._start_ts = np.resize(self._start_ts, cohort_capacity)
+        self._simulation_ts = np.resize(self._simulation_ts, ts_capacity)
+
+    def get_cohort_start_ts(self) -> np.ndarray:
+        """Return the start ts of every cohort, in the same order as get_latest_population_values()"""
+        return self._start_ts[: self._num_cohorts]
+
+    def get_latest_population_values(self) -> np.ndarray:
+        """Return the population of every cohort at the latest simulation ts"""
+        if self._num_ts == 0:
+            return np.zeros(self._num_cohorts, dtype=float)
+        return self._populations[: self._num_cohorts, self._num_ts - 1]
 
     def get_latest_population(self) -> pd.Series:
-        if self.cohort_df.empty:
-            return pd.Series(
-                {start_ts: 0 for start_ts in self.cohort_df.index}, dtype=float
-            )
-
-        return self.cohort_df.iloc[:, -1]
+        return pd.Series(
+            self.get_latest_population_values().copy(),
+            index=self.get_cohort_start_ts().copy(),
+            dtype=float,
+        )
 
     def get_per_ts_population(self) -> pd.Series:
-        return self.cohort_df.sum(axis=0)
-
-    def append_ts_end_count(self, cohort_sizes: pd.Series, projection_ts: int) -> None:
-        """Append the cohort sizes for the end of the projection ts"""
-        latest_population = self.get_latest_population()
-        if (round(cohort_sizes, SIG_FIGS) > round(latest_population, SIG_FIGS)).any():
+        return pd.Series(
+            self._populations[: self._num_cohorts, : self._num_ts].sum(axis=0),
+            index=self._simulation_ts[: self._num_ts].copy(),
+            dtype=float,
+        )
+
+    def append_ts_end_values(
+        self, cohort_sizes: np.ndarray, projection_ts: int
+    ) -> None:
+        """Append the cohort sizes for the end of the projection ts, given in the same order as
+        get_cohort_start_ts()"""
+        latest_population = self.get_latest_population_values()
+        if len(cohort_sizes) != len(latest_population):
+            raise ValueError(
+                f"Expected sizes for {len(latest_population)} cohorts, got {len(cohort_sizes)}"
+            )
+        too_large = np.round(cohort_sizes, SIG_FIGS) > np.round(
+            latest_population, SIG_FIGS
+        )
+        if too_large.any():
+            start_ts = self.get_cohort_start_ts()
             raise ValueError(
                 "Cannot append cohort data that is larger than the latest population\n"
-                f"Latest population: {latest_population[cohort_sizes > latest_population]}\n"
-                f"Attempting to append: {cohort_sizes[cohort_sizes > latest_population]}"
+                f"Latest population: {pd.Series(latest_population[too_large], index=start_ts[too_large])}\n"
+                f"Attempting to append: {pd.Series(cohort_sizes[too_large], index=start_ts[too_large])}"
             )
 
-        if projection_ts in self.cohort_df.columns:
+        if projection_ts in self._ts_index:
             raise ValueError(f"Cannot overwrite cohort for time {projection_ts}")
 
-        self.cohort_df[projection_ts] = cohort_sizes
+        self._reserve(self._num_cohorts, self._num_ts + 1)
+        self._populations[: self._num_cohorts, self._num_ts] = cohort_sizes
+        self._simulation_ts[self._num_ts] = projection_ts
+        self._ts_index[projection_ts] = self._num_ts
+        self._num_ts += 1
+
+    def append_ts_end_count(self, cohort_sizes: pd.Series, projection_ts: int) -> None:
+        """Append the cohort sizes for the end of the projection ts"""
+        start_ts = self.get_cohort_start_ts()
+        if (
+            len(cohort_sizes) != len(start_ts)
+            or not cohort_sizes.index.isin(start_ts).all()
+        ):
+            raise ValueError(
+                "Cohort sizes must be provided for every cohort\n"
+                f"Cohort start times: {start_ts}\n"
+                f"Attempting to append: {cohort_sizes}"
+            )
+        self.append_ts_end_values(
+            cohort_sizes.reindex(start_ts).to_numpy(dtype=float), projection_ts
+        )
 
     def append_cohort(self, cohort_size: float, projection_ts: int) -> None:
         """Add a new cohort to the bottom of the cohort table"""
-        if projection_ts not in self.cohort_df.columns:
+        if projection_ts not in self._ts_index:
             raise ValueError(
                 f"Cannot append cohort with start time {projection_ts} outside of CohortTable timeline "
-                f"{self.cohort_df.columns}"
+                f"{self._simulation_ts[: self._num_ts]}"
             )
-        if projection_ts in self.cohort_df.index:
+        if projection_ts in self._cohort_index:
             raise ValueError(f"Cannot overwrite cohort for time {projection_ts}")
-        self.cohort_df = pd.concat(
-            [
-                self.cohort_df,
-                pd.DataFrame({projection_ts: [cohort_size]}, index=[projection_ts]),
-            ]
-        ).fillna(0)
+
+        self._reserve(self._num_cohorts + 1, self._num_ts)
+        self._populations[self._num_cohorts, : self._num_ts] = 0
+        self._populations[
+            self._num_cohorts, self._ts_index[projection_ts]
+        ] = cohort_size
+        self._start_ts[self._num_cohorts] = projection_ts
+        self._cohort_index[projection_ts] = self._num_cohorts
+        self._num_cohorts += 1
 
     def scale_cohort_size(self, scalar: float) -> None:
         if scalar < 0:
             raise ValueError(f"Cannot scale cohort by a negative factor: {scalar}")
-        self.cohort_df *= scalar
+        self._populations[: self._num_cohorts, : self._num_ts] *= scalar
 
-    def get_cohort_timeline(self, cohort_start_year: int) -> pd.DataFrame:
-        return self.cohort_df.loc[cohort_start_year]
+    def get_cohort_timeline(self, cohort_start_year: int) -> pd.Series:
+        return pd.Series(
+            self._populations[
+                self._cohort_index[cohort_start_year], : self._num_ts
+            ].copy(),
+            index=self._simulation_ts[: self._num_ts].copy(),
+            name=cohort_start_year,
+        )
 
     def pop_cohorts(self) -> pd.DataFrame:
         """pop cohort_df for cross-simulation flow"""
         cohort_df = self.cohort_df
-        self.cohort_df = pd.DataFrame()
+        self._num_cohorts = 0
+        self._num_ts = 0
+        self._cohort_index = {}
+        self._ts_index = {}
         return cohort_df
 
     def ingest_cross_simulation_cohorts(
         self, cross_simulation_flows: pd.DataFrame
     ) -> None:
         """ingest new cohort_df from cross-simulation flow"""
-        self.cohort_df = cross_simulation_flows
+        start_ts = cross_simulation_flows.index.to_numpy(dtype=int)
+        simulation_ts = cross_simulation_flows.columns.to_numpy(dtype=int)
+        self._num_cohorts = 0
+        self._num_ts = 0
+        self._reserve(len(start_ts), len(simulation_ts))
+
+        self._populations[
+            : len(start_ts), : len(simulation_ts)
+        ] = cross_simulation_flows.fillna(0).to_numpy(dtype=float)
+        self._start_ts[: len(start_ts)] = start_ts
+        self._simulation_ts[: len(simulation_ts)] = simulation_ts
+        self._num_cohorts = len(start_ts)
+        self._num_ts = len(simulation_ts)
+        self._cohort_index = {ts: i for i, ts in enumerate(start_ts.tolist())}
+        self._ts_index = {ts: i for i, ts in enumerate(simulation_ts.tolist())}
@@ -43,6 +43,8 @@ class CompartmentTransitions:
 
         self.transition_tables: Dict[int, TransitionTable] = {}
 
+        self.policy_list: List[SparkPolicy] = []
+
     @staticmethod
     def _check_inputs_valid(historical_outflows: pd.DataFrame) -> None:
         """Check historical data passed to CompartmentTransitions is valid."""
@@ -84,6 +86,8 @@ class CompartmentTransitions:
 
     def initialize_transition_tables(self, policy_list: List[SparkPolicy]) -> None:
         """Populate the 'before' transition table and initializes the max_sentence from historical data"""
+        self.policy_list = policy_list
+        self.transition_tables = {}
         self.transition_tables[MIN_POSSIBLE_POLICY_TS] = TransitionTable(
             MIN_POSSIBLE_POLICY_TS, []
         )
@@ -116,6 +120,10 @@ class CompartmentTransitions:
         for transition_table in self.transition_tables.values():
             transition_table.normalize_transitions()
 
+    def add_policies(self, policy_list: List[SparkPolicy]) -> None:
+        """Re-initialize the transition tables with `policy_list` applied on top of the policies already in place"""
+        self.initialize_transition_tables(self.policy_list + policy_list)
+
     def get_per_ts_transition_table(self, current_ts: int) -> pd.DataFrame:
         """function used by SparkCompartment to determine which of the state transition tables to pull from"""
 
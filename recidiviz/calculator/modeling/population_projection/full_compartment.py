@@ -42,12 +42,13 @@ class FullCompartment(SparkCompartment):
         compartment_transitions: CompartmentTransitions,
         starting_ts: int,
         tag: str,
+        num_time_steps: int = 0,
     ) -> None:
 
         super().__init__(outflow_data, starting_ts, tag)
 
         # store all population cohorts with their population counts per ts
-        self.cohorts: CohortTable = CohortTable()
+        self.cohorts: CohortTable = CohortTable(num_time_steps)
 
         # separate incoming cohorts that should be processed after .step_forward()
         self.incoming_cohorts: float = 0
@@ -55,8 +56,8 @@ class FullCompartment(SparkCompartment):
         # transition tables object from compartment out
         self.compartment_transitions = compartment_transitions
 
-        # Series containing compartment population at the end of each ts in the simulation
-        self.end_ts_populations = pd.Series(dtype=float)
+        # compartment population at the end of each ts in the simulation
+        self.end_ts_populations: Dict[int, float] = {}
 
     def single_cohort_intitialize(self, total_population: int) -> None:
         """Populate cohort table with single starting cohort"""
@@ -74,45 +75,54 @@ class FullCompartment(SparkCompartment):
             self.current_ts
         )
 
-        latest_ts_pop = self.cohorts.get_latest_population()
+        latest_ts_pop = self.cohorts.get_latest_population_values()
 
-        # convert index from starting year to years in compartment
-        latest_ts_pop.index = self.current_ts - latest_ts_pop.index
+        # convert from starting ts to ts in compartment
+        cohort_start_ts = self.cohorts.get_cohort_start_ts()
+        ts_in_compartment = self.current_ts - cohort_start_ts
 
         # no cohort should start in cohort after current_ts
-        if any(latest_ts_pop.index <= 0):
+        if (ts_in_compartment <= 0).any():
             raise ValueError(
                 "Cohort cannot start after current time step\n"
                 f"Current time step: {self.current_ts}\n"
-                f"Cohort start times: {self.current_ts - latest_ts_pop.index}"
+                f"Cohort start times: {cohort_start_ts}"
             )
 
-        latest_ts_pop_short = latest_ts_pop[
-            latest_ts_pop.index <= len(per_ts_transitions)
-        ]
-        latest_ts_pop_long = latest_ts_pop[
-            latest_ts_pop.index > len(per_ts_transitions)
-        ]
-        if not np.isclose(latest_ts_pop_long, 0, SIG_FIGS).all():
+        is_short = ts_in_compartment <= len(per_ts_transitions)
+        if not np.isclose(latest_ts_pop[~is_short], 0, SIG_FIGS).all():
             raise ValueError(
-                f"cohorts not empty after max sentence: {latest_ts_pop_long}"
+                "cohorts not empty after max sentence: "
+                f"{pd.Series(latest_ts_pop[~is_short], index=ts_in_compartment[~is_short])}"
             )
 
-        # broadcast latest cohort populations onto transition table
-        latest_ts_pop_short = per_ts_transitions.mul(
-            latest_ts_pop_short, axis=0
-        ).dropna(how="all")
-
-        latest_ts_pop = pd.concat([latest_ts_pop_long, latest_ts_pop_short.remaining])
+        # look up the transition probabilities for each cohort by its ts in compartment.
+        # Cohorts with no matching row in the transition table are dropped.
+        short_cohorts = np.flatnonzero(is_short)
+        transition_rows = per_ts_transitions.index.get_indexer(
+            ts_in_compartment[short_cohorts]
+        )
+        short_cohorts = short_cohorts[transition_rows >= 0]
+        transition_rows = transition_rows[transition_rows >= 0]
 
-        # convert index back to starting year from years in compartment
-        latest_ts_pop.index = self.current_ts - latest_ts_pop.index
+        # broadcast latest cohort populations onto transition table
+        cohort_transitions = (
+            per_ts_transitions.to_numpy(dtype=float)[transition_rows]
+            * latest_ts_pop[short_cohorts, np.newaxis]
+        )
+        has_transitions = ~np.isnan(cohort_transitions).all(axis=1)
+        short_cohorts = short_cohorts[has_transitions]
+        cohort_transitions = cohort_transitions[has_transitions]
 
-        self.cohorts.append_ts_end_count(latest_ts_pop.sort_index(), self.current_ts)
+        remaining_column = per_ts_transitions.columns.get_loc("remaining")
+        end_ts_pop = np.where(is_short, 0.0, latest_ts_pop)
+        end_ts_pop[short_cohorts] = cohort_transitions[:, remaining_column]
+        self.cohorts.append_ts_end_values(end_ts_pop, self.current_ts)
 
+        outflow_totals = np.nansum(cohort_transitions, axis=0)
         outflow_dict = {
-            outflow: latest_ts_pop_short.sum(axis=0)[outflow]
-            for outflow in latest_ts_pop_short.columns
+            outflow: outflow_totals[i]
+            for i, outflow in enumerate(per_ts_transitions.columns)
             if outflow != "remaining"
         }
         return outflow_dict
@@ -190,12 +200,7 @@ class FullCompartment(SparkCompartment):
                 f"Cannot prepare_for_next_step() if population already recorded for this time step \n"
                 f"time step {self.current_ts} already in end_ts_populations {self.end_ts_populations}"
             )
-        self.end_ts_populations = pd.concat(
-            [
-                self.end_ts_populations,
-                pd.Series({self.current_ts: self.get_current_population()}),
-            ]
-        )
+        self.end_ts_populations[self.current_ts] = self.get_current_population()
 
         super().prepare_for_next_step()
 
@@ -204,10 +209,10 @@ class FullCompartment(SparkCompartment):
 
     def get_per_ts_population(self) -> pd.Series:
         """Return the per_ts projected population as a pd.Series of counts per EOTS"""
-        return self.end_ts_populations
+        return pd.Series(self.end_ts_populations, dtype=float)
 
     def get_current_population(self) -> float:
-        return self.cohorts.get_latest_population().sum()
+        return np.nansum(self.cohorts.get_latest_population_values())
 
     def get_cohort_df(self) -> pd.DataFrame:
         return self.cohorts.pop_cohorts()
@@ -18,10 +18,14 @@
 # pylint: disable=unused-argument
 
 from time import time
-from typing import Any, Callable, Dict, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import pandas as pd
 
+from recidiviz.calculator.modeling.population_projection.population_simulation.sub_simulation_pool import (
+    SubSimulationPool,
+)
+from recidiviz.calculator.modeling.population_projection.spark_policy import SparkPolicy
 from recidiviz.calculator.modeling.population_projection.sub_simulation.sub_simulation import (
     SubSimulation,
 )
@@ -43,6 +47,7 @@ class PopulationSimulation:
         ],
         should_scale_populations: bool,
         validation_transitions_data: Optional[pd.DataFrame] = None,
+        num_workers: int = 1,
     ) -> None:
         self.sub_simulations = sub_simulations
         self.sub_group_ids_dict = sub_group_ids_dict
@@ -58,6 +63,8 @@ class PopulationSimulation:
         self.should_scale_populations = should_scale_populations
         self.validation_transition_data = validation_transitions_data or pd.DataFrame()
         self.population_projections = pd.DataFrame()
+        # Number of processes to step the sub simulations on, 1 runs them in-process
+        self.num_workers = num_workers
 
     def get_population_projections(self) -> pd.DataFrame:
         return self.population_projections
@@ -82,39 +89,69 @@ class PopulationSimulation:
 
         return self.population_projections
 
+    def add_policies(self, policy_list: List[SparkPolicy]) -> None:
+        """
+        Apply `policy_list` to the sub simulations on top of the policies already in place. Only policies that take
+        effect at or after the current ts can be added, since earlier policies would change time steps that have
+        already been simulated.
+        """
+        early_policies = [
+            policy for policy in policy_list if policy.policy_ts < self.current_ts
+        ]
+        if early_policies:
+            raise ValueError(
+                f"Cannot add policies with policy_ts before the current ts ({self.current_ts}): "
+                f"{[policy.policy_ts for policy in early_policies]}"
+            )
+        for sub_group_id, sub_group_attributes in self.sub_group_ids_dict.items():
+            self.sub_simulations[sub_group_id].add_policies(
+                SparkPolicy.get_sub_population_policies(
+                    policy_list, sub_group_attributes
+                )
+            )
+
     def step_forward(self, num_ts: int) -> None:
         """Steps forward in the projection by some number of steps."""
-        for _ in range(num_ts):
-            for simulation_obj in self.sub_simulations.values():
-                simulation_obj.step_forward()
-            for simulation_obj in self.sub_simulations.values():
-                simulation_obj.create_new_cohort()
-
-            self._cross_flow()
+        with SubSimulationPool(self.sub_simulations, self.num_workers) as pool:
+            for _ in range(num_ts):
+                sub_group_cohorts = pool.step_forward()
 
-            if self.should_scale_populations:
-                self._scale_populations()
+                populations = pool.ingest_cross_simulation_cohorts(
+                    self._cross_flow(sub_group_cohorts),
+                    collect_populations=self.should_scale_populations,
+                )
 
-            for simulation_obj in self.sub_simulations.values():
-                simulation_obj.prepare_for_next_step()
+                scale_factors = (
+                    self._scale_populations(populations)
+                    if self.should_scale_populations
+                    else None
+                )
+                pool.finish_step(scale_factors, self.current_ts)
 
-            self.current_ts += 1
+                self.current_ts += 1
+        self.sub_simulations = pool.sub_simulations
 
-    def _collect_subsimulation_populations(self) -> pd.DataFrame:
+    def _collect_subsimulation_populations(
+        self, sub_group_populations: Dict[str, pd.DataFrame]
+    ) -> pd.DataFrame:
         """Helper function for step_forward(). Collects subgroup populations for total population scaling."""
         disaggregation_axes = list(list(self.sub_group_ids_dict.values())[0].keys())
         populations_df = pd.DataFrame()
         for simulation_id, simulation_attr in self.sub_group_ids_dict.items():
-            sim_pops = self.sub_simulations[simulation_id].get_current_populations()
+            sim_pops = sub_group_populations[simulation_id]
             sim_pops[disaggregation_axes] = pd.Series(simulation_attr)
             populations_df = pd.concat([populations_df, sim_pops])
         return populations_df
 
-    def _cross_flow(self) -> None:
-        """Helper function for step_forward. Transfer cohorts between SubSimulations"""
+    def _cross_flow(
+        self, sub_group_cohorts: Dict[str, pd.DataFrame]
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Helper function for step_forward. Transfer cohorts between SubSimulations,
+        returning the cohorts each SubSimulation should ingest keyed by sub group id.
+        """
         cross_simulation_flows = pd.DataFrame()
-        for sub_group_id, simulation_obj in self.sub_simulations.items():
-            simulation_cohorts = simulation_obj.cross_flow()
+        for sub_group_id, simulation_cohorts in sub_group_cohorts.items():
             simulation_cohorts = self._subgroup_id_to_attributes(
                 simulation_cohorts, sub_group_id
             )
@@ -146,11 +183,12 @@ class PopulationSimulation:
             .reset_index(["compartment", "sub_group_id"])
         )
 
-        for sub_group_id, simulation_obj in self.sub_simulations.items():
-            sub_group_cohorts = cross_simulation_flows[
+        return {
+            sub_group_id: cross_simulation_flows[
                 cross_simulation_flows.sub_group_id == sub_group_id
             ].drop("sub_group_id", axis=1)
-            simulation_obj.ingest_cross_simulation_cohorts(sub_group_cohorts)
+            for sub_group_id in sub_group_cohorts
+        }
 
     def _subgroup_id_to_attributes(
         self, cohorts_df: pd.DataFrame, simulation_id: str
@@ -172,8 +210,13 @@ class PopulationSimulation:
         output_df = output_df.drop(disaggregation_axes, axis=1)
         return output_df
 
-    def _scale_populations(self) -> None:
-        """Helper function for step_forward. Scale populations in each compartment to match historical data."""
+    def _scale_populations(
+        self, sub_group_populations: Dict[str, pd.DataFrame]
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Helper function for step_forward. Computes the factors to scale populations in
+        each compartment to match historical data, keyed by sub group id.
+        """
         disaggregation_axes = list(self.sub_group_ids_dict.values())[0].keys()
         population_disagg_axes = [
             axis
@@ -192,7 +235,9 @@ class PopulationSimulation:
             .total_population
         )
 
-        subgroup_populations = self._collect_subsimulation_populations()
+        subgroup_populations = self._collect_subsimulation_populations(
+            sub_group_populations
+        )
         subgroup_populations = (
             subgroup_populations.groupby(population_df_sort_indices)
             .sum()
@@ -208,18 +253,17 @@ class PopulationSimulation:
             {"total_population": "scale_factor"}, axis=1
         )
 
+        sub_group_scale_factors = {}
         for simulation_id, simulation_attr in self.sub_group_ids_dict.items():
             agg_simulation_attr = {
                 i: j for i, j in simulation_attr.items() if i in population_disagg_axes
             }
-            simulation_scale_factors = scale_factors[
+            sub_group_scale_factors[simulation_id] = scale_factors[
                 (scale_factors[population_disagg_axes] == agg_simulation_attr).all(
                     axis=1
                 )
             ].drop(population_disagg_axes, axis=1)
-            self.sub_simulations[simulation_id].scale_cohorts(
-                simulation_scale_factors, self.current_ts
-            )
+        return sub_group_scale_factors
 
     def calculate_transition_error(
         self, validation_data: Optional[pd.DataFrame] = None
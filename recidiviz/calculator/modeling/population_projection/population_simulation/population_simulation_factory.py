@@ -145,6 +145,7 @@ class PopulationSimulationFactory:
             cross_flow_function=user_inputs.cross_flow_function,
             override_cross_flow_function=data_inputs.override_cross_flow_function,
             should_scale_populations=data_inputs.should_scale_populations_after_step,
+            num_workers=user_inputs.num_workers or 1,
         )
 
         # run simulation up to the start_year
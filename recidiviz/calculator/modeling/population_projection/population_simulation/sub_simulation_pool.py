@@ -0,0 +1,251 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2022 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Steps the SubSimulations of a PopulationSimulation forward, either in the current
+process or split across a pool of worker processes.
+
+Each time step is broken into three phases that only touch one SubSimulation at a time.
+Between the phases the PopulationSimulation needs the results from every SubSimulation
+(to move cohorts between sub-groups and to scale populations), so the pool acts as a
+barrier: each phase returns only once every SubSimulation has finished it. When run
+with worker processes, each worker owns a fixed partition of the SubSimulations for
+the life of the pool and only the small per-step cohort and population DataFrames are
+sent between processes. The SubSimulations are sent back to the parent process when the
+pool is closed so that they can be used to build outputs.
+"""
+import multiprocessing
+from multiprocessing.connection import Connection
+from types import TracebackType
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+import pandas as pd
+
+from recidiviz.calculator.modeling.population_projection.sub_simulation.sub_simulation import (
+    SubSimulation,
+)
+
+_CLOSE_COMMAND = "close"
+
+
+def step_sub_simulations(
+    sub_simulations: Dict[str, SubSimulation]
+) -> Dict[str, pd.DataFrame]:
+    """Steps each SubSimulation forward one ts, then returns the cohorts that each
+    SubSimulation passes up for cross-simulation flows."""
+    for simulation_obj in sub_simulations.values():
+        simulation_obj.step_forward()
+    for simulation_obj in sub_simulations.values():
+        simulation_obj.create_new_cohort()
+    return {
+        sub_group_id: simulation_obj.cross_flow()
+        for sub_group_id, simulation_obj in sub_simulations.items()
+    }
+
+
+def ingest_sub_simulation_cohorts(
+    sub_simulations: Dict[str, SubSimulation],
+    cohorts_by_sub_group: Dict[str, pd.DataFrame],
+    collect_populations: bool,
+) -> Dict[str, pd.DataFrame]:
+    """Hands each SubSimulation back its cohorts after the cross-simulation flows. If
+    |collect_populations| is True, returns the resulting population of each
+    SubSimulation."""
+    for sub_group_id, simulation_obj in sub_simulations.items():
+        simulation_obj.ingest_cross_simulation_cohorts(
+            cohorts_by_sub_group[sub_group_id]
+        )
+    if not collect_populations:
+        return {}
+    return {
+        sub_group_id: simulation_obj.get_current_populations()
+        for sub_group_id, simulation_obj in sub_simulations.items()
+    }
+
+
+def finish_sub_simulation_step(
+    sub_simulations: Dict[str, SubSimulation],
+    scale_factors_by_sub_group: Optional[Dict[str, pd.DataFrame]],
+    current_ts: int,
+) -> Dict[str, Any]:
+    """Scales each SubSimulation by its scale factors, if provided, and prepares it
+    for the next ts."""
+    if scale_factors_by_sub_group is not None:
+        for sub_group_id, simulation_obj in sub_simulations.items():
+            simulation_obj.scale_cohorts(
+                scale_factors_by_sub_group[sub_group_id], current_ts
+            )
+    for simulation_obj in sub_simulations.values():
+        simulation_obj.prepare_for_next_step()
+    return {}
+
+
+_PHASES: Dict[str, Callable[..., Dict[str, Any]]] = {
+    "step": step_sub_simulations,
+    "ingest": ingest_sub_simulation_cohorts,
+    "finish": finish_sub_simulation_step,
+}
+
+
+def _run_worker(conn: Connection, sub_simulations: Dict[str, SubSimulation]) -> None:
+    """Entrypoint for a worker process. Runs phases on this worker's partition of the
+    SubSimulations until told to close, then sends the SubSimulations back."""
+    while True:
+        command, args = conn.recv()
+        if command == _CLOSE_COMMAND:
+            conn.send((True, sub_simulations))
+            conn.close()
+            return
+        try:
+            result = _PHASES[command](sub_simulations, *args)
+        except Exception as e:
+            conn.send((False, e))
+            continue
+        conn.send((True, result))
+
+
+class SubSimulationPool:
+    """Runs each phase of a time step over a set of SubSimulations. With
+    |num_workers| <= 1, or only one SubSimulation, everything runs in the current
+    process and the SubSimulations are mutated in place. Otherwise, the
+    SubSimulations are partitioned across worker processes.
+
+    Use as a context manager, then read `sub_simulations` after the block exits to
+    get the stepped SubSimulations.
+    """
+
+    def __init__(
+        self, sub_simulations: Dict[str, SubSimulation], num_workers: int
+    ) -> None:
+        self.sub_simulations = sub_simulations
+        self._sub_group_ids = list(sub_simulations)
+        self._num_workers = min(num_workers, len(sub_simulations))
+        self._workers: List[Tuple[multiprocessing.Process, Connection]] = []
+
+    def __enter__(self) -> "SubSimulationPool":
+        if self._num_workers <= 1:
+            return self
+        for worker_num in range(self._num_workers):
+            partition = {
+                sub_group_id: self.sub_simulations[sub_group_id]
+                for sub_group_id in self._sub_group_ids[worker_num :: self._num_workers]
+            }
+            parent_conn, child_conn = multiprocessing.Pipe()
+            process = multiprocessing.Process(
+                target=_run_worker, args=(child_conn, partition), daemon=True
+            )
+            process.start()
+            child_conn.close()
+            self._workers.append((process, parent_conn))
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        if not self._workers:
+            return
+        try:
+            if exc_type is None:
+                self.sub_simulations = self._run_phase(
+                    _CLOSE_COMMAND, [() for _ in self._workers]
+                )
+        finally:
+            for process, conn in self._workers:
+                if exc_type is not None:
+                    process.terminate()
+                process.join()
+                conn.close()
+            self._workers = []
+
+    def _run_phase(
+        self, command: str, args_by_worker: List[Tuple[Any, ...]]
+    ) -> Dict[str, Any]:
+        """Sends |command| to every worker, then waits for all of them to finish.
+        Returns the merged per-sub-group results in the original sub-group order."""
+        for (_, conn), args in zip(self._workers, args_by_worker):
+            conn.send((command, args))
+
+        results: Dict[str, Any] = {}
+        error: Optional[BaseException] = None
+        for _, conn in self._workers:
+            succeeded, result = conn.recv()
+            if not succeeded:
+                error = error or result
+                continue
+            results.update(result)
+        if error is not None:
+            raise error
+        return {
+            sub_group_id: results[sub_group_id]
+            for sub_group_id in self._sub_group_ids
+            if sub_group_id in results
+        }
+
+    def _partition(self, values_by_sub_group: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return [
+            {
+                sub_group_id: values_by_sub_group[sub_group_id]
+                for sub_group_id in self._sub_group_ids[worker_num :: self._num_workers]
+            }
+            for worker_num in range(len(self._workers))
+        ]
+
+    def step_forward(self) -> Dict[str, pd.DataFrame]:
+        """Steps every SubSimulation forward one ts and returns the cohorts each one
+        passes up for cross-simulation flows, keyed by sub-group id."""
+        if not self._workers:
+            return step_sub_simulations(self.sub_simulations)
+        return self._run_phase("step", [() for _ in self._workers])
+
+    def ingest_cross_simulation_cohorts(
+        self,
+        cohorts_by_sub_group: Dict[str, pd.DataFrame],
+        collect_populations: bool,
+    ) -> Dict[str, pd.DataFrame]:
+        """Hands each SubSimulation its cohorts after cross-simulation flows. Returns
+        the current population of each SubSimulation if |collect_populations|."""
+        if not self._workers:
+            return ingest_sub_simulation_cohorts(
+                self.sub_simulations, cohorts_by_sub_group, collect_populations
+            )
+        return self._run_phase(
+            "ingest",
+            [
+                (partition, collect_populations)
+                for partition in self._partition(cohorts_by_sub_group)
+            ],
+        )
+
+    def finish_step(
+        self,
+        scale_factors_by_sub_group: Optional[Dict[str, pd.DataFrame]],
+        current_ts: int,
+    ) -> None:
+        """Applies the scale factors, if any, and prepares every SubSimulation for the
+        next ts."""
+        if not self._workers:
+            finish_sub_simulation_step(
+                self.sub_simulations, scale_factors_by_sub_group, current_ts
+            )
+            return
+        partitions = (
+            self._partition(scale_factors_by_sub_group)
+            if scale_factors_by_sub_group is not None
+            else [None for _ in self._workers]
+        )
+        self._run_phase("finish", [(partition, current_ts) for partition in partitions])
@@ -24,7 +24,13 @@ import pandas as pd
 from numpy.linalg.linalg import LinAlgError
 from statsmodels.tsa.arima.model import ARIMA, ARIMAResults
 
+from recidiviz.calculator.modeling.population_projection.utils.arima_cache import (
+    ARIMA_CACHE,
+    ArimaCache,
+)
+
 ORDER = (1, 1, 0)
+TREND = "t"
 MIN_NUM_DATA_POINTS = 4
 
 
@@ -132,10 +138,8 @@ class PredictedAdmissions:
                         outflow, missing_data_backward
                     ] = historical_data.loc[outflow, min_data_ts]
                 else:
-                    model_backcast = (
-                        ARIMA(row.iloc[::-1].dropna().values, order=ORDER, trend="t")
-                        .fit()
-                        .forecast(steps=len(missing_data_backward))
+                    model_backcast = PredictedAdmissions._forecast_arima(
+                        row.iloc[::-1].dropna().values, len(missing_data_backward)
                     )
 
                     # flip the predictions back around so they're ordered correctly for the historical data indexing
@@ -150,10 +154,8 @@ class PredictedAdmissions:
                         outflow, missing_data_forward
                     ] = historical_data.loc[outflow, max_data_ts]
                 else:
-                    model_forecast = (
-                        ARIMA(row.dropna().values, order=ORDER, trend="t")
-                        .fit()
-                        .forecast(steps=len(missing_data_forward))
+                    model_forecast = PredictedAdmissions._forecast_arima(
+                        row.dropna().values, len(missing_data_forward)
                     )
 
                     historical_data.loc[outflow, missing_data_forward] = model_forecast
@@ -166,15 +168,13 @@ class PredictedAdmissions:
         """
         trained_model_dict = {}
         for outflow_compartment, row in self.historical_data.iterrows():
-            model_forecast = ARIMA(row.values, order=ORDER, trend="t")
-            model_backcast = ARIMA(row.iloc[::-1].values, order=ORDER, trend="t")
             try:
                 trained_model_dict[
                     (outflow_compartment, PredictionDirectionType.FORWARD)
-                ] = model_forecast.fit()
+                ] = self._fit_arima(row.values)
                 trained_model_dict[
                     (outflow_compartment, PredictionDirectionType.BACKWARD)
-                ] = model_backcast.fit()
+                ] = self._fit_arima(row.iloc[::-1].values)
 
             except LinAlgError:
                 # Add warnings
@@ -186,12 +186,12 @@ class PredictedAdmissions:
                 model_forecast = ARIMA(
                     row.values + np.random.normal(0, 0.001, len(row.values)),
                     order=ORDER,
-                    trend="t",
+                    trend=TREND,
                 )
                 model_backcast = ARIMA(
                     row.iloc[::-1].values + np.random.normal(0, 0.001, len(row.values)),
                     order=ORDER,
-                    trend="t",
+                    trend=TREND,
                 )
                 trained_model_dict[
                     (outflow_compartment, PredictionDirectionType.FORWARD)
@@ -202,6 +202,34 @@ class PredictedAdmissions:
 
         self.trained_model_dict = trained_model_dict
 
+    @staticmethod
+    def _fit_arima(values: np.ndarray) -> ARIMAResults:
+        """
+        Fit an ARIMA model to `values`. If the model has been fit to the same values before, the cached parameters
+        are used to filter the data instead of re-running the (much slower) maximum likelihood fit.
+        """
+        model = ARIMA(values, order=ORDER, trend=TREND)
+        cache_key = ArimaCache.cache_key("params", values, ORDER, TREND)
+        params = ARIMA_CACHE.get(cache_key)
+        if params is not None:
+            return model.filter(params)
+
+        results = model.fit()
+        ARIMA_CACHE.put(cache_key, results.params)
+        return results
+
+    @staticmethod
+    def _forecast_arima(values: np.ndarray, steps: int) -> np.ndarray:
+        """Forecast `steps` values past the end of `values` with an ARIMA model, caching the forecast"""
+        cache_key = ArimaCache.cache_key("forecast", values, ORDER, TREND, steps)
+        forecast = ARIMA_CACHE.get(cache_key)
+        if forecast is None:
+            forecast = (
+                ARIMA(values, order=ORDER, trend=TREND).fit().forecast(steps=steps)
+            )
+            ARIMA_CACHE.put(cache_key, forecast)
+        return forecast
+
     def _gen_predicted_data(self, start_period: int, end_period: int) -> None:
         """Generate the predictions between the start and end periods"""
 
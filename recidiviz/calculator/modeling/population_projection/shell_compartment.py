@@ -52,10 +52,20 @@ class ShellCompartment(SparkCompartment):
 
         self.policy_data: Dict[int, pd.DataFrame] = {}
 
+        self.constant_admissions = constant_admissions
+
         self._initialize_admissions_predictors(constant_admissions)
 
-    def _initialize_admissions_predictors(self, constant_admissions: bool) -> None:
-        """Generate the dictionary of one admission predictor per policy time step that defines outflow behaviors"""
+    def _initialize_admissions_predictors(
+        self,
+        constant_admissions: bool,
+        existing_predictors: Optional[Dict[int, PredictedAdmissions]] = None,
+    ) -> None:
+        """
+        Generate the dictionary of one admission predictor per policy time step that defines outflow behaviors
+        `existing_predictors` are already-fit predictors to reuse for time steps whose outflows data is unchanged
+        """
+        existing_predictors = existing_predictors or {}
         policy_time_steps = list({policy.policy_ts for policy in self.policy_list})
 
         if (
@@ -88,9 +98,32 @@ class ShellCompartment(SparkCompartment):
 
         # second pass creates admissions predictors from transformed outflows data
         for ts, ts_data in self.policy_data.items():
-            self.admissions_predictors[ts] = PredictedAdmissions(
-                ts_data, constant_admissions
-            )
+            if ts in existing_predictors:
+                self.admissions_predictors[ts] = existing_predictors[ts]
+            else:
+                self.admissions_predictors[ts] = PredictedAdmissions(
+                    ts_data, constant_admissions
+                )
+
+    def add_policies(self, policy_list: List[SparkPolicy]) -> None:
+        """
+        Add `policy_list` on top of the policies already in place. Only the admissions predictors for time steps on or
+        after the earliest new policy are re-fit, since the outflows data before then is unchanged.
+        """
+        if not policy_list:
+            return
+        first_new_policy_ts = min(policy.policy_ts for policy in policy_list)
+        existing_predictors = {
+            ts: predictor
+            for ts, predictor in self.admissions_predictors.items()
+            if ts < first_new_policy_ts
+        }
+        self.policy_list = self.policy_list + policy_list
+        self.policy_data = {}
+        self.admissions_predictors = {}
+        self._initialize_admissions_predictors(
+            self.constant_admissions, existing_predictors
+        )
 
     def initialize_edges(self, edges: List[SparkCompartment]) -> None:
         """checks all compartments this outflows to are in `self.edges`"""
@@ -16,7 +16,7 @@
 # =============================================================================
 """Simulate multiple demographic/age groups"""
 
-from typing import Dict
+from typing import Dict, List
 
 import pandas as pd
 
@@ -29,6 +29,7 @@ from recidiviz.calculator.modeling.population_projection.shell_compartment impor
 from recidiviz.calculator.modeling.population_projection.spark_compartment import (
     SparkCompartment,
 )
+from recidiviz.calculator.modeling.population_projection.spark_policy import SparkPolicy
 
 
 class SubSimulation:
@@ -62,6 +63,19 @@ class SubSimulation:
         )
         return arima_output_df
 
+    def add_policies(self, policy_list: List[SparkPolicy]) -> None:
+        """Apply `policy_list` to the compartments it targets, on top of the policies already in place"""
+        for compartment_tag, compartment in self.simulation_compartments.items():
+            compartment_policies = SparkPolicy.get_compartment_policies(
+                policy_list, compartment_tag
+            )
+            if not compartment_policies:
+                continue
+            if isinstance(compartment, FullCompartment):
+                compartment.compartment_transitions.add_policies(compartment_policies)
+            elif isinstance(compartment, ShellCompartment):
+                compartment.add_policies(compartment_policies)
+
     def step_forward(self) -> None:
         """Run the simulation for one time step"""
         for compartment in self.simulation_compartments.values():
@@ -231,6 +231,10 @@ class SubSimulationFactory:
                     ],
                     starting_ts=first_relevant_ts,
                     tag=compartment,
+                    num_time_steps=user_inputs.start_time_step
+                    + user_inputs.projection_time_steps
+                    - first_relevant_ts
+                    + 1,
                 )
             else:
                 logging.warning("Not initializing a compartment for %s", compartment)
@@ -50,6 +50,9 @@ class UserInputs:
     speed_run: Optional[bool] = None
     # Optional alternative function to handle cross-flows between SubSimulations
     cross_flow_function: Optional[str] = None
+    # Number of processes to step the SubSimulations on in parallel. None or 1
+    # steps them serially in the current process
+    num_workers: Optional[int] = None
 
 
 @dataclasses.dataclass
@@ -16,7 +16,9 @@
 # =============================================================================
 """SuperSimulation composed object for initializing simulations."""
 import logging
+from copy import deepcopy
 from datetime import datetime
+from multiprocessing import Pool
 from typing import Any, Dict, List, Optional
 
 import matplotlib.pyplot as plt
@@ -40,6 +42,39 @@ from recidiviz.calculator.modeling.population_projection.super_simulation.initia
 from recidiviz.calculator.modeling.population_projection.super_simulation.time_converter import (
     TimeConverter,
 )
+from recidiviz.calculator.modeling.population_projection.transition_table import (
+    cache_normalized_tables,
+)
+from recidiviz.calculator.modeling.population_projection.utils.arima_cache import (
+    ARIMA_CACHE,
+)
+
+# The initialized baseline PopulationSimulation shared by the worker processes that run
+# policy scenarios in Simulator.simulate_policy_scenarios()
+_scenario_baseline: Optional[PopulationSimulation] = None
+
+
+def _set_scenario_baseline(baseline: PopulationSimulation) -> None:
+    global _scenario_baseline
+    _scenario_baseline = baseline
+
+
+def _simulate_scenario_from_baseline(
+    baseline: PopulationSimulation, policy_list: List[SparkPolicy]
+) -> PopulationSimulation:
+    """Copies the initialized `baseline`, applies `policy_list`, and runs the projection on the copy"""
+    scenario_simulation = deepcopy(baseline)
+    scenario_simulation.add_policies(policy_list)
+    scenario_simulation.simulate_policies()
+    return scenario_simulation
+
+
+def _simulate_scenario_in_worker(
+    policy_list: List[SparkPolicy],
+) -> PopulationSimulation:
+    if _scenario_baseline is None:
+        raise ValueError("Scenario worker was not initialized with a baseline")
+    return _simulate_scenario_from_baseline(_scenario_baseline, policy_list)
 
 
 class Simulator:
@@ -98,6 +133,75 @@ class Simulator:
         self._graph_results(user_inputs, results, output_compartment)
         return self._format_simulation_results(user_inputs, collapse_compartments=False)
 
+    def simulate_policy_scenarios(
+        self,
+        user_inputs: UserInputs,
+        data_inputs: SimulationInputData,
+        first_relevant_ts: int,
+        scenarios: Dict[str, List[SparkPolicy]],
+        num_workers: int = 1,
+    ) -> pd.DataFrame:
+        """
+        Run a batch of policy scenarios alongside a "control" scenario with no policies, returns one row per
+            scenario, simulation group, compartment, and time step
+        The baseline simulation is built and initialized up to the start_time_step once. Each scenario then runs on
+            its own copy of the initialized baseline with its policies added, so scenarios only re-do the work for
+            the time steps their policies can affect. Scenarios with a policy before the start_time_step are built
+            from scratch instead.
+        `scenarios` should be a dict of scenario name to the list of SparkPolicy objects to apply in that scenario
+        `num_workers` is the number of processes to run scenarios on. When greater than 1, the policies (and any
+            override cross flow function) must be picklable
+        """
+        if "control" in scenarios:
+            raise ValueError("'control' is reserved for the scenario with no policies")
+
+        self._reset_pop_simulations()
+
+        # Scenarios normalize many of the same transition tables, so share them for this run
+        with cache_normalized_tables():
+            baseline = self._build_population_simulation(
+                user_inputs, data_inputs, [], first_relevant_ts
+            )
+
+            from_baseline_scenarios: Dict[str, List[SparkPolicy]] = {"control": []}
+            for scenario, policy_list in scenarios.items():
+                if any(
+                    policy.policy_ts < baseline.current_ts for policy in policy_list
+                ):
+                    self.pop_simulations[scenario] = self._build_population_simulation(
+                        user_inputs, data_inputs, policy_list, first_relevant_ts
+                    )
+                    self.pop_simulations[scenario].simulate_policies()
+                else:
+                    from_baseline_scenarios[scenario] = policy_list
+
+            if num_workers > 1 and len(from_baseline_scenarios) > 1:
+                # Scenario processes can't start their own sub simulation worker processes
+                baseline.num_workers = 1
+                with Pool(
+                    processes=min(num_workers, len(from_baseline_scenarios)),
+                    initializer=_set_scenario_baseline,
+                    initargs=(baseline,),
+                ) as pool:
+                    scenario_simulations = pool.map(
+                        _simulate_scenario_in_worker, from_baseline_scenarios.values()
+                    )
+                self.pop_simulations.update(
+                    zip(from_baseline_scenarios.keys(), scenario_simulations)
+                )
+            else:
+                for scenario, policy_list in from_baseline_scenarios.items():
+                    self.pop_simulations[scenario] = _simulate_scenario_from_baseline(
+                        baseline, policy_list
+                    )
+
+        # log warnings from ARIMA model
+        self._log_predicted_admissions_warnings()
+
+        return self._format_scenario_results(
+            user_inputs, ["control", *scenarios.keys()]
+        )
+
     def simulate_baseline(
         self,
         user_inputs: UserInputs,
@@ -282,12 +386,38 @@ class Simulator:
 
         return simulation_results
 
+    def _format_scenario_results(
+        self, user_inputs: UserInputs, scenarios: List[str]
+    ) -> pd.DataFrame:
+        """Stack the projections of each scenario into one long DataFrame with a `scenario` column"""
+        scenario_results = []
+        for scenario in scenarios:
+            results = self.pop_simulations[scenario].get_population_projections()
+            results = results[results.time_step >= user_inputs.start_time_step]
+            scenario_results.append(results.assign(scenario=scenario))
+
+        combined_results = pd.concat(scenario_results, ignore_index=True)
+        combined_results["year"] = self.time_converter.convert_time_steps_to_year(
+            combined_results.time_step
+        )
+        return combined_results[
+            [
+                "scenario",
+                "simulation_group",
+                "compartment",
+                "time_step",
+                "year",
+                "total_population",
+            ]
+        ]
+
     def _reset_pop_simulations(self) -> None:
         self.pop_simulations = {}
 
     def _log_predicted_admissions_warnings(self) -> None:
         """
-        Checks if PredictedAdmissions objects have any warnings. If so, log them.
+        Checks if PredictedAdmissions objects have any warnings. If so, log them. Also logs how often ARIMA fits were
+        served from the cache since the last call.
         """
         warnings = []
 
@@ -310,6 +440,15 @@ class Simulator:
             w = warnings.pop()
             logging.warning(w)
 
+        hits, misses = ARIMA_CACHE.pop_hit_counts()
+        if hits + misses:
+            logging.info(
+                "ARIMA cache hit rate: %.1f%% (%d hits, %d misses)",
+                100 * hits / (hits + misses),
+                hits,
+                misses,
+            )
+
     @staticmethod
     def _build_population_simulation(
         user_inputs: UserInputs,
@@ -96,6 +96,31 @@ class SuperSimulation:
         )
         return simulation_output
 
+    def simulate_policy_scenarios(
+        self, scenarios: Dict[str, List[SparkPolicy]], num_workers: int = 1
+    ) -> pd.DataFrame:
+        """
+        Run many policy scenarios against one shared baseline initialization.
+        `scenarios` should be a dict of scenario name to the list of SparkPolicy objects for that scenario
+        `num_workers` is the number of processes to run the scenarios on
+        """
+        first_relevant_ts = self.initializer.get_first_relevant_ts()
+        data_inputs = self.initializer.get_data_inputs()
+        user_inputs = self.initializer.get_user_inputs()
+
+        simulation_output = self.simulator.simulate_policy_scenarios(
+            user_inputs,
+            data_inputs,
+            first_relevant_ts,
+            scenarios,
+            num_workers,
+        )
+        self.validator.reset(
+            self.simulator.get_population_simulations(),
+            {"policy_scenarios": simulation_output},
+        )
+        return simulation_output
+
     def microsim_baseline_over_time(
         self,
         start_run_dates: List[datetime],
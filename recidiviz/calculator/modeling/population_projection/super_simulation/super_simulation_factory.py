@@ -184,6 +184,7 @@ class SuperSimulationFactory:
         cross_flow_function = user_inputs_yaml_dict.pop_optional(
             "cross_flow_function", str
         )
+        num_workers = user_inputs_yaml_dict.pop_optional("num_workers", int)
 
         # Check for any remaining unused arguments
         if user_inputs_yaml_dict:
@@ -198,6 +199,7 @@ class SuperSimulationFactory:
             run_date=run_date,
             speed_run=speed_run,
             cross_flow_function=cross_flow_function,
+            num_workers=num_workers,
         )
 
     @staticmethod
@@ -16,7 +16,9 @@
 # =============================================================================
 """table containing probabilities of transition to other FullCompartments used by CompartmentTransitions object"""
 import collections
-from typing import Any, Dict, List, Optional
+import hashlib
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
@@ -26,6 +28,48 @@ from recidiviz.calculator.modeling.population_projection.utils.transitions_utils
     SIG_FIGS,
 )
 
+# Maximum number of normalized tables to keep while cache_normalized_tables() is active
+_NORMALIZED_TABLE_CACHE_SIZE = 1024
+
+# Normalized transition tables keyed by a hash of the inputs used to produce them, or None
+# if caching isn't active. See cache_normalized_tables().
+_normalized_table_cache: Optional[
+    "collections.OrderedDict[Tuple[Any, ...], pd.DataFrame]"
+] = None
+
+
+def _table_cache_key(table: pd.DataFrame) -> Tuple[Any, ...]:
+    """Returns a hashable key that identifies the contents of |table|."""
+    row_hashes = pd.util.hash_pandas_object(table, index=True).values
+    return (
+        tuple(table.columns),
+        table.index.name,
+        str(table.index.dtype),
+        tuple(str(dtype) for dtype in table.dtypes),
+        hashlib.sha1(row_hashes.tobytes()).hexdigest(),
+    )
+
+
+@contextmanager
+def cache_normalized_tables() -> Iterator[None]:
+    """
+    Caches the results of TransitionTable.normalized_table() by a hash of its inputs until the context exits.
+    Simulations of different policy scenarios over the same data normalize many identical tables (e.g. every
+        table before a policy takes effect, or for sub-groups a policy doesn't touch), so each is computed once and
+        a copy is handed out. The least recently used tables are dropped once more than
+        _NORMALIZED_TABLE_CACHE_SIZE are cached. Nested contexts share the outermost context's cache.
+    """
+    global _normalized_table_cache
+    if _normalized_table_cache is not None:
+        yield
+        return
+
+    _normalized_table_cache = collections.OrderedDict()
+    try:
+        yield
+    finally:
+        _normalized_table_cache = None
+
 
 class TransitionTable:
     """Handle transitions around one policy time_step for population projection modeling"""
@@ -137,7 +181,40 @@ class TransitionTable:
         max_sentence: int,
         before_table: Optional[pd.DataFrame] = None,
     ) -> pd.DataFrame:
-        """Convert the per-ts population counts into normalized probabilities"""
+        """
+        Convert the per-ts population counts into normalized probabilities. While cache_normalized_tables() is
+            active, results are cached by the contents of the inputs, and a new copy is returned on every call so
+            callers are free to modify it.
+        """
+        if _normalized_table_cache is None:
+            return TransitionTable._compute_normalized_table(
+                table, max_sentence, before_table
+            )
+
+        cache_key = (
+            _table_cache_key(table),
+            max_sentence,
+            None if before_table is None else _table_cache_key(before_table),
+        )
+        if cache_key in _normalized_table_cache:
+            _normalized_table_cache.move_to_end(cache_key)
+            return _normalized_table_cache[cache_key].copy()
+
+        normalized_df = TransitionTable._compute_normalized_table(
+            table, max_sentence, before_table
+        )
+        _normalized_table_cache[cache_key] = normalized_df.copy()
+        if len(_normalized_table_cache) > _NORMALIZED_TABLE_CACHE_SIZE:
+            _normalized_table_cache.popitem(last=False)
+        return normalized_df
+
+    @staticmethod
+    def _compute_normalized_table(
+        table: pd.DataFrame,
+        max_sentence: int,
+        before_table: Optional[pd.DataFrame] = None,
+    ) -> pd.DataFrame:
+        """Helper for normalized_table() that does the normalization"""
         if table.empty:
             raise ValueError(
                 "Cannot normalize transition tables before they are initialized"
@@ -364,13 +441,14 @@ class TransitionTable:
         if "remaining" not in table:
             raise ValueError("trying to unnormalize a table that isn't normalized")
 
-        for sentence_length in table.index.sort_values(ascending=False):
-            for shorter_sentence in range(1, sentence_length):
-                table.loc[sentence_length] *= (
-                    1 - table.loc[shorter_sentence].drop("remaining").sum()
-                )
+        # the fraction of the cohort left after each sentence length, i.e. the product of (1 - total outflow
+        #   probability) for all shorter sentence lengths
+        outflow_totals = table.drop("remaining", axis=1).sum(axis=1).sort_index()
+        fraction_remaining = (1 - outflow_totals).cumprod().shift(1, fill_value=1.0)
 
-        return table.drop("remaining", axis=1)
+        return table.drop("remaining", axis=1).mul(
+            fraction_remaining.reindex(table.index), axis=0
+        )
 
     def unnormalize_previous_tables(self) -> None:
         """revert all normalized previous table back to an un-normalized df. sum of all total populations will be 1"""
@@ -436,28 +514,32 @@ class TransitionTable:
         self.tables[ts].loc[:, outflows] = before_table.loc[:, outflows]
 
         new_total_outflows = self.tables[ts].drop("remaining", axis=1).sum(axis=1)
-        # will change as we go, so can't cumprod all at once
+        # the fraction of each sentence length's cohort that doesn't leave, using the outflows
+        #   before re-normalization. The scale factor for each row below only depends on these
+        #   values for shorter sentence lengths, not on any re-normalized row, so the cumprod
+        #   is taken over all sentence lengths at once
         new_total_remaining = 1 - new_total_outflows
 
-        # re-normalize other outflows
-        for sentence_length in range(2, self.max_sentence + 1):
-            # if no remaining, we're done
-            #   only need to check one of the two because scaling will never bring outflows from non-zero to zero
-            if new_total_remaining[sentence_length] == 0:
-                break
-
-            # cumprod happens here, step by step as the df is updated
-            new_total_remaining[sentence_length] *= new_total_remaining[
-                sentence_length - 1
-            ]
-
-            # re-normalize un-affected outflows for this row
-            self.tables[ts].loc[
-                sentence_length, ~self.tables[ts].columns.isin(outflows)
-            ] *= (
-                old_total_remaining[sentence_length - 1]
-                / new_total_remaining[sentence_length - 1]
+        # re-normalize other outflows, up to the first sentence length with no one remaining
+        #   only need to check one of the two because scaling will never bring outflows from non-zero to zero
+        sentence_lengths = np.arange(2, self.max_sentence + 1)
+        no_remaining = new_total_remaining.loc[sentence_lengths].to_numpy() == 0
+        if no_remaining.any():
+            sentence_lengths = sentence_lengths[: np.argmax(no_remaining)]
+        new_total_remaining = new_total_remaining.loc[1 : self.max_sentence].cumprod()
+
+        unaffected_outflows = ~self.tables[ts].columns.isin(outflows)
+        self.tables[ts].loc[sentence_lengths, unaffected_outflows] = (
+            self.tables[ts]
+            .loc[sentence_lengths, unaffected_outflows]
+            .mul(
+                (
+                    old_total_remaining.loc[sentence_lengths - 1]
+                    / new_total_remaining.loc[sentence_lengths - 1]
+                ).to_numpy(),
+                axis=0,
             )
+        )
 
         # revert altered table back to un-normalized
         if before_ts is None:
@@ -507,47 +589,94 @@ class TransitionTable:
         for ts in time_steps:
             self._check_table_invariant_before_normalization(ts)
 
-        for _, row in reduction_df.iterrows():
-            for sentence_length in range(affected_LOS[0], affected_LOS[1]):  # type: ignore
-                for ts in time_steps:
-                    # record population to re-distribute
-                    sentence_count = (
-                        self.tables[ts].loc[sentence_length, row.outflow]
-                        * row.affected_fraction
-                    )
-
-                    # start by clearing df entry that's getting re-distributed
-                    self.tables[ts].loc[sentence_length, row.outflow] *= (
-                        1 - row.affected_fraction
-                    )
-
-                    # calculate new sentence length
-                    if reduction_type == "*":
-                        new_sentence_length = max(
-                            [sentence_length * (1 - row.reduction_size), 1]
-                        )
-                    elif reduction_type == "+":
-                        new_sentence_length = max(
-                            [sentence_length - row.reduction_size, 1]
-                        )
-                    else:
-                        raise RuntimeError(
-                            f"reduction type {reduction_type} not recognized (must be '*' or '+')"
-                        )
+        if reduction_type not in ("*", "+"):
+            raise RuntimeError(
+                f"reduction type {reduction_type} not recognized (must be '*' or '+')"
+            )
+
+        sentence_lengths = np.arange(affected_LOS[0], affected_LOS[1])
+        for row in reduction_df.itertuples():
+            # calculate new sentence lengths
+            if reduction_type == "*":
+                new_sentence_lengths = np.maximum(
+                    sentence_lengths * (1 - row.reduction_size), 1
+                )
+            else:
+                new_sentence_lengths = np.maximum(
+                    sentence_lengths - row.reduction_size, 1
+                )
+
+            for ts in time_steps:
+                self.tables[ts][row.outflow] = self._shift_sentence_lengths(
+                    self.tables[ts][row.outflow],
+                    sentence_lengths,
+                    new_sentence_lengths,
+                    row.affected_fraction,
+                )
+
+    @staticmethod
+    def _shift_sentence_lengths(
+        outflow_counts: pd.Series,
+        sentence_lengths: np.ndarray,
+        new_sentence_lengths: np.ndarray,
+        affected_fraction: float,
+    ) -> np.ndarray:
+        """
+        Helper for apply_reductions(). Moves `affected_fraction` of the population at each of `sentence_lengths` to
+            the corresponding `new_sentence_lengths`, and returns the new counts aligned with `outflow_counts`.
+        Non-integer sentence lengths are split into one chunk rounded up and one chunk rounded down, weighted by where
+            in the middle the actual sentence falls.
+        Sentence lengths are processed from shortest to longest, so population moved to a longer sentence length is
+            moved again when that sentence length is processed. Reductions never do this, so they are applied to all
+            sentence lengths at once.
+        """
+        counts = outflow_counts.to_numpy(dtype=float, copy=True)
 
-                    # separate out non-integer sentence length into one chunk rounded up and one chunk rounded down,
-                    #   weighted by where in the middle actual sentence falls
-                    longer_bit = (new_sentence_length % 1) * sentence_count
-                    shorter_bit = sentence_count - longer_bit
+        def positions(lengths: np.ndarray) -> np.ndarray:
+            indexer = outflow_counts.index.get_indexer(lengths)
+            if (indexer == -1).any():
+                raise KeyError(
+                    f"Sentence lengths not in transition table: {lengths[indexer == -1]}"
+                )
+            return indexer
 
-                    # add in new sentence length probabilities to the df
-                    self.tables[ts].loc[
-                        int(new_sentence_length), row.outflow
-                    ] += shorter_bit
-                    if longer_bit > 0:
-                        self.tables[ts].loc[
-                            int(new_sentence_length) + 1, row.outflow
-                        ] += longer_bit
+        if (new_sentence_lengths > sentence_lengths).any():
+            for sentence_length, new_sentence_length in zip(
+                sentence_lengths, new_sentence_lengths
+            ):
+                position = positions(np.array([sentence_length]))[0]
+                sentence_count = counts[position] * affected_fraction
+                counts[position] *= 1 - affected_fraction
+
+                longer_bit = (new_sentence_length % 1) * sentence_count
+                shorter_bit = sentence_count - longer_bit
+                counts[
+                    positions(np.array([int(new_sentence_length)]))[0]
+                ] += shorter_bit
+                if longer_bit > 0:
+                    counts[
+                        positions(np.array([int(new_sentence_length) + 1]))[0]
+                    ] += longer_bit
+            return counts
+
+        sentence_length_positions = positions(sentence_lengths)
+        sentence_counts = counts[sentence_length_positions] * affected_fraction
+        counts[sentence_length_positions] *= 1 - affected_fraction
+
+        longer_bits = (new_sentence_lengths % 1) * sentence_counts
+        shorter_bits = sentence_counts - longer_bits
+        rounded_down_lengths = new_sentence_lengths.astype(int)
+
+        # Interleave the chunks so they are added in the same order as processing one sentence length at a time
+        target_lengths = np.stack(
+            [rounded_down_lengths, rounded_down_lengths + 1], axis=1
+        ).ravel()
+        bits = np.stack([shorter_bits, longer_bits], axis=1).ravel()
+        has_bit = np.stack(
+            [np.full(len(shorter_bits), True), longer_bits > 0], axis=1
+        ).ravel()
+        np.add.at(counts, positions(target_lengths[has_bit]), bits[has_bit])
+        return counts
 
     def reallocate_outflow(
         self,
@@ -578,30 +707,26 @@ class TransitionTable:
                 )
 
             for _, row in reallocation_df.iterrows():
-                before_outflow = np.array(self.tables[ts][row.outflow])
-                self.tables[ts][row.outflow] = list(
-                    before_outflow * (1 - row.affected_fraction)
+                before_outflow = self.tables[ts][row.outflow].to_numpy()
+                self.tables[ts][row.outflow] = before_outflow * (
+                    1 - row.affected_fraction
                 )
 
                 if not row.isnull().new_outflow:
                     if reallocation_type == "+":
-                        new_outflow_value = list(
-                            np.array(self.tables[ts].get(row.new_outflow, 0))
+                        self.tables[ts][row.new_outflow] = (
+                            self.tables[ts].get(row.new_outflow, 0)
                             + before_outflow * row.affected_fraction
                         )
-                        self.tables[ts][row.new_outflow] = new_outflow_value
                     elif reallocation_type == "*":
                         reallocated_population = (
-                            sum(before_outflow) * row.affected_fraction
+                            before_outflow.sum() * row.affected_fraction
                         )
-                        new_outflow_population = sum(self.tables[ts][row.new_outflow])
+                        new_outflow_population = self.tables[ts][row.new_outflow].sum()
                         scale_factor = (
                             1 + reallocated_population / new_outflow_population
                         )
-                        updated_new_outflow = (
-                            np.array(self.tables[ts][row.new_outflow]) * scale_factor
-                        )
-                        self.tables[ts][row.new_outflow] = list(updated_new_outflow)
+                        self.tables[ts][row.new_outflow] *= scale_factor
 
                     else:
                         raise RuntimeError(
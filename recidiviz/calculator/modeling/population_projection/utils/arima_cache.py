@@ -0,0 +1,155 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2022 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Cache of fitted ARIMA model outputs used by PredictedAdmissions.
+
+The same historical admissions series are fit over and over across policy scenarios,
+validation runs and cohort backfills. Entries are keyed by a hash of the series values
+and the model specification, so they are shared in memory across every
+PredictedAdmissions in a process and, if SPARK_ARIMA_CACHE_DIR is set, on disk across
+processes.
+"""
+import collections
+import hashlib
+import logging
+import os
+import tempfile
+from typing import Optional, Tuple
+
+import numpy as np
+import statsmodels
+
+# Set to a directory to also cache on disk. If unset or empty, arrays are only cached in
+# memory.
+ARIMA_CACHE_DIR_ENV_VAR = "SPARK_ARIMA_CACHE_DIR"
+
+# Included in every cache key. Bump this whenever the way PredictedAdmissions fits or
+# forecasts with ARIMA models changes, so that entries from older code are not reused.
+ARIMA_CACHE_VERSION = 1
+
+# Maximum number of arrays to keep in memory
+_DEFAULT_MAX_ARRAYS_IN_MEMORY = 4096
+
+
+class ArimaCache:
+    """Stores arrays computed from ARIMA models (e.g. fitted parameters or forecasts)
+    in memory and, if |cache_dir| is set, as .npy files in that directory. At most
+    |max_arrays_in_memory| arrays are kept in memory, dropping the least recently used.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str],
+        max_arrays_in_memory: int = _DEFAULT_MAX_ARRAYS_IN_MEMORY,
+    ) -> None:
+        self.cache_dir = cache_dir
+        self.max_arrays_in_memory = max_arrays_in_memory
+        self._arrays: "collections.OrderedDict[str, np.ndarray]" = (
+            collections.OrderedDict()
+        )
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def cache_key(
+        kind: str,
+        values: np.ndarray,
+        order: Tuple[int, int, int],
+        trend: str,
+        steps: Optional[int] = None,
+    ) -> str:
+        """Returns the key for the |kind| of output of an ARIMA model with the given
+        |order| and |trend|, fit to |values|. The cache version and statsmodels version
+        are included since fits may differ between versions.
+        """
+        hasher = hashlib.sha256()
+        hasher.update(
+            repr(
+                (
+                    kind,
+                    tuple(order),
+                    trend,
+                    steps,
+                    ARIMA_CACHE_VERSION,
+                    statsmodels.__version__,
+                )
+            ).encode()
+        )
+        hasher.update(np.ascontiguousarray(values, dtype=np.float64).tobytes())
+        return hasher.hexdigest()
+
+    def _path(self, key: str) -> Optional[str]:
+        if not self.cache_dir:
+            return None
+        return os.path.join(self.cache_dir, f"{key}.npy")
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """Returns a copy of the array stored for |key|, or None if there isn't one."""
+        if key not in self._arrays:
+            path = self._path(key)
+            if path and os.path.exists(path):
+                try:
+                    self._store_in_memory(key, np.load(path))
+                except (OSError, ValueError) as e:
+                    logging.warning("Could not read ARIMA cache file [%s]: %s", path, e)
+
+        if key in self._arrays:
+            self._arrays.move_to_end(key)
+            self.hits += 1
+            return self._arrays[key].copy()
+        self.misses += 1
+        return None
+
+    def _store_in_memory(self, key: str, array: np.ndarray) -> None:
+        self._arrays[key] = array
+        self._arrays.move_to_end(key)
+        while len(self._arrays) > self.max_arrays_in_memory:
+            self._arrays.popitem(last=False)
+
+    def put(self, key: str, array: np.ndarray) -> None:
+        """Stores |array| for |key|. Files are written to a temporary path first then
+        moved into place, so concurrent processes never read a partial file.
+        """
+        array = np.array(array, dtype=np.float64)
+        self._store_in_memory(key, array)
+        path = self._path(key)
+        if not path:
+            return
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                dir=os.path.dirname(path), suffix=".npy", delete=False
+            ) as f:
+                np.save(f, array)
+            os.replace(f.name, path)
+        except OSError as e:
+            logging.warning("Could not write ARIMA cache file [%s]: %s", path, e)
+
+    def pop_hit_counts(self) -> Tuple[int, int]:
+        """Returns the number of (hits, misses) since the last call."""
+        counts = (self.hits, self.misses)
+        self.hits = 0
+        self.misses = 0
+        return counts
+
+
+def cache_dir_from_env() -> Optional[str]:
+    """Returns the directory to use for the on-disk cache, or None if the cache should
+    only be kept in memory."""
+    return os.environ.get(ARIMA_CACHE_DIR_ENV_VAR) or None
+
+
+ARIMA_CACHE = ArimaCache(cache_dir_from_env())
@@ -15,8 +15,8 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 # =============================================================================
 """Various events related to being on supervision."""
-from datetime import date
-from typing import Optional
+from datetime import date, timedelta
+from typing import Iterator, Optional
 
 import attr
 
@@ -206,6 +206,54 @@ class SupervisionPopulationEvent(
         )
 
 
+@attr.s(frozen=True)
+class SupervisionPopulationSpanEvent(SupervisionPopulationEvent):
+    """Models a run of consecutive days, beginning on the event_date, on which a person
+    was on supervision and all attributes of the SupervisionPopulationEvent for each
+    day in the run are identical, aside from the dates.
+
+    These events are produced in place of one SupervisionPopulationEvent per day to
+    reduce the number of events produced for long supervision periods, and are
+    expanded into daily SupervisionPopulationEvents only when needed to produce
+    daily metrics.
+    """
+
+    # The day after the last day in the run (exclusive)
+    end_date_exclusive: date = attr.ib(default=None)
+
+    def daily_events(
+        self,
+        lower_bound_inclusive: Optional[date] = None,
+        upper_bound_inclusive: Optional[date] = None,
+    ) -> Iterator[SupervisionPopulationEvent]:
+        """Yields the SupervisionPopulationEvent for each day in this run, optionally
+        limited to the days that fall between the provided bounds."""
+        event_date = self.event_date
+        if lower_bound_inclusive and lower_bound_inclusive > event_date:
+            event_date = lower_bound_inclusive
+
+        end_date_exclusive = self.end_date_exclusive
+        if upper_bound_inclusive and upper_bound_inclusive < end_date_exclusive:
+            end_date_exclusive = upper_bound_inclusive + timedelta(days=1)
+
+        event_kwargs = {
+            field_name: getattr(self, field_name)
+            for field_name in attr.fields_dict(SupervisionPopulationEvent)
+        }
+
+        while event_date < end_date_exclusive:
+            event_kwargs["event_date"] = event_date
+            event_kwargs["year"] = event_date.year
+            event_kwargs["month"] = event_date.month
+            if self.case_compliance:
+                event_kwargs["case_compliance"] = attr.evolve(
+                    self.case_compliance, date_of_evaluation=event_date
+                )
+            yield SupervisionPopulationEvent(**event_kwargs)
+
+            event_date = event_date + timedelta(days=1)
+
+
 @attr.s(frozen=True)
 class ProjectedSupervisionCompletionEvent(SupervisionEvent):
     """Models a month in which supervision was projected to complete.
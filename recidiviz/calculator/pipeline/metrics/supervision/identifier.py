@@ -15,6 +15,7 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 # =============================================================================
 """Identifies various events related to supervision."""
+import bisect
 import datetime
 import logging
 from collections import defaultdict
@@ -32,6 +33,7 @@ from recidiviz.calculator.pipeline.metrics.supervision.events import (
     ProjectedSupervisionCompletionEvent,
     SupervisionEvent,
     SupervisionPopulationEvent,
+    SupervisionPopulationSpanEvent,
     SupervisionStartEvent,
     SupervisionTerminationEvent,
 )
@@ -114,11 +116,17 @@ from recidiviz.persistence.entity.state.entities import (
 
 
 class SupervisionIdentifier(BaseIdentifier[List[SupervisionEvent]]):
-    """Identifier class for events related to supervision."""
+    """Identifier class for events related to supervision.
 
-    def __init__(self) -> None:
+    If |emit_population_spans| is True, produces a SupervisionPopulationSpanEvent for
+    each run of consecutive days on which all attributes of a person's supervision
+    population events are the same, instead of one SupervisionPopulationEvent per day.
+    """
+
+    def __init__(self, emit_population_spans: bool = False) -> None:
         self.identifier_result_class = SupervisionEvent
         self.field_index = CoreEntityFieldIndex()
+        self.emit_population_spans = emit_population_spans
 
     def identify(
         self, person: StatePerson, identifier_context: IdentifierContext
@@ -294,6 +302,10 @@ class SupervisionIdentifier(BaseIdentifier[List[SupervisionEvent]]):
                     supervision_events.append(supervision_start_event)
 
         if supervision_delegate.supervision_types_mutually_exclusive():
+            if self.emit_population_spans:
+                supervision_events = self._split_population_spans_at_boundaries(
+                    supervision_events
+                )
             supervision_events = self._convert_events_to_dual(supervision_events)
         else:
             supervision_events = self._expand_dual_supervision_events(
@@ -340,7 +352,9 @@ class SupervisionIdentifier(BaseIdentifier[List[SupervisionEvent]]):
             - judicial_district_code: The judicial district responsible for the period of supervision
         Returns
             - A set of unique SupervisionPopulationEvents for the person for the given
-            StateSupervisionPeriod.
+            StateSupervisionPeriod. If emit_population_spans is set, these are
+            SupervisionPopulationSpanEvents that each cover a run of days on which all
+            attributes of the event were the same.
         """
         supervision_population_events: List[SupervisionPopulationEvent] = []
 
@@ -407,6 +421,29 @@ class SupervisionIdentifier(BaseIdentifier[List[SupervisionEvent]]):
             else date.today() + relativedelta(days=1)
         )
 
+        supervision_type = (
+            supervision_period.supervision_type
+            if supervision_period.supervision_type
+            else StateSupervisionPeriodSupervisionType.INTERNAL_UNKNOWN
+        )
+
+        deprecated_supervising_district_external_id = (
+            level_2_supervision_location_external_id
+            or level_1_supervision_location_external_id
+        )
+
+        projected_end_date = supervision_delegate.get_projected_completion_date(
+            supervision_period=supervision_period,
+            incarceration_sentences=incarceration_sentences,
+            supervision_sentences=supervision_sentences,
+        )
+
+        # The start date, end date (exclusive) and attributes of the run of days
+        # currently being built, if emitting population spans
+        span_start_date: Optional[date] = None
+        span_end_date_exclusive: Optional[date] = None
+        span_attributes: Optional[Dict[str, Any]] = None
+
         while event_date < end_date:
             if self._in_supervision_population_for_period_on_date(
                 event_date,
@@ -415,13 +452,6 @@ class SupervisionIdentifier(BaseIdentifier[List[SupervisionEvent]]):
                 supervision_delegate,
                 supervising_officer_external_id,
             ):
-
-                supervision_type = (
-                    supervision_period.supervision_type
-                    if supervision_period.supervision_type
-                    else StateSupervisionPeriodSupervisionType.INTERNAL_UNKNOWN
-                )
-
                 assessment_score = None
                 assessment_level = None
                 assessment_type = None
@@ -458,11 +488,6 @@ class SupervisionIdentifier(BaseIdentifier[List[SupervisionEvent]]):
                         event_date
                     )
 
-                deprecated_supervising_district_external_id = (
-                    level_2_supervision_location_external_id
-                    or level_1_supervision_location_external_id
-                )
-
                 supervision_level_downgrade_occurred = False
                 previous_supervision_level = None
                 if event_date == supervision_period.start_date:
@@ -473,47 +498,111 @@ class SupervisionIdentifier(BaseIdentifier[List[SupervisionEvent]]):
                         supervision_period_index, supervision_period
                     )
 
-                projected_end_date = supervision_delegate.get_projected_completion_date(
-                    supervision_period=supervision_period,
-                    incarceration_sentences=incarceration_sentences,
-                    supervision_sentences=supervision_sentences,
-                )
-
-                supervision_population_events.append(
-                    SupervisionPopulationEvent(
-                        state_code=supervision_period.state_code,
-                        year=event_date.year,
-                        month=event_date.month,
-                        event_date=event_date,
-                        supervision_type=supervision_type,
-                        case_type=case_type,
-                        assessment_score=assessment_score,
-                        assessment_level=assessment_level,
-                        assessment_type=assessment_type,
-                        assessment_score_bucket=assessment_score_bucket,
-                        most_severe_violation_type=violation_history.most_severe_violation_type,
-                        most_severe_violation_type_subtype=violation_history.most_severe_violation_type_subtype,
-                        most_severe_response_decision=violation_history.most_severe_response_decision,
-                        response_count=violation_history.response_count,
-                        supervising_officer_external_id=supervising_officer_external_id,
-                        supervising_district_external_id=deprecated_supervising_district_external_id,
-                        level_1_supervision_location_external_id=level_1_supervision_location_external_id,
-                        level_2_supervision_location_external_id=level_2_supervision_location_external_id,
-                        supervision_level=supervision_period.supervision_level,
-                        supervision_level_raw_text=supervision_period.supervision_level_raw_text,
-                        case_compliance=case_compliance,
-                        judicial_district_code=judicial_district_code,
-                        custodial_authority=supervision_period.custodial_authority,
-                        supervision_level_downgrade_occurred=supervision_level_downgrade_occurred,
-                        previous_supervision_level=previous_supervision_level,
-                        projected_end_date=projected_end_date,
+                daily_attributes: Dict[str, Any] = {
+                    "state_code": supervision_period.state_code,
+                    "supervision_type": supervision_type,
+                    "case_type": case_type,
+                    "assessment_score": assessment_score,
+                    "assessment_level": assessment_level,
+                    "assessment_type": assessment_type,
+                    "assessment_score_bucket": assessment_score_bucket,
+                    "most_severe_violation_type": violation_history.most_severe_violation_type,
+                    "most_severe_violation_type_subtype": violation_history.most_severe_violation_type_subtype,
+                    "most_severe_response_decision": violation_history.most_severe_response_decision,
+                    "response_count": violation_history.response_count,
+                    "supervising_officer_external_id": supervising_officer_external_id,
+                    "supervising_district_external_id": deprecated_supervising_district_external_id,
+                    "level_1_supervision_location_external_id": level_1_supervision_location_external_id,
+                    "level_2_supervision_location_external_id": level_2_supervision_location_external_id,
+                    "supervision_level": supervision_period.supervision_level,
+                    "supervision_level_raw_text": supervision_period.supervision_level_raw_text,
+                    "case_compliance": case_compliance,
+                    "judicial_district_code": judicial_district_code,
+                    "custodial_authority": supervision_period.custodial_authority,
+                    "supervision_level_downgrade_occurred": supervision_level_downgrade_occurred,
+                    "previous_supervision_level": previous_supervision_level,
+                    "projected_end_date": projected_end_date,
+                }
+
+                if not self.emit_population_spans:
+                    supervision_population_events.append(
+                        SupervisionPopulationEvent(
+                            year=event_date.year,
+                            month=event_date.month,
+                            event_date=event_date,
+                            **daily_attributes,
+                        )
                     )
-                )
+                else:
+                    if case_compliance:
+                        # The date_of_evaluation is the only attribute on the
+                        # compliance that is guaranteed to change day to day
+                        daily_attributes["case_compliance"] = attr.evolve(
+                            case_compliance, date_of_evaluation=None
+                        )
+
+                    if (
+                        span_start_date
+                        and span_end_date_exclusive == event_date
+                        and span_attributes == daily_attributes
+                    ):
+                        span_end_date_exclusive = event_date + relativedelta(days=1)
+                    else:
+                        if (
+                            span_start_date
+                            and span_end_date_exclusive
+                            and span_attributes
+                        ):
+                            supervision_population_events.append(
+                                self._build_supervision_population_span_event(
+                                    span_start_date,
+                                    span_end_date_exclusive,
+                                    span_attributes,
+                                )
+                            )
+                        span_start_date = event_date
+                        span_end_date_exclusive = event_date + relativedelta(days=1)
+                        span_attributes = daily_attributes
 
             event_date = event_date + relativedelta(days=1)
 
+        if span_start_date and span_end_date_exclusive and span_attributes:
+            supervision_population_events.append(
+                self._build_supervision_population_span_event(
+                    span_start_date, span_end_date_exclusive, span_attributes
+                )
+            )
+
         return supervision_population_events
 
+    @staticmethod
+    def _build_supervision_population_span_event(
+        start_date: date,
+        end_date_exclusive: date,
+        span_attributes: Dict[str, Any],
+    ) -> SupervisionPopulationSpanEvent:
+        """Builds the SupervisionPopulationSpanEvent covering the run of days from the
+        start_date until the end_date_exclusive, on which all of the given
+        span_attributes were true."""
+        case_compliance: Optional[SupervisionCaseCompliance] = span_attributes[
+            "case_compliance"
+        ]
+
+        return SupervisionPopulationSpanEvent(
+            year=start_date.year,
+            month=start_date.month,
+            event_date=start_date,
+            end_date_exclusive=end_date_exclusive,
+            **{
+                **span_attributes,
+                "case_compliance": (
+                    attr.evolve(case_compliance, date_of_evaluation=start_date)
+                    if case_compliance
+                    else None
+                ),
+            },
+        )
+
     def _supervision_period_counts_towards_supervision_population_in_date_range(
         self,
         date_range: DateRange,
@@ -1124,6 +1213,58 @@ class SupervisionIdentifier(BaseIdentifier[List[SupervisionEvent]]):
             f"Unexpected StateSupervisionPeriodTerminationReason: {termination_reason}"
         )
 
+    @staticmethod
+    def _split_population_spans_at_boundaries(
+        supervision_events: List[SupervisionEvent],
+    ) -> List[SupervisionEvent]:
+        """Splits each SupervisionPopulationSpanEvent at the start and end dates of all
+        other SupervisionPopulationSpanEvents, so that any two spans that overlap cover
+        exactly the same days. This allows the spans to be compared by event_date in
+        _convert_events_to_dual as if they were daily SupervisionPopulationEvents."""
+        boundary_dates = sorted(
+            {
+                boundary_date
+                for event in supervision_events
+                if isinstance(event, SupervisionPopulationSpanEvent)
+                for boundary_date in (event.event_date, event.end_date_exclusive)
+            }
+        )
+
+        if not boundary_dates:
+            return supervision_events
+
+        updated_supervision_events: List[SupervisionEvent] = []
+        for event in supervision_events:
+            if not isinstance(event, SupervisionPopulationSpanEvent):
+                updated_supervision_events.append(event)
+                continue
+
+            start_index = bisect.bisect_right(boundary_dates, event.event_date)
+            end_index = bisect.bisect_left(boundary_dates, event.end_date_exclusive)
+            span_start = event.event_date
+            for span_end in boundary_dates[start_index:end_index] + [
+                event.end_date_exclusive
+            ]:
+                updated_supervision_events.append(
+                    attr.evolve(
+                        event,
+                        year=span_start.year,
+                        month=span_start.month,
+                        event_date=span_start,
+                        end_date_exclusive=span_end,
+                        case_compliance=(
+                            attr.evolve(
+                                event.case_compliance, date_of_evaluation=span_start
+                            )
+                            if event.case_compliance
+                            else None
+                        ),
+                    )
+                )
+                span_start = span_end
+
+        return updated_supervision_events
+
     def _expand_dual_supervision_events(
         self,
         supervision_events: List[SupervisionEvent],
@@ -19,6 +19,7 @@
 This contains the core logic for calculating supervision metrics on a person-by-person
 basis. It transforms SupervisionEvents into SupervisionMetrics.
 """
+from datetime import date
 from operator import attrgetter
 from typing import Dict, List, Optional, Type
 
@@ -29,6 +30,7 @@ from recidiviz.calculator.pipeline.metrics.supervision.events import (
     ProjectedSupervisionCompletionEvent,
     SupervisionEvent,
     SupervisionPopulationEvent,
+    SupervisionPopulationSpanEvent,
     SupervisionStartEvent,
     SupervisionTerminationEvent,
 )
@@ -139,8 +141,6 @@ class SupervisionMetricProducer(
         """
         metrics: List[SupervisionMetric] = []
 
-        identifier_events.sort(key=attrgetter("year", "month"))
-
         calculation_month_upper_bound = get_calculation_month_upper_bound_date(
             calculation_end_month
         )
@@ -148,6 +148,15 @@ class SupervisionMetricProducer(
             calculation_month_upper_bound, calculation_month_count
         )
 
+        identifier_events = self._expand_population_span_events(
+            identifier_events,
+            metric_inclusions,
+            calculation_month_upper_bound,
+            calculation_month_lower_bound,
+        )
+
+        identifier_events.sort(key=attrgetter("year", "month"))
+
         for event in identifier_events:
             event_date = event.event_date
 
@@ -208,6 +217,44 @@ class SupervisionMetricProducer(
 
         return metrics
 
+    def _expand_population_span_events(
+        self,
+        identifier_events: List[SupervisionEvent],
+        metric_inclusions: Dict[SupervisionMetricType, bool],
+        calculation_month_upper_bound: date,
+        calculation_month_lower_bound: Optional[date],
+    ) -> List[SupervisionEvent]:
+        """Replaces each SupervisionPopulationSpanEvent in the identifier_events with
+        the daily SupervisionPopulationEvents that fall within the calculation months.
+        If none of the metrics produced from SupervisionPopulationEvents are included
+        in the metric_inclusions, then the spans are dropped without being expanded."""
+        if not any(
+            isinstance(event, SupervisionPopulationSpanEvent)
+            for event in identifier_events
+        ):
+            return identifier_events
+
+        include_daily_population_events = any(
+            metric_inclusions.get(metric_type)
+            for metric_type in self.event_to_metric_types[SupervisionPopulationEvent]
+        )
+
+        expanded_events: List[SupervisionEvent] = []
+        for event in identifier_events:
+            if not isinstance(event, SupervisionPopulationSpanEvent):
+                expanded_events.append(event)
+                continue
+
+            if include_daily_population_events:
+                expanded_events.extend(
+                    event.daily_events(
+                        lower_bound_inclusive=calculation_month_lower_bound,
+                        upper_bound_inclusive=calculation_month_upper_bound,
+                    )
+                )
+
+        return expanded_events
+
     def include_event_in_metric(
         self,
         event: SupervisionEvent,
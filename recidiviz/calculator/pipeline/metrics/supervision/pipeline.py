@@ -98,7 +98,7 @@ class SupervisionMetricsPipelineRunDelegate(MetricPipelineRunDelegate):
 
     @classmethod
     def identifier(cls) -> BaseIdentifier:
-        return identifier.SupervisionIdentifier()
+        return identifier.SupervisionIdentifier(emit_population_spans=True)
 
     @classmethod
     def metric_producer(cls) -> BaseMetricProducer:
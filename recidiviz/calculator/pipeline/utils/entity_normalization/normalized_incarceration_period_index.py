@@ -19,7 +19,7 @@ for use in the metric calculation pipelines."""
 
 from collections import defaultdict
 from datetime import date
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import attr
 
@@ -42,7 +42,7 @@ from recidiviz.common.constants.state.state_incarceration_period import (
     is_official_release,
 )
 from recidiviz.common.constants.state.state_shared_enums import StateCustodialAuthority
-from recidiviz.common.date import DateRange, DateRangeDiff
+from recidiviz.common.date import DateRange, DateRangeUnion
 from recidiviz.persistence.entity.state.entities import StateIncarcerationPeriod
 
 
@@ -94,71 +94,28 @@ class NormalizedIncarcerationPeriodIndex:
             )
         ]
 
-    # A set of tuples in the format (year, month) for each month of which this person has been incarcerated for any
-    # portion of the month, where the incarceration prevents the person from being counted simultaneously in the
-    # supervision population.
-    month_to_overlapping_ips_not_under_supervision_authority: Dict[
-        int, Dict[int, List[StateIncarcerationPeriod]]
-    ] = attr.ib()
-
-    @month_to_overlapping_ips_not_under_supervision_authority.default
-    def _month_to_overlapping_ips_not_under_supervision_authority(
-        self,
-    ) -> Dict[int, Dict[int, List[StateIncarcerationPeriod]]]:
-        month_to_overlapping_ips_not_under_supervision_authority: Dict[
-            int, Dict[int, List[StateIncarcerationPeriod]]
-        ] = defaultdict(lambda: defaultdict(list))
-
-        for (
-            incarceration_period
-        ) in self.incarceration_periods_that_exclude_person_from_supervision_population:
-            for (
-                year,
-                month,
-            ) in incarceration_period.duration.get_months_range_overlaps_at_all():
-                month_to_overlapping_ips_not_under_supervision_authority[year][
-                    month
-                ].append(incarceration_period)
-
-        return month_to_overlapping_ips_not_under_supervision_authority
-
-    # A set of tuples in the format (year, month) for each month of which this person has been incarcerated for the full
-    # month, where the incarceration prevents the person from being counted simultaneously in the supervision
-    # population.
-    months_excluded_from_supervision_population: Set[Tuple[int, int]] = attr.ib()
-
-    @months_excluded_from_supervision_population.default
-    def _months_excluded_from_supervision_population(self) -> Set[Tuple[int, int]]:
-        """For each StateIncarcerationPeriod, identifies months where the person was incarcerated for every day during
-        that month. Returns a set of months in the format (year, month) for which the person spent the entire month in a
-        prison, where the incarceration prevents the person from being counted simultaneously in the supervision
-        population.
-        """
-        months_excluded_from_supervision_population: Set[Tuple[int, int]] = set()
-
-        for (
-            incarceration_period
-        ) in self.incarceration_periods_that_exclude_person_from_supervision_population:
-            months_overlaps_at_all = (
-                incarceration_period.duration.get_months_range_overlaps_at_all()
-            )
+    # The union of the durations of all incarceration periods during which a person
+    # cannot also be counted in the supervision population
+    ranges_excluded_from_supervision_population: DateRangeUnion = attr.ib()
 
-            for year, month in months_overlaps_at_all:
-                overlapping_periods = (
-                    self.month_to_overlapping_ips_not_under_supervision_authority[year][
-                        month
-                    ]
-                )
+    @ranges_excluded_from_supervision_population.default
+    def _ranges_excluded_from_supervision_population(self) -> DateRangeUnion:
+        return DateRangeUnion.from_ranges(
+            ip.duration
+            for ip in self.incarceration_periods_that_exclude_person_from_supervision_population
+        )
 
-                remaining_ranges_to_cover = (
-                    self._get_portions_of_range_not_covered_by_periods_subset(
-                        DateRange.for_month(year, month), overlapping_periods
-                    )
-                )
-                if not remaining_ranges_to_cover:
-                    months_excluded_from_supervision_population.add((year, month))
+    # The union of the durations of all incarceration periods during which a person is
+    # counted in the incarceration population
+    ranges_in_incarceration_population: DateRangeUnion = attr.ib()
 
-        return months_excluded_from_supervision_population
+    @ranges_in_incarceration_population.default
+    def _ranges_in_incarceration_population(self) -> DateRangeUnion:
+        return DateRangeUnion.from_ranges(
+            ip.duration
+            for ip in self.sorted_incarceration_periods
+            if self.incarceration_delegate.is_period_included_in_state_population(ip)
+        )
 
     # A dictionary mapping admission dates of admissions to prison to the StateIncarcerationPeriods that happened on
     # that day.
@@ -187,58 +144,14 @@ class NormalizedIncarcerationPeriodIndex:
         self, range_to_cover: DateRange
     ) -> bool:
         """Returns True if this person is incarcerated for the full duration of the date range."""
-
-        months_range_overlaps = range_to_cover.get_months_range_overlaps_at_all()
-
-        if not months_range_overlaps:
-            return False
-
-        months_without_exclusion_from_supervision = []
-        for year, month in months_range_overlaps:
-            was_incarcerated_all_month = (
-                year,
-                month,
-            ) in self.months_excluded_from_supervision_population
-            if not was_incarcerated_all_month:
-                months_without_exclusion_from_supervision.append((year, month))
-
-        for year, month in months_without_exclusion_from_supervision:
-            overlapping_periods = (
-                self.month_to_overlapping_ips_not_under_supervision_authority[year][
-                    month
-                ]
-            )
-
-            range_portion_overlapping_month = (
-                range_to_cover.portion_overlapping_with_month(year, month)
-            )
-            if not range_portion_overlapping_month:
-                raise ValueError(
-                    f"Expecting only months that overlap with the range, month ({year}, {month}) does not."
-                )
-
-            remaining_ranges_to_cover = (
-                self._get_portions_of_range_not_covered_by_periods_subset(
-                    range_portion_overlapping_month, overlapping_periods
-                )
-            )
-            if remaining_ranges_to_cover:
-                return False
-
-        return True
+        return self.ranges_excluded_from_supervision_population.covers_range(
+            range_to_cover
+        )
 
     def was_in_incarceration_population_on_date(self, evaluation_date: date) -> bool:
         """Returns True if this person was counted in the incarcerated population
         on the given date."""
-        for period in self.sorted_incarceration_periods:
-            if period.duration.contains_day(
-                evaluation_date
-            ) and self.incarceration_delegate.is_period_included_in_state_population(
-                period
-            ):
-                return True
-
-        return False
+        return self.ranges_in_incarceration_population.contains_day(evaluation_date)
 
     def incarceration_admissions_between_dates(
         self, start_date: date, end_date: date
@@ -250,32 +163,6 @@ class NormalizedIncarcerationPeriodIndex:
             for ip in self.sorted_incarceration_periods
         )
 
-    @staticmethod
-    def _get_portions_of_range_not_covered_by_periods_subset(
-        time_range_to_cover: DateRange,
-        incarceration_periods_subset: List[StateIncarcerationPeriod],
-    ) -> List[DateRange]:
-        """Returns a list of date ranges within the provided |time_range_to_cover| which the provided set of
-        incarceration periods does not fully overlap.
-        """
-
-        remaining_ranges_to_cover = [time_range_to_cover]
-
-        for incarceration_period in incarceration_periods_subset:
-            new_remaining_ranges_to_cover = []
-            for time_range in remaining_ranges_to_cover:
-                new_remaining_ranges_to_cover.extend(
-                    DateRangeDiff(
-                        range_1=incarceration_period.duration, range_2=time_range
-                    ).range_2_non_overlapping_parts
-                )
-
-            remaining_ranges_to_cover = new_remaining_ranges_to_cover
-            if not remaining_ranges_to_cover:
-                break
-
-        return remaining_ranges_to_cover
-
     # A dictionary mapping incarceration_period_id values to the original
     # admission_reason and corresponding admission_reason_raw_text that started the
     # period of being incarcerated.
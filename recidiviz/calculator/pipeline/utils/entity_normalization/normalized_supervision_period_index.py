@@ -16,6 +16,7 @@
 # =============================================================================
 """A class for caching information about a set of supervision periods for use in the metric calculation pipelines."""
 
+import bisect
 from collections import defaultdict
 from datetime import date
 from typing import Dict, List, Optional
@@ -152,6 +153,35 @@ class NormalizedSupervisionPeriodIndex:
 
         return supervision_periods_by_termination_month
 
+    # The earliest start date of any period in sorted_supervision_periods at or after
+    # each position in the list
+    supervision_period_min_remaining_start_dates: List[date] = attr.ib()
+
+    @supervision_period_min_remaining_start_dates.default
+    def _supervision_period_min_remaining_start_dates(self) -> List[date]:
+        min_start_dates: List[date] = []
+        for sp in reversed(self.sorted_supervision_periods):
+            start_date = sp.duration.lower_bound_inclusive_date
+            min_start_dates.append(
+                min(start_date, min_start_dates[-1]) if min_start_dates else start_date
+            )
+        return list(reversed(min_start_dates))
+
+    # The latest exclusive end date of any period in sorted_supervision_periods up to and
+    # including the period at each position in the list. This list is always sorted, so
+    # it can be bisected to find the first period that ends after a given date.
+    supervision_period_max_end_dates: List[date] = attr.ib()
+
+    @supervision_period_max_end_dates.default
+    def _supervision_period_max_end_dates(self) -> List[date]:
+        max_end_dates: List[date] = []
+        for sp in self.sorted_supervision_periods:
+            end_date = sp.duration.upper_bound_exclusive_date
+            max_end_dates.append(
+                max(end_date, max_end_dates[-1]) if max_end_dates else end_date
+            )
+        return max_end_dates
+
     def get_most_recent_previous_supervision_period(
         self, current_supervision_period: NormalizedStateSupervisionPeriod
     ) -> Optional[NormalizedStateSupervisionPeriod]:
@@ -186,9 +216,23 @@ class NormalizedSupervisionPeriodIndex:
         self, date_range: DateRange
     ) -> Optional[NormalizedStateSupervisionPeriod]:
         """Returns the first supervision period that overlaps with the given date range."""
-        for supervision_period in self.sorted_supervision_periods:
+        # No period before this position ends after the start of the date range
+        first_candidate_index = bisect.bisect_right(
+            self.supervision_period_max_end_dates,
+            date_range.lower_bound_inclusive_date,
+        )
+
+        for index in range(first_candidate_index, len(self.sorted_supervision_periods)):
+            supervision_period = self.sorted_supervision_periods[index]
             if DateRangeDiff(supervision_period.duration, date_range).overlapping_range:
                 return supervision_period
+
+            if (
+                self.supervision_period_min_remaining_start_dates[index]
+                >= date_range.upper_bound_exclusive_date
+            ):
+                # All remaining periods start after the end of the date range
+                break
         return None
 
 
@@ -131,9 +131,11 @@ class GCSFileSystem:
 
     @abc.abstractmethod
     def upload_from_string(
-        self, path: GcsfsFilePath, contents: str, content_type: str
+        self, path: GcsfsFilePath, contents: Union[str, bytes], content_type: str
     ) -> None:
-        """Uploads string contents to a file path."""
+        """Uploads string or bytes contents to a file path. String contents are
+        uploaded UTF-8 encoded.
+        """
 
     @abc.abstractmethod
     def upload_from_contents_handle_stream(
@@ -384,7 +386,7 @@ class GCSFileSystemImpl(GCSFileSystem):
 
     @retry.Retry(predicate=retry_predicate)
     def upload_from_string(
-        self, path: GcsfsFilePath, contents: str, content_type: str
+        self, path: GcsfsFilePath, contents: Union[str, bytes], content_type: str
     ) -> None:
         bucket = self.storage_client.bucket(path.bucket_name)
         bucket.blob(path.blob_name).upload_from_string(
@@ -17,7 +17,9 @@
 """Streaming read functionality for Google Cloud Storage CSV files."""
 import abc
 import csv
+import logging
 from contextlib import contextmanager
+from functools import partial
 from typing import Any, Dict, Iterator, List, Optional, TextIO, Tuple, Union
 
 import pandas as pd
@@ -27,6 +29,10 @@ from recidiviz.cloud_storage.gcsfs_path import GcsfsFilePath
 from recidiviz.cloud_storage.read_only_csv_normalizing_stream import (
     ReadOnlyCsvNormalizingStream,
 )
+from recidiviz.cloud_storage.resumable_decoding_stream import (
+    ResumableDecodingStream,
+    filter_decodable_encodings,
+)
 
 UTF_8_ENCODING = "UTF-8"
 
@@ -42,6 +48,11 @@ COMMON_RAW_FILE_ENCODINGS = [
     ISO_8859_1_ENCODING,
 ]
 
+# The number of bytes at the start of a file we try to decode with each candidate
+# encoding before starting the read, so that we can skip encodings that we know will
+# fail without reading the whole file with them.
+ENCODING_SNIFF_SAMPLE_SIZE = 1024 * 1024
+
 
 class GcsfsCsvReaderDelegate:
     """A delegate for handling various events that happen during a GcsfsCsvReader streaming_read() call."""
@@ -80,6 +91,16 @@ class GcsfsCsvReaderDelegate:
         the next encoding type.
         """
 
+    @abc.abstractmethod
+    def on_decode_fallback(
+        self, failed_encoding: str, new_encoding: str, bytes_wasted: int
+    ) -> None:
+        """Called when part of the file cannot be decoded with |failed_encoding| and the read will continue with
+        |new_encoding|. If everything read so far decodes identically with both encodings, decoding resumes in place
+        and |bytes_wasted| is 0. Otherwise, this is called after on_unicode_decode_error() and the read restarts from
+        the beginning of the file, with |bytes_wasted| set to the number of bytes read in the failed attempt.
+        """
+
     @abc.abstractmethod
     def on_exception(self, encoding: str, e: Exception) -> bool:
         """Called when the file read hits any error that is not a UnicodeDecodeError. Any necessary clean up for the
@@ -154,6 +175,31 @@ class GcsfsCsvReader:
 
         return preprocessed_fp, encoding, kwargs
 
+    def _sniff_encodings(
+        self, path: GcsfsFilePath, encodings_to_try: List[str]
+    ) -> List[str]:
+        """Returns the encodings in |encodings_to_try|, in order, that can decode the
+        first ENCODING_SNIFF_SAMPLE_SIZE bytes of the file at |path|.
+        """
+        with self.gcs_file_system.open(
+            path, chunk_size=ENCODING_SNIFF_SAMPLE_SIZE
+        ) as fp:
+            sample = fp.buffer.read(ENCODING_SNIFF_SAMPLE_SIZE)
+
+        candidate_encodings = filter_decodable_encodings(
+            sample,
+            encodings_to_try,
+            is_complete=len(sample) < ENCODING_SNIFF_SAMPLE_SIZE,
+        )
+        if candidate_encodings != encodings_to_try:
+            logging.info(
+                "Skipping encodings %s for [%s] - unable to decode the first [%d] bytes.",
+                [e for e in encodings_to_try if e not in candidate_encodings],
+                path.abs_path(),
+                len(sample),
+            )
+        return candidate_encodings
+
     def streaming_read(
         self,
         path: GcsfsFilePath,
@@ -181,15 +227,30 @@ class GcsfsCsvReader:
         if not encodings_to_try:
             encodings_to_try = COMMON_RAW_FILE_ENCODINGS
 
-        for encoding in encodings_to_try:
+        candidate_encodings = self._sniff_encodings(path, encodings_to_try)
+
+        encoding_index = 0
+        while encoding_index < len(candidate_encodings):
+            encoding = candidate_encodings[encoding_index]
             delegate.on_start_read_with_encoding(encoding)
+            decoding_stream: Optional[ResumableDecodingStream] = None
+            normalized = False
             try:
                 with self._file_pointer_for_path(path, encoding=encoding) as fp:
+                    decoding_stream = ResumableDecodingStream(
+                        fp.buffer,
+                        candidate_encodings[encoding_index:],
+                        on_encoding_switch=partial(
+                            delegate.on_decode_fallback, bytes_wasted=0
+                        ),
+                    )
                     (
                         preprocessed_fp,
                         updated_encoding,
                         updated_kwargs,
-                    ) = self._get_preprocessed_file_stream(fp, encoding, kwargs)
+                    ) = self._get_preprocessed_file_stream(
+                        decoding_stream, encoding, kwargs
+                    )
 
                     if encoding != updated_encoding or kwargs != updated_kwargs:
                         delegate.on_file_stream_normalization(
@@ -197,6 +258,7 @@ class GcsfsCsvReader:
                         )
                         encoding = updated_encoding
                         kwargs = updated_kwargs
+                        normalized = True
 
                     try:
                         reader: Iterator[pd.DataFrame] = pd.read_csv(
@@ -214,22 +276,41 @@ class GcsfsCsvReader:
 
                     for i, df in enumerate(reader):
                         continue_iteration = delegate.on_dataframe(
-                            encoding=encoding, chunk_num=i, df=df
+                            encoding=encoding
+                            if normalized
+                            else decoding_stream.encoding,
+                            chunk_num=i,
+                            df=df,
                         )
                         if not continue_iteration:
                             break
 
-                    delegate.on_file_read_success(encoding)
+                    delegate.on_file_read_success(
+                        encoding if normalized else decoding_stream.encoding
+                    )
                     return
             except UnicodeError as e:
+                if decoding_stream:
+                    encoding = decoding_stream.encoding
+                    encoding_index += decoding_stream.num_encoding_switches
                 should_throw = delegate.on_unicode_decode_error(encoding, e)
                 if should_throw:
                     raise e
+                encoding_index += 1
+                if encoding_index < len(candidate_encodings):
+                    delegate.on_decode_fallback(
+                        encoding,
+                        candidate_encodings[encoding_index],
+                        bytes_wasted=decoding_stream.bytes_read
+                        if decoding_stream
+                        else 0,
+                    )
                 continue
             except Exception as e:
                 should_throw = delegate.on_exception(encoding, e)
                 if should_throw:
                     raise e
+                encoding_index += 1
 
         raise ValueError(
             f"Unable to read path [{path.abs_path()}] for any of these encodings: {encodings_to_try}"
@@ -19,14 +19,63 @@
 import abc
 import csv
 import logging
-from typing import List, Optional
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from enum import Enum
+from typing import Deque, List, Optional, Tuple
 
+import attr
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 
 from recidiviz.cloud_storage.gcs_file_system import GCSFileSystem
 from recidiviz.cloud_storage.gcsfs_csv_reader import GcsfsCsvReaderDelegate
 from recidiviz.cloud_storage.gcsfs_path import GcsfsFilePath
 
+# The default maximum number of chunks SplittingGcsfsCsvReaderDelegate will have
+# in flight (transforming, serializing or uploading) at once when pipelining uploads.
+DEFAULT_MAX_PENDING_CHUNKS = 4
+
+# The default maximum number of bytes of serialized chunks waiting to be uploaded
+# when pipelining uploads.
+DEFAULT_MAX_PENDING_BYTES = 512 * 1024 * 1024
+
+
+class ChunkFileFormat(Enum):
+    """The file format SplittingGcsfsCsvReaderDelegate writes each chunk in. The value
+    is used as the file extension.
+    """
+
+    CSV = "csv"
+    PARQUET = "parquet"
+
+
+def dataframe_to_parquet(df: pd.DataFrame) -> bytes:
+    """Serializes the dataframe to Parquet. Object (string) columns are explicitly typed
+    as strings, even if all values are null, and empty strings are written as nulls to
+    match how BigQuery loads empty values in CSV files. Timestamps are written with
+    microsecond precision, the finest precision BigQuery supports.
+    """
+    arrays = []
+    for column_name in df.columns:
+        column = df[column_name]
+        if column.dtype == object:
+            array = pa.array(column, type=pa.string(), from_pandas=True)
+            array = pc.if_else(
+                pc.equal(array, ""), pa.scalar(None, type=pa.string()), array
+            )
+        else:
+            array = pa.array(column, from_pandas=True)
+        arrays.append(array)
+
+    table = pa.Table.from_arrays(arrays, names=[str(c) for c in df.columns])
+    sink = pa.BufferOutputStream()
+    pq.write_table(table, sink, coerce_timestamps="us")
+    return sink.getvalue().to_pybytes()
+
 
 class SimpleGcsfsCsvReaderDelegate(GcsfsCsvReaderDelegate):
     """A simple, base implementation of the GcsfsCsvReaderDelegate that allows the GcsfsCsvReader to cycle through all
@@ -47,6 +96,11 @@ class SimpleGcsfsCsvReaderDelegate(GcsfsCsvReaderDelegate):
     def on_unicode_decode_error(self, encoding: str, e: UnicodeError) -> bool:
         return False
 
+    def on_decode_fallback(
+        self, failed_encoding: str, new_encoding: str, bytes_wasted: int
+    ) -> None:
+        pass
+
     def on_exception(self, encoding: str, e: Exception) -> bool:
         return True
 
@@ -69,19 +123,70 @@ class ReadOneGcsfsCsvReaderDelegate(SimpleGcsfsCsvReaderDelegate):
         return False
 
 
+@attr.s(frozen=True)
+class _OutputChunk:
+    """A transformed chunk of the CSV that has been (or is being) written to
+    output_path.
+    """
+
+    chunk_num: int = attr.ib()
+    output_path: GcsfsFilePath = attr.ib()
+    columns: List[str] = attr.ib()
+    num_bytes: int = attr.ib()
+
+
 class SplittingGcsfsCsvReaderDelegate(GcsfsCsvReaderDelegate):
     """An implementation of the GcsfsCsvReaderDelegate that uploads each CSV chunk to a separate Google Cloud Storage
     path.
+
+    By default, each chunk is transformed, serialized and uploaded before the next chunk is read. If
+    |num_upload_threads| is positive, chunks are instead processed in a pipeline: while the next chunk is being parsed,
+    a single worker thread transforms and serializes earlier chunks and a pool of |num_upload_threads| threads uploads
+    them. At most |max_pending_chunks| chunks, and roughly |max_pending_bytes| bytes of serialized chunks waiting to be
+    uploaded, are in flight at once. In both modes, output_paths is in chunk order.
+
+    Chunks are written as CSV by default, or in the given |output_format|.
     """
 
-    def __init__(self, path: GcsfsFilePath, fs: GCSFileSystem, include_header: bool):
+    def __init__(
+        self,
+        path: GcsfsFilePath,
+        fs: GCSFileSystem,
+        include_header: bool,
+        num_upload_threads: int = 0,
+        max_pending_chunks: int = DEFAULT_MAX_PENDING_CHUNKS,
+        max_pending_bytes: int = DEFAULT_MAX_PENDING_BYTES,
+        output_format: ChunkFileFormat = ChunkFileFormat.CSV,
+    ):
         self.path = path
         self.fs = fs
         self.include_header = include_header
+        self.output_format = output_format
 
         self.output_paths: List[GcsfsFilePath] = []
         self.output_columns: Optional[List[str]] = None
 
+        # The total size of all files in output_paths
+        self.output_bytes = 0
+
+        self.num_upload_threads = num_upload_threads
+        self.max_pending_chunks = max(1, max_pending_chunks)
+        self.max_pending_bytes = max_pending_bytes
+
+        self._serialize_executor: Optional[ThreadPoolExecutor] = None
+        self._upload_executor: Optional[ThreadPoolExecutor] = None
+
+        # Chunks that have been handed off to the pipeline but not yet recorded in
+        # output_paths, in chunk order. Each future resolves to the chunk and the future
+        # for its upload, or None if there was nothing to upload.
+        self._pending_chunks: Deque[
+            "Future[Optional[Tuple[_OutputChunk, Future[None]]]]"
+        ] = deque()
+
+        # The number of bytes of serialized chunks waiting to be uploaded
+        self._pending_bytes = 0
+        self._pending_bytes_lock = threading.Lock()
+
     def on_start_read_with_encoding(self, encoding: str) -> None:
         logging.info(
             "Attempting to do chunked upload of [%s] with encoding [%s]",
@@ -103,6 +208,45 @@ class SplittingGcsfsCsvReaderDelegate(GcsfsCsvReaderDelegate):
             "Loaded DataFrame chunk [%d] has [%d] rows", chunk_num, df.shape[0]
         )
 
+        if self.num_upload_threads <= 0:
+            serialized_chunk = self._transform_and_serialize(chunk_num, df)
+            if serialized_chunk:
+                output_chunk, contents = serialized_chunk
+                self._upload(output_chunk, contents)
+                self._record_output_chunk(output_chunk)
+            return True
+
+        if not self._serialize_executor or not self._upload_executor:
+            self._serialize_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="csv_chunk_serialize"
+            )
+            self._upload_executor = ThreadPoolExecutor(
+                max_workers=self.num_upload_threads,
+                thread_name_prefix="csv_chunk_upload",
+            )
+
+        # Wait for earlier chunks to finish before adding more work, which also
+        # surfaces any errors from earlier chunks.
+        while self._pending_chunks and (
+            len(self._pending_chunks) >= self.max_pending_chunks
+            or self._pending_bytes >= self.max_pending_bytes
+        ):
+            self._finish_oldest_pending_chunk()
+
+        self._pending_chunks.append(
+            self._serialize_executor.submit(
+                self._transform_serialize_and_start_upload, chunk_num, df
+            )
+        )
+        return True
+
+    def _transform_and_serialize(
+        self, chunk_num: int, df: pd.DataFrame
+    ) -> Optional[Tuple[_OutputChunk, bytes]]:
+        """Transforms the given chunk and serializes it in the output format, returning
+        the chunk and its encoded contents, or None if there is nothing to upload for
+        this chunk.
+        """
         transformed_df = self.transform_dataframe(df)
 
         num_rows = transformed_df.shape[0]
@@ -113,41 +257,121 @@ class SplittingGcsfsCsvReaderDelegate(GcsfsCsvReaderDelegate):
             logging.info(
                 "Skipping output for chunk [%s] - no data in chunk.", chunk_num
             )
-            return True
-
-        output_path = self.get_output_path(chunk_num=chunk_num)
+            return None
+
+        if self.output_format == ChunkFileFormat.PARQUET:
+            contents = dataframe_to_parquet(transformed_df)
+        else:
+            # We cannot use QUOTE_ALL as it results in empty values being written as "" in our temp file csv.
+            # When uploading the temp file to BQ this results in empty strings being uploaded instead of NULLs.
+            quoting = csv.QUOTE_MINIMAL
+            # Encode once up front so that the sizes we track are in bytes, not
+            # characters.
+            contents = transformed_df.to_csv(
+                header=self.include_header, index=False, quoting=quoting
+            ).encode("utf-8")
+        output_chunk = _OutputChunk(
+            chunk_num=chunk_num,
+            output_path=self.get_output_path(chunk_num=chunk_num),
+            columns=list(transformed_df.columns.values),
+            num_bytes=len(contents),
+        )
+        return output_chunk, contents
 
+    def _upload(self, output_chunk: _OutputChunk, contents: bytes) -> None:
         logging.info(
             "Writing DataFrame chunk [%d] to output path [%s]",
-            chunk_num,
-            output_path.abs_path(),
+            output_chunk.chunk_num,
+            output_chunk.output_path.abs_path(),
         )
-
-        # We cannot use QUOTE_ALL as it results in empty values being written as "" in our temp file csv.
-        # When uploading the temp file to BQ this results in empty strings being uploaded instead of NULLs.
-        quoting = csv.QUOTE_MINIMAL
-        self.fs.upload_from_string(
-            output_path,
-            transformed_df.to_csv(
-                header=self.include_header, index=False, quoting=quoting
-            ),
-            "text/csv",
+        content_type = (
+            "application/octet-stream"
+            if self.output_format == ChunkFileFormat.PARQUET
+            else "text/csv"
         )
+        self.fs.upload_from_string(output_chunk.output_path, contents, content_type)
         logging.info("Done writing to output path")
 
-        columns_as_list = list(transformed_df.columns.values)
+    def _record_output_chunk(self, output_chunk: _OutputChunk) -> None:
+        # Record the path before validating so that it is cleaned up on failure
+        self.output_paths.append(output_chunk.output_path)
+        self.output_bytes += output_chunk.num_bytes
+
         if self.output_columns is None:
-            self.output_columns = columns_as_list
+            self.output_columns = output_chunk.columns
 
-        if columns_as_list != self.output_columns:
+        if output_chunk.columns != self.output_columns:
             raise ValueError(
-                f"Found columns written to [{output_path}] that don't match previous "
-                f"columns. Found columns: {columns_as_list}. Previous columns: "
-                f"{self.output_columns}."
+                f"Found columns written to [{output_chunk.output_path}] that don't "
+                f"match previous columns. Found columns: {output_chunk.columns}. "
+                f"Previous columns: {self.output_columns}."
             )
 
-        self.output_paths.append(output_path)
-        return True
+    def _transform_serialize_and_start_upload(
+        self, chunk_num: int, df: pd.DataFrame
+    ) -> Optional[Tuple[_OutputChunk, "Future[None]"]]:
+        """Runs on the serialize thread. Hands the serialized chunk off to the upload
+        pool so that the next chunk can be serialized while this one uploads.
+        """
+        if not self._upload_executor:
+            raise ValueError("Upload executor unexpectedly None.")
+
+        serialized_chunk = self._transform_and_serialize(chunk_num, df)
+        if not serialized_chunk:
+            return None
+        output_chunk, contents = serialized_chunk
+
+        self._update_pending_bytes(len(contents))
+        upload_future = self._upload_executor.submit(
+            self._upload, output_chunk, contents
+        )
+        upload_future.add_done_callback(
+            lambda _: self._update_pending_bytes(-len(contents))
+        )
+        return output_chunk, upload_future
+
+    def _update_pending_bytes(self, delta: int) -> None:
+        with self._pending_bytes_lock:
+            self._pending_bytes += delta
+
+    def _finish_oldest_pending_chunk(self) -> None:
+        """Waits for the oldest pending chunk to be uploaded, then records its output.
+        Raises if any stage failed for that chunk.
+        """
+        result = self._pending_chunks.popleft().result()
+        if not result:
+            return
+        output_chunk, upload_future = result
+        upload_future.result()
+        self._record_output_chunk(output_chunk)
+
+    def _shut_down_pipeline(self) -> None:
+        if self._serialize_executor:
+            self._serialize_executor.shutdown(wait=True)
+            self._serialize_executor = None
+        if self._upload_executor:
+            self._upload_executor.shutdown(wait=True)
+            self._upload_executor = None
+
+    def _abort_pipeline(self) -> None:
+        """Stops all pending work, recording the output paths of any chunks that were
+        uploaded so that they can be cleaned up.
+        """
+        for future in self._pending_chunks:
+            future.cancel()
+        while self._pending_chunks:
+            future = self._pending_chunks.popleft()
+            if future.cancelled():
+                continue
+            try:
+                result = future.result()
+                if result:
+                    output_chunk, upload_future = result
+                    upload_future.result()
+                    self.output_paths.append(output_chunk.output_path)
+            except Exception as e:
+                logging.info("Pending chunk failed while aborting upload: %s", e)
+        self._shut_down_pipeline()
 
     def on_unicode_decode_error(self, encoding: str, e: UnicodeError) -> bool:
         logging.info(
@@ -159,12 +383,26 @@ class SplittingGcsfsCsvReaderDelegate(GcsfsCsvReaderDelegate):
         self._delete_temp_output_paths()
         return False
 
+    def on_decode_fallback(
+        self, failed_encoding: str, new_encoding: str, bytes_wasted: int
+    ) -> None:
+        logging.info(
+            "Falling back from encoding [%s] to [%s] for file [%s]. Bytes wasted: [%d]",
+            failed_encoding,
+            new_encoding,
+            self.path.abs_path(),
+            bytes_wasted,
+        )
+
     def on_exception(self, encoding: str, e: Exception) -> bool:
         logging.error("Failed to upload to GCS - cleaning up temp paths")
         self._delete_temp_output_paths()
         return True
 
     def on_file_read_success(self, encoding: str) -> None:
+        while self._pending_chunks:
+            self._finish_oldest_pending_chunk()
+        self._shut_down_pipeline()
         logging.info(
             "Successfully read file [%s] with encoding [%s]",
             self.path.abs_path(),
@@ -172,11 +410,13 @@ class SplittingGcsfsCsvReaderDelegate(GcsfsCsvReaderDelegate):
         )
 
     def _delete_temp_output_paths(self) -> None:
+        self._abort_pipeline()
         for temp_output_path in self.output_paths:
             logging.info("Deleting temp file [%s].", temp_output_path.abs_path())
             self.fs.delete(temp_output_path)
         self.output_paths.clear()
         self.output_columns = None
+        self.output_bytes = 0
 
     @abc.abstractmethod
     def transform_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
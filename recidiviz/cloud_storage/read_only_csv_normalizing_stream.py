@@ -19,7 +19,8 @@ format with arbitrary delimiters and newline terminators to a standardized forma
 """
 import csv
 import logging
-from typing import Optional, TextIO
+from collections import deque
+from typing import Deque, List, Optional, TextIO
 
 DOUBLE_QUOTE = '"'
 ESCAPED_DOUBLE_QUOTE = '""'
@@ -36,6 +37,11 @@ class ReadOnlyCsvNormalizingStream:
     format with arbitrary delimiters and newline terminators to a standardized format
     with fully-quoted fields, escaped quotes in free-text columns, commas for delimiters
     and newlines for terminators.
+
+    Both internal buffers are kept as lists of chunks rather than as single strings so
+    that adding to or reading from them never requires copying the data that has
+    already been buffered. This keeps the cost of normalizing a file linear in the size
+    of the file, even for very long lines or very small read sizes.
     """
 
     def __init__(
@@ -49,14 +55,22 @@ class ReadOnlyCsvNormalizingStream:
         self.line_terminator = line_terminator
 
         # Holds the next part of the text stream that we may have read but have not yet
-        # done any preprocessing to. Between calls to read(), this will never hold more
-        # than part of a single CSV line.
-        self._unnormalized_buffer = ""
+        # done any preprocessing to, as a list of blocks. Between calls to read(), this
+        # will never hold more than part of a single CSV line (i.e. the joined blocks
+        # never contain the line terminator).
+        self._unnormalized_blocks: List[str] = []
 
         # Holds the next portion of the stream that has been normalized and is ready
-        # to read. It is only added to in one-line increments, but may be read from in
-        # any size increment.
-        self._normalized_buffer = ""
+        # to read, as a queue of chunks. It is only added to in whole-line increments,
+        # but may be read from in any size increment.
+        self._normalized_chunks: Deque[str] = deque()
+
+        # The number of characters at the start of the first normalized chunk that have
+        # already been read.
+        self._normalized_offset = 0
+
+        # The total number of normalized characters that have not yet been read.
+        self._normalized_length = 0
 
         # When True, indicates that we have reached the end of the file stream and
         # should not attempt to read more. This may be set before all of the normalized
@@ -67,6 +81,22 @@ class ReadOnlyCsvNormalizingStream:
         # buffer.
         self._num_lines_processed = 0
 
+    def _contains_line_terminator(self, block: str) -> bool:
+        """Returns True if the line terminator appears in the unnormalized buffer once
+        |block| is added to it. Only the new block (plus enough of the preceding text to
+        catch a terminator split across blocks) needs to be searched, since the
+        unnormalized buffer never contains a full line terminator on its own.
+        """
+        if self.line_terminator in block:
+            return True
+        overlap = len(self.line_terminator) - 1
+        if not overlap or not self._unnormalized_blocks:
+            return False
+        # Blocks are never empty, so the last |overlap| blocks hold at least |overlap|
+        # characters.
+        preceding = "".join(self._unnormalized_blocks[-overlap:])[-overlap:]
+        return self.line_terminator in preceding + block[:overlap]
+
     def _add_to_buffer(self, block_size: Optional[int]) -> None:
         """Reads the next portion of the file and normalizes any full lines, adding them
         to the end of the normalized buffer.
@@ -74,36 +104,88 @@ class ReadOnlyCsvNormalizingStream:
         if self._eof:
             return
 
-        while not self._eof and self.line_terminator not in self._unnormalized_buffer:
+        found_terminator = False
+        while not self._eof and not found_terminator:
             block = self.fp.read(block_size or -1)
             if not block or block_size is None:
                 self._eof = True
-            self._unnormalized_buffer += block
+            if block:
+                found_terminator = self._contains_line_terminator(block)
+                self._unnormalized_blocks.append(block)
 
-        lines = self._unnormalized_buffer.split(self.line_terminator)
+        lines = "".join(self._unnormalized_blocks).split(self.line_terminator)
         if self._eof:
+            self._unnormalized_blocks = []
             full_lines = lines
         else:
             if len(lines) < 2:
                 raise ValueError("Expected more than one line, found only one.")
-            self._unnormalized_buffer = lines[-1]
+            self._unnormalized_blocks = [lines[-1]] if lines[-1] else []
             full_lines = lines[: len(lines) - 1]
 
         if not full_lines and not self._eof:
             raise ValueError("Expect to have lines if not EOF, found None.")
 
-        for full_line in full_lines:
-            if self._num_lines_processed > 0:
-                self._normalized_buffer += NEWLINE
-            if full_line:
-                self._normalized_buffer += (
-                    DOUBLE_QUOTE
-                    + full_line.replace(DOUBLE_QUOTE, ESCAPED_DOUBLE_QUOTE)
-                    .replace(self.delimiter, COMMA_SURROUNDED_BY_DOUBLE_QUOTES)
-                    .replace(NULL_BYTE, "")
-                    + DOUBLE_QUOTE
-                )
-            self._num_lines_processed += 1
+        normalized_chunk = NEWLINE.join(
+            DOUBLE_QUOTE
+            + full_line.replace(DOUBLE_QUOTE, ESCAPED_DOUBLE_QUOTE)
+            .replace(self.delimiter, COMMA_SURROUNDED_BY_DOUBLE_QUOTES)
+            .replace(NULL_BYTE, "")
+            + DOUBLE_QUOTE
+            if full_line
+            else ""
+            for full_line in full_lines
+        )
+        if self._num_lines_processed > 0:
+            normalized_chunk = NEWLINE + normalized_chunk
+        self._num_lines_processed += len(full_lines)
+
+        if normalized_chunk:
+            self._normalized_chunks.append(normalized_chunk)
+            self._normalized_length += len(normalized_chunk)
+
+    def _find_newline_in_normalized_buffer(self, limit: Optional[int]) -> int:
+        """Returns the index of the first newline in the unread portion of the
+        normalized buffer, only looking at the first |limit| characters if a limit is
+        provided. Returns -1 if no newline is found.
+        """
+        if not self._normalized_chunks:
+            return -1
+        chunk_start = 0
+        offset = self._normalized_offset
+        for chunk in self._normalized_chunks:
+            end = len(chunk) if limit is None else min(len(chunk), offset + limit)
+            index = chunk.find(NEWLINE, offset, end)
+            if index != -1:
+                return chunk_start + index - offset
+            chunk_start += len(chunk) - offset
+            if limit is not None:
+                limit -= end - offset
+                if limit <= 0:
+                    break
+            offset = 0
+        return -1
+
+    def _pop_from_normalized_buffer(self, length: int) -> str:
+        """Removes and returns up to |length| characters from the front of the
+        normalized buffer.
+        """
+        remaining = min(length, self._normalized_length)
+        self._normalized_length -= remaining
+        parts = []
+        while remaining:
+            chunk = self._normalized_chunks[0]
+            start = self._normalized_offset
+            end = start + remaining
+            if end < len(chunk):
+                parts.append(chunk[start:end])
+                self._normalized_offset = end
+                break
+            parts.append(chunk[start:] if start else chunk)
+            self._normalized_chunks.popleft()
+            self._normalized_offset = 0
+            remaining = end - len(chunk)
+        return parts[0] if len(parts) == 1 else "".join(parts)
 
     def read(self, __size: Optional[int] = None) -> str:
         if __size is not None and __size < 1:
@@ -114,13 +196,10 @@ class ReadOnlyCsvNormalizingStream:
             if not self._eof:
                 raise ValueError("Must have reached EOF if reading full file.")
         else:
-            while not self._eof and len(self._normalized_buffer) < __size:
-                self._add_to_buffer(__size - len(self._normalized_buffer))
+            while not self._eof and self._normalized_length < __size:
+                self._add_to_buffer(__size - self._normalized_length)
 
-        read_length = __size or len(self._normalized_buffer)
-        ret = self._normalized_buffer[:read_length]
-        self._normalized_buffer = self._normalized_buffer[read_length:]
-        return ret
+        return self._pop_from_normalized_buffer(__size or self._normalized_length)
 
     def readline(self, __size: Optional[int] = None) -> str:
         """Read a single line from the stream, or up to __size bytes, whichever is
@@ -131,8 +210,14 @@ class ReadOnlyCsvNormalizingStream:
 
         bytes_read = 0
         while True:
-            index = self._normalized_buffer.find("\n")
-            if index != -1 or self._eof or (__size and bytes_read >= __size):
+            index = self._find_newline_in_normalized_buffer(__size or None)
+            if (
+                index != -1
+                or self._eof
+                or (__size and bytes_read >= __size)
+                # A newline past __size would not change what we return
+                or (__size and self._normalized_length >= __size)
+            ):
                 break
 
             bytes_to_read = (
@@ -152,16 +237,14 @@ class ReadOnlyCsvNormalizingStream:
             # Read the whole line, including the newline
             read_length = index + 1
         elif not __size:
-            read_length = len(self._normalized_buffer)
+            read_length = self._normalized_length
         else:
             read_length = __size
 
         # Read length can never be more than __size
         read_length = min(__size, read_length) if __size else read_length
 
-        ret = self._normalized_buffer[:read_length]
-
-        self._normalized_buffer = self._normalized_buffer[read_length:]
+        ret = self._pop_from_normalized_buffer(read_length)
 
         if not ret and not self._eof:
             raise ValueError("Should not have empty return if not EOF")
@@ -0,0 +1,215 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2022 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Read-only text stream that decodes a binary stream block by block, falling back
+to the next candidate encoding in place when it is safe to do so.
+"""
+import codecs
+import io
+from typing import BinaryIO, Callable, List, Optional, TextIO
+
+NEWLINE = "\n"
+
+# The number of bytes we decode at a time
+DECODE_BLOCK_SIZE = 1024 * 1024
+
+_ASCII_BYTES = bytes(range(128))
+
+
+def is_ascii_compatible(encoding: str) -> bool:
+    """Returns True if every ASCII byte decodes to the same character with the given
+    encoding as it does with ASCII.
+    """
+    try:
+        return _ASCII_BYTES.decode(encoding) == _ASCII_BYTES.decode("ascii")
+    except UnicodeError:
+        return False
+
+
+def filter_decodable_encodings(
+    sample: bytes, encodings: List[str], is_complete: bool
+) -> List[str]:
+    """Returns the encodings in |encodings|, in order, that can decode |sample|. If
+    |is_complete| is False, |sample| is treated as a prefix of a larger stream, so a
+    multibyte character cut off at the end of the sample is not a decode error.
+    """
+    decodable_encodings = []
+    for encoding in encodings:
+        try:
+            codecs.getincrementaldecoder(encoding)().decode(sample, is_complete)
+        except UnicodeError:
+            continue
+        decodable_encodings.append(encoding)
+    return decodable_encodings
+
+
+class ResumableDecodingStream(io.TextIOBase, TextIO):
+    """Wrapper around a binary stream that decodes it into text one block at a time
+    using the first of the provided encodings, translating newlines the same way
+    TextIOWrapper does by default.
+
+    If a block cannot be decoded and all of the bytes decoded so far were ASCII, the
+    text we have already returned would be identical under the next candidate
+    encoding (if that encoding is ASCII compatible), so we switch to that encoding and
+    resume decoding from the failed block rather than raising. Otherwise, the
+    UnicodeDecodeError is raised and the caller must restart the read with a
+    different encoding.
+    """
+
+    def __init__(
+        self,
+        fp: BinaryIO,
+        encodings: List[str],
+        on_encoding_switch: Optional[Callable[[str, str], None]] = None,
+        block_size: Optional[int] = None,
+    ) -> None:
+        super().__init__()
+        if not encodings:
+            raise ValueError("Must provide at least one encoding.")
+
+        self._fp = fp
+        self._encodings = encodings
+        self._on_encoding_switch = on_encoding_switch
+        self._block_size = block_size or DECODE_BLOCK_SIZE
+
+        self._encoding_index = 0
+        self._decoder = self._decoder_for_encoding(encodings[0])
+
+        # Decoded text that has not been read yet starts at |_buffer_offset|. The
+        # buffer is only compacted when it is added to.
+        self._buffer = ""
+        self._buffer_offset = 0
+
+        self._eof = False
+
+        # True if every byte decoded so far was ASCII.
+        self._all_ascii = True
+
+        # The number of bytes read from the underlying binary stream.
+        self.bytes_read = 0
+
+    @property
+    def encoding(self) -> str:  # type: ignore[override]
+        """The encoding currently being used to decode the stream."""
+        return self._encodings[self._encoding_index]
+
+    @property
+    def num_encoding_switches(self) -> int:
+        return self._encoding_index
+
+    @staticmethod
+    def _decoder_for_encoding(encoding: str) -> io.IncrementalNewlineDecoder:
+        return io.IncrementalNewlineDecoder(
+            codecs.getincrementaldecoder(encoding)(), translate=True
+        )
+
+    def _can_switch_encoding(self) -> bool:
+        next_index = self._encoding_index + 1
+        return (
+            self._all_ascii
+            and next_index < len(self._encodings)
+            and is_ascii_compatible(self.encoding)
+            and is_ascii_compatible(self._encodings[next_index])
+        )
+
+    def _decode(self, block: bytes, final: bool) -> str:
+        while True:
+            # Since all bytes before this block were ASCII, the only state we need to
+            # carry over to a new decoder is whether the last character was a '\r'.
+            state = self._decoder.getstate()
+            try:
+                text = self._decoder.decode(block, final)
+            except UnicodeDecodeError:
+                if not self._can_switch_encoding():
+                    raise
+                old_encoding = self.encoding
+                self._encoding_index += 1
+                self._decoder = self._decoder_for_encoding(self.encoding)
+                self._decoder.setstate(state)
+                if self._on_encoding_switch:
+                    self._on_encoding_switch(old_encoding, self.encoding)
+                continue
+
+            if self._all_ascii and not block.isascii():
+                self._all_ascii = False
+            return text
+
+    def _add_to_buffer(self) -> None:
+        """Reads and decodes the next block of the binary stream, adding it to the end
+        of the buffer.
+        """
+        block = self._fp.read(self._block_size)
+        self.bytes_read += len(block)
+        if not block:
+            self._eof = True
+        text = self._decode(block, final=self._eof)
+        if text:
+            self._buffer = self._buffer[self._buffer_offset :] + text
+            self._buffer_offset = 0
+
+    def _pop_from_buffer(self, length: int) -> str:
+        end = min(self._buffer_offset + length, len(self._buffer))
+        ret = self._buffer[self._buffer_offset : end]
+        self._buffer_offset = end
+        return ret
+
+    def _num_buffered_chars(self) -> int:
+        return len(self._buffer) - self._buffer_offset
+
+    def read(self, size: Optional[int] = -1) -> str:
+        if size is None or size < 0:
+            while not self._eof:
+                self._add_to_buffer()
+            return self._pop_from_buffer(self._num_buffered_chars())
+
+        while not self._eof and self._num_buffered_chars() < size:
+            self._add_to_buffer()
+        return self._pop_from_buffer(size)
+
+    def readline(self, size: Optional[int] = -1) -> str:
+        """Read a single line from the stream, or up to |size| characters, whichever
+        is shorter.
+        """
+        if size is None:
+            size = -1
+        # The number of buffered characters we have already searched for a newline
+        num_searched = 0
+        while True:
+            index = self._buffer.find(NEWLINE, self._buffer_offset + num_searched)
+            if index != -1:
+                line_length = index + 1 - self._buffer_offset
+                break
+            num_searched = self._num_buffered_chars()
+            if self._eof or 0 <= size <= num_searched:
+                line_length = num_searched
+                break
+            self._add_to_buffer()
+
+        if size >= 0:
+            line_length = min(size, line_length)
+        return self._pop_from_buffer(line_length)
+
+    def readable(self) -> bool:
+        return True
+
+    @property
+    def mode(self) -> str:
+        return "r"
+
+    # This is overridden purely to appease mypy which otherwise will complain about
+    # incompatible definitions in super classes.
+    def __enter__(self) -> "ResumableDecodingStream":
+        return self
@@ -16,9 +16,10 @@
 # =============================================================================
 """Contains logic related to EnumOverrides."""
 
+import functools
 from collections import defaultdict
 from enum import Enum
-from typing import Callable, Dict, Optional, Set, Type, TypeVar
+from typing import Any, Callable, Dict, Optional, Set, Type, TypeVar, cast
 
 import attr
 
@@ -29,6 +30,42 @@ EnumIgnorePredicate = Callable[[str], bool]
 
 EnumT = TypeVar("EnumT", bound=Enum)
 
+EnumParsingFnT = TypeVar("EnumParsingFnT", bound=Callable[..., Any])
+
+# Attribute set on functions that have been declared pure via @pure_enum_parsing_fn.
+_PURE_ENUM_PARSING_FN_ATTR = "is_pure_enum_parsing_fn"
+
+# The maximum number of distinct labels whose results are cached for each pure enum
+# mapper function or ignore predicate.
+PURE_ENUM_PARSING_FN_CACHE_SIZE = 4096
+
+
+def pure_enum_parsing_fn(fn: EnumParsingFnT) -> EnumParsingFnT:
+    """Decorator that declares an enum mapper function, custom enum parser or ignore
+    predicate to be pure, i.e. its result depends only on its raw text argument and
+    calling it has no side effects. The results of pure functions may be cached.
+    """
+    setattr(fn, _PURE_ENUM_PARSING_FN_ATTR, True)
+    return fn
+
+
+def is_pure_enum_parsing_fn(fn: Callable[..., Any]) -> bool:
+    """Returns True if |fn| has been declared pure via @pure_enum_parsing_fn."""
+    return getattr(fn, _PURE_ENUM_PARSING_FN_ATTR, False)
+
+
+def _with_cache_if_pure(fn: EnumParsingFnT) -> EnumParsingFnT:
+    """Returns a version of |fn| that caches its results by label if |fn| is pure,
+    otherwise returns |fn| unchanged.
+    """
+    if not is_pure_enum_parsing_fn(fn) or hasattr(fn, "cache_info"):
+        return fn
+    # The wrapper copies the __dict__ of |fn|, so it is also marked as pure.
+    return cast(
+        EnumParsingFnT, functools.lru_cache(maxsize=PURE_ENUM_PARSING_FN_CACHE_SIZE)(fn)
+    )
+
+
 # pylint doesn't support custom decorators, so these attributes can't be subscripted.
 # https://github.com/PyCQA/pylint/issues/1694
 # pylint: disable=unsubscriptable-object
@@ -49,6 +86,19 @@ class EnumOverrides:
         )
         return label in self._ignores[enum_class] or any(predicate_calls)
 
+    def is_cacheable(self, enum_class: Type[Enum]) -> bool:
+        """Returns True if the result of parsing a label for |enum_class| is fully
+        determined by the label, i.e. if all mapper functions and ignore predicates
+        used to parse |enum_class| have been declared pure.
+        """
+        return all(
+            is_pure_enum_parsing_fn(fn)
+            for fn in self._mapper_fns_dict.get(enum_class, set())
+        ) and all(
+            is_pure_enum_parsing_fn(predicate)
+            for predicate in self._ignore_predicates_dict.get(enum_class, set())
+        )
+
     def parse(self, label: str, enum_class: Type[EnumT]) -> Optional[Enum]:
         """Parses the provided string text into an enum based on the provided mappings.
         Returns None if there is no configured mapping or the string value is marked in
@@ -62,9 +112,9 @@ class EnumOverrides:
             return direct_lookup
 
         matches = {
-            mapper_fn(label)
+            mapped_value
             for mapper_fn in self._mapper_fns_dict[enum_class]
-            if mapper_fn(label) is not None
+            if (mapped_value := mapper_fn(label)) is not None
         }
         if len(matches) > 1:
             raise ValueError(
@@ -118,7 +168,8 @@ class EnumOverrides:
         ) -> "EnumOverrides.Builder":
             """Adds a |mapper_fn| which maps field values to enums within the
             |mapped_cls|. |mapper_fn| must be a Callable which, given a string value,
-            returns an enum of class |mapped_cls| or None.
+            returns an enum of class |mapped_cls| or None. If |mapper_fn| has been
+            declared pure via @pure_enum_parsing_fn, its results are cached.
 
             Optionally, the |from_field| parameter allows values to be mapped across
             fields. For example:
@@ -132,7 +183,7 @@ class EnumOverrides:
             """
             if from_field is None:
                 from_field = mapped_cls
-            self._mapper_fns_dict[from_field].add(mapper_fn)
+            self._mapper_fns_dict[from_field].add(_with_cache_if_pure(mapper_fn))
             return self
 
         def add(
@@ -181,7 +232,7 @@ class EnumOverrides:
             self, predicate: EnumIgnorePredicate, from_field: Type[Enum]
         ) -> "EnumOverrides.Builder":
             """Marks strings matching |predicate| as ignored values for |from_field| enum class."""
-            self._ignore_predicates_dict[from_field].add(predicate)
+            self._ignore_predicates_dict[from_field].add(_with_cache_if_pure(predicate))
             return self
 
         def ignore(
@@ -15,10 +15,11 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 # ============================================================================
 """Utils for parsing dates."""
+import bisect
 import datetime
 import re
 from abc import ABCMeta, abstractmethod
-from typing import List, Optional, Tuple, TypeVar
+from typing import Iterable, List, Optional, Tuple, TypeVar
 
 import attr
 
@@ -262,6 +263,95 @@ class DateRangeDiff:
         return parts
 
 
+@attr.s(frozen=True)
+class DateRangeUnion:
+    """Object representing the union of a collection of date ranges, stored as a
+    sorted list of disjoint, non-adjacent date ranges so that whether a day or a range
+    of days is covered can be answered with a binary search."""
+
+    # Sorted, disjoint ranges that together cover every day in the union
+    merged_ranges: List[DateRange] = attr.ib()
+
+    # The lower bound of each range in merged_ranges, for bisecting
+    _lower_bounds: List[datetime.date] = attr.ib()
+
+    @_lower_bounds.default
+    def _lower_bounds_default(self) -> List[datetime.date]:
+        return [r.lower_bound_inclusive_date for r in self.merged_ranges]
+
+    @classmethod
+    def from_ranges(cls, date_ranges: Iterable[DateRange]) -> "DateRangeUnion":
+        """Builds the union of the given date ranges. Empty ranges are ignored, and
+        ranges that overlap or are adjacent to each other are merged."""
+        merged_ranges: List[DateRange] = []
+
+        for date_range in sorted(
+            date_ranges, key=lambda r: r.lower_bound_inclusive_date
+        ):
+            if (
+                date_range.lower_bound_inclusive_date
+                >= date_range.upper_bound_exclusive_date
+            ):
+                continue
+
+            if (
+                merged_ranges
+                and date_range.lower_bound_inclusive_date
+                <= merged_ranges[-1].upper_bound_exclusive_date
+            ):
+                if (
+                    date_range.upper_bound_exclusive_date
+                    > merged_ranges[-1].upper_bound_exclusive_date
+                ):
+                    merged_ranges[-1] = DateRange(
+                        lower_bound_inclusive_date=merged_ranges[
+                            -1
+                        ].lower_bound_inclusive_date,
+                        upper_bound_exclusive_date=date_range.upper_bound_exclusive_date,
+                    )
+                continue
+
+            merged_ranges.append(
+                DateRange(
+                    lower_bound_inclusive_date=date_range.lower_bound_inclusive_date,
+                    upper_bound_exclusive_date=date_range.upper_bound_exclusive_date,
+                )
+            )
+
+        return cls(merged_ranges=merged_ranges)
+
+    def _range_containing_day(self, day: datetime.date) -> Optional[DateRange]:
+        index = bisect.bisect_right(self._lower_bounds, day) - 1
+        if index < 0:
+            return None
+        date_range = self.merged_ranges[index]
+        if day >= date_range.upper_bound_exclusive_date:
+            return None
+        return date_range
+
+    def contains_day(self, day: datetime.date) -> bool:
+        """Returns True if the given day falls in any of the ranges in the union."""
+        return self._range_containing_day(day) is not None
+
+    def covers_range(self, date_range: DateRange) -> bool:
+        """Returns True if every day in the given date range falls in the union. Empty
+        ranges are never considered covered."""
+        if (
+            date_range.lower_bound_inclusive_date
+            >= date_range.upper_bound_exclusive_date
+        ):
+            return False
+
+        containing_range = self._range_containing_day(
+            date_range.lower_bound_inclusive_date
+        )
+        return (
+            containing_range is not None
+            and date_range.upper_bound_exclusive_date
+            <= containing_range.upper_bound_exclusive_date
+        )
+
+
 class DurationMixin(metaclass=ABCMeta):
     """Mixin to use if the given object has a duration"""
 
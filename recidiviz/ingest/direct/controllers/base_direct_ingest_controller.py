@@ -618,7 +618,10 @@ class BaseDirectIngestController:
                 delegate=IngestViewResultsParserDelegateImpl(
                     self.region, self.system_level.schema_type(), self.ingest_instance
                 )
-            )
+            ),
+            persist_batch_size=self.region.persist_batch_size,
+            persist_shard_size=self.region.persist_shard_size,
+            num_persist_shard_workers=self.region.num_persist_shard_workers,
         )
 
     @trace.span
@@ -20,7 +20,7 @@ results and persist the contents appropriately to the Recidiviz schema in Postgr
 
 import abc
 import csv
-from typing import Dict, Iterator, List, cast
+from typing import Dict, Hashable, Iterator, List, Optional, cast
 
 from recidiviz.big_query.big_query_results_contents_handle import (
     BigQueryResultsContentsHandle,
@@ -33,6 +33,7 @@ from recidiviz.ingest.direct.ingest_mappings.ingest_view_results_parser import (
 )
 from recidiviz.ingest.direct.types.cloud_task_args import ExtractAndMergeArgs
 from recidiviz.persistence import persistence
+from recidiviz.persistence.entity.base_entity import Entity
 from recidiviz.persistence.entity.county import entities as county_entities
 from recidiviz.persistence.entity.state import entities as state_entities
 from recidiviz.persistence.ingest_info_converter.base_converter import (
@@ -67,14 +68,46 @@ class IngestViewProcessor:
         )
 
 
+def _person_external_ids_key(entity: Entity) -> Hashable:
+    """Returns a key identifying a person tree by its external id(s). People without
+    any external ids get a unique key, so they never hold a batch open.
+    """
+    key: Hashable = None
+    if isinstance(entity, state_entities.StatePerson):
+        key = frozenset(
+            (external_id.id_type, external_id.external_id)
+            for external_id in entity.external_ids
+        )
+    elif isinstance(entity, county_entities.Person):
+        key = entity.external_id
+    return key if key else object()
+
+
 class IngestViewProcessorImpl(IngestViewProcessor):
     """Standard (new) implementation of the IngestViewProcessor, which takes ingest view
     query results and persists the contents appropriately to the Recidiviz schema in
     Postgres.
     """
 
-    def __init__(self, ingest_view_file_parser: IngestViewResultsParser):
+    def __init__(
+        self,
+        ingest_view_file_parser: IngestViewResultsParser,
+        persist_batch_size: Optional[int] = None,
+        persist_shard_size: Optional[int] = None,
+        num_persist_shard_workers: int = 1,
+    ):
         self.ingest_view_file_parser = ingest_view_file_parser
+        # If set, parsed people are persisted in batches of roughly this many trees so
+        # that the whole file never has to be held in memory at once. Each batch is
+        # persisted in its own transaction. Trees that share the same external ids and
+        # are adjacent in the input are always persisted in the same batch.
+        self.persist_batch_size = persist_batch_size
+        # If set, state people in each batch are further split into shards of at most
+        # this many people with disjoint external ids, each matched and committed in
+        # its own transaction by one of |num_persist_shard_workers| workers. See
+        # persistence.write_entities().
+        self.persist_shard_size = persist_shard_size
+        self.num_persist_shard_workers = num_persist_shard_workers
 
     def parse_and_persist_contents(
         self,
@@ -82,11 +115,27 @@ class IngestViewProcessorImpl(IngestViewProcessor):
         contents_handle: ContentsHandle,
         ingest_metadata: IngestMetadata,
     ) -> bool:
-        parsed_entities = self.ingest_view_file_parser.parse(
+        contents_iterator = self.row_iterator_from_contents_handle(contents_handle)
+        if self.persist_batch_size is None:
+            parsed_entities = self.ingest_view_file_parser.parse(
+                ingest_view_name=args.ingest_view_name,
+                contents_iterator=contents_iterator,
+            )
+            return self._persist_entities(parsed_entities, ingest_metadata)
+
+        for parsed_entities_batch in self.ingest_view_file_parser.parse_batches(
             ingest_view_name=args.ingest_view_name,
-            contents_iterator=self.row_iterator_from_contents_handle(contents_handle),
-        )
+            contents_iterator=contents_iterator,
+            batch_size=self.persist_batch_size,
+            batch_key_fn=_person_external_ids_key,
+        ):
+            if not self._persist_entities(parsed_entities_batch, ingest_metadata):
+                return False
+        return True
 
+    def _persist_entities(
+        self, parsed_entities: List[Entity], ingest_metadata: IngestMetadata
+    ) -> bool:
         if all(isinstance(e, state_entities.StatePerson) for e in parsed_entities):
             return persistence.write_entities(
                 conversion_result=EntityDeserializationResult(
@@ -99,6 +148,8 @@ class IngestViewProcessorImpl(IngestViewProcessor):
                 ),
                 ingest_metadata=ingest_metadata,
                 total_people=len(parsed_entities),
+                max_people_per_shard=self.persist_shard_size,
+                num_shard_workers=self.num_persist_shard_workers,
             )
         if all(isinstance(e, county_entities.Person) for e in parsed_entities):
             return persistence.write_entities(
@@ -237,7 +237,7 @@ class DirectIngestGCSFileSystem(Generic[GCSFileSystemType], GCSFileSystem):
         return self.gcs_file_system.download_as_bytes(path)
 
     def upload_from_string(
-        self, path: GcsfsFilePath, contents: str, content_type: str
+        self, path: GcsfsFilePath, contents: Union[str, bytes], content_type: str
     ) -> None:
         return self.gcs_file_system.upload_from_string(path, contents, content_type)
 
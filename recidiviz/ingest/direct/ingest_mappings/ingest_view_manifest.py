@@ -20,7 +20,9 @@ tree.
 """
 
 import abc
+import functools
 import json
+import operator
 import re
 from enum import Enum
 from typing import (
@@ -62,6 +64,9 @@ from recidiviz.utils.yaml_dict import YAMLDict
 
 ManifestNodeT = TypeVar("ManifestNodeT")
 
+# A function that evaluates a compiled manifest node for a single input row.
+RowEvaluator = Callable[[Dict[str, str]], ManifestNodeT]
+
 
 @attr.s(kw_only=True)
 class ManifestNode(Generic[ManifestNodeT]):
@@ -91,6 +96,15 @@ class ManifestNode(Generic[ManifestNodeT]):
         in the entity tree, parsed out of the input row.
         """
 
+    def compile_row_evaluator(self) -> RowEvaluator[Optional[ManifestNodeT]]:
+        """Returns a function that produces the same result as build_from_row() for a
+        given row. This is called once per file, so that column names, child nodes and
+        constant values can be resolved up front rather than re-dispatched through the
+        tree for every row. Subclasses on the hot path override this; by default we
+        just evaluate the node with build_from_row().
+        """
+        return self.build_from_row
+
     def columns_referenced(self) -> Set[str]:
         """Returns a set of columns that this node references. Must be overridden by
         subclasses that do not have child nodes.
@@ -133,6 +147,9 @@ class VariableManifestNode(ManifestNode[ManifestNodeT]):
     def build_from_row(self, row: Dict[str, str]) -> Optional[ManifestNodeT]:
         return self.value_manifest.build_from_row(row)
 
+    def compile_row_evaluator(self) -> RowEvaluator[Optional[ManifestNodeT]]:
+        return self.value_manifest.compile_row_evaluator()
+
     def child_manifest_nodes(self) -> List["ManifestNode"]:
         return [self.value_manifest]
 
@@ -194,6 +211,46 @@ class EntityTreeManifest(ManifestNode[EntityT]):
 
         return entity
 
+    def compile_row_evaluator(self) -> RowEvaluator[Optional[EntityT]]:
+        # Fields with literal values are the same for every row, so we fold them into
+        # the args that every entity starts from.
+        initial_args: Dict[str, DeserializableEntityFieldValue] = dict(self.common_args)
+        field_evaluators: List[Tuple[str, RowEvaluator]] = []
+        for field_name, field_manifest in self.field_manifests.items():
+            if isinstance(
+                field_manifest, (StringLiteralFieldManifest, EnumLiteralFieldManifest)
+            ):
+                literal_value = field_manifest.build_from_row({})
+                if literal_value is not None:
+                    initial_args[field_name] = literal_value
+                continue
+            field_evaluators.append(
+                (field_name, field_manifest.compile_row_evaluator())
+            )
+
+        entity_cls = self.entity_cls
+        deserialize = self.entity_factory_cls.deserialize
+        filter_predicate = self.filter_predicate
+
+        def build_entity(row: Dict[str, str]) -> Optional[EntityT]:
+            args = initial_args.copy()
+            for field_name, evaluator in field_evaluators:
+                field_value = evaluator(row)
+                if field_value is not None:
+                    args[field_name] = field_value
+
+            entity = deserialize(**args)
+
+            if not isinstance(entity, entity_cls):
+                raise ValueError(f"Unexpected type for entity: [{type(entity)}]")
+
+            if filter_predicate and filter_predicate(entity):
+                return None
+
+            return entity
+
+        return build_entity
+
     def child_manifest_nodes(self) -> List["ManifestNode"]:
         return list(self.field_manifests.values())
 
@@ -468,6 +525,18 @@ class SplitCommaSeparatedListManifest(ManifestNode[List[str]]):
         #  delimiter to be configurable.
         return column_value.split(self.DEFAULT_LIST_VALUE_DELIMITER)
 
+    def compile_row_evaluator(self) -> RowEvaluator[List[str]]:
+        column_name = self.column_name
+        delimiter = self.DEFAULT_LIST_VALUE_DELIMITER
+
+        def split_column_value(row: Dict[str, str]) -> List[str]:
+            column_value = row[column_name]
+            if not column_value:
+                return []
+            return column_value.split(delimiter)
+
+        return split_column_value
+
     def child_manifest_nodes(self) -> List["ManifestNode"]:
         return []
 
@@ -557,6 +626,32 @@ class ExpandableListItemManifest(ManifestNode[List[Entity]]):
                 result.append(entity)
         return result
 
+    def compile_row_evaluator(self) -> RowEvaluator[List[Entity]]:
+        values_evaluator = self.values_manifest.compile_row_evaluator()
+        child_entity_evaluator = self.child_entity_manifest.compile_row_evaluator()
+        loop_value_name = self.FOREACH_LOOP_VALUE_NAME
+
+        def build_entities(row: Dict[str, str]) -> List[Entity]:
+            values = values_evaluator(row)
+            if values is None:
+                raise ValueError("Unexpected null list value.")
+
+            result = []
+            if loop_value_name in row:
+                raise ValueError(
+                    f"Unexpected {loop_value_name} key value in row: {row}. "
+                    f"Nested loops not supported."
+                )
+            for value in values:
+                row[loop_value_name] = value
+                entity = child_entity_evaluator(row)
+                del row[loop_value_name]
+                if entity:
+                    result.append(entity)
+            return result
+
+        return build_entities
+
     def child_manifest_nodes(self) -> List["ManifestNode"]:
         return [self.values_manifest, self.child_entity_manifest]
 
@@ -623,6 +718,28 @@ class ListRelationshipFieldManifest(ManifestNode[List[Entity]]):
                     child_entities.append(child_entity)
         return child_entities
 
+    def compile_row_evaluator(self) -> RowEvaluator[List[Entity]]:
+        child_evaluators = [
+            (
+                isinstance(child_manifest, ExpandableListItemManifest),
+                child_manifest.compile_row_evaluator(),
+            )
+            for child_manifest in self.child_manifests
+        ]
+
+        def build_child_entities(row: Dict[str, str]) -> List[Entity]:
+            child_entities = []
+            for is_expandable, child_evaluator in child_evaluators:
+                if is_expandable:
+                    child_entities.extend(child_evaluator(row))
+                else:
+                    child_entity = child_evaluator(row)
+                    if child_entity:
+                        child_entities.append(child_entity)
+            return child_entities
+
+        return build_child_entities
+
     def child_manifest_nodes(self) -> List["ManifestNode"]:
         return self.child_manifests
 
@@ -645,6 +762,9 @@ class DirectMappingFieldManifest(ManifestNode[str]):
     def build_from_row(self, row: Dict[str, str]) -> str:
         return row[self.mapped_column]
 
+    def compile_row_evaluator(self) -> RowEvaluator[str]:
+        return operator.itemgetter(self.mapped_column)
+
     def child_manifest_nodes(self) -> List["ManifestNode"]:
         return []
 
@@ -673,6 +793,10 @@ class StringLiteralFieldManifest(ManifestNode[str]):
     def build_from_row(self, row: Dict[str, str]) -> Optional[str]:
         return self.literal_value
 
+    def compile_row_evaluator(self) -> RowEvaluator[Optional[str]]:
+        literal_value = self.literal_value
+        return lambda row: literal_value
+
     def child_manifest_nodes(self) -> List["ManifestNode"]:
         return []
 
@@ -712,6 +836,10 @@ class EnumLiteralFieldManifest(ManifestNode[EnumT]):
     def build_from_row(self, row: Dict[str, str]) -> EnumT:
         return self.enum_value
 
+    def compile_row_evaluator(self) -> RowEvaluator[EnumT]:
+        enum_value = self.enum_value
+        return lambda row: enum_value
+
     def child_manifest_nodes(self) -> List["ManifestNode"]:
         return []
 
@@ -768,10 +896,28 @@ class EnumMappingManifest(ManifestNode[EnumT]):
     # these values will never be passed to the custom parser function.
     IGNORES_KEY = "$ignore"
 
+    # The maximum number of distinct raw text values whose parsed enum values are
+    # cached by each node.
+    PARSING_CACHE_SIZE = 4096
+
     enum_cls: Type[EnumT] = attr.ib()
     enum_overrides: EnumOverrides = attr.ib()
     raw_text_field_manifest: ManifestNode[str] = attr.ib()
 
+    # LRU-cached version of _parse_raw_text(). Enum columns tend to have very few
+    # distinct values, so this saves re-parsing the same value for every row. Only
+    # set when the parsed value is fully determined by the raw text, i.e. the custom
+    # parser function, if any, has been declared pure.
+    _cached_parse_raw_text_fn: Optional[
+        Callable[[Optional[str]], Optional[EnumT]]
+    ] = attr.ib(init=False, default=None, eq=False, repr=False)
+
+    def __attrs_post_init__(self) -> None:
+        if self.enum_overrides.is_cacheable(self.enum_cls):
+            self._cached_parse_raw_text_fn = functools.lru_cache(
+                maxsize=self.PARSING_CACHE_SIZE
+            )(self._parse_raw_text)
+
     @property
     def result_type(self) -> Type[EnumT]:
         return self.enum_cls
@@ -780,12 +926,31 @@ class EnumMappingManifest(ManifestNode[EnumT]):
         return {_raw_text_field_name(field_name): self.raw_text_field_manifest}
 
     def build_from_row(self, row: Dict[str, str]) -> Optional[EnumT]:
+        raw_text = self.raw_text_field_manifest.build_from_row(row)
+        if self._cached_parse_raw_text_fn:
+            return self._cached_parse_raw_text_fn(raw_text)
+        return self._parse_raw_text(raw_text)
+
+    def compile_row_evaluator(self) -> RowEvaluator[Optional[EnumT]]:
+        raw_text_evaluator = self.raw_text_field_manifest.compile_row_evaluator()
+        parse_raw_text_fn = self._cached_parse_raw_text_fn or self._parse_raw_text
+        return lambda row: parse_raw_text_fn(raw_text_evaluator(row))
+
+    def _parse_raw_text(self, raw_text: Optional[str]) -> Optional[EnumT]:
         return StrictEnumParser(
-            raw_text=self.raw_text_field_manifest.build_from_row(row),
+            raw_text=raw_text,
             enum_cls=self.enum_cls,
             enum_overrides=self.enum_overrides,
         ).parse()
 
+    def parsing_cache_info(self) -> Optional["functools._CacheInfo"]:
+        """Returns hit / miss statistics for the cache of parsed enum values, or None
+        if parsed values are not cached for this node.
+        """
+        if not self._cached_parse_raw_text_fn:
+            return None
+        return self._cached_parse_raw_text_fn.cache_info()  # type: ignore[attr-defined]
+
     def child_manifest_nodes(self) -> List["ManifestNode"]:
         return [self.raw_text_field_manifest]
 
@@ -969,6 +1134,20 @@ class CustomFunctionManifest(ManifestNode[ManifestNodeT]):
         }
         return self.function(**kwargs)
 
+    def compile_row_evaluator(self) -> RowEvaluator[Optional[ManifestNodeT]]:
+        kwarg_evaluators = [
+            (key, manifest.compile_row_evaluator())
+            for key, manifest in self.kwarg_manifests.items()
+        ]
+        function = self.function
+
+        def call_function(row: Dict[str, str]) -> Optional[ManifestNodeT]:
+            return function(
+                **{key: evaluator(row) for key, evaluator in kwarg_evaluators}
+            )
+
+        return call_function
+
     def child_manifest_nodes(self) -> List["ManifestNode"]:
         return list(self.kwarg_manifests.values())
 
@@ -1172,6 +1351,26 @@ class ConcatenatedStringsManifest(ManifestNode[str]):
 
         return self.separator.join(values)
 
+    def compile_row_evaluator(self) -> RowEvaluator[str]:
+        value_evaluators = [
+            value_manifest.compile_row_evaluator()
+            for value_manifest in self.value_manifests
+        ]
+        separator = self.separator
+        null_value = str(None).upper() if self.include_nulls else None
+
+        def concatenate(row: Dict[str, str]) -> str:
+            values = []
+            for value_evaluator in value_evaluators:
+                value = value_evaluator(row)
+                if value:
+                    values.append(value)
+                elif null_value:
+                    values.append(null_value)
+            return separator.join(values)
+
+        return concatenate
+
     def child_manifest_nodes(self) -> List["ManifestNode"]:
         return self.value_manifests
 
@@ -1412,6 +1611,20 @@ class ContainsConditionManifest(ManifestNode[bool]):
 
         return value in options
 
+    def compile_row_evaluator(self) -> RowEvaluator[bool]:
+        value_evaluator = self.value_manifest.compile_row_evaluator()
+        if all(
+            isinstance(m, StringLiteralFieldManifest) for m in self.options_manifests
+        ):
+            # Options are almost always literals, so we can build the set just once.
+            literal_options = {m.build_from_row({}) for m in self.options_manifests}
+            return lambda row: value_evaluator(row) in literal_options
+
+        option_evaluators = [m.compile_row_evaluator() for m in self.options_manifests]
+        return lambda row: value_evaluator(row) in {
+            option_evaluator(row) for option_evaluator in option_evaluators
+        }
+
     def child_manifest_nodes(self) -> List["ManifestNode"]:
         return [self.value_manifest, *self.options_manifests]
 
@@ -1461,6 +1674,10 @@ class IsNullConditionManifest(ManifestNode[bool]):
         value = self.value_manifest.build_from_row(row)
         return not bool(value)
 
+    def compile_row_evaluator(self) -> RowEvaluator[bool]:
+        value_evaluator = self.value_manifest.compile_row_evaluator()
+        return lambda row: not bool(value_evaluator(row))
+
     def child_manifest_nodes(self) -> List["ManifestNode"]:
         return [self.value_manifest]
 
@@ -1513,6 +1730,21 @@ class EqualsConditionManifest(ManifestNode[bool]):
             for value_manifest in self.value_manifests[1:]
         )
 
+    def compile_row_evaluator(self) -> RowEvaluator[bool]:
+        first_value_evaluator, *other_value_evaluators = [
+            value_manifest.compile_row_evaluator()
+            for value_manifest in self.value_manifests
+        ]
+
+        def all_equal(row: Dict[str, str]) -> bool:
+            first_value = first_value_evaluator(row)
+            return all(
+                first_value == value_evaluator(row)
+                for value_evaluator in other_value_evaluators
+            )
+
+        return all_equal
+
     def child_manifest_nodes(self) -> List["ManifestNode"]:
         return self.value_manifests
 
@@ -1570,6 +1802,15 @@ class AndConditionManifest(ManifestNode[bool]):
             for value_manifest in self.condition_manifests
         )
 
+    def compile_row_evaluator(self) -> RowEvaluator[bool]:
+        condition_evaluators = [
+            condition_manifest.compile_row_evaluator()
+            for condition_manifest in self.condition_manifests
+        ]
+        return lambda row: all(
+            condition_evaluator(row) for condition_evaluator in condition_evaluators
+        )
+
     def child_manifest_nodes(self) -> List["ManifestNode"]:
         return self.condition_manifests
 
@@ -1627,6 +1868,15 @@ class OrConditionManifest(ManifestNode[bool]):
             for value_manifest in self.condition_manifests
         )
 
+    def compile_row_evaluator(self) -> RowEvaluator[bool]:
+        condition_evaluators = [
+            condition_manifest.compile_row_evaluator()
+            for condition_manifest in self.condition_manifests
+        ]
+        return lambda row: any(
+            condition_evaluator(row) for condition_evaluator in condition_evaluators
+        )
+
     def child_manifest_nodes(self) -> List["ManifestNode"]:
         return self.condition_manifests
 
@@ -1672,6 +1922,10 @@ class InvertConditionManifest(ManifestNode[bool]):
     def build_from_row(self, row: Dict[str, str]) -> bool:
         return not self.condition_manifest.build_from_row(row)
 
+    def compile_row_evaluator(self) -> RowEvaluator[bool]:
+        condition_evaluator = self.condition_manifest.compile_row_evaluator()
+        return lambda row: not condition_evaluator(row)
+
     def child_manifest_nodes(self) -> List["ManifestNode"]:
         return [self.condition_manifest]
 
@@ -1697,6 +1951,10 @@ class BooleanLiteralManifest(ManifestNode[bool]):
     def build_from_row(self, row: Dict[str, str]) -> bool:
         return self.value
 
+    def compile_row_evaluator(self) -> RowEvaluator[bool]:
+        value = self.value
+        return lambda row: value
+
     def child_manifest_nodes(self) -> List["ManifestNode"]:
         return []
 
@@ -1790,6 +2048,37 @@ class BooleanConditionManifest(ManifestNode[ManifestNodeT]):
 
         return self.else_manifest.build_from_row(row)
 
+    def compile_row_evaluator(self) -> RowEvaluator[Optional[ManifestNodeT]]:
+        if isinstance(self.condition_manifest, BooleanLiteralManifest):
+            # Conditions on environment properties have the same result for every row,
+            # so only the branch that will be taken needs to be compiled.
+            if self.condition_manifest.value:
+                return self.then_manifest.compile_row_evaluator()
+            if not self.else_manifest:
+                return lambda row: None
+            return self.else_manifest.compile_row_evaluator()
+
+        condition_evaluator = self.condition_manifest.compile_row_evaluator()
+        then_evaluator = self.then_manifest.compile_row_evaluator()
+        else_evaluator = (
+            self.else_manifest.compile_row_evaluator() if self.else_manifest else None
+        )
+
+        def evaluate_branch(row: Dict[str, str]) -> Optional[ManifestNodeT]:
+            condition = condition_evaluator(row)
+            if condition is None:
+                raise ValueError("Condition manifest should not return None.")
+
+            if condition:
+                return then_evaluator(row)
+
+            if not else_evaluator:
+                return None
+
+            return else_evaluator(row)
+
+        return evaluate_branch
+
     def child_manifest_nodes(self) -> List["ManifestNode"]:
         manifests: List[ManifestNode] = [self.condition_manifest, self.then_manifest]
         if self.else_manifest:
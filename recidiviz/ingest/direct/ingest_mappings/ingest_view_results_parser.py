@@ -17,8 +17,9 @@
 """Class that parses the results of an ingest view query into entities based on the
 manifest file for this ingest view.
 """
+import logging
 import os
-from typing import Dict, Iterator, List, Set, Tuple
+from typing import Callable, Dict, Hashable, Iterator, List, Optional, Set, Tuple
 
 from more_itertools import one
 
@@ -27,6 +28,8 @@ from recidiviz.ingest.direct.ingest_mappings import yaml_schema
 from recidiviz.ingest.direct.ingest_mappings.ingest_view_manifest import (
     EntityTreeManifest,
     EntityTreeManifestFactory,
+    EnumMappingManifest,
+    ManifestNode,
     VariableManifestNode,
     build_manifest_from_raw_typed,
 )
@@ -56,17 +59,104 @@ class IngestViewResultsParser:
         """Parses ingest view query results into entities based on the manifest file for
         this ingest view.
         """
+        return list(
+            self.iter_parse(
+                ingest_view_name=ingest_view_name, contents_iterator=contents_iterator
+            )
+        )
 
+    def iter_parse(
+        self, *, ingest_view_name: str, contents_iterator: Iterator[Dict[str, str]]
+    ) -> Iterator[Entity]:
+        """Lazily parses ingest view query results into entities based on the manifest
+        file for this ingest view, yielding one entity tree per input row.
+        """
         manifest_path = self.delegate.get_ingest_view_manifest_path(ingest_view_name)
         output_manifest, expected_input_columns = self.parse_manifest(manifest_path)
-        result = []
+        # Resolve the manifest into a single row evaluator up front so that each row
+        # does not have to recurse through every node of the manifest tree.
+        build_output_tree = output_manifest.compile_row_evaluator()
         for i, row in enumerate(contents_iterator):
-            self._validate_row_columns(i, row, expected_input_columns)
-            output_tree = output_manifest.build_from_row(row)
+            # Comparing the keys view against the expected set does not allocate, so
+            # we only build the (much more expensive) column diffs for invalid rows.
+            if row.keys() != expected_input_columns:
+                self._validate_row_columns(i, row, expected_input_columns)
+            output_tree = build_output_tree(row)
             if not output_tree:
                 raise ValueError("Unexpected null output tree for row.")
-            result.append(output_tree)
-        return result
+            yield output_tree
+
+        self._log_enum_parsing_cache_stats(ingest_view_name, output_manifest)
+
+    def parse_batches(
+        self,
+        *,
+        ingest_view_name: str,
+        contents_iterator: Iterator[Dict[str, str]],
+        batch_size: int,
+        batch_key_fn: Optional[Callable[[Entity], Hashable]] = None,
+    ) -> Iterator[List[Entity]]:
+        """Lazily parses ingest view query results into entities based on the manifest
+        file for this ingest view, yielding lists of at most |batch_size| entity trees
+        so that only one batch needs to be held in memory at a time.
+
+        If |batch_key_fn| is provided, consecutive entity trees with the same key are
+        never split across batches. If the input rows are sorted by that key (e.g. a
+        person external id), all trees for a given key land in the same batch. A batch
+        may exceed |batch_size| if a single key has more than |batch_size| trees.
+        """
+        if batch_size <= 0:
+            raise ValueError(f"Batch size must be positive, found [{batch_size}].")
+
+        batch: List[Entity] = []
+        batch_key: Optional[Hashable] = None
+        for output_tree in self.iter_parse(
+            ingest_view_name=ingest_view_name, contents_iterator=contents_iterator
+        ):
+            key = batch_key_fn(output_tree) if batch_key_fn else None
+            if len(batch) >= batch_size and (batch_key_fn is None or key != batch_key):
+                yield batch
+                batch = []
+            batch.append(output_tree)
+            batch_key = key
+
+        if batch:
+            yield batch
+
+    @staticmethod
+    def _log_enum_parsing_cache_stats(
+        ingest_view_name: str, output_manifest: EntityTreeManifest
+    ) -> None:
+        """Logs the combined hit / miss statistics of the enum parsing caches for all
+        enum mappings in this manifest.
+        """
+        hits = misses = num_uncached_enum_mappings = 0
+        # Nodes may be reachable via multiple paths (e.g. if referenced by variables)
+        visited_node_ids: Set[int] = set()
+        nodes_to_visit: List[ManifestNode] = [output_manifest]
+        while nodes_to_visit:
+            node = nodes_to_visit.pop()
+            if id(node) in visited_node_ids:
+                continue
+            visited_node_ids.add(id(node))
+            nodes_to_visit.extend(node.child_manifest_nodes())
+            if not isinstance(node, EnumMappingManifest):
+                continue
+            cache_info = node.parsing_cache_info()
+            if cache_info is None:
+                num_uncached_enum_mappings += 1
+                continue
+            hits += cache_info.hits
+            misses += cache_info.misses
+
+        logging.info(
+            "Enum parsing cache for ingest view [%s]: [%d] hits, [%d] misses. Found "
+            "[%d] enum mappings with uncached (non-pure) custom parsers.",
+            ingest_view_name,
+            hits,
+            misses,
+            num_uncached_enum_mappings,
+        )
 
     @staticmethod
     def _validate_row_columns(
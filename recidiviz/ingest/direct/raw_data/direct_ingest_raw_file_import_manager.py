@@ -20,15 +20,19 @@ import datetime
 import logging
 import os
 import re
+import time
 from enum import Enum
 from types import ModuleType
 from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 import attr
+import numpy as np
 import pandas as pd
 from google.api_core.exceptions import BadRequest
 from google.cloud import bigquery
 from more_itertools import one
+from opencensus.stats import aggregation, measure
+from opencensus.stats import view as opencensus_view
 
 from recidiviz.big_query.big_query_client import BigQueryClient
 from recidiviz.big_query.big_query_utils import normalize_column_name_for_bq
@@ -38,6 +42,7 @@ from recidiviz.cloud_storage.gcsfs_csv_reader import (
     GcsfsCsvReader,
 )
 from recidiviz.cloud_storage.gcsfs_csv_reader_delegates import (
+    ChunkFileFormat,
     ReadOneGcsfsCsvReaderDelegate,
     SplittingGcsfsCsvReaderDelegate,
 )
@@ -59,6 +64,7 @@ from recidiviz.ingest.direct.types.direct_ingest_constants import (
     UPDATE_DATETIME_COL_NAME,
 )
 from recidiviz.persistence.entity.operations.entities import DirectIngestRawFileMetadata
+from recidiviz.utils import monitoring
 from recidiviz.utils.regions import Region
 from recidiviz.utils.yaml_dict import YAMLDict
 
@@ -163,6 +169,49 @@ class RawTableColumnInfo:
 
 _DEFAULT_BQ_UPLOAD_CHUNK_SIZE = 250000
 
+# The number of threads used to upload transformed chunks of a raw data file to GCS
+# while later chunks are still being parsed and transformed.
+_RAW_DATA_CHUNK_UPLOAD_THREADS = 4
+
+# Maps the format of the temp files raw data is written to before loading into BQ to
+# the BQ load job source format.
+_BQ_SOURCE_FORMAT_FOR_TEMP_FILE_FORMAT = {
+    ChunkFileFormat.CSV: bigquery.SourceFormat.CSV,
+    ChunkFileFormat.PARQUET: bigquery.SourceFormat.PARQUET,
+}
+
+m_raw_data_temp_file_bytes = measure.MeasureInt(
+    "ingest/raw_data/temp_file_bytes",
+    "The total size of the temp files a raw data file is written to before loading into BigQuery",
+    "By",
+)
+
+m_raw_data_load_job_duration = measure.MeasureFloat(
+    "ingest/raw_data/load_job_duration",
+    "The time spent waiting for the BigQuery load job for a raw data file",
+    "s",
+)
+
+raw_data_temp_file_bytes_view = opencensus_view.View(
+    "ingest/raw_data/temp_file_bytes",
+    "The distribution of the total size of raw data temp files per imported file",
+    [monitoring.TagKey.REGION, monitoring.TagKey.RAW_DATA_TEMP_FILE_FORMAT],
+    m_raw_data_temp_file_bytes,
+    aggregation.DistributionAggregation(monitoring.exponential_buckets(1024, 4, 15)),
+)
+
+raw_data_load_job_duration_view = opencensus_view.View(
+    "ingest/raw_data/load_job_duration",
+    "The distribution of the duration of raw data BigQuery load jobs",
+    [monitoring.TagKey.REGION, monitoring.TagKey.RAW_DATA_TEMP_FILE_FORMAT],
+    m_raw_data_load_job_duration,
+    aggregation.DistributionAggregation(monitoring.exponential_buckets(1, 2, 14)),
+)
+
+monitoring.register_views(
+    [raw_data_temp_file_bytes_view, raw_data_load_job_duration_view]
+)
+
 
 @attr.s(frozen=True)
 class DirectIngestRawFileConfig:
@@ -232,6 +281,15 @@ class DirectIngestRawFileConfig:
     # A comma-separated string representation of the primary keys
     primary_key_str: str = attr.ib()
 
+    # The format of the temp files this file is split into before being loaded into
+    # BigQuery. Parquet files carry explicit string / NULL typing, so they avoid the
+    # CSV quoting and escaping work and are smaller and faster for BigQuery to load.
+    # Defaults to CSV.
+    import_temp_file_format: ChunkFileFormat = attr.ib(
+        default=ChunkFileFormat.CSV,
+        validator=attr.validators.instance_of(ChunkFileFormat),
+    )
+
     @primary_key_str.default
     def _primary_key_str(self) -> str:
         return ", ".join(self.primary_key_cols)
@@ -314,6 +372,7 @@ class DirectIngestRawFileConfig:
         default_infer_columns_from_config: Optional[bool],
         file_config_dict: YAMLDict,
         yaml_filename: str,
+        default_import_temp_file_format: Optional[str] = None,
     ) -> "DirectIngestRawFileConfig":
         """Returns a DirectIngestRawFileConfig built from a YAMLDict"""
         primary_key_cols = file_config_dict.pop("primary_key_cols", list)
@@ -350,6 +409,9 @@ class DirectIngestRawFileConfig:
         infer_columns_from_config = file_config_dict.pop_optional(
             "infer_columns_from_config", bool
         )
+        import_temp_file_format = file_config_dict.pop_optional(
+            "import_temp_file_format", str
+        )
 
         if len(file_config_dict) > 0:
             raise ValueError(
@@ -407,6 +469,15 @@ class DirectIngestRawFileConfig:
                 if default_infer_columns_from_config is not None
                 else False
             ),
+            import_temp_file_format=ChunkFileFormat(
+                import_temp_file_format
+                if import_temp_file_format is not None
+                else (
+                    default_import_temp_file_format
+                    if default_import_temp_file_format is not None
+                    else ChunkFileFormat.CSV.value
+                )
+            ),
         )
 
 
@@ -433,6 +504,11 @@ class DirectIngestRawFileDefaultConfig:
     default_infer_columns_from_config: Optional[bool] = attr.ib(
         default=None, validator=attr_validators.is_opt_bool
     )
+    # The default format of the temp files raw files from this region are split into
+    # before being loaded into BigQuery
+    default_import_temp_file_format: Optional[str] = attr.ib(
+        default=None, validator=attr_validators.is_opt_str
+    )
 
 
 @attr.s
@@ -466,6 +542,9 @@ class DirectIngestRegionRawFileConfig:
         default_infer_columns_from_config = default_contents.pop_optional(
             "default_infer_columns_from_config", bool
         )
+        default_import_temp_file_format = default_contents.pop_optional(
+            "default_import_temp_file_format", str
+        )
 
         return DirectIngestRawFileDefaultConfig(
             filename=default_filename,
@@ -475,6 +554,7 @@ class DirectIngestRegionRawFileConfig:
             default_ignore_quotes=default_ignore_quotes,
             default_infer_columns_from_config=default_infer_columns_from_config,
             default_always_historical_export=default_always_historical_export,
+            default_import_temp_file_format=default_import_temp_file_format,
         )
 
     def _region_ingest_dir(self) -> str:
@@ -534,6 +614,7 @@ class DirectIngestRegionRawFileConfig:
                     default_config.default_infer_columns_from_config,
                     yaml_contents,
                     filename,
+                    default_config.default_import_temp_file_format,
                 )
         else:
             raise ValueError(
@@ -609,7 +690,14 @@ class DirectIngestRawFileImportManager:
         if temp_output_paths:
             if not columns:
                 raise ValueError("Found delegate output_columns is unexpectedly None.")
-            self._load_contents_to_bigquery(parts.file_tag, temp_output_paths, columns)
+            self._load_contents_to_bigquery(
+                parts.file_tag,
+                temp_output_paths,
+                columns,
+                self.region_raw_file_config.raw_file_configs[
+                    parts.file_tag
+                ].import_temp_file_format,
+            )
 
         migration_queries = self.raw_table_migrations.get(parts.file_tag, [])
         logging.info(
@@ -640,7 +728,11 @@ class DirectIngestRawFileImportManager:
         columns = self._get_validated_columns(path, file_config)
 
         delegate = DirectIngestRawDataSplittingGcsfsCsvReaderDelegate(
-            path, self.fs, file_metadata, self.temp_output_directory_path
+            path,
+            self.fs,
+            file_metadata,
+            self.temp_output_directory_path,
+            output_format=file_config.import_temp_file_format,
         )
 
         self.csv_reader.streaming_read(
@@ -655,6 +747,22 @@ class DirectIngestRawFileImportManager:
             **self._common_read_csv_kwargs(file_config),
         )
 
+        logging.info(
+            "Wrote [%s] bytes of [%s] temp files for [%s]",
+            delegate.output_bytes,
+            file_config.import_temp_file_format.value,
+            path.abs_path(),
+        )
+        with monitoring.measurements(
+            {
+                monitoring.TagKey.REGION: self.region.region_code,
+                monitoring.TagKey.RAW_DATA_TEMP_FILE_FORMAT: file_config.import_temp_file_format.value,
+            }
+        ) as measurements:
+            measurements.measure_int_put(
+                m_raw_data_temp_file_bytes, delegate.output_bytes
+            )
+
         return delegate.output_paths, delegate.output_columns
 
     def _delete_conflicting_contents_from_bigquery(
@@ -686,7 +794,11 @@ class DirectIngestRawFileImportManager:
         delete_job.result()
 
     def _load_contents_to_bigquery(
-        self, file_tag: str, temp_output_paths: List[GcsfsFilePath], columns: List[str]
+        self,
+        file_tag: str,
+        temp_output_paths: List[GcsfsFilePath],
+        columns: List[str],
+        temp_file_format: ChunkFileFormat,
     ) -> None:
         """Loads the contents in the given handle to the appropriate table in BigQuery."""
 
@@ -703,6 +815,7 @@ class DirectIngestRawFileImportManager:
                     columns
                 ),
                 write_disposition=bigquery.WriteDisposition.WRITE_APPEND,
+                source_format=_BQ_SOURCE_FORMAT_FOR_TEMP_FILE_FORMAT[temp_file_format],
             )
         except Exception as e:
             logging.error("Failed to start load job - cleaning up temp paths")
@@ -716,12 +829,25 @@ class DirectIngestRawFileImportManager:
                 len(temp_output_paths),
                 load_job.destination,
             )
+            start = time.perf_counter()
             load_job.result()
+            load_duration_seconds = time.perf_counter() - start
             logging.info(
-                "[%s] BigQuery load of [%s] paths complete",
+                "[%s] BigQuery load of [%s] [%s] paths complete in [%.1f] seconds",
                 datetime.datetime.now().isoformat(),
                 len(temp_output_paths),
+                temp_file_format.value,
+                load_duration_seconds,
             )
+            with monitoring.measurements(
+                {
+                    monitoring.TagKey.REGION: self.region.region_code,
+                    monitoring.TagKey.RAW_DATA_TEMP_FILE_FORMAT: temp_file_format.value,
+                }
+            ) as measurements:
+                measurements.measure_float_put(
+                    m_raw_data_load_job_duration, load_duration_seconds
+                )
         except BadRequest as e:
             logging.error(
                 "Insert job [%s] failed with errors: [%s]",
@@ -918,21 +1044,23 @@ class DirectIngestRawDataSplittingGcsfsCsvReaderDelegate(
         fs: DirectIngestGCSFileSystem,
         file_metadata: DirectIngestRawFileMetadata,
         temp_output_directory_path: GcsfsDirectoryPath,
+        output_format: ChunkFileFormat = ChunkFileFormat.CSV,
     ):
 
-        super().__init__(path, fs, include_header=False)
+        super().__init__(
+            path,
+            fs,
+            include_header=False,
+            num_upload_threads=_RAW_DATA_CHUNK_UPLOAD_THREADS,
+            output_format=output_format,
+        )
         self.file_metadata = file_metadata
         self.temp_output_directory_path = temp_output_directory_path
 
     def transform_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
-        # Stripping white space from all fields
-        df = df.applymap(lambda x: x.strip())
-
         num_rows_before_filter = df.shape[0]
 
-        # Filter out rows where ALL values are null / empty string. Solution largely
-        # copied from https://stackoverflow.com/a/41401892.
-        df = df[~pd.isnull(df.applymap(lambda x: None if x == "" else x)).all(axis=1)]
+        df = strip_whitespace_and_drop_empty_rows(df)
 
         num_rows_after_filter = df.shape[0]
         if num_rows_before_filter > num_rows_after_filter:
@@ -950,7 +1078,8 @@ class DirectIngestRawDataSplittingGcsfsCsvReaderDelegate(
         name, _extension = os.path.splitext(self.path.file_name)
 
         return GcsfsFilePath.from_directory_and_file_name(
-            self.temp_output_directory_path, f"temp_{name}_{chunk_num}.csv"
+            self.temp_output_directory_path,
+            f"temp_{name}_{chunk_num}.{self.output_format.value}",
         )
 
     @staticmethod
@@ -970,6 +1099,36 @@ class DirectIngestRawDataSplittingGcsfsCsvReaderDelegate(
         )
 
 
+# Applies str.strip() to every element of a numpy object array in a single C-level
+# loop, without the per-cell overhead of DataFrame.applymap().
+_strip_values = np.frompyfunc(str.strip, 1, 1)
+
+
+def strip_whitespace_and_drop_empty_rows(raw_data_df: pd.DataFrame) -> pd.DataFrame:
+    """Strips leading and trailing white space from all values in the dataframe, then
+    filters out rows where ALL values are null / empty string.
+
+    Values are stripped with str.strip(), so the output is identical to stripping
+    each cell individually, but all cells are processed in a single vectorized pass.
+    """
+    values = raw_data_df.to_numpy(dtype=object)
+    try:
+        stripped_values = _strip_values(values)
+    except TypeError:
+        # The dataframe contains non-string (e.g. null) values, which we can't strip.
+        # Fall back to column-wise stripping, which passes nulls through as-is.
+        stripped_df = raw_data_df.apply(lambda column: column.str.strip())
+        return stripped_df[~(stripped_df.isna() | (stripped_df == "")).all(axis=1)]
+
+    # Every value is a string, so a value is empty iff it is falsy
+    rows_to_keep = stripped_values.astype(bool).any(axis=1)
+    return pd.DataFrame(
+        stripped_values[rows_to_keep],
+        index=raw_data_df.index[rows_to_keep],
+        columns=raw_data_df.columns,
+    )
+
+
 def augment_raw_data_df_with_metadata_columns(
     raw_data_df: pd.DataFrame,
     file_id: int,
@@ -25,6 +25,7 @@ from typing import Callable, Dict, List, Optional, Set
 from more_itertools import one
 
 from recidiviz.common.constants.entity_enum import EnumParsingError
+from recidiviz.common.constants.enum_overrides import pure_enum_parsing_fn
 from recidiviz.common.constants.state.state_agent import StateAgentType
 from recidiviz.common.constants.state.state_incarceration_period import (
     StateIncarcerationPeriodAdmissionReason,
@@ -705,6 +706,7 @@ STR_TO_SUPERVISION_PERIOD_TERMINATION_REASON_MAPPINGS: Dict[
 ] = invert_enum_to_str_mappings(SUPERVISION_PERIOD_TERMINATION_REASON_TO_STR_MAPPINGS)
 
 
+@pure_enum_parsing_fn
 def supervision_period_admission_reason_mapper(
     label: str,
 ) -> Optional[StateSupervisionPeriodAdmissionReason]:
@@ -759,6 +761,7 @@ def supervision_period_admission_reason_mapper(
     return StateSupervisionPeriodAdmissionReason.INTERNAL_UNKNOWN
 
 
+@pure_enum_parsing_fn
 def supervision_period_termination_reason_mapper(
     label: str,
 ) -> Optional[StateSupervisionPeriodTerminationReason]:
@@ -932,6 +935,7 @@ def rank_incarceration_period_admission_reason_status_str(
     return None
 
 
+@pure_enum_parsing_fn
 def incarceration_period_admission_reason_mapper(
     status_list_str: str,
 ) -> StateIncarcerationPeriodAdmissionReason:
@@ -978,6 +982,7 @@ def incarceration_period_admission_reason_mapper(
     return one(potential_admission_reasons)
 
 
+@pure_enum_parsing_fn
 def supervising_officer_mapper(label: str) -> Optional[StateAgentType]:
     """Maps |label|, a MO specific job title, to its corresponding StateAgentType."""
     if not label:
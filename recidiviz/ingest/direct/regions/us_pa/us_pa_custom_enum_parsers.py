@@ -23,9 +23,11 @@ my_enum_field:
     $custom_parser: us_pa_custom_enum_parsers.<function name>
 """
 
+from recidiviz.common.constants.enum_overrides import pure_enum_parsing_fn
 from recidiviz.common.constants.state.state_person import StateResidencyStatus
 
 
+@pure_enum_parsing_fn
 def residency_status_from_address(raw_text: str) -> StateResidencyStatus:
     normalized_address = raw_text.upper()
     no_stable_housing_indicators = ["HOMELESS", "TRANSIENT"]
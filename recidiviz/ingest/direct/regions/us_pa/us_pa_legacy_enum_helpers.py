@@ -22,6 +22,7 @@ TODO(#8902): This file should become empty and be deleted when we have fully mig
 """
 from typing import Dict, List, Optional
 
+from recidiviz.common.constants.enum_overrides import pure_enum_parsing_fn
 from recidiviz.common.constants.state.state_assessment import StateAssessmentLevel
 from recidiviz.common.constants.state.state_incarceration_period import (
     StateIncarcerationPeriodAdmissionReason,
@@ -313,6 +314,7 @@ STR_TO_SUPERVISION_PERIOD_SUPERVISION_TYPE_MAPPINGS: Dict[
 ] = invert_enum_to_str_mappings(SUPERVISION_PERIOD_SUPERVISION_TYPE_TO_STR_MAPPINGS)
 
 
+@pure_enum_parsing_fn
 def incarceration_period_admission_reason_mapper(
     concatenated_codes: str,
 ) -> StateIncarcerationPeriodAdmissionReason:
@@ -365,6 +367,7 @@ def incarceration_period_admission_reason_mapper(
     return admission_reason
 
 
+@pure_enum_parsing_fn
 def incarceration_period_release_reason_mapper(
     concatenated_codes: str,
 ) -> StateIncarcerationPeriodReleaseReason:
@@ -444,6 +447,7 @@ def incarceration_period_release_reason_mapper(
     return _retrieve_release_reason_mapping(end_movement_code)
 
 
+@pure_enum_parsing_fn
 def incarceration_period_purpose_mapper(
     concatenated_codes: str,
 ) -> StateSpecializedPurposeForIncarceration:
@@ -504,6 +508,7 @@ def incarceration_period_purpose_mapper(
     return StateSpecializedPurposeForIncarceration.GENERAL
 
 
+@pure_enum_parsing_fn
 def supervision_period_supervision_type_mapper(
     supervision_types_str: Optional[str],
 ) -> Optional[StateSupervisionPeriodSupervisionType]:
@@ -592,6 +597,7 @@ def concatenate_ccis_incarceration_period_purpose_codes(row: Dict[str, str]) ->
     return f"{code_type}-{program_type}"
 
 
+@pure_enum_parsing_fn
 def assessment_level_mapper(
     assessment_level_raw_text: Optional[str],
 ) -> Optional[StateAssessmentLevel]:
@@ -611,6 +617,7 @@ def assessment_level_mapper(
     )
 
 
+@pure_enum_parsing_fn
 def supervision_contact_location_mapper(
     supervision_contact_location_raw_text: Optional[str],
 ) -> StateSupervisionContactLocation:
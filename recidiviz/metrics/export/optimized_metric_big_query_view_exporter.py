@@ -49,6 +49,10 @@ from recidiviz.utils import structured_logging
 # 10000 rows appears to be a reasonable balance of speed and memory usage from local testing
 QUERY_PAGE_SIZE = 10000
 
+# Number of upcoming query result pages to fetch in the background while the current page is processed. This is
+# kept small since each of the OPTIMIZED_VIEW_EXPORTER_MAX_WORKERS export threads may prefetch this many pages at once.
+QUERY_NUM_PREFETCH_PAGES = 2
+
 DEFAULT_DATA_VALUE = 0
 
 # We set this to 10 because urllib3 (used by the Google BigQuery client) has an default limit of 10 connections and
@@ -170,7 +174,10 @@ class OptimizedMetricBigQueryViewExporter(BigQueryViewExporter):
         )
         assemble_manifest_fn = _gen_assemble_manifest(dimension_values_by_key)
         self.bq_client.paged_read_and_process(
-            query_job, QUERY_PAGE_SIZE, assemble_manifest_fn
+            query_job,
+            QUERY_PAGE_SIZE,
+            assemble_manifest_fn,
+            num_prefetch_pages=QUERY_NUM_PREFETCH_PAGES,
         )
         logging.info(
             "Produced dictionary-based manifest for view: %s", export_view.view_id
@@ -204,7 +211,10 @@ class OptimizedMetricBigQueryViewExporter(BigQueryViewExporter):
             data_values, value_keys, dimension_manifest
         )
         self.bq_client.paged_read_and_process(
-            query_job, QUERY_PAGE_SIZE, place_value_in_matrix_fn
+            query_job,
+            QUERY_PAGE_SIZE,
+            place_value_in_matrix_fn,
+            num_prefetch_pages=QUERY_NUM_PREFETCH_PAGES,
         )
         logging.info(
             "Finished paged read and process for view: %s", export_view.view_id
@@ -18,12 +18,19 @@
 """Data Access Object (DAO) with logic for accessing state-level information
 from a SQL Database."""
 import datetime
+import functools
 import logging
+import time
 from collections import defaultdict
-from typing import Dict, Iterable, List, Type
+from typing import Any, Collection, Dict, Iterable, List, Set, Tuple, Type
 
-from sqlalchemy import func
-from sqlalchemy.orm import Session
+from sqlalchemy import Integer, String, and_, bindparam, func, inspect
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Query, Session, lazyload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.interfaces import MANYTOMANY, MANYTOONE, ONETOMANY
+from sqlalchemy.sql.selectable import TableValuedAlias
+from sqlalchemy.types import TypeEngine
 
 from recidiviz.persistence.database.base_schema import StateBase
 from recidiviz.persistence.database.schema.state import schema
@@ -54,31 +61,12 @@ def read_people_by_cls_external_ids(
     """
     check_not_dirty(session)
 
-    if schema_cls == schema.StatePerson:
-        schema_cls = schema.StatePersonExternalId
-
-    logging.info(
-        "[DAO] Starting read of external ids of class [%s]", schema_cls.__name__
-    )
-    person_ids_result = (
-        session.query(schema_cls.person_id)
-        .filter(schema_cls.external_id.in_(cls_external_ids))
-        .filter(schema_cls.state_code == state_code.upper())
-        .all()
+    person_ids = _read_person_ids_by_cls_external_ids(
+        session,
+        schema_cls,
+        {(state_code.upper(), external_id) for external_id in cls_external_ids},
     )
-    person_ids = [res[0] for res in person_ids_result]
-    logging.info(
-        "[DAO] Finished read of external ids of class [%s]. Found [%s] person ids.",
-        schema_cls.__name__,
-        len(person_ids),
-    )
-
-    query = session.query(schema.StatePerson).filter(
-        schema.StatePerson.person_id.in_(person_ids)
-    )
-    schema_persons = query.all()
-    logging.info("[DAO] Finished read of [%s] persons.", len(schema_persons))
-    return _normalize_record_trees(schema_persons)
+    return _read_person_trees(session, person_ids)
 
 
 def read_placeholder_persons(
@@ -100,12 +88,7 @@ def read_placeholder_persons(
         "[DAO] Finished read of placeholder person ids. Found [%s] person ids.",
         len(person_ids),
     )
-    query = session.query(schema.StatePerson).filter(
-        schema.StatePerson.person_id.in_(person_ids)
-    )
-    schema_persons = query.all()
-    logging.info("[DAO] Finished read of [%s] persons.", len(schema_persons))
-    return _normalize_record_trees(schema_persons)
+    return _read_person_trees(session, person_ids)
 
 
 def read_people(
@@ -169,19 +152,283 @@ def read_people_by_external_ids(
     """
     check_not_dirty(session)
 
-    region_to_external_ids: Dict[str, List[str]] = defaultdict(list)
-    for ingested_person in ingested_people:
-        for external_id_info in ingested_person.external_ids:
-            region_to_external_ids[external_id_info.state_code].append(
-                external_id_info.external_id
+    person_ids = _read_person_ids_by_cls_external_ids(
+        session,
+        schema.StatePerson,
+        {
+            (external_id_info.state_code.upper(), external_id_info.external_id)
+            for ingested_person in ingested_people
+            for external_id_info in ingested_person.external_ids
+        },
+    )
+    return _read_person_trees(session, person_ids)
+
+
+def _unnest(**arrays: Tuple[TypeEngine, Collection[Any]]) -> TableValuedAlias:
+    """Returns a FROM clause that expands the given arrays of values into rows with
+    Postgres unnest(), with one column per keyword argument. Joining against this sends
+    each array as a single bound parameter, rather than building an IN (...) list with
+    one parameter per value, which keeps queries over tens of thousands of ids cheap to
+    plan.
+    """
+    return (
+        func.unnest(
+            *(
+                bindparam(name, value=list(values), type_=postgresql.ARRAY(sql_type))
+                for name, (sql_type, values) in arrays.items()
+            )
+        )
+        .table_valued(*arrays.keys())
+        .render_derived()
+    )
+
+
+def _read_person_ids_by_cls_external_ids(
+    session: Session,
+    schema_cls: Type[StateBase],
+    state_code_external_id_pairs: Collection[Tuple[str, str]],
+) -> List[int]:
+    """Returns the ids of all people who have an entity of type |schema_cls| with one
+    of the given (state_code, external_id) pairs, in a single query.
+    """
+    if schema_cls == schema.StatePerson:
+        schema_cls = schema.StatePersonExternalId
+
+    logging.info(
+        "[DAO] Starting read of [%s] external ids of class [%s]",
+        len(state_code_external_id_pairs),
+        schema_cls.__name__,
+    )
+    if not state_code_external_id_pairs:
+        return []
+
+    state_codes, external_ids = zip(*state_code_external_id_pairs)
+    staged = _unnest(
+        state_code=(String, state_codes), external_id=(String, external_ids)
+    )
+    person_ids_result = (
+        session.query(schema_cls.person_id)
+        .join(
+            staged,
+            and_(
+                schema_cls.external_id == staged.c.external_id,
+                schema_cls.state_code == staged.c.state_code,
+            ),
+        )
+        .distinct()
+        .all()
+    )
+    person_ids = [res[0] for res in person_ids_result]
+    logging.info(
+        "[DAO] Finished read of external ids of class [%s]. Found [%s] person ids.",
+        schema_cls.__name__,
+        len(person_ids),
+    )
+    return person_ids
+
+
+@functools.lru_cache(maxsize=None)
+def _person_tree_classes() -> Tuple[Type[StateBase], ...]:
+    """Returns every schema class reachable from StatePerson via relationships,
+    starting with StatePerson.
+    """
+    classes: List[Type[StateBase]] = [schema.StatePerson]
+    for cls in classes:
+        for relationship in inspect(cls).relationships:
+            if relationship.mapper.class_ not in classes:
+                classes.append(relationship.mapper.class_)
+    return tuple(classes)
+
+
+def _read_person_trees(
+    session: Session, person_ids: Iterable[int]
+) -> List[schema.StatePerson]:
+    """Reads the full entity trees of the people with the given ids.
+
+    Rather than relying on the selectin relationship loaders, which issue a query per
+    relationship per 500 parent rows, this loads every table in the tree with a single
+    query keyed on person_id (or, for entities shared between people like StateAgent,
+    on the ids referenced by the loaded rows), then populates every relationship from
+    the loaded rows. The number of queries is therefore fixed by the schema, regardless
+    of how many people are read. Relationships that cannot be fully populated from the
+    loaded rows are left to be lazy-loaded as usual.
+    """
+    person_ids = sorted(set(person_ids))
+    if not person_ids:
+        return []
+
+    logging.info("[DAO] Starting read of [%s] person trees", len(person_ids))
+    start = time.perf_counter()
+    timings: List[Tuple[str, int, float]] = []
+
+    def timed_all(description: str, query: Query) -> List[Any]:
+        query_start = time.perf_counter()
+        results = query.all()
+        timings.append((description, len(results), time.perf_counter() - query_start))
+        return results
+
+    # Load every table with a person_id column, i.e. all rows in the person trees
+    # except for entities shared between people.
+    loaded: Dict[Type[StateBase], List[Any]] = {}
+    for cls in _person_tree_classes():
+        if not hasattr(cls, "person_id"):
+            continue
+        staged = _unnest(person_id=(Integer, person_ids))
+        loaded[cls] = timed_all(
+            cls.__tablename__,
+            session.query(cls)
+            .options(lazyload("*"))
+            .join(staged, cls.person_id == staged.c.person_id)
+            .order_by(*inspect(cls).primary_key),
+        )
+
+    # Load the (parent id, child id) pairs for each many-to-many relationship
+    association_pairs: Dict[Tuple[Type[StateBase], str], List[Tuple[int, int]]] = {}
+    for cls in list(loaded):
+        for relationship in inspect(cls).relationships:
+            if relationship.direction is not MANYTOMANY:
+                continue
+            ((parent_column, parent_fk_column),) = relationship.synchronize_pairs
+            ((_, child_fk_column),) = relationship.secondary_synchronize_pairs
+            parent_key = _key_for_column(cls, parent_column)
+            staged = _unnest(
+                parent_id=(Integer, [getattr(p, parent_key) for p in loaded[cls]])
+            )
+            association_pairs[(cls, relationship.key)] = timed_all(
+                f"{cls.__name__}.{relationship.key}",
+                session.query(parent_fk_column, child_fk_column)
+                .join(staged, parent_fk_column == staged.c.parent_id)
+                .order_by(child_fk_column),
             )
 
-    state_persons: List[schema.StatePerson] = []
-    for state_code, external_ids in region_to_external_ids.items():
-        state_persons += read_people_by_cls_external_ids(
-            session, state_code, schema.StatePerson, external_ids
+    # Load entities shared between people (e.g. StateAgent) that are referenced by the
+    # rows loaded so far.
+    shared_ids: Dict[Type[StateBase], Set[int]] = defaultdict(set)
+    for cls in list(loaded):
+        for relationship in inspect(cls).relationships:
+            child_cls = relationship.mapper.class_
+            if child_cls in loaded:
+                continue
+            if relationship.direction is MANYTOONE:
+                ((fk_column, _),) = relationship.local_remote_pairs
+                fk_key = _key_for_column(cls, fk_column)
+                shared_ids[child_cls].update(
+                    getattr(parent, fk_key)
+                    for parent in loaded[cls]
+                    if getattr(parent, fk_key) is not None
+                )
+            elif relationship.direction is MANYTOMANY:
+                shared_ids[child_cls].update(
+                    child_id
+                    for _, child_id in association_pairs[(cls, relationship.key)]
+                )
+    for cls, ids in shared_ids.items():
+        if not ids:
+            loaded[cls] = []
+            continue
+        (primary_key_column,) = inspect(cls).primary_key
+        staged = _unnest(id=(Integer, ids))
+        loaded[cls] = timed_all(
+            cls.__tablename__,
+            session.query(cls)
+            .options(lazyload("*"))
+            .join(staged, primary_key_column == staged.c.id)
+            .order_by(primary_key_column),
         )
-    return state_persons
+
+    _populate_relationships(loaded, association_pairs)
+
+    people = loaded[schema.StatePerson]
+    logging.info(
+        "[DAO] Finished read of [%s] person trees in [%s] queries and [%.3f] seconds. "
+        "Slowest queries: %s",
+        len(people),
+        len(timings),
+        time.perf_counter() - start,
+        ", ".join(
+            f"[{description}: {num_rows} rows in {seconds:.3f}s]"
+            for description, num_rows, seconds in sorted(
+                timings, key=lambda t: t[2], reverse=True
+            )[:5]
+        ),
+    )
+    for description, num_rows, seconds in timings:
+        logging.debug(
+            "[DAO] Read [%s] rows for [%s] in [%.3f] seconds",
+            num_rows,
+            description,
+            seconds,
+        )
+    return _normalize_record_trees(people)
+
+
+def _key_for_column(cls: Type[StateBase], column: Any) -> str:
+    return inspect(cls).get_property_by_column(column).key
+
+
+def _populate_relationships(
+    loaded: Dict[Type[StateBase], List[Any]],
+    association_pairs: Dict[Tuple[Type[StateBase], str], List[Tuple[int, int]]],
+) -> None:
+    """Sets every relationship on the |loaded| rows of classes with a person_id column
+    from the other |loaded| rows, without issuing any queries. Values are set as
+    committed state, so the session does not consider any of the rows modified.
+    """
+    by_primary_key: Dict[Type[StateBase], Dict[int, Any]] = {}
+    for cls, rows in loaded.items():
+        (primary_key_column,) = inspect(cls).primary_key
+        primary_key = _key_for_column(cls, primary_key_column)
+        by_primary_key[cls] = {getattr(row, primary_key): row for row in rows}
+
+    for cls, rows in loaded.items():
+        if not hasattr(cls, "person_id"):
+            continue
+        for relationship in inspect(cls).relationships:
+            child_cls = relationship.mapper.class_
+            if child_cls not in loaded:
+                continue
+            children_by_id = by_primary_key[child_cls]
+            if relationship.direction is MANYTOONE:
+                ((fk_column, _),) = relationship.local_remote_pairs
+                fk_key = _key_for_column(cls, fk_column)
+                for row in rows:
+                    child_id = getattr(row, fk_key)
+                    if child_id is None or child_id in children_by_id:
+                        set_committed_value(
+                            row, relationship.key, children_by_id.get(child_id)
+                        )
+            elif relationship.direction is ONETOMANY and hasattr(
+                child_cls, "person_id"
+            ):
+                ((parent_column, child_fk_column),) = relationship.local_remote_pairs
+                parent_key = _key_for_column(cls, parent_column)
+                child_fk_key = _key_for_column(child_cls, child_fk_column)
+                children_by_parent_id: Dict[int, List[Any]] = defaultdict(list)
+                for child in loaded[child_cls]:
+                    children_by_parent_id[getattr(child, child_fk_key)].append(child)
+                for row in rows:
+                    children = children_by_parent_id.get(getattr(row, parent_key), [])
+                    set_committed_value(
+                        row,
+                        relationship.key,
+                        children
+                        if relationship.uselist
+                        else next(iter(children), None),
+                    )
+            elif relationship.direction is MANYTOMANY:
+                ((parent_column, _),) = relationship.synchronize_pairs
+                parent_key = _key_for_column(cls, parent_column)
+                child_ids_by_parent_id: Dict[int, List[int]] = defaultdict(list)
+                for parent_id, child_id in association_pairs[(cls, relationship.key)]:
+                    child_ids_by_parent_id[parent_id].append(child_id)
+                for row in rows:
+                    child_ids = child_ids_by_parent_id.get(getattr(row, parent_key), [])
+                    if all(child_id in children_by_id for child_id in child_ids):
+                        set_committed_value(
+                            row,
+                            relationship.key,
+                            [children_by_id[child_id] for child_id in child_ids],
+                        )
 
 
 def _normalize_record_trees(
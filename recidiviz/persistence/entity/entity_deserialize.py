@@ -16,6 +16,7 @@
 # =============================================================================
 """Provides a decorator for augmenting Entity classes with a deserialization constructor."""
 import datetime
+import functools
 from abc import abstractmethod
 from enum import Enum
 from typing import Any, Callable, Dict, Generic, Optional, Type, TypeVar, Union
@@ -63,6 +64,51 @@ class EntityFieldConverter(Generic[T]):
         return self.conversion_function(field_value)
 
 
+@attr.s(frozen=True)
+class _DeserializableField:
+    """The type information for a single entity field that entity_deserialize() needs
+    in order to convert a value for that field.
+    """
+
+    field: attr.Attribute = attr.ib()
+    is_str: bool = attr.ib()
+    is_date: bool = attr.ib()
+    is_int: bool = attr.ib()
+    is_bool: bool = attr.ib()
+    is_enum: bool = attr.ib()
+    is_forward_ref_or_list: bool = attr.ib()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_deserializable_fields(cls: Type[Entity]) -> Dict[str, _DeserializableField]:
+    """Returns the type information for every field on |cls|, keyed by field name.
+    Inspecting the field types is expensive relative to converting a single value, so
+    we only do it once per class rather than once per deserialized entity.
+    """
+    if not is_attr_decorated(cls):
+        raise ValueError(
+            f"Can only deserialize attrs classes with entity_deserialize() - found class [{cls}]."
+        )
+
+    if not issubclass(cls, Entity):
+        raise ValueError(
+            f"Can only deserialize Entity classes with entity_deserialize() - found class [{cls}]."
+        )
+
+    return {
+        field_name: _DeserializableField(
+            field=field_,
+            is_str=is_str(field_),
+            is_date=is_date(field_),
+            is_int=is_int(field_),
+            is_bool=is_bool(field_),
+            is_enum=is_enum(field_),
+            is_forward_ref_or_list=is_forward_ref(field_) or is_list(field_),
+        )
+        for field_name, field_ in attr.fields_dict(cls).items()
+    }
+
+
 def entity_deserialize(
     cls: Type[EntityT],
     converter_overrides: Dict[str, EntityFieldConverter],
@@ -81,19 +127,13 @@ def entity_deserialize(
     |defaults| map.
     """
 
-    if not is_attr_decorated(cls):
-        raise ValueError(
-            f"Can only deserialize attrs classes with entity_deserialize() - found class [{cls}]."
-        )
-
-    if not issubclass(cls, Entity):
-        raise ValueError(
-            f"Can only deserialize Entity classes with entity_deserialize() - found class [{cls}]."
-        )
+    deserializable_fields = _get_deserializable_fields(cls)
 
     def convert_field_value(
-        field: attr.Attribute, field_value: DeserializableEntityFieldValue
+        deserializable_field: _DeserializableField,
+        field_value: DeserializableEntityFieldValue,
     ) -> Any:
+        field = deserializable_field.field
         if field_value is None:
             return None
 
@@ -113,39 +153,39 @@ def entity_deserialize(
 
         # TODO(#8905): Remove this block when ingest mappings v2 migration is complete
         if isinstance(field_value, EnumParser):
-            if is_enum(field):
+            if deserializable_field.is_enum:
                 return field_value.parse()
             raise ValueError(
                 f"Found field value [{field_value}] for field that is not an enum [{field}]."
             )
 
         if isinstance(field_value, str):
-            if is_str(field):
+            if deserializable_field.is_str:
                 return normalize(field_value)
-            if is_date(field):
+            if deserializable_field.is_date:
                 return parse_date(field_value)
-            if is_int(field):
+            if deserializable_field.is_int:
                 return parse_int(field_value)
-            if is_bool(field):
+            if deserializable_field.is_bool:
                 return parse_bool(field_value)
 
         if isinstance(field_value, Enum):
-            if is_enum(field):
+            if deserializable_field.is_enum:
                 return field_value
 
         if isinstance(field_value, datetime.date):
-            if is_date(field):
+            if deserializable_field.is_date:
                 return field_value
 
         if isinstance(field_value, int):
-            if is_int(field):
+            if deserializable_field.is_int:
                 return field_value
 
         if isinstance(field_value, bool):
-            if is_bool(field):
+            if deserializable_field.is_bool:
                 return field_value
 
-        if is_forward_ref(field) or is_list(field):
+        if deserializable_field.is_forward_ref_or_list:
             return field_value
 
         raise ValueError(
@@ -153,17 +193,7 @@ def entity_deserialize(
             f"{field_value} ({type(field_value)})."
         )
 
-    converted_args = {}
-    fields = set()
-    for field_name, field_ in attr.fields_dict(cls).items():
-        if field_name in kwargs:
-            converted_args[field_name] = convert_field_value(field_, kwargs[field_name])
-        if field_name in defaults:
-            if converted_args.get(field_name, None) is None:
-                converted_args[field_name] = defaults[field_name]
-        fields.add(field_name)
-
-    unexpected_kwargs = set(kwargs.keys()).difference(fields)
+    unexpected_kwargs = set(kwargs.keys()).difference(deserializable_fields)
     if unexpected_kwargs:
         # Throw if there are unexpected args. NOTE: if there are missing required args,
         # that will be caught by the object construction itself.
@@ -171,6 +201,15 @@ def entity_deserialize(
             f"Unexpected kwargs for class [{cls.__name__}]: {unexpected_kwargs}"
         )
 
+    converted_args = {
+        field_name: convert_field_value(deserializable_fields[field_name], field_value)
+        for field_name, field_value in kwargs.items()
+    }
+    for field_name, default in defaults.items():
+        if field_name in deserializable_fields:
+            if converted_args.get(field_name, None) is None:
+                converted_args[field_name] = default
+
     return cls(**converted_args)  # type: ignore[call-arg]
 
 
@@ -26,6 +26,7 @@ from types import ModuleType
 from typing import (
     Any,
     Dict,
+    FrozenSet,
     Iterable,
     List,
     Optional,
@@ -328,33 +329,28 @@ class EntityFieldType(Enum):
     ALL = auto()
 
 
-class CoreEntityFieldIndex:
-    """Class that caches the results of certain CoreEntity class introspection
-    functionality.
-    """
+# Process-wide cache of the field names on each CoreEntity class, by field type. The
+# entry for a class is computed in full the first time an entity of that class is
+# passed to a CoreEntityFieldIndex and is never modified afterwards.
+_FIELDS_BY_TYPE_BY_CLASS: Dict[
+    Type[CoreEntity], Dict[EntityFieldType, FrozenSet[str]]
+] = {}
 
-    def __init__(self) -> None:
-        self.state_direction_checker = (
-            SchemaEdgeDirectionChecker.state_direction_checker()
-        )
-        self.county_direction_checker = (
-            SchemaEdgeDirectionChecker.county_direction_checker()
-        )
 
-        # Cache of fields by field type for DatabaseEntity classes
-        self.database_entity_fields_by_field_type: Dict[
-            str, Dict[EntityFieldType, Set[str]]
-        ] = defaultdict(lambda: defaultdict(set))
+def _direction_checker_for_entity_name(entity_name: str) -> SchemaEdgeDirectionChecker:
+    if entity_name.startswith("state_"):
+        return SchemaEdgeDirectionChecker.state_direction_checker()
+    return SchemaEdgeDirectionChecker.county_direction_checker()
 
-        # Cache of fields by field type for Entity classes
-        self.entity_fields_by_field_type: Dict[
-            str, Dict[EntityFieldType, Set[str]]
-        ] = defaultdict(lambda: defaultdict(set))
 
-    def _direction_checker(self, entity_name: str) -> SchemaEdgeDirectionChecker:
-        if entity_name.startswith("state_"):
-            return self.state_direction_checker
-        return self.county_direction_checker
+class CoreEntityFieldIndex:
+    """Class that caches the results of certain CoreEntity class introspection
+    functionality.
+
+    The cached field names are shared by all instances in the process, so this class
+    holds no state of its own and is cheap to construct and to pickle (e.g. when it is
+    shipped to Beam workers as part of a DoFn).
+    """
 
     def get_fields_with_non_empty_values(
         self, entity: CoreEntity, entity_field_type: EntityFieldType
@@ -362,13 +358,12 @@ class CoreEntityFieldIndex:
         """Returns a set of field_names that correspond to any non-empty (nonnull or
         non-empty list) fields on the provided |entity| class that match the provided
         |entity_field_type|.
-
-        Note: This function is relatively slow for Entity type entities and should not
-        be called in a tight loop.
         """
         result = set()
+        # The field names come from the entity's own class, so we can skip the
+        # existence checks done by CoreEntity.get_field().
         for field_name in self.get_all_core_entity_fields(entity, entity_field_type):
-            v = entity.get_field(field_name)
+            v = getattr(entity, field_name)
             if isinstance(v, list):
                 if v:
                     result.add(field_name)
@@ -378,95 +373,96 @@ class CoreEntityFieldIndex:
 
     def get_all_core_entity_fields(
         self, entity: CoreEntity, entity_field_type: EntityFieldType
-    ) -> Set[str]:
+    ) -> FrozenSet[str]:
         """Returns a set of field_names that correspond to any fields (non-empty or
-        otherwise) on the provided DatabaseEntity |entity| class that match the provided
+        otherwise) on the provided |entity| class that match the provided
         |entity_field_type|. Fields are included whether or not the values are non-empty
         on the provided object.
 
-        This function is caches the results for subsequent calls.
+        The fields for each class are computed once per process and cached for all
+        subsequent calls.
         """
-        entity_name = entity.get_entity_name()
+        fields_by_type = _FIELDS_BY_TYPE_BY_CLASS.get(type(entity))
+        if fields_by_type is None:
+            fields_by_type = self._get_fields_by_type_slow(entity)
+            _FIELDS_BY_TYPE_BY_CLASS[type(entity)] = fields_by_type
+        return fields_by_type[entity_field_type]
+
+    def _get_fields_by_type_slow(
+        self, entity: CoreEntity
+    ) -> Dict[EntityFieldType, FrozenSet[str]]:
+        """Returns the field_names of every EntityFieldType on the provided |entity|
+        class.
 
+        This function is relatively slow and the results should be cached across
+        repeated calls.
+        """
         if isinstance(entity, DatabaseEntity):
-            if not self.database_entity_fields_by_field_type[entity_name][
-                entity_field_type
-            ]:
-                self.database_entity_fields_by_field_type[entity_name][
-                    entity_field_type
-                ] = self._get_all_database_entity_fields_slow(entity, entity_field_type)
-            return self.database_entity_fields_by_field_type[entity_name][
-                entity_field_type
-            ]
-
-        if isinstance(entity, Entity):
-            if not self.entity_fields_by_field_type[entity_name][entity_field_type]:
-                self.entity_fields_by_field_type[entity_name][
-                    entity_field_type
-                ] = self._get_entity_fields_with_type_slow(entity, entity_field_type)
-            return self.entity_fields_by_field_type[entity_name][entity_field_type]
-
-        raise ValueError(f"Unexpected entity type: {type(entity)}")
-
+            (
+                flat_fields,
+                foreign_keys,
+                forward_edges,
+                back_edges,
+            ) = self._get_all_database_entity_fields_slow(entity)
+        elif isinstance(entity, Entity):
+            foreign_keys = frozenset()  # Entity objects never have foreign keys
+            (
+                flat_fields,
+                forward_edges,
+                back_edges,
+            ) = self._get_entity_fields_with_type_slow(entity)
+        else:
+            raise ValueError(f"Unexpected entity type: {type(entity)}")
+
+        return {
+            EntityFieldType.FLAT_FIELD: flat_fields,
+            EntityFieldType.FOREIGN_KEYS: foreign_keys,
+            EntityFieldType.FORWARD_EDGE: forward_edges,
+            EntityFieldType.BACK_EDGE: back_edges,
+            EntityFieldType.ALL: flat_fields
+            | foreign_keys
+            | forward_edges
+            | back_edges,
+        }
+
+    @staticmethod
     def _get_all_database_entity_fields_slow(
-        self,
         entity: DatabaseEntity,
-        entity_field_type: EntityFieldType,
-    ) -> Set[str]:
-        """Returns a set of field_names that correspond to any fields (non-empty or
-        otherwise) on the provided DatabaseEntity |entity| that match the provided
-        |entity_field_type|.
-
-        This function is relatively slow and the results should be cached across
-        repeated calls.
+    ) -> Tuple[FrozenSet[str], FrozenSet[str], FrozenSet[str], FrozenSet[str]]:
+        """Returns the flat field, foreign key, forward edge and back edge field_names
+        on the provided DatabaseEntity |entity| class.
         """
-        entity_name = entity.get_entity_name()
-        direction_checker = self._direction_checker(entity_name)
+        direction_checker = _direction_checker_for_entity_name(entity.get_entity_name())
 
         back_edges = set()
         forward_edges = set()
-        flat_fields = set()
-        foreign_keys = set()
-
         for relationship_field_name in entity.get_relationship_property_names():
             if direction_checker.is_back_edge(entity, relationship_field_name):
                 back_edges.add(relationship_field_name)
             else:
                 forward_edges.add(relationship_field_name)
 
-        for foreign_key_name in entity.get_foreign_key_names():
-            foreign_keys.add(foreign_key_name)
-
-        for column_field_name in entity.get_column_property_names():
-            if column_field_name not in foreign_keys:
-                flat_fields.add(column_field_name)
-
-        if entity_field_type is EntityFieldType.FLAT_FIELD:
-            return flat_fields
-        if entity_field_type is EntityFieldType.FOREIGN_KEYS:
-            return foreign_keys
-        if entity_field_type is EntityFieldType.FORWARD_EDGE:
-            return forward_edges
-        if entity_field_type is EntityFieldType.BACK_EDGE:
-            return back_edges
-        if entity_field_type is EntityFieldType.ALL:
-            return flat_fields | foreign_keys | forward_edges | back_edges
-        raise ValueError(
-            f"Unrecognized EntityFieldType [{entity_field_type}] on entity [{entity}]"
+        foreign_keys = frozenset(entity.get_foreign_key_names())
+        flat_fields = frozenset(
+            column_field_name
+            for column_field_name in entity.get_column_property_names()
+            if column_field_name not in foreign_keys
+        )
+        return (
+            flat_fields,
+            foreign_keys,
+            frozenset(forward_edges),
+            frozenset(back_edges),
         )
 
+    @staticmethod
     def _get_entity_fields_with_type_slow(
-        self, entity: Entity, entity_field_type: EntityFieldType
-    ) -> Set[str]:
-        """Returns a set of field_names that correspond to any fields (non-empty or
-        otherwise) on the provided Entity |entity| that match the provided
-        |entity_field_type|.
-
-        This function is relatively slow and the results should be cached across
-        repeated calls.
+        entity: Entity,
+    ) -> Tuple[FrozenSet[str], FrozenSet[str], FrozenSet[str]]:
+        """Returns the flat field, forward edge and back edge field_names on the
+        provided Entity |entity| class.
         """
-        entity_name = entity.get_entity_name()
-        direction_checker = self._direction_checker(entity_name)
+        direction_checker = _direction_checker_for_entity_name(entity.get_entity_name())
 
         back_edges = set()
         forward_edges = set()
@@ -483,19 +479,7 @@ class CoreEntityFieldIndex:
             else:
                 flat_fields.add(field)
 
-        if entity_field_type is EntityFieldType.FLAT_FIELD:
-            return flat_fields
-        if entity_field_type is EntityFieldType.FOREIGN_KEYS:
-            return set()  # Entity objects never have foreign keys
-        if entity_field_type is EntityFieldType.FORWARD_EDGE:
-            return forward_edges
-        if entity_field_type is EntityFieldType.BACK_EDGE:
-            return back_edges
-        if entity_field_type is EntityFieldType.ALL:
-            return flat_fields | forward_edges | back_edges
-        raise ValueError(
-            f"Unrecognized EntityFieldType {entity_field_type} on entity [{entity}]"
-        )
+        return frozenset(flat_fields), frozenset(forward_edges), frozenset(back_edges)
 
 
 def prune_dangling_placeholders_from_tree(
@@ -15,8 +15,8 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 # =============================================================================
 """Contains utils for match database entities with ingested entities."""
-
-from typing import Callable, List, Optional, Sequence, TypeVar, cast
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Type, TypeVar, cast
 
 from recidiviz.persistence.entity.core_entity import CoreEntity
 from recidiviz.persistence.entity.entity_utils import CoreEntityFieldIndex
@@ -86,3 +86,43 @@ def get_all_matches(
             field_index=field_index,
         )
     ]
+
+
+class ExternalIdMatchIndex:
+    """Index of a list of candidate DB EntityTrees, keyed by the class and external_id
+    of the entity at the root of each tree. Used to find the DB entities that could
+    match an ingested entity with an external_id with a hash lookup, rather than by
+    comparing the ingested entity against every candidate.
+    """
+
+    def __init__(self, db_entity_trees: Sequence[EntityTree]):
+        self.num_db_entity_trees = len(db_entity_trees)
+
+        # Candidate trees keyed by (entity class, external_id), in the same order
+        # they appear in the original list.
+        self._db_entity_trees_by_key: Dict[
+            Tuple[Type[CoreEntity], str], List[EntityTree]
+        ] = defaultdict(list)
+        for db_entity_tree in db_entity_trees:
+            db_entity = db_entity_tree.entity
+            external_id = db_entity.get_external_id()
+            if external_id is not None:
+                self._db_entity_trees_by_key[(db_entity.__class__, external_id)].append(
+                    db_entity_tree
+                )
+
+    def get_candidates(self, ingested_entity: CoreEntity) -> Optional[List[EntityTree]]:
+        """Returns all indexed DB trees whose root entity has the same class and
+        external_id as the provided |ingested_entity|. These are the only trees
+        that could be an external_id match for the ingested entity, but callers
+        should still confirm the match with their matcher function.
+
+        Returns None if the |ingested_entity| has no external_id, in which case
+        the index cannot narrow down the list of candidates.
+        """
+        external_id = ingested_entity.get_external_id()
+        if external_id is None:
+            return None
+        return self._db_entity_trees_by_key.get(
+            (ingested_entity.__class__, external_id), []
+        )
@@ -136,6 +136,13 @@ class StateEntityMatcher(BaseEntityMatcher[entities.StatePerson]):
         self.session: Optional[Session] = None
 
         self.field_index = CoreEntityFieldIndex()
+
+        # Counts of ingested vs DB entity comparisons performed while looking for
+        # exact matches, and of the comparisons skipped because candidates could
+        # be looked up by external id instead.
+        self.num_match_comparisons = 0
+        self.num_match_comparisons_avoided = 0
+
         self.tree_merger = StateIngestedTreeMerger(self.field_index)
 
     def set_session(self, session: Session) -> None:
@@ -375,6 +382,12 @@ class StateEntityMatcher(BaseEntityMatcher[entities.StatePerson]):
             datetime.datetime.now().isoformat(),
         )
         matched_entities_builder = self._run_match(ingested_db_persons, db_persons)
+        logging.info(
+            "[Entity matching] Performed [%d] match comparisons, avoided [%d] "
+            "comparisons via external id lookups.",
+            self.num_match_comparisons,
+            self.num_match_comparisons_avoided,
+        )
 
         # In order to maintain the invariant that all objects are properly
         # added to the Session when we return from entity_matching we
@@ -563,11 +576,15 @@ class StateEntityMatcher(BaseEntityMatcher[entities.StatePerson]):
         individual_match_results: List[IndividualMatchResult] = []
         matched_entities_by_db_id: Dict[int, List[DatabaseEntity]] = {}
         error_count = 0
+        db_entity_tree_index = entity_matching_utils.ExternalIdMatchIndex(
+            db_entity_trees
+        )
         for ingested_entity_tree in ingested_entity_trees:
             try:
                 match_result = self._match_entity_tree(
                     ingested_entity_tree=ingested_entity_tree,
                     db_entity_trees=db_entity_trees,
+                    db_entity_tree_index=db_entity_tree_index,
                     matched_entities_by_db_ids=matched_entities_by_db_id,
                     root_entity_cls=root_entity_cls,
                 )
@@ -625,13 +642,16 @@ class StateEntityMatcher(BaseEntityMatcher[entities.StatePerson]):
         *,
         ingested_entity_tree: EntityTree,
         db_entity_trees: List[EntityTree],
+        db_entity_tree_index: Optional[entity_matching_utils.ExternalIdMatchIndex],
         matched_entities_by_db_ids: Dict[int, List[DatabaseEntity]],
         root_entity_cls: Type,
     ) -> IndividualMatchResult:
         """Attempts to match the provided |ingested_entity_tree| to one of the
         provided |db_entity_trees|. If a successful match is found, merges the
         ingested entity onto the matching database entity and performs entity
-        matching on all children of the matched entities.
+        matching on all children of the matched entities. If provided,
+        |db_entity_tree_index| is used to look up exact match candidates by
+        external id.
         Returns the results of matching as an IndividualMatchResult.
         """
 
@@ -643,7 +663,9 @@ class StateEntityMatcher(BaseEntityMatcher[entities.StatePerson]):
                 root_entity_cls=root_entity_cls,
             )
 
-        db_match_tree = self._get_match(ingested_entity_tree, db_entity_trees)
+        db_match_tree = self._get_match(
+            ingested_entity_tree, db_entity_trees, db_entity_tree_index
+        )
 
         if not db_match_tree:
             return self._match_unmatched_tree(
@@ -1110,15 +1132,34 @@ class StateEntityMatcher(BaseEntityMatcher[entities.StatePerson]):
         return cached_matches
 
     def _get_match(
-        self, ingested_entity_tree: EntityTree, db_entity_trees: List[EntityTree]
+        self,
+        ingested_entity_tree: EntityTree,
+        db_entity_trees: List[EntityTree],
+        db_entity_tree_index: Optional[
+            entity_matching_utils.ExternalIdMatchIndex
+        ] = None,
     ) -> Optional[EntityTree]:
         """With the provided |ingested_entity_tree|, this attempts to find a
         match among the provided |db_entity_trees|. If a match is found, it is
         returned.
+
+        If the ingested entity has an external id and a |db_entity_tree_index| over
+        the |db_entity_trees| is provided, only DB trees with the same external id
+        are considered for an exact match.
         """
-        db_match_candidates = db_entity_trees
+        db_match_candidates: List[EntityTree] = db_entity_trees
         if isinstance(ingested_entity_tree.entity, schema.StatePerson):
             db_match_candidates = self.get_cached_matches(ingested_entity_tree.entity)
+        elif db_entity_tree_index is not None:
+            indexed_candidates = db_entity_tree_index.get_candidates(
+                ingested_entity_tree.entity
+            )
+            if indexed_candidates is not None:
+                db_match_candidates = indexed_candidates
+                self.num_match_comparisons_avoided += (
+                    db_entity_tree_index.num_db_entity_trees - len(indexed_candidates)
+                )
+        self.num_match_comparisons += len(db_match_candidates)
 
         # Entities that can have multiple external IDs need special casing to
         # handle the fact that multiple DB entities could match the provided
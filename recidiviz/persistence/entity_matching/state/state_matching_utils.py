@@ -17,7 +17,7 @@
 """State specific utils for entity matching. Utils in this file are generic to any DatabaseEntity."""
 import logging
 from enum import Enum
-from typing import List, Optional, Sequence, Set, Type, cast
+from typing import AbstractSet, List, Optional, Sequence, Set, Type, cast
 
 from recidiviz.common.common_utils import check_all_objs_have_type
 from recidiviz.common.constants.state import enum_canonical_strings
@@ -405,22 +405,23 @@ def merge_flat_fields(
     """Merges all set non-relationship fields on the |new_entity| onto the |old_entity|.
     Returns the newly merged entity."""
 
+    fields: AbstractSet[str]
     if can_atomically_merge_entity(new_entity, field_index):
         fields = field_index.get_all_core_entity_fields(
             new_entity, EntityFieldType.FLAT_FIELD
         )
     else:
-        fields = get_explicilty_set_flat_fields(new_entity, field_index)
+        set_fields = get_explicilty_set_flat_fields(new_entity, field_index)
 
         # If an enum field is updated, always update the corresponding raw text field
         # (and vice versa), even if one of the values is null.
         new_fields = set()
-        for field_name in fields:
+        for field_name in set_fields:
             if isinstance(new_entity.get_field(field_name), Enum):
                 new_fields.add(f"{field_name}{EnumEntity.RAW_TEXT_FIELD_SUFFIX}")
             if field_name.endswith(EnumEntity.RAW_TEXT_FIELD_SUFFIX):
                 new_fields.add(field_name[: -len(EnumEntity.RAW_TEXT_FIELD_SUFFIX)])
-        fields.update(new_fields)
+        fields = set_fields | new_fields
 
     for child_field_name in fields:
         if child_field_name == old_entity.get_class_id_name():
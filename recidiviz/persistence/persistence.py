@@ -15,9 +15,13 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 # =============================================================================
 """Contains logic for communicating with the persistence layer."""
+import contextvars
 import datetime
 import logging
-from typing import Callable, Dict, List, Optional, Union
+import threading
+from concurrent import futures
+from functools import partial
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
 import psycopg2
 import sqlalchemy
@@ -50,6 +54,7 @@ from recidiviz.persistence.database_invariant_validator import (
     database_invariant_validator,
 )
 from recidiviz.persistence.entity.county import entities as county_entities
+from recidiviz.persistence.entity.state import entities as state_entities
 from recidiviz.persistence.entity_matching import entity_matching
 from recidiviz.persistence.entity_validator import entity_validator
 from recidiviz.persistence.ingest_info_converter import ingest_info_converter
@@ -418,6 +423,112 @@ def retry_transaction(
         measurements.measure_int_put(m_retries, num_retries)
 
 
+def shard_people_by_external_ids(
+    people: List[state_entities.StatePerson], max_people_per_shard: int
+) -> List[List[state_entities.StatePerson]]:
+    """Splits |people| into shards of at most |max_people_per_shard| people such that
+    no external id appears in more than one shard. People who share an external id may
+    be merged by entity matching, so they must always be matched in the same
+    transaction - a group of people linked by shared external ids that is larger than
+    |max_people_per_shard| is placed in a shard of its own.
+
+    Shards and the people within them are returned in the order they appear in
+    |people|.
+    """
+    if max_people_per_shard < 1:
+        raise ValueError(f"Invalid max_people_per_shard [{max_people_per_shard}]")
+
+    # Union-find over indices into |people|, where each group is represented by the
+    # index of its first person.
+    group_index = list(range(len(people)))
+
+    def find_group(i: int) -> int:
+        while group_index[i] != i:
+            group_index[i] = group_index[group_index[i]]
+            i = group_index[i]
+        return i
+
+    first_index_by_external_id: Dict[Tuple[str, str], int] = {}
+    for i, person in enumerate(people):
+        for external_id in person.external_ids:
+            key = (external_id.id_type, external_id.external_id)
+            first_index = first_index_by_external_id.setdefault(key, i)
+            group_a, group_b = find_group(i), find_group(first_index)
+            if group_a != group_b:
+                group_index[max(group_a, group_b)] = min(group_a, group_b)
+
+    groups: Dict[int, List[state_entities.StatePerson]] = {}
+    for i, person in enumerate(people):
+        groups.setdefault(find_group(i), []).append(person)
+
+    shards: List[List[state_entities.StatePerson]] = []
+    current_shard: List[state_entities.StatePerson] = []
+    for group in groups.values():
+        if current_shard and len(current_shard) + len(group) > max_people_per_shard:
+            shards.append(current_shard)
+            current_shard = []
+        current_shard.extend(group)
+    if current_shard:
+        shards.append(current_shard)
+    return shards
+
+
+class _ShardErrorCounts:
+    """Thread-safe tally of the entity matching and database invariant errors found in
+    each shard of a write_entities() call, so that error thresholds are applied to all
+    shards matched so far rather than to each shard. Counts are keyed by shard so that a
+    retried shard replaces, rather than adds to, the counts from its failed attempt.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entity_matching_errors: Dict[int, int] = {}
+        self._root_entities: Dict[int, int] = {}
+        self._database_invariant_errors: Dict[int, int] = {}
+        # Set once any shard exceeds an error threshold or fails. Shards that have not
+        # yet been written are skipped once this is set.
+        self._aborted = False
+
+    @property
+    def aborted(self) -> bool:
+        with self._lock:
+            return self._aborted
+
+    def abort(self) -> None:
+        """Marks the write as aborted, so that any shards that have not yet been
+        written are skipped.
+        """
+        with self._lock:
+            self._aborted = True
+
+    def record_entity_matching_errors(
+        self, shard_index: int, error_count: int, total_root_entities: int
+    ) -> Tuple[int, int]:
+        """Records the entity matching errors and number of root entities matched for a
+        shard, returning the total errors and root entities across all shards matched
+        so far. Error ratios are measured against the shards matched so far, rather than
+        the whole batch, since each shard is committed as soon as it is matched.
+        """
+        with self._lock:
+            self._entity_matching_errors[shard_index] = error_count
+            self._root_entities[shard_index] = total_root_entities
+            self._database_invariant_errors.pop(shard_index, None)
+            return (
+                sum(self._entity_matching_errors.values()),
+                sum(self._root_entities.values()),
+            )
+
+    def record_database_invariant_errors(
+        self, shard_index: int, error_count: int
+    ) -> int:
+        """Records the database invariant errors for a shard, returning the total
+        across all shards so far.
+        """
+        with self._lock:
+            self._database_invariant_errors[shard_index] = error_count
+            return sum(self._database_invariant_errors.values())
+
+
 @trace.span
 def write_ingest_info(
     ingest_info: IngestInfo,
@@ -466,6 +577,8 @@ def write_entities(
     run_txn_fn: Callable[
         [Session, MeasurementMap, Callable[[Session], bool], Optional[int]], bool
     ] = retry_transaction,
+    max_people_per_shard: Optional[int] = None,
+    num_shard_workers: int = 1,
 ) -> bool:
     """If should_persist(), persist each object in the |conversion_result|. If an object
     representing any given entity already exists, that object is merely updated via the
@@ -478,7 +591,24 @@ def write_entities(
     `retry_transaction`. `run_txn_fn` must handle the coordination of the transaction
     including, when to run the body of the transaction and when to commit or rollback
     the session.
+
+    By default, all people are matched and committed in a single transaction. If
+    |max_people_per_shard| is set (state ingest only), people are split into shards
+    with disjoint external ids (see shard_people_by_external_ids()) and each shard is
+    matched and committed in its own transaction, so that a serialization failure only
+    retries that shard. Shards are written by up to |num_shard_workers| threads, each
+    with its own session. Error thresholds are applied to the errors across all shards,
+    but shards that have already been committed when a threshold is exceeded are not
+    rolled back - the remaining shards are skipped and False is returned.
     """
+    if (
+        max_people_per_shard is not None
+        and ingest_metadata.system_level != SystemLevel.STATE
+    ):
+        raise ValueError(
+            f"Sharded writes are not supported for system level "
+            f"[{ingest_metadata.system_level}]"
+        )
 
     mtags: Dict[str, Union[bool, str]] = {
         monitoring.TagKey.SHOULD_PERSIST: should_persist(),
@@ -515,19 +645,48 @@ def write_entities(
         if not should_persist():
             return True
 
+        shards = (
+            shard_people_by_external_ids(people, max_people_per_shard)
+            if max_people_per_shard is not None and people
+            else [people]
+        )
+        shard_error_counts = _ShardErrorCounts()
+
         @trace.span
-        def match_and_write_people(session: Session) -> bool:
-            logging.info("Starting entity matching")
+        def match_and_write_people(session: Session, shard_index: int) -> bool:
+            if shard_error_counts.aborted:
+                logging.info(
+                    "Skipping shard [%s] because an error threshold was exceeded",
+                    shard_index,
+                )
+                return False
+
+            logging.info(
+                "Starting entity matching for shard [%s] of [%s]",
+                shard_index + 1,
+                len(shards),
+            )
 
             entity_matching_output = entity_matching.match(
-                session, ingest_metadata.region, people, ingest_metadata
+                session, ingest_metadata.region, shards[shard_index], ingest_metadata
             )
             output_people = entity_matching_output.people
-            total_root_entities = (
-                total_people
-                if ingest_metadata.system_level == SystemLevel.COUNTY
-                else entity_matching_output.total_root_entities
+            (
+                entity_matching_errors,
+                matched_root_entities,
+            ) = shard_error_counts.record_entity_matching_errors(
+                shard_index,
+                entity_matching_output.error_count,
+                entity_matching_output.total_root_entities,
             )
+            if ingest_metadata.system_level == SystemLevel.COUNTY:
+                total_root_entities = total_people
+            else:
+                # With multiple shards, thresholds are measured against the shards
+                # matched so far. Measuring against the whole batch would let shards
+                # be committed until their errors add up to the threshold for the
+                # whole batch.
+                total_root_entities = matched_root_entities
             logging.info(
                 "Completed entity matching with [%s] errors",
                 entity_matching_output.error_count,
@@ -542,19 +701,23 @@ def write_entities(
                 system_level=ingest_metadata.system_level,
                 conversion_result=conversion_result,
                 region_code=ingest_metadata.region,
-                entity_matching_errors=entity_matching_output.error_count,
+                entity_matching_errors=entity_matching_errors,
             ):
                 #  TODO(#1665): remove once dangling PERSIST session
                 #   investigation is complete.
                 logging.info("_should_abort_ was true after entity matching")
+                shard_error_counts.abort()
                 return False
 
             database_invariant_errors = (
-                database_invariant_validator.validate_invariants(
-                    session,
-                    ingest_metadata.system_level,
-                    ingest_metadata.region,
-                    output_people,
+                shard_error_counts.record_database_invariant_errors(
+                    shard_index,
+                    database_invariant_validator.validate_invariants(
+                        session,
+                        ingest_metadata.system_level,
+                        ingest_metadata.region,
+                        output_people,
+                    ),
                 )
             )
 
@@ -568,14 +731,15 @@ def write_entities(
                 logging.info(
                     "_should_abort_ was true after database invariant validation"
                 )
+                shard_error_counts.abort()
                 return False
 
-            if entity_matching_output.error_count:
+            if entity_matching_errors:
                 logging.warning(
                     "Proceeding with persist step even though there are [%s] entity "
                     "matching errors ([%s] error ratio).",
-                    entity_matching_output.error_count,
-                    entity_matching_output.error_count / total_root_entities,
+                    entity_matching_errors,
+                    entity_matching_errors / total_root_entities,
                 )
             if database_invariant_errors:
                 logging.warning(
@@ -594,12 +758,34 @@ def write_entities(
             logging.info("Successfully wrote to the database")
             return True
 
+        def write_shard(shard_index: int) -> bool:
+            with monitoring.measurements(dict(mtags)) as shard_measurements:
+                with SessionFactory.using_database(
+                    ingest_metadata.database_key, autocommit=False
+                ) as session:
+                    return run_txn_fn(
+                        session,
+                        shard_measurements,
+                        partial(match_and_write_people, shard_index=shard_index),
+                        5,
+                    )
+
         try:
-            with SessionFactory.using_database(
-                ingest_metadata.database_key, autocommit=False
-            ) as session:
-                if not run_txn_fn(session, measurements, match_and_write_people, 5):
-                    return False
+            if len(shards) == 1:
+                with SessionFactory.using_database(
+                    ingest_metadata.database_key, autocommit=False
+                ) as session:
+                    if not run_txn_fn(
+                        session,
+                        measurements,
+                        partial(match_and_write_people, shard_index=0),
+                        5,
+                    ):
+                        return False
+            elif not _write_shards(
+                write_shard, len(shards), num_shard_workers, shard_error_counts
+            ):
+                return False
             mtags[monitoring.TagKey.PERSISTED] = True
         except Exception as e:
             logging.exception(
@@ -612,6 +798,63 @@ def write_entities(
         return True
 
 
+def _write_shards(
+    write_shard: Callable[[int], bool],
+    num_shards: int,
+    num_workers: int,
+    shard_error_counts: _ShardErrorCounts,
+) -> bool:
+    """Writes each shard with |write_shard|, using up to |num_workers| threads.
+    Returns True if every shard was committed. If any shard raises, shards that have
+    not yet started are skipped and the first exception is re-raised once in-flight
+    shards finish.
+    """
+    logging.info(
+        "Writing [%s] shards with [%s] workers", num_shards, max(num_workers, 1)
+    )
+    results: List[bool] = []
+    if num_workers <= 1:
+        for shard_index in range(num_shards):
+            if shard_error_counts.aborted:
+                break
+            results.append(write_shard(shard_index))
+    else:
+        with futures.ThreadPoolExecutor(max_workers=num_workers) as executor:
+            # Run each shard in a copy of the current context so that monitoring tags
+            # are propagated to the worker threads.
+            shard_futures = [
+                executor.submit(
+                    contextvars.copy_context().run, write_shard, shard_index
+                )
+                for shard_index in range(num_shards)
+            ]
+            _, not_done = futures.wait(
+                shard_futures, return_when=futures.FIRST_EXCEPTION
+            )
+            if not_done:
+                shard_error_counts.abort()
+                for future in not_done:
+                    future.cancel()
+                futures.wait(not_done)
+            for future in shard_futures:
+                if future.cancelled():
+                    continue
+                exception = future.exception()
+                if exception:
+                    raise exception
+                results.append(future.result())
+
+    num_committed = sum(results)
+    if num_committed < num_shards:
+        logging.warning(
+            "Only [%s] of [%s] shards were committed before the write was aborted",
+            num_committed,
+            num_shards,
+        )
+        return False
+    return True
+
+
 def _get_total_people(
     ingest_info: IngestInfo, ingest_metadata: LegacyStateAndJailsIngestMetadata
 ) -> int:
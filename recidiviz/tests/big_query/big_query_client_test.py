@@ -140,6 +140,15 @@ class BigQueryClientImplTest(unittest.TestCase):
         self.mock_client.query.assert_called()
         self.other_mock_client.query.assert_not_called()
 
+    def test_dry_run_query(self) -> None:
+        self.bq_client.dry_run_query("some query")
+
+        self.mock_client.query.assert_called_once()
+        _, kwargs = self.mock_client.query.call_args
+        self.assertEqual("some query", kwargs["query"])
+        self.assertTrue(kwargs["job_config"].dry_run)
+        self.assertFalse(kwargs["job_config"].use_query_cache)
+
     def test_table_exists(self) -> None:
         """Check that table_exists returns True if the table exists."""
         self.mock_client.get_table.side_effect = None
@@ -234,6 +243,26 @@ class BigQueryClientImplTest(unittest.TestCase):
         self.mock_client.create_dataset.assert_not_called()
         self.mock_client.load_table_from_uri.assert_called()
 
+    def test_load_table_async_parquet(self) -> None:
+        """Test that load_table_from_cloud_storage_async only sets CSV options when
+        loading CSV files."""
+
+        self.bq_client.load_table_from_cloud_storage_async(
+            destination_dataset_ref=self.mock_dataset_ref,
+            destination_table_id=self.mock_table_id,
+            destination_table_schema=[
+                SchemaField("my_column", "STRING", "NULLABLE", None, ())
+            ],
+            source_uris=["gs://bucket/export-uri.parquet"],
+            write_disposition=bigquery.WriteDisposition.WRITE_APPEND,
+            source_format=bigquery.SourceFormat.PARQUET,
+        )
+
+        job_config = self.mock_client.load_table_from_uri.call_args[1]["job_config"]
+        self.assertEqual(bigquery.SourceFormat.PARQUET, job_config.source_format)
+        self.assertIsNone(job_config.allow_quoted_newlines)
+        self.assertIsNone(job_config.skip_leading_rows)
+
     def test_load_into_table_from_dataframe_async_create_dataset(self) -> None:
         """Test that load_into_table_from_dataframe_async tries to create a parent dataset."""
 
@@ -1172,6 +1201,43 @@ class BigQueryClientImplTest(unittest.TestCase):
             ]
         )
 
+    @mock.patch("google.cloud.bigquery.QueryJob")
+    def test_paged_read_multiple_pages_with_prefetch(
+        self, mock_query_job: mock.MagicMock
+    ) -> None:
+        rows = [
+            bigquery.table.Row(
+                ["parole", i, "10N"],
+                {"supervision_type": 0, "revocations": 1, "district": 2},
+            )
+            for i in range(5)
+        ]
+
+        def _result(max_results: int, start_index: int) -> List[bigquery.table.Row]:
+            return rows[start_index : start_index + max_results]
+
+        mock_query_job.result.side_effect = _result
+
+        processed_results = []
+
+        def _process_fn(page_rows: List[bigquery.table.Row]) -> None:
+            for row in page_rows:
+                processed_results.append(dict(row))
+
+        self.bq_client.paged_read_and_process(
+            mock_query_job, 2, _process_fn, num_prefetch_pages=2
+        )
+
+        self.assertEqual([dict(row) for row in rows], processed_results)
+        mock_query_job.result.assert_has_calls(
+            [
+                call(max_results=2, start_index=0),
+                call(max_results=2, start_index=2),
+                call(max_results=2, start_index=4),
+            ],
+            any_order=True,
+        )
+
     @mock.patch("recidiviz.big_query.big_query_client.DataTransferServiceClient")
     @mock.patch(
         "recidiviz.big_query.big_query_client.CROSS_REGION_COPY_STATUS_ATTEMPT_SLEEP_TIME_SEC",
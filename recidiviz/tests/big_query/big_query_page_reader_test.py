@@ -0,0 +1,137 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2022 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Tests for big_query_page_reader.py."""
+import unittest
+from typing import Any, List
+from unittest import mock
+
+from google.cloud import bigquery
+
+from recidiviz.big_query.big_query_page_reader import (
+    QueryJobPageReader,
+    prefetching_paged_read_and_process,
+)
+from recidiviz.tests.big_query.fakes.fake_big_query_page_reader import (
+    FakeBigQueryPageReader,
+)
+
+
+class PrefetchingPagedReadAndProcessTest(unittest.TestCase):
+    """Tests for prefetching_paged_read_and_process()."""
+
+    def setUp(self) -> None:
+        self.processed_pages: List[List[Any]] = []
+
+    def _process_page(self, rows: List[Any]) -> None:
+        self.processed_pages.append(rows)
+
+    def test_read_multiple_pages_in_order(self) -> None:
+        rows = list(range(25))
+        page_reader = FakeBigQueryPageReader(rows, latency_seconds=0.01)
+
+        stats = prefetching_paged_read_and_process(
+            page_reader, 10, self._process_page, num_prefetch_pages=3
+        )
+
+        self.assertEqual(
+            [list(range(10)), list(range(10, 20)), list(range(20, 25))],
+            self.processed_pages,
+        )
+        self.assertEqual(25, stats.num_rows)
+        self.assertEqual(3, stats.num_pages)
+        self.assertGreater(stats.rows_per_second, 0)
+
+    def test_read_pages_concurrently(self) -> None:
+        page_reader = FakeBigQueryPageReader(list(range(100)), latency_seconds=0.05)
+
+        prefetching_paged_read_and_process(
+            page_reader, 10, self._process_page, num_prefetch_pages=4
+        )
+
+        self.assertEqual(10, len(self.processed_pages))
+        self.assertGreater(page_reader.max_concurrent_reads, 1)
+        self.assertLessEqual(page_reader.max_concurrent_reads, 4)
+
+    def test_read_exact_multiple_of_page_size(self) -> None:
+        page_reader = FakeBigQueryPageReader(list(range(20)))
+
+        stats = prefetching_paged_read_and_process(
+            page_reader, 10, self._process_page, num_prefetch_pages=1
+        )
+
+        self.assertEqual([list(range(10)), list(range(10, 20))], self.processed_pages)
+        self.assertEqual(2, stats.num_pages)
+        self.assertEqual([0, 10, 20], page_reader.requested_start_indices)
+
+    def test_read_no_rows(self) -> None:
+        page_reader = FakeBigQueryPageReader([])
+
+        stats = prefetching_paged_read_and_process(
+            page_reader, 10, self._process_page, num_prefetch_pages=2
+        )
+
+        self.assertEqual([], self.processed_pages)
+        self.assertEqual(0, stats.num_rows)
+
+    def test_bounded_number_of_outstanding_pages(self) -> None:
+        page_reader = FakeBigQueryPageReader(list(range(100)))
+
+        def process_page(rows: List[Any]) -> None:
+            # Never more than num_prefetch_pages requested beyond the current page
+            self.assertLessEqual(
+                max(page_reader.requested_start_indices), rows[0] + 2 * 10
+            )
+
+        prefetching_paged_read_and_process(
+            page_reader, 10, process_page, num_prefetch_pages=2
+        )
+
+    def test_process_page_error_raised(self) -> None:
+        page_reader = FakeBigQueryPageReader(list(range(100)))
+
+        def process_page(_rows: List[Any]) -> None:
+            raise ValueError("Processing failed")
+
+        with self.assertRaisesRegex(ValueError, "Processing failed"):
+            prefetching_paged_read_and_process(
+                page_reader, 10, process_page, num_prefetch_pages=2
+            )
+
+    def test_invalid_arguments(self) -> None:
+        page_reader = FakeBigQueryPageReader(list(range(10)))
+
+        with self.assertRaises(ValueError):
+            prefetching_paged_read_and_process(
+                page_reader, 0, self._process_page, num_prefetch_pages=2
+            )
+        with self.assertRaises(ValueError):
+            prefetching_paged_read_and_process(
+                page_reader, 10, self._process_page, num_prefetch_pages=0
+            )
+
+
+class QueryJobPageReaderTest(unittest.TestCase):
+    """Tests for QueryJobPageReader."""
+
+    def test_read_page(self) -> None:
+        query_job = mock.create_autospec(bigquery.QueryJob)
+        query_job.result.return_value = iter(["row1", "row2"])
+
+        rows = QueryJobPageReader(query_job).read_page(start_index=20, page_size=10)
+
+        self.assertEqual(["row1", "row2"], rows)
+        query_job.result.assert_called_once_with(max_results=10, start_index=20)
@@ -193,6 +193,117 @@ class TestBigQueryViewDagWalker(unittest.TestCase):
         # in series.
         self.assertLess(processing_time * 5, serial_processing_time)
 
+    def _chain_and_leaves_dag_views(self) -> List[BigQueryView]:
+        """Builds views forming a DAG with a single root, a chain of three views
+        descending from the root, and five leaf views that depend only on the root.
+        """
+
+        def build(dataset_id: str, view_id: str, parent: str) -> BigQueryView:
+            return SimpleBigQueryViewBuilder(
+                dataset_id=dataset_id,
+                view_id=view_id,
+                description=f"{view_id} description",
+                view_query_template=f"SELECT * FROM `{{project_id}}.{parent}`",
+            ).build()
+
+        views = [build("dataset_root", "root", "source_dataset.source_table")]
+        parent = "dataset_root.root"
+        for i in range(3):
+            views.append(build("dataset_chain", f"chain_{i}", parent))
+            parent = f"dataset_chain.chain_{i}"
+        for i in range(5):
+            views.append(build("dataset_leaf", f"leaf_{i}", "dataset_root.root"))
+        return views
+
+    @patch(
+        "recidiviz.big_query.big_query_view_dag_walker.DAG_WALKER_MAX_WORKERS",
+        1,
+    )
+    def test_dag_process_prioritize_critical_path(self) -> None:
+        views = self._chain_and_leaves_dag_views()
+        walker = BigQueryViewDagWalker(views)
+
+        mutex = threading.Lock()
+        processing_order: List[str] = []
+
+        def process_simple(
+            view: BigQueryView, _parent_results: Dict[BigQueryView, None]
+        ) -> None:
+            with mutex:
+                processing_order.append(view.view_id)
+
+        walker.process_dag(process_simple, prioritize_critical_path=True)
+
+        # The last view in the chain has no descendants, so it has the same priority
+        # as the leaf views that were ready before it.
+        self.assertEqual(["root", "chain_0", "chain_1"], processing_order[:3])
+        self.assertEqual(len(views), len(processing_order))
+
+    @patch(
+        "recidiviz.big_query.big_query_view_dag_walker.DAG_WALKER_MAX_WORKERS",
+        1,
+    )
+    def test_dag_process_prioritize_critical_path_runtime_estimates(self) -> None:
+        views = self._chain_and_leaves_dag_views()
+        walker = BigQueryViewDagWalker(views)
+
+        mutex = threading.Lock()
+        processing_order: List[str] = []
+
+        def process_simple(
+            view: BigQueryView, _parent_results: Dict[BigQueryView, None]
+        ) -> None:
+            with mutex:
+                processing_order.append(view.view_id)
+
+        # A single slow leaf outweighs the whole chain
+        runtime_estimates_seconds = {view.address: 1.0 for view in views}
+        runtime_estimates_seconds[
+            BigQueryAddress(dataset_id="dataset_leaf", table_id="leaf_3")
+        ] = 100.0
+        walker.process_dag(
+            process_simple,
+            prioritize_critical_path=True,
+            runtime_estimates_seconds=runtime_estimates_seconds,
+        )
+
+        self.assertEqual(["root", "leaf_3", "chain_0"], processing_order[:3])
+
+    def test_dag_process_with_stats(self) -> None:
+        views = self._chain_and_leaves_dag_views()
+        walker = BigQueryViewDagWalker(views)
+
+        def process_simple(
+            view: BigQueryView, _parent_results: Dict[BigQueryView, None]
+        ) -> str:
+            time.sleep(MOCK_VIEW_PROCESS_TIME_SECONDS)
+            return view.view_id
+
+        processing_result = walker.process_dag_with_stats(
+            process_simple, prioritize_critical_path=True
+        )
+
+        self.assertEqual(
+            {view: view.view_id for view in views}, processing_result.view_results
+        )
+        self.assertEqual(set(views), set(processing_result.view_processing_stats))
+        for stats in processing_result.view_processing_stats.values():
+            self.assertGreaterEqual(stats.queue_wait_seconds, 0)
+            self.assertGreaterEqual(
+                stats.execution_seconds, MOCK_VIEW_PROCESS_TIME_SECONDS
+            )
+            self.assertLessEqual(
+                stats.end_time, processing_result.total_runtime_seconds
+            )
+
+        self.assertEqual(
+            ["root", "chain_0", "chain_1", "chain_2"],
+            [view.view_id for view in processing_result.critical_path],
+        )
+        report = processing_result.critical_path_report()
+        self.assertTrue(report.startswith(f"Processed [{len(views)}] views in"))
+        self.assertIn("dataset_chain.chain_2", report)
+
     def test_dag_does_not_process_until_parents_processed(self) -> None:
         walker = BigQueryViewDagWalker(self.all_views)
 
@@ -476,6 +587,99 @@ The following views have less restrictive projects_to_deploy than their parents:
         ).build()
         _ = BigQueryViewDagWalker([view_1, view_2, view_3])
 
+    @staticmethod
+    def _ladder_dag_views(num_levels: int) -> List[BigQueryView]:
+        """Builds views forming a DAG with |num_levels| levels of two views each,
+        where each view depends on both views in the level above it. The number
+        of distinct paths through this DAG grows exponentially with its depth.
+        """
+        views = []
+        for level in range(num_levels):
+            for i in range(2):
+                if level == 0:
+                    query = "SELECT * FROM `{project_id}.source_dataset.source_table`"
+                else:
+                    query = f"""
+            SELECT * FROM `{{project_id}}.dataset_{level - 1}.table_0`
+            JOIN `{{project_id}}.dataset_{level - 1}.table_1`
+            USING (col)"""
+                views.append(
+                    SimpleBigQueryViewBuilder(
+                        dataset_id=f"dataset_{level}",
+                        view_id=f"table_{i}",
+                        description=f"dataset_{level}.table_{i} description",
+                        view_query_template=query,
+                    ).build()
+                )
+        return views
+
+    def test_dag_no_cycle_many_paths(self) -> None:
+        views = self._ladder_dag_views(num_levels=40)
+
+        start = datetime.datetime.now()
+        dag_walker = BigQueryViewDagWalker(views)
+        end = datetime.datetime.now()
+
+        self.assertLess((end - start).total_seconds(), 5)
+        self.assertEqual(39, dag_walker.depth_for_key(DagKey.for_view(views[-1])))
+
+    def test_dag_with_cycle_many_paths(self) -> None:
+        views = self._ladder_dag_views(num_levels=40)
+        views[0] = SimpleBigQueryViewBuilder(
+            dataset_id="dataset_0",
+            view_id="table_0",
+            description="dataset_0.table_0 description",
+            view_query_template="SELECT * FROM `{project_id}.dataset_39.table_0`",
+        ).build()
+
+        with self.assertRaisesRegex(ValueError, r"^Detected cycle in graph"):
+            _ = BigQueryViewDagWalker(views)
+
+    def test_topological_order_and_depth(self) -> None:
+        dag_walker = BigQueryViewDagWalker(self.diamond_shaped_dag_views_list)
+
+        keys = [DagKey.for_view(v) for v in self.diamond_shaped_dag_views_list]
+        topological_order = dag_walker.topological_order
+        self.assertCountEqual(keys, topological_order)
+        for key in topological_order:
+            for parent_key in dag_walker.nodes_by_key[key].parent_keys:
+                if parent_key in dag_walker.nodes_by_key:
+                    self.assertLess(
+                        topological_order.index(parent_key),
+                        topological_order.index(key),
+                    )
+
+        self.assertEqual(
+            [0, 0, 1, 2, 2, 3], [dag_walker.depth_for_key(key) for key in keys]
+        )
+
+    def test_ancestor_and_descendant_keys(self) -> None:
+        dag_walker = BigQueryViewDagWalker(self.diamond_shaped_dag_views_list)
+        keys = [DagKey.for_view(v) for v in self.diamond_shaped_dag_views_list]
+
+        self.assertEqual(
+            {
+                keys[0],
+                keys[1],
+                DagKey(
+                    view_address=BigQueryAddress(
+                        dataset_id="source_dataset", table_id="source_table"
+                    )
+                ),
+                DagKey(
+                    view_address=BigQueryAddress(
+                        dataset_id="source_dataset", table_id="source_table_2"
+                    )
+                ),
+            },
+            dag_walker.ancestor_keys_for_key(keys[2]),
+        )
+        self.assertEqual(
+            {keys[2], keys[3], keys[4], keys[5]},
+            dag_walker.descendant_keys_for_key(keys[0]),
+        )
+        self.assertEqual(set(), dag_walker.descendant_keys_for_key(keys[5]))
+
     def test_populate_node_family_full_parentage(self) -> None:
         dag_walker = BigQueryViewDagWalker(self.x_shaped_dag_views_list)
 
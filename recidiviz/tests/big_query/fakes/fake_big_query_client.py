@@ -169,6 +169,7 @@ class FakeBigQueryClient(BigQueryClient):
         destination_table_schema: List[bigquery.SchemaField],
         write_disposition: bigquery.WriteDisposition,
         skip_leading_rows: int = 0,
+        source_format: str = bigquery.SourceFormat.CSV,
     ) -> bigquery.job.LoadJob:
         raise ValueError("Must be implemented for use in tests.")
 
@@ -214,11 +215,15 @@ class FakeBigQueryClient(BigQueryClient):
 
         return FakeQueryJob(run_query_fn=run_query_fn)
 
+    def dry_run_query(self, query_str: str) -> bigquery.QueryJob:
+        raise ValueError("Must be implemented for use in tests.")
+
     def paged_read_and_process(
         self,
         query_job: bigquery.QueryJob,
         page_size: int,
         process_page_fn: Callable[[List[bigquery.table.Row]], None],
+        num_prefetch_pages: int = 0,
     ) -> None:
         raise ValueError("Must be implemented for use in tests.")
 
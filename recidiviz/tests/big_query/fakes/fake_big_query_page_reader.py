@@ -0,0 +1,50 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2022 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""A fake BigQueryPageReader that serves pages from an in-memory list of rows."""
+import threading
+import time
+from typing import Any, List
+
+from recidiviz.big_query.big_query_page_reader import BigQueryPageReader
+
+
+class FakeBigQueryPageReader(BigQueryPageReader):
+    """Serves pages from an in-memory list of rows, optionally sleeping before
+    returning each page to simulate network latency."""
+
+    def __init__(self, rows: List[Any], latency_seconds: float = 0.0) -> None:
+        self.rows = rows
+        self.latency_seconds = latency_seconds
+        self._lock = threading.Lock()
+        self.requested_start_indices: List[int] = []
+        self.max_concurrent_reads = 0
+        self._num_concurrent_reads = 0
+
+    def read_page(self, start_index: int, page_size: int) -> List[Any]:
+        with self._lock:
+            self.requested_start_indices.append(start_index)
+            self._num_concurrent_reads += 1
+            self.max_concurrent_reads = max(
+                self.max_concurrent_reads, self._num_concurrent_reads
+            )
+        try:
+            if self.latency_seconds:
+                time.sleep(self.latency_seconds)
+            return self.rows[start_index : start_index + page_size]
+        finally:
+            with self._lock:
+                self._num_concurrent_reads -= 1
@@ -0,0 +1,153 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2022 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Tests for view_deploy_manifest.py."""
+import unittest
+from typing import List
+from unittest import mock
+from unittest.mock import patch
+
+from google.cloud import bigquery
+
+from recidiviz.big_query.big_query_address import BigQueryAddress
+from recidiviz.big_query.big_query_view import BigQueryView, SimpleBigQueryViewBuilder
+from recidiviz.big_query.big_query_view_dag_walker import BigQueryViewDagWalker
+from recidiviz.big_query.view_deploy_manifest import (
+    VIEW_DEPLOY_MANIFEST_TABLE_ID,
+    ViewDeployManifest,
+    compute_view_deploy_hashes,
+)
+
+_PROJECT_ID = "fake-recidiviz-project"
+
+
+class ComputeViewDeployHashesTest(unittest.TestCase):
+    """Tests for compute_view_deploy_hashes()."""
+
+    def setUp(self) -> None:
+        self.metadata_patcher = patch("recidiviz.utils.metadata.project_id")
+        self.metadata_patcher.start().return_value = _PROJECT_ID
+
+    def tearDown(self) -> None:
+        self.metadata_patcher.stop()
+
+    @staticmethod
+    def _build_views(root_query: str) -> List[BigQueryView]:
+        """Builds a root view, a child of the root view, and an unrelated view."""
+        return [
+            SimpleBigQueryViewBuilder(
+                dataset_id="dataset_1",
+                view_id="root",
+                description="root description",
+                view_query_template=root_query,
+            ).build(),
+            SimpleBigQueryViewBuilder(
+                dataset_id="dataset_2",
+                view_id="child",
+                description="child description",
+                view_query_template="SELECT * FROM `{project_id}.dataset_1.root`",
+                should_materialize=True,
+            ).build(),
+            SimpleBigQueryViewBuilder(
+                dataset_id="dataset_3",
+                view_id="unrelated",
+                description="unrelated description",
+                view_query_template="SELECT * FROM `{project_id}.source.table`",
+            ).build(),
+        ]
+
+    def test_compute_view_deploy_hashes(self) -> None:
+        views = self._build_views("SELECT * FROM `{project_id}.source.table`")
+        hashes = compute_view_deploy_hashes(BigQueryViewDagWalker(views))
+
+        self.assertEqual({v.address for v in views}, set(hashes))
+        self.assertEqual(
+            hashes,
+            compute_view_deploy_hashes(
+                BigQueryViewDagWalker(
+                    self._build_views("SELECT * FROM `{project_id}.source.table`")
+                )
+            ),
+        )
+
+    def test_compute_view_deploy_hashes_parent_changed(self) -> None:
+        views = self._build_views("SELECT * FROM `{project_id}.source.table`")
+        hashes = compute_view_deploy_hashes(BigQueryViewDagWalker(views))
+
+        updated_views = self._build_views("SELECT a FROM `{project_id}.source.table`")
+        updated_hashes = compute_view_deploy_hashes(
+            BigQueryViewDagWalker(updated_views)
+        )
+
+        root, child, unrelated = (v.address for v in views)
+        self.assertNotEqual(hashes[root], updated_hashes[root])
+        # The child's definition is unchanged but its parent's has changed
+        self.assertNotEqual(hashes[child], updated_hashes[child])
+        self.assertEqual(hashes[unrelated], updated_hashes[unrelated])
+
+
+class ViewDeployManifestTest(unittest.TestCase):
+    """Tests for ViewDeployManifest."""
+
+    def setUp(self) -> None:
+        self.mock_client = mock.MagicMock()
+        self.mock_client.project_id = _PROJECT_ID
+        self.mock_client.dataset_ref_for_id.side_effect = (
+            lambda dataset_id: bigquery.DatasetReference(_PROJECT_ID, dataset_id)
+        )
+        self.manifest = ViewDeployManifest(self.mock_client)
+
+    def test_load_deployed_hashes_no_table(self) -> None:
+        self.mock_client.table_exists.return_value = False
+
+        self.assertEqual({}, self.manifest.load_deployed_hashes())
+        self.mock_client.run_query_async.assert_not_called()
+
+    def test_load_deployed_hashes(self) -> None:
+        self.mock_client.table_exists.return_value = True
+        self.mock_client.run_query_async.return_value = [
+            {"dataset_id": "dataset_1", "view_id": "view_1", "view_hash": "abc"},
+            {"dataset_id": "dataset_2", "view_id": "view_2", "view_hash": "def"},
+        ]
+
+        self.assertEqual(
+            {
+                BigQueryAddress(dataset_id="dataset_1", table_id="view_1"): "abc",
+                BigQueryAddress(dataset_id="dataset_2", table_id="view_2"): "def",
+            },
+            self.manifest.load_deployed_hashes(),
+        )
+
+    def test_record_deployed_hashes(self) -> None:
+        self.mock_client.table_exists.return_value = False
+
+        self.manifest.record_deployed_hashes(
+            {BigQueryAddress(dataset_id="dataset_1", table_id="view_1"): "abc"}
+        )
+
+        self.mock_client.create_table_with_schema.assert_called_once()
+        self.mock_client.stream_into_table.assert_called_once()
+        _, table_id, rows = self.mock_client.stream_into_table.call_args[0]
+        self.assertEqual(VIEW_DEPLOY_MANIFEST_TABLE_ID, table_id)
+        self.assertEqual(1, len(rows))
+        self.assertEqual("dataset_1", rows[0]["dataset_id"])
+        self.assertEqual("view_1", rows[0]["view_id"])
+        self.assertEqual("abc", rows[0]["view_hash"])
+
+    def test_record_deployed_hashes_empty(self) -> None:
+        self.manifest.record_deployed_hashes({})
+
+        self.mock_client.stream_into_table.assert_not_called()
@@ -19,7 +19,7 @@
 import re
 import unittest
 from http import HTTPStatus
-from typing import Any, Dict, Set, Tuple
+from typing import Any, Dict, List, Set, Tuple
 from unittest import mock
 from unittest.mock import MagicMock, call, patch
 
@@ -31,6 +31,8 @@ from recidiviz.big_query import view_update_manager
 from recidiviz.big_query.big_query_address import BigQueryAddress
 from recidiviz.big_query.big_query_table_checker import BigQueryTableChecker
 from recidiviz.big_query.big_query_view import BigQueryView, SimpleBigQueryViewBuilder
+from recidiviz.big_query.big_query_view_dag_walker import BigQueryViewDagWalker
+from recidiviz.big_query.view_deploy_manifest import compute_view_deploy_hashes
 from recidiviz.big_query.view_update_manager import (
     view_builder_sub_graph_for_view_builders_to_load,
     view_update_manager_blueprint,
@@ -328,6 +330,101 @@ class ViewManagerTest(unittest.TestCase):
         self.mock_client.delete_dataset.assert_not_called()
         self.assertEqual(self.mock_client.delete_table.call_count, 3)
 
+    def _skip_unchanged_view_builders(self) -> List[SimpleBigQueryViewBuilder]:
+        return [
+            SimpleBigQueryViewBuilder(
+                dataset_id=_DATASET_NAME,
+                view_id="my_fake_view",
+                description="my_fake_view description",
+                view_query_template="SELECT NULL LIMIT 0",
+                should_materialize=True,
+            ),
+            SimpleBigQueryViewBuilder(
+                dataset_id=_DATASET_NAME,
+                view_id="my_fake_view_2",
+                description="my_fake_view_2 description",
+                view_query_template="SELECT NULL LIMIT 0",
+                should_materialize=True,
+            ),
+            SimpleBigQueryViewBuilder(
+                dataset_id=_DATASET_NAME,
+                view_id="my_fake_view_3",
+                description="my_fake_view_3 description",
+                view_query_template=f"SELECT * FROM `{{project_id}}.{_DATASET_NAME}.my_fake_view`",
+                should_materialize=True,
+            ),
+        ]
+
+    @patch(
+        "recidiviz.big_query.view_update_manager.ViewDeployManifest.record_deployed_hashes"
+    )
+    @patch(
+        "recidiviz.big_query.view_update_manager.ViewDeployManifest.load_deployed_hashes"
+    )
+    def test_create_managed_dataset_and_deploy_views_for_view_builders_skip_unchanged(
+        self, mock_load_hashes: MagicMock, mock_record_hashes: MagicMock
+    ) -> None:
+        """Tests that views whose hashes match the deploy manifest are skipped
+        entirely, and that only the hashes of updated views are recorded."""
+        dataset = bigquery.dataset.DatasetReference(_PROJECT_ID, _DATASET_NAME)
+        self.mock_client.dataset_ref_for_id.return_value = dataset
+
+        view_builders = self._skip_unchanged_view_builders()
+        views = [b.build() for b in view_builders]
+        hashes = compute_view_deploy_hashes(BigQueryViewDagWalker(views))
+
+        # my_fake_view_2 has changed since the last deploy
+        mock_load_hashes.return_value = {
+            views[0].address: hashes[views[0].address],
+            views[1].address: "outdated_hash",
+            views[2].address: hashes[views[2].address],
+        }
+        self.mock_client.create_or_update_view.return_value = mock.MagicMock(
+            schema=[bigquery.SchemaField("some_field", "STRING", "REQUIRED")],
+        )
+
+        view_update_manager.create_managed_dataset_and_deploy_views_for_view_builders(
+            view_source_table_datasets=VIEW_SOURCE_TABLE_DATASETS,
+            view_builders_to_update=view_builders,
+            historically_managed_datasets_to_clean=None,
+            skip_unchanged_views=True,
+        )
+
+        self.mock_client.create_or_update_view.assert_called_once_with(views[1])
+        self.mock_client.materialize_view_to_table.assert_called_once_with(views[1])
+        self.mock_client.delete_table.assert_called_once_with(
+            _DATASET_NAME, "my_fake_view_2"
+        )
+        mock_record_hashes.assert_called_once_with(
+            {views[1].address: hashes[views[1].address]}
+        )
+
+    @patch(
+        "recidiviz.big_query.view_update_manager.ViewDeployManifest.record_deployed_hashes"
+    )
+    @patch(
+        "recidiviz.big_query.view_update_manager.ViewDeployManifest.load_deployed_hashes"
+    )
+    def test_create_managed_dataset_and_deploy_views_for_view_builders_dry_run(
+        self, mock_load_hashes: MagicMock, mock_record_hashes: MagicMock
+    ) -> None:
+        view_builders = self._skip_unchanged_view_builders()
+        mock_load_hashes.return_value = {}
+
+        with self.assertLogs(level="INFO") as logs:
+            view_update_manager.create_managed_dataset_and_deploy_views_for_view_builders(
+                view_source_table_datasets=VIEW_SOURCE_TABLE_DATASETS,
+                view_builders_to_update=view_builders,
+                historically_managed_datasets_to_clean=None,
+                dry_run=True,
+            )
+
+        self.assertIn("[DRY RUN] Would update [3] of [3] views", "\n".join(logs.output))
+        self.mock_client.create_dataset_if_necessary.assert_not_called()
+        self.mock_client.create_or_update_view.assert_not_called()
+        self.mock_client.materialize_view_to_table.assert_not_called()
+        mock_record_hashes.assert_not_called()
+
     def test_create_managed_dataset_and_deploy_views_for_view_builders_materialize_children(
         self,
     ) -> None:
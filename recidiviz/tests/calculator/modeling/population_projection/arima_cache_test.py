@@ -0,0 +1,147 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2022 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Tests for the ArimaCache and its use by PredictedAdmissions"""
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+from pandas.testing import assert_frame_equal
+
+from recidiviz.calculator.modeling.population_projection.predicted_admissions import (
+    ORDER,
+    TREND,
+    PredictedAdmissions,
+)
+from recidiviz.calculator.modeling.population_projection.utils.arima_cache import (
+    ARIMA_CACHE_DIR_ENV_VAR,
+    ArimaCache,
+    cache_dir_from_env,
+)
+
+
+class TestArimaCache(unittest.TestCase):
+    """Tests for the ArimaCache"""
+
+    def setUp(self) -> None:
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.values = np.array([10.0, 12.0, 13.0, 15.0, 14.0, 18.0])
+
+    def tearDown(self) -> None:
+        self.cache_dir.cleanup()
+
+    def test_key_depends_on_inputs(self) -> None:
+        key = ArimaCache.cache_key("params", self.values, ORDER, TREND)
+        self.assertEqual(
+            key, ArimaCache.cache_key("params", self.values.copy(), ORDER, TREND)
+        )
+        self.assertNotEqual(
+            key, ArimaCache.cache_key("params", self.values + 1, ORDER, TREND)
+        )
+        self.assertNotEqual(
+            key, ArimaCache.cache_key("params", self.values, (1, 0, 0), TREND)
+        )
+        self.assertNotEqual(
+            key, ArimaCache.cache_key("params", self.values, ORDER, "c")
+        )
+        self.assertNotEqual(
+            key, ArimaCache.cache_key("forecast", self.values, ORDER, TREND, 3)
+        )
+        with patch(
+            "recidiviz.calculator.modeling.population_projection.utils.arima_cache.ARIMA_CACHE_VERSION",
+            2,
+        ):
+            self.assertNotEqual(
+                key, ArimaCache.cache_key("params", self.values, ORDER, TREND)
+            )
+
+    def test_disk_cache_only_used_if_dir_set(self) -> None:
+        with patch.dict(os.environ, {ARIMA_CACHE_DIR_ENV_VAR: self.cache_dir.name}):
+            self.assertEqual(self.cache_dir.name, cache_dir_from_env())
+        with patch.dict(os.environ, {ARIMA_CACHE_DIR_ENV_VAR: ""}):
+            self.assertIsNone(cache_dir_from_env())
+        with patch.dict(os.environ):
+            os.environ.pop(ARIMA_CACHE_DIR_ENV_VAR, None)
+            self.assertIsNone(cache_dir_from_env())
+
+        cache = ArimaCache(None)
+        cache.put("key", np.array([1.0]))
+        np.testing.assert_array_equal(np.array([1.0]), cache.get("key"))
+        self.assertEqual([], os.listdir(self.cache_dir.name))
+
+    def test_memory_cache_drops_least_recently_used(self) -> None:
+        cache = ArimaCache(None, max_arrays_in_memory=2)
+        cache.put("a", np.array([1.0]))
+        cache.put("b", np.array([2.0]))
+        self.assertIsNotNone(cache.get("a"))
+        cache.put("c", np.array([3.0]))
+
+        self.assertIsNone(cache.get("b"))
+        np.testing.assert_array_equal(np.array([1.0]), cache.get("a"))
+        np.testing.assert_array_equal(np.array([3.0]), cache.get("c"))
+
+    def test_disk_entries_reloaded_after_eviction_from_memory(self) -> None:
+        cache = ArimaCache(self.cache_dir.name, max_arrays_in_memory=1)
+        cache.put("a", np.array([1.0]))
+        cache.put("b", np.array([2.0]))
+
+        np.testing.assert_array_equal(np.array([1.0]), cache.get("a"))
+        np.testing.assert_array_equal(np.array([2.0]), cache.get("b"))
+        self.assertEqual((2, 0), cache.pop_hit_counts())
+
+    def test_get_from_memory_and_disk(self) -> None:
+        cache = ArimaCache(self.cache_dir.name)
+        self.assertIsNone(cache.get("key"))
+        cache.put("key", np.array([1.0, 2.0]))
+
+        cached = cache.get("key")
+        assert cached is not None
+        cached[0] = 5
+        np.testing.assert_array_equal(np.array([1.0, 2.0]), cache.get("key"))
+        self.assertEqual((2, 1), cache.pop_hit_counts())
+
+        other_process_cache = ArimaCache(self.cache_dir.name)
+        np.testing.assert_array_equal(
+            np.array([1.0, 2.0]), other_process_cache.get("key")
+        )
+        self.assertIsNone(ArimaCache("").get("key"))
+
+    def test_predicted_admissions_reuses_fits(self) -> None:
+        historical_data = pd.DataFrame(
+            {ts: [10 + ts + (ts % 3), 5 + 2 * ts - (ts % 2)] for ts in range(-8, 0)},
+            index=["prison", "jail"],
+            dtype=float,
+        )
+        # Missing data at the end is forecast when the data is loaded
+        historical_data.loc["jail", -1] = np.nan
+        cache = ArimaCache(self.cache_dir.name)
+        with patch(
+            "recidiviz.calculator.modeling.population_projection.predicted_admissions.ARIMA_CACHE",
+            cache,
+        ):
+            first = PredictedAdmissions(historical_data.copy(), False)
+            first_estimate = first.get_time_step_estimate(5)
+            self.assertEqual((0, 5), cache.pop_hit_counts())
+
+            second = PredictedAdmissions(historical_data.copy(), False)
+            self.assertEqual(first_estimate, second.get_time_step_estimate(5))
+            self.assertEqual((5, 0), cache.pop_hit_counts())
+
+        assert_frame_equal(first.historical_data, second.historical_data)
+        assert_frame_equal(first.gen_arima_output_df(), second.gen_arima_output_df())
@@ -17,7 +17,9 @@
 """Test the CohortTable object"""
 
 import unittest
+
 import pandas as pd
+from pandas.testing import assert_frame_equal
 
 from recidiviz.calculator.modeling.population_projection.cohort_table import CohortTable
 
@@ -67,3 +69,25 @@ class TestCohortTable(unittest.TestCase):
             self.assertEqual(
                 cohort_size, cohort.get_cohort_timeline(start_time).iloc[index]
             )
+
+    def test_cross_simulation_round_trip(self) -> None:
+        """Tests the cohorts popped for cross-simulation flow can be ingested and extended"""
+        cohort = CohortTable(num_time_steps=1)
+        for ts in range(2000, 2010):
+            cohort.append_ts_end_count(cohort.get_latest_population() * 0.5, ts)
+            cohort.append_cohort(ts - 1990, ts)
+
+        cohort_df = cohort.pop_cohorts()
+        self.assertEqual((10, 10), cohort_df.shape)
+        self.assertTrue(cohort.get_latest_population().empty)
+
+        cohort.ingest_cross_simulation_cohorts(cohort_df)
+        assert_frame_equal(cohort_df, cohort.cohort_df)
+
+        cohort.append_ts_end_count(cohort.get_latest_population(), 2010)
+        cohort.append_cohort(5, 2010)
+        self.assertEqual(5, cohort.get_cohort_timeline(2000).loc[2001])
+        self.assertEqual([0] * 10 + [5], cohort.get_cohort_timeline(2010).tolist())
+        self.assertEqual(
+            cohort_df.sum(axis=0)[2009] + 5, cohort.get_per_ts_population()[2010]
+        )
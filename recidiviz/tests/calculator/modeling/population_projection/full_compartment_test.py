@@ -19,6 +19,7 @@ import unittest
 from typing import List, Optional
 
 import pandas as pd
+from pandas.testing import assert_frame_equal, assert_series_equal
 
 from recidiviz.calculator.modeling.population_projection.compartment_transitions import (
     CompartmentTransitions,
@@ -29,6 +30,27 @@ from recidiviz.calculator.modeling.population_projection.full_compartment import
 from recidiviz.calculator.modeling.population_projection.spark_policy import SparkPolicy
 
 
+def _reference_step(
+    cohort_df: pd.DataFrame, per_ts_transitions: pd.DataFrame, current_ts: int
+) -> pd.Series:
+    """Steps the cohorts in `cohort_df` forward with the DataFrame computation that the
+    array-backed CohortTable replaced, and returns the outflows"""
+    latest_ts_pop = cohort_df.iloc[:, -1].copy()
+    latest_ts_pop.index = current_ts - latest_ts_pop.index
+    latest_ts_pop_short = per_ts_transitions.mul(
+        latest_ts_pop[latest_ts_pop.index <= len(per_ts_transitions)], axis=0
+    ).dropna(how="all")
+    latest_ts_pop = pd.concat(
+        [
+            latest_ts_pop[latest_ts_pop.index > len(per_ts_transitions)],
+            latest_ts_pop_short.remaining,
+        ]
+    )
+    latest_ts_pop.index = current_ts - latest_ts_pop.index
+    cohort_df[current_ts] = latest_ts_pop.sort_index()
+    return latest_ts_pop_short.drop("remaining", axis=1).sum(axis=0)
+
+
 class TestFullCompartment(unittest.TestCase):
     """Test the FullCompartment runs correctly"""
 
@@ -114,3 +136,52 @@ class TestFullCompartment(unittest.TestCase):
 
         for compartment in compartment_list:
             compartment.step_forward()
+
+    def test_cohort_steps_match_dataframe_reference(self) -> None:
+        """Tests the array-backed cohort steps match the DataFrame computation they replaced"""
+        assert self.incarceration_transition_table is not None
+
+        compartment = FullCompartment(
+            pd.DataFrame(), self.incarceration_transition_table, 2015, "test"
+        )
+        compartment.initialize_edges([compartment])
+        compartment.single_cohort_intitialize(100)
+        reference_cohort_df = pd.DataFrame({2015: [100.0]}, index=[2015])
+
+        for ts in range(2016, 2031):
+            compartment.step_forward()
+            expected_outflows = _reference_step(
+                reference_cohort_df,
+                self.incarceration_transition_table.get_per_ts_transition_table(ts),
+                ts,
+            )
+            assert_series_equal(
+                expected_outflows,
+                compartment.outflows[ts - 1],
+                check_names=False,
+                check_index_type=False,
+            )
+
+            new_admissions = ts % 7 * 10.0
+            compartment.ingest_incoming_cohort({"test": new_admissions})
+            compartment.create_new_cohort()
+            reference_cohort_df = pd.concat(
+                [
+                    reference_cohort_df,
+                    pd.DataFrame({ts: [new_admissions]}, index=[ts]),
+                ]
+            ).fillna(0)
+            compartment.prepare_for_next_step()
+
+        assert_frame_equal(
+            reference_cohort_df,
+            compartment.cohorts.cohort_df,
+            check_names=False,
+            check_index_type=False,
+            check_column_type=False,
+        )
+        assert_series_equal(
+            reference_cohort_df.sum(axis=0),
+            compartment.get_per_ts_population(),
+            check_index_type=False,
+        )
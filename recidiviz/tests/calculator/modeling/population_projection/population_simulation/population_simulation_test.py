@@ -381,6 +381,35 @@ class TestPopulationSimulation(unittest.TestCase):
 
         assert_frame_equal(coarse_population_projection, self.macro_projection)
 
+    def test_parallel_workers_match_serial_projection(self) -> None:
+        """Stepping the sub-simulations on worker processes gives the same results"""
+        test_data_inputs = SimulationInputData(
+            outflows_data=self.test_outflows_data,
+            transitions_data=self.test_transitions_data,
+            total_population_data=self.test_total_population_data,
+            compartments_architecture=self.simulation_architecture,
+            disaggregation_axes=["crime"],
+            microsim=False,
+            microsim_data=pd.DataFrame(),
+            should_initialize_compartment_populations=False,
+            should_scale_populations_after_step=True,
+            override_cross_flow_function=None,
+        )
+        parallel_user_inputs = deepcopy(self.user_inputs)
+        parallel_user_inputs.num_workers = 2
+        parallel_population_simulation = (
+            PopulationSimulationFactory.build_population_simulation(
+                parallel_user_inputs, [], -5, test_data_inputs
+            )
+        )
+        parallel_projection = parallel_population_simulation.simulate_policies()
+
+        assert_frame_equal(parallel_projection, self.macro_projection)
+        assert_frame_equal(
+            parallel_population_simulation.get_outflows(),
+            self.macro_population_simulation.get_outflows(),
+        )
+
     def test_update_attributes_age_recidiviz_schema_matches_example_by_hand(
         self,
     ) -> None:
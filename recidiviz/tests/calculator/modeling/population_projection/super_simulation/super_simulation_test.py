@@ -20,7 +20,7 @@ import os
 import unittest
 from datetime import datetime
 from functools import partial
-from typing import Optional
+from typing import List, Optional
 
 import pandas as pd
 from mock import MagicMock, patch
@@ -526,6 +526,94 @@ class TestSuperSimulation(unittest.TestCase):
             # Error should be 0 for each compartment/simulation group on the first ts
             self.assertTrue((initial_error == 0).all())
 
+    @staticmethod
+    def _release_reduction_policies(
+        policy_ts: int, reduction_size: float
+    ) -> List[SparkPolicy]:
+        return [
+            SparkPolicy(
+                policy_fn=partial(
+                    TransitionTable.apply_reductions,
+                    reduction_df=pd.DataFrame(
+                        {
+                            "outflow": ["RELEASE"],
+                            "reduction_size": [reduction_size],
+                            "affected_fraction": [0.75],
+                        }
+                    ),
+                    reduction_type="*",
+                    retroactive=True,
+                ),
+                spark_compartment="PRISON",
+                sub_population={"crime_type": crime_type},
+                policy_ts=policy_ts,
+                apply_retroactive=True,
+            )
+            for crime_type in ["NONVIOLENT", "VIOLENT"]
+        ]
+
+    def test_f_policy_scenarios_match_simulate_policy(self) -> None:
+        """Tests scenarios run from the shared baseline match separately built simulations"""
+        assert isinstance(self.macrosim, SuperSimulation)
+        start_time_step = self.macrosim.initializer.get_user_inputs().start_time_step
+        policy_list = self._release_reduction_policies(start_time_step + 5, 0.5)
+        self.macrosim.simulate_policy(policy_list, "PRISON")
+        expected_projections = {
+            scenario: simulation.get_population_projections()
+            for scenario, simulation in self.macrosim.get_population_simulations().items()
+        }
+
+        scenario_results = self.macrosim.simulate_policy_scenarios(
+            {"policy": policy_list}
+        )
+
+        self.assertEqual(
+            ["control", "policy"], list(scenario_results.scenario.unique())
+        )
+        for scenario, projections in expected_projections.items():
+            projections = projections[projections.time_step >= start_time_step]
+            assert_frame_equal(
+                projections[
+                    ["simulation_group", "compartment", "time_step", "total_population"]
+                ].reset_index(drop=True),
+                scenario_results[scenario_results.scenario == scenario][
+                    ["simulation_group", "compartment", "time_step", "total_population"]
+                ].reset_index(drop=True),
+            )
+
+    def test_g_parallel_policy_scenarios_match_serial(self) -> None:
+        """Tests scenarios run on worker processes match scenarios run in this process"""
+        assert isinstance(self.macrosim, SuperSimulation)
+        start_time_step = self.macrosim.initializer.get_user_inputs().start_time_step
+        scenarios = {
+            "small_reduction": self._release_reduction_policies(
+                start_time_step + 2, 0.25
+            ),
+            "large_reduction": self._release_reduction_policies(
+                start_time_step + 5, 0.5
+            ),
+        }
+
+        serial_results = self.macrosim.simulate_policy_scenarios(scenarios)
+        parallel_results = self.macrosim.simulate_policy_scenarios(
+            scenarios, num_workers=2
+        )
+
+        self.assertEqual(
+            ["control", "small_reduction", "large_reduction"],
+            list(parallel_results.scenario.unique()),
+        )
+        self.assertFalse(
+            serial_results[serial_results.scenario == "small_reduction"]
+            .total_population.reset_index(drop=True)
+            .equals(
+                serial_results[
+                    serial_results.scenario == "large_reduction"
+                ].total_population.reset_index(drop=True)
+            )
+        )
+        assert_frame_equal(serial_results, parallel_results)
+
     @patch(
         "recidiviz.calculator.modeling.population_projection.utils.ignite_bq_utils.load_ignite_table_from_big_query",
         mock_load_table_from_big_query_micro_outflows_missing_time_steps,
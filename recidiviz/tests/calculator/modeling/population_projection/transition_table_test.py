@@ -18,6 +18,7 @@
 
 import unittest
 from functools import partial
+from unittest.mock import patch
 
 import numpy as np
 import pandas as pd
@@ -26,6 +27,7 @@ from pandas.testing import assert_frame_equal, assert_index_equal, assert_series
 from recidiviz.calculator.modeling.population_projection.spark_policy import SparkPolicy
 from recidiviz.calculator.modeling.population_projection.transition_table import (
     TransitionTable,
+    cache_normalized_tables,
 )
 from recidiviz.calculator.modeling.population_projection.utils.transitions_utils import (
     MIN_POSSIBLE_POLICY_TS,
@@ -103,6 +105,63 @@ class TestInitialization(TestTransitionTable):
 
         self.assertEqual(transition_table_default, transition_table_shuffled)
 
+    def test_normalized_table_cache_returns_independent_copies(self) -> None:
+        table = self.prev_table.get_after_table()
+        max_sentence = self.prev_table.max_sentence
+
+        with cache_normalized_tables():
+            first = TransitionTable.normalized_table(table, max_sentence)
+            first.loc[:, "jail"] = -1
+            second = TransitionTable.normalized_table(table.copy(), max_sentence)
+
+            assert_frame_equal(
+                TransitionTable._compute_normalized_table(  # pylint: disable=protected-access
+                    table, max_sentence
+                ),
+                second,
+            )
+            self.assertIsNot(
+                second, TransitionTable.normalized_table(table.copy(), max_sentence)
+            )
+
+            # Tables with the same values but a different max_sentence aren't shared
+            self.assertGreater(second.loc[2, "remaining"], 0)
+            self.assertEqual(
+                0, TransitionTable.normalized_table(table, 2).loc[2, "remaining"]
+            )
+
+    def test_normalized_table_cache_scoped_and_bounded(self) -> None:
+        table = self.prev_table.get_after_table()
+        other_table = table * 2
+        max_sentence = self.prev_table.max_sentence
+
+        with patch.object(
+            TransitionTable,
+            "_compute_normalized_table",
+            wraps=TransitionTable._compute_normalized_table,  # pylint: disable=protected-access
+        ) as mock_compute, patch(
+            "recidiviz.calculator.modeling.population_projection.transition_table._NORMALIZED_TABLE_CACHE_SIZE",
+            1,
+        ):
+            # Nothing is cached outside of cache_normalized_tables()
+            TransitionTable.normalized_table(table, max_sentence)
+            TransitionTable.normalized_table(table, max_sentence)
+            self.assertEqual(2, mock_compute.call_count)
+
+            with cache_normalized_tables():
+                TransitionTable.normalized_table(table, max_sentence)
+                with cache_normalized_tables():
+                    TransitionTable.normalized_table(table, max_sentence)
+                self.assertEqual(3, mock_compute.call_count)
+
+                # Only the most recently used table is kept
+                TransitionTable.normalized_table(other_table, max_sentence)
+                TransitionTable.normalized_table(table, max_sentence)
+                self.assertEqual(5, mock_compute.call_count)
+
+            TransitionTable.normalized_table(table, max_sentence)
+            self.assertEqual(6, mock_compute.call_count)
+
 
 class TestPolicyFunctions(TestTransitionTable):
     """Test the policy functions used for Spark modeling"""
@@ -329,6 +388,37 @@ class TestPolicyFunctions(TestTransitionTable):
             round(expected_result, SIG_FIGS),
         )
 
+    def test_apply_lengthening_reductions_matches_example_by_hand(self) -> None:
+        """Lengthened cohorts can be lengthened again once they reach their new LOS"""
+        transition_table = TransitionTable(
+            5, [], {MIN_POSSIBLE_POLICY_TS: self.prev_table.get_after_table()}
+        )
+        transition_table.apply_reductions(
+            reduction_df=pd.DataFrame(
+                {
+                    "outflow": ["jail"],
+                    "affected_fraction": [0.5],
+                    "reduction_size": [-1.5],
+                }
+            ),
+            reduction_type="+",
+            affected_LOS=[None, 5],
+            retroactive=True,
+        )
+
+        expected_result = pd.Series(
+            [2, 1.5, 0.875, 0.59375, 0.734375, 0.296875, 0, 0, 0, 0],
+            index=range(1, 11),
+            dtype=float,
+            name="jail",
+        )
+        expected_result.index.name = "compartment_duration"
+
+        assert_series_equal(
+            round(transition_table.tables[MIN_POSSIBLE_POLICY_TS]["jail"], SIG_FIGS),
+            round(expected_result, SIG_FIGS),
+        )
+
     def test_constrained_apply_reductions_doesnt_affect_above_affected_LOS(
         self,
     ) -> None:
@@ -35,6 +35,7 @@ from recidiviz.calculator.pipeline.metrics.supervision.events import (
     ProjectedSupervisionCompletionEvent,
     SupervisionEvent,
     SupervisionPopulationEvent,
+    SupervisionPopulationSpanEvent,
     SupervisionStartEvent,
     SupervisionTerminationEvent,
 )
@@ -2968,6 +2969,155 @@ class TestClassifySupervisionEvents(unittest.TestCase):
 
         self.assertCountEqual(expected_events, supervision_events)
 
+    def _assert_population_spans_match_daily_events(
+        self,
+        supervision_periods: List[NormalizedStateSupervisionPeriod],
+        incarceration_periods: List[NormalizedStateIncarcerationPeriod],
+        assessments: List[StateAssessment],
+        state_code_override: Optional[str] = None,
+    ) -> List[SupervisionEvent]:
+        """Asserts that the events produced when emitting population spans match the
+        daily events once all spans have been expanded. Returns the events produced
+        when emitting population spans."""
+        daily_events = self._test_find_supervision_events(
+            supervision_sentences=[],
+            incarceration_sentences=[],
+            supervision_periods=supervision_periods,
+            incarceration_periods=incarceration_periods,
+            assessments=assessments,
+            violation_responses=[],
+            supervision_contacts=[],
+            state_code_override=state_code_override,
+        )
+
+        self.identifier = identifier.SupervisionIdentifier(emit_population_spans=True)
+        span_events = self._test_find_supervision_events(
+            supervision_sentences=[],
+            incarceration_sentences=[],
+            supervision_periods=supervision_periods,
+            incarceration_periods=incarceration_periods,
+            assessments=assessments,
+            violation_responses=[],
+            supervision_contacts=[],
+            state_code_override=state_code_override,
+        )
+
+        expanded_span_events: List[SupervisionEvent] = []
+        for event in span_events:
+            if isinstance(event, SupervisionPopulationSpanEvent):
+                expanded_span_events.extend(event.daily_events())
+            else:
+                expanded_span_events.append(event)
+
+        self.assertCountEqual(daily_events, expanded_span_events)
+        self.assertLess(len(span_events), len(daily_events))
+
+        return span_events
+
+    def test_find_supervision_events_population_spans(self) -> None:
+        """Tests that the population spans produced for overlapping supervision periods
+        of different types, with an incarceration stay and a reassessment, match the
+        daily population events."""
+        first_supervision_period = NormalizedStateSupervisionPeriod.new_with_defaults(
+            supervision_period_id=111,
+            external_id="sp1",
+            state_code="US_XX",
+            start_date=date(2018, 3, 5),
+            termination_date=date(2018, 9, 19),
+            supervision_type=StateSupervisionPeriodSupervisionType.PROBATION,
+            termination_reason=StateSupervisionPeriodTerminationReason.DISCHARGE,
+            sequence_num=0,
+        )
+
+        second_supervision_period = NormalizedStateSupervisionPeriod.new_with_defaults(
+            supervision_period_id=222,
+            external_id="sp2",
+            state_code="US_XX",
+            start_date=date(2018, 4, 15),
+            termination_date=date(2018, 12, 19),
+            supervision_type=StateSupervisionPeriodSupervisionType.PAROLE,
+            termination_reason=StateSupervisionPeriodTerminationReason.DISCHARGE,
+            sequence_num=1,
+        )
+
+        incarceration_period = NormalizedStateIncarcerationPeriod.new_with_defaults(
+            incarceration_period_id=111,
+            external_id="ip1",
+            state_code="US_XX",
+            admission_date=date(2018, 6, 1),
+            admission_reason=StateIncarcerationPeriodAdmissionReason.NEW_ADMISSION,
+            specialized_purpose_for_incarceration=StateSpecializedPurposeForIncarceration.GENERAL,
+            release_date=date(2018, 7, 1),
+            release_reason=ReleaseReason.SENTENCE_SERVED,
+        )
+
+        assessment = StateAssessment.new_with_defaults(
+            state_code="US_XX",
+            assessment_type=StateAssessmentType.ORAS_COMMUNITY_SUPERVISION,
+            assessment_score=33,
+            assessment_level=StateAssessmentLevel.HIGH,
+            assessment_date=date(2018, 8, 1),
+        )
+
+        span_events = self._assert_population_spans_match_daily_events(
+            supervision_periods=[first_supervision_period, second_supervision_period],
+            incarceration_periods=[incarceration_period],
+            assessments=[assessment],
+        )
+
+        self.assertEqual(
+            6,
+            len(
+                [
+                    event
+                    for event in span_events
+                    if isinstance(event, SupervisionPopulationSpanEvent)
+                ]
+            ),
+        )
+
+    def test_find_supervision_events_population_spans_us_id(self) -> None:
+        """Tests that the population spans produced for overlapping supervision periods
+        of different types in a state where supervision types are mutually exclusive
+        match the daily population events, once converted to DUAL."""
+        first_supervision_period = NormalizedStateSupervisionPeriod.new_with_defaults(
+            supervision_period_id=111,
+            external_id="sp1",
+            state_code="US_ID",
+            start_date=date(2018, 3, 5),
+            termination_date=date(2018, 9, 19),
+            supervision_type=StateSupervisionPeriodSupervisionType.PROBATION,
+            termination_reason=StateSupervisionPeriodTerminationReason.DISCHARGE,
+            sequence_num=0,
+        )
+
+        second_supervision_period = NormalizedStateSupervisionPeriod.new_with_defaults(
+            supervision_period_id=222,
+            external_id="sp2",
+            state_code="US_ID",
+            start_date=date(2018, 4, 15),
+            termination_date=date(2018, 12, 19),
+            supervision_type=StateSupervisionPeriodSupervisionType.PAROLE,
+            termination_reason=StateSupervisionPeriodTerminationReason.DISCHARGE,
+            sequence_num=1,
+        )
+
+        span_events = self._assert_population_spans_match_daily_events(
+            supervision_periods=[first_supervision_period, second_supervision_period],
+            incarceration_periods=[],
+            assessments=[],
+            state_code_override="US_ID",
+        )
+
+        self.assertIn(
+            StateSupervisionPeriodSupervisionType.DUAL,
+            [
+                event.supervision_type
+                for event in span_events
+                if isinstance(event, SupervisionPopulationSpanEvent)
+            ],
+        )
+
 
 class TestFindPopulationEventsForSupervisionPeriod(unittest.TestCase):
     """Tests for the find_population_events_for_supervision_period function."""
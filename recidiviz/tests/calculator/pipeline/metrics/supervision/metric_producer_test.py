@@ -32,6 +32,7 @@ from recidiviz.calculator.pipeline.metrics.supervision.events import (
     ProjectedSupervisionCompletionEvent,
     SupervisionEvent,
     SupervisionPopulationEvent,
+    SupervisionPopulationSpanEvent,
     SupervisionStartEvent,
     SupervisionTerminationEvent,
 )
@@ -39,6 +40,7 @@ from recidiviz.calculator.pipeline.metrics.supervision.metrics import (
     SupervisionMetricType,
     SupervisionOutOfStatePopulationMetric,
     SupervisionPopulationMetric,
+    SupervisionStartMetric,
     SupervisionSuccessMetric,
     SupervisionTerminationMetric,
 )
@@ -1837,6 +1839,111 @@ class TestProduceSupervisionMetrics(unittest.TestCase):
 
         self.assertEqual(expected_count, len(metrics))
 
+    def test_produce_supervision_metrics_population_span(self) -> None:
+        """Tests the produce_supervision_metrics function when there is a
+        SupervisionPopulationSpanEvent, which should produce the same metrics as the
+        daily SupervisionPopulationEvents in the calculation months."""
+        person = StatePerson.new_with_defaults(
+            state_code="US_XX",
+            person_id=12345,
+            birthdate=date(1984, 8, 31),
+            gender=StateGender.FEMALE,
+        )
+
+        span_event = SupervisionPopulationSpanEvent(
+            state_code="US_XX",
+            year=2018,
+            month=2,
+            event_date=date(2018, 2, 20),
+            end_date_exclusive=date(2018, 4, 11),
+            supervision_type=StateSupervisionPeriodSupervisionType.PAROLE,
+            case_type=StateSupervisionCaseType.GENERAL,
+            supervision_level=StateSupervisionLevel.HIGH,
+            supervision_level_raw_text="HIGH",
+            case_compliance=SupervisionCaseCompliance(
+                date_of_evaluation=date(2018, 2, 20),
+                next_recommended_assessment_date=date(2018, 4, 19),
+            ),
+            projected_end_date=None,
+        )
+
+        span_metrics = self.metric_producer.produce_metrics(
+            person,
+            [span_event],
+            ALL_METRICS_INCLUSIONS_DICT,
+            calculation_end_month="2018-04",
+            calculation_month_count=2,
+            person_metadata=_DEFAULT_PERSON_METADATA,
+            pipeline_job_id=_PIPELINE_JOB_ID,
+        )
+
+        daily_events: List[SupervisionEvent] = list(
+            span_event.daily_events(lower_bound_inclusive=date(2018, 3, 1))
+        )
+
+        self.assertEqual(41, len(daily_events))
+        self.assertEqual(date(2018, 3, 1), daily_events[0].event_date)
+
+        daily_metrics = self.metric_producer.produce_metrics(
+            person,
+            daily_events,
+            ALL_METRICS_INCLUSIONS_DICT,
+            calculation_end_month="2018-04",
+            calculation_month_count=2,
+            person_metadata=_DEFAULT_PERSON_METADATA,
+            pipeline_job_id=_PIPELINE_JOB_ID,
+        )
+
+        self.assertEqual(expected_metrics_count(daily_events), len(span_metrics))
+        self.assertCountEqual(daily_metrics, span_metrics)
+
+    def test_produce_supervision_metrics_population_span_not_expanded(self) -> None:
+        """Tests that SupervisionPopulationSpanEvents do not produce any metrics when
+        no metrics produced from SupervisionPopulationEvents are included."""
+        person = StatePerson.new_with_defaults(
+            state_code="US_XX",
+            person_id=12345,
+            birthdate=date(1984, 8, 31),
+            gender=StateGender.FEMALE,
+        )
+
+        supervision_events: List[SupervisionEvent] = [
+            SupervisionPopulationSpanEvent(
+                state_code="US_XX",
+                year=2018,
+                month=2,
+                event_date=date(2018, 2, 20),
+                end_date_exclusive=date(2018, 4, 11),
+                supervision_type=StateSupervisionPeriodSupervisionType.PAROLE,
+                projected_end_date=None,
+            ),
+            SupervisionStartEvent(
+                state_code="US_XX",
+                year=2018,
+                month=2,
+                event_date=date(2018, 2, 20),
+                supervision_type=StateSupervisionPeriodSupervisionType.PAROLE,
+            ),
+        ]
+
+        inclusions_dict = {
+            metric_type: (metric_type == SupervisionMetricType.SUPERVISION_START)
+            for metric_type in SupervisionMetricType
+        }
+
+        metrics = self.metric_producer.produce_metrics(
+            person,
+            supervision_events,
+            inclusions_dict,
+            calculation_end_month="2018-04",
+            calculation_month_count=-1,
+            person_metadata=_DEFAULT_PERSON_METADATA,
+            pipeline_job_id=_PIPELINE_JOB_ID,
+        )
+
+        self.assertEqual(1, len(metrics))
+        assert all(isinstance(metric, SupervisionStartMetric) for metric in metrics)
+
 
 class TestIncludeEventInMetric(unittest.TestCase):
     """Tests the include_event_in_metric function."""
@@ -18,13 +18,16 @@
 
 import unittest
 from datetime import date, timedelta
-from typing import List
+from typing import List, Set, Tuple
 
 from freezegun import freeze_time
 
 from recidiviz.calculator.pipeline.normalization.utils.normalized_entities import (
     NormalizedStateIncarcerationPeriod,
 )
+from recidiviz.calculator.pipeline.utils.entity_normalization.normalized_incarceration_period_index import (
+    NormalizedIncarcerationPeriodIndex,
+)
 from recidiviz.common.constants.state.state_incarceration_period import (
     StateIncarcerationPeriodAdmissionReason,
 )
@@ -162,6 +165,21 @@ class TestIndexIncarcerationPeriodsByAdmissionMonth(unittest.TestCase):
         )
 
 
+def _months_excluded_from_supervision_population(
+    incarceration_period_index: NormalizedIncarcerationPeriodIndex,
+) -> Set[Tuple[int, int]]:
+    """Returns the (year, month) for each month during which the person was excluded
+    from the supervision population for the entire month."""
+    return {
+        (year, month)
+        for date_range in incarceration_period_index.ranges_excluded_from_supervision_population.merged_ranges
+        for year, month in date_range.get_months_range_overlaps_at_all()
+        if incarceration_period_index.is_excluded_from_supervision_population_for_range(
+            DateRange.for_month(year, month)
+        )
+    }
+
+
 class TestMonthsExcludedFromSupervisionPopulation(unittest.TestCase):
     """Tests the months_excluded_from_supervision_population function."""
 
@@ -184,7 +202,7 @@ class TestMonthsExcludedFromSupervisionPopulation(unittest.TestCase):
         )
 
         self.assertEqual(
-            incarceration_period_index.months_excluded_from_supervision_population,
+            _months_excluded_from_supervision_population(incarceration_period_index),
             {(2018, 7), (2018, 8), (2018, 9), (2018, 10), (2018, 11)},
         )
 
@@ -208,7 +226,7 @@ class TestMonthsExcludedFromSupervisionPopulation(unittest.TestCase):
         )
 
         self.assertEqual(
-            incarceration_period_index.months_excluded_from_supervision_population,
+            _months_excluded_from_supervision_population(incarceration_period_index),
             {(2018, 8), (2018, 9), (2018, 10), (2018, 11)},
         )
 
@@ -232,7 +250,7 @@ class TestMonthsExcludedFromSupervisionPopulation(unittest.TestCase):
         )
 
         self.assertEqual(
-            incarceration_period_index.months_excluded_from_supervision_population,
+            _months_excluded_from_supervision_population(incarceration_period_index),
             {
                 (2018, 9)
                 # The person is not counted as incarcerated on 10/31/2018, so they are not fully incarcerated this month
@@ -259,7 +277,7 @@ class TestMonthsExcludedFromSupervisionPopulation(unittest.TestCase):
         )
 
         self.assertEqual(
-            incarceration_period_index.months_excluded_from_supervision_population,
+            _months_excluded_from_supervision_population(incarceration_period_index),
             set(),
         )
 
@@ -284,7 +302,7 @@ class TestMonthsExcludedFromSupervisionPopulation(unittest.TestCase):
         )
 
         self.assertEqual(
-            incarceration_period_index.months_excluded_from_supervision_population,
+            _months_excluded_from_supervision_population(incarceration_period_index),
             set(),
         )
 
@@ -306,7 +324,7 @@ class TestMonthsExcludedFromSupervisionPopulation(unittest.TestCase):
         )
 
         self.assertEqual(
-            incarceration_period_index.months_excluded_from_supervision_population,
+            _months_excluded_from_supervision_population(incarceration_period_index),
             set(),
         )
 
@@ -327,7 +345,7 @@ class TestMonthsExcludedFromSupervisionPopulation(unittest.TestCase):
         )
 
         self.assertEqual(
-            incarceration_period_index.months_excluded_from_supervision_population,
+            _months_excluded_from_supervision_population(incarceration_period_index),
             {(2005, 3)},
         )
 
@@ -351,7 +369,7 @@ class TestMonthsExcludedFromSupervisionPopulation(unittest.TestCase):
         )
 
         self.assertEqual(
-            incarceration_period_index.months_excluded_from_supervision_population,
+            _months_excluded_from_supervision_population(incarceration_period_index),
             set(),
         )
 
@@ -372,18 +390,18 @@ class TestMonthsExcludedFromSupervisionPopulation(unittest.TestCase):
         )
 
         self.assertEqual(
-            incarceration_period_index.months_excluded_from_supervision_population,
+            _months_excluded_from_supervision_population(incarceration_period_index),
             set(),
         )
 
 
-class TestIndexMonthToOverlappingIPsNotUnderSupervisionAuthority(unittest.TestCase):
-    """Tests the month_to_overlapping_ips_not_under_supervision_authority initialization function."""
+class TestRangesExcludedFromSupervisionPopulation(unittest.TestCase):
+    """Tests the ranges_excluded_from_supervision_population initialization function."""
 
     def test_no_periods(self):
         index = default_normalized_ip_index_for_tests()
         self.assertEqual(
-            index.month_to_overlapping_ips_not_under_supervision_authority, {}
+            index.ranges_excluded_from_supervision_population.merged_ranges, []
         )
 
     def test_one_period_start_end_middle_of_months(self):
@@ -401,17 +419,10 @@ class TestIndexMonthToOverlappingIPsNotUnderSupervisionAuthority(unittest.TestCa
 
         index = default_normalized_ip_index_for_tests([incarceration_period])
 
-        expected = {
-            2007: {12: [incarceration_period]},
-            2008: {
-                1: [incarceration_period],
-                2: [incarceration_period],
-                3: [incarceration_period],
-            },
-        }
+        expected = [DateRange(date(2007, 12, 2), date(2008, 3, 28))]
 
         self.assertEqual(
-            index.month_to_overlapping_ips_not_under_supervision_authority, expected
+            index.ranges_excluded_from_supervision_population.merged_ranges, expected
         )
 
     def test_one_period_start_end_exactly_on_month(self):
@@ -429,13 +440,10 @@ class TestIndexMonthToOverlappingIPsNotUnderSupervisionAuthority(unittest.TestCa
 
         index = default_normalized_ip_index_for_tests([incarceration_period])
 
-        expected = {
-            2007: {12: [incarceration_period]},
-            2008: {1: [incarceration_period]},
-        }
+        expected = [DateRange(date(2007, 12, 1), date(2008, 2, 1))]
 
         self.assertEqual(
-            index.month_to_overlapping_ips_not_under_supervision_authority, expected
+            index.ranges_excluded_from_supervision_population.merged_ranges, expected
         )
 
     @freeze_time("2008-04-01")
@@ -452,18 +460,10 @@ class TestIndexMonthToOverlappingIPsNotUnderSupervisionAuthority(unittest.TestCa
 
         index = default_normalized_ip_index_for_tests([incarceration_period])
 
-        expected = {
-            2007: {12: [incarceration_period]},
-            2008: {
-                1: [incarceration_period],
-                2: [incarceration_period],
-                3: [incarceration_period],
-                4: [incarceration_period],
-            },
-        }
+        expected = [DateRange(date(2007, 12, 1), date(2008, 4, 2))]
 
         self.assertEqual(
-            index.month_to_overlapping_ips_not_under_supervision_authority, expected
+            index.ranges_excluded_from_supervision_population.merged_ranges, expected
         )
 
     def test_multiple_periods(self):
@@ -497,18 +497,13 @@ class TestIndexMonthToOverlappingIPsNotUnderSupervisionAuthority(unittest.TestCa
             [incarceration_period, incarceration_period_2]
         )
 
-        expected = {
-            2007: {12: [incarceration_period]},
-            2008: {
-                1: [incarceration_period],
-                2: [incarceration_period, incarceration_period_2],
-                3: [incarceration_period_2],
-                4: [incarceration_period_2],
-            },
-        }
+        expected = [
+            DateRange(date(2007, 12, 1), date(2008, 2, 2)),
+            DateRange(date(2008, 2, 4), date(2008, 4, 5)),
+        ]
 
         self.assertEqual(
-            index.month_to_overlapping_ips_not_under_supervision_authority, expected
+            index.ranges_excluded_from_supervision_population.merged_ranges, expected
         )
 
     def test_period_starts_ends_same_month(self):
@@ -526,14 +521,10 @@ class TestIndexMonthToOverlappingIPsNotUnderSupervisionAuthority(unittest.TestCa
 
         index = default_normalized_ip_index_for_tests([incarceration_period])
 
-        expected = {
-            2008: {
-                2: [incarceration_period],
-            },
-        }
+        expected = [DateRange(date(2008, 2, 4), date(2008, 2, 5))]
 
         self.assertEqual(
-            index.month_to_overlapping_ips_not_under_supervision_authority, expected
+            index.ranges_excluded_from_supervision_population.merged_ranges, expected
         )
 
     def test_multiple_periods_one_under_supervision_authority(self):
@@ -568,13 +559,10 @@ class TestIndexMonthToOverlappingIPsNotUnderSupervisionAuthority(unittest.TestCa
             [incarceration_period, incarceration_period_2]
         )
 
-        expected = {
-            2007: {12: [incarceration_period]},
-            2008: {1: [incarceration_period], 2: [incarceration_period]},
-        }
+        expected = [DateRange(date(2007, 12, 1), date(2008, 2, 2))]
 
         self.assertEqual(
-            index.month_to_overlapping_ips_not_under_supervision_authority, expected
+            index.ranges_excluded_from_supervision_population.merged_ranges, expected
         )
 
 
@@ -30,6 +30,7 @@ from recidiviz.common.constants.state.state_supervision_period import (
     StateSupervisionPeriodSupervisionType,
     StateSupervisionPeriodTerminationReason,
 )
+from recidiviz.common.date import DateRange
 from recidiviz.tests.calculator.pipeline.utils.entity_normalization.normalization_testing_utils import (
     default_normalized_sp_index_for_tests,
 )
@@ -663,3 +664,68 @@ class TestGetMostRecentPreviousSupervisionPeriod(unittest.TestCase):
     ):
         for supervision_type in StateSupervisionPeriodSupervisionType:
             _transfer_from_supervision_type_is_official_admission(supervision_type)
+
+
+class TestGetSupervisionPeriodOverlappingWithDateRange(unittest.TestCase):
+    """Tests get_supervision_period_overlapping_with_date_range."""
+
+    def setUp(self) -> None:
+        self.supervision_period_1 = NormalizedStateSupervisionPeriod.new_with_defaults(
+            state_code="US_XX",
+            supervision_period_id=111,
+            sequence_num=0,
+            start_date=date(2000, 1, 1),
+            termination_date=date(2005, 1, 1),
+        )
+        self.supervision_period_2 = NormalizedStateSupervisionPeriod.new_with_defaults(
+            state_code="US_XX",
+            supervision_period_id=222,
+            sequence_num=1,
+            start_date=date(2001, 1, 1),
+            termination_date=date(2001, 3, 1),
+        )
+        self.supervision_period_3 = NormalizedStateSupervisionPeriod.new_with_defaults(
+            state_code="US_XX",
+            supervision_period_id=333,
+            sequence_num=2,
+            start_date=date(2010, 1, 1),
+        )
+
+        self.supervision_period_index = default_normalized_sp_index_for_tests(
+            supervision_periods=[
+                self.supervision_period_1,
+                self.supervision_period_2,
+                self.supervision_period_3,
+            ]
+        )
+
+    def test_get_supervision_period_overlapping_with_date_range(self) -> None:
+        self.assertEqual(
+            self.supervision_period_1,
+            self.supervision_period_index.get_supervision_period_overlapping_with_date_range(
+                DateRange.for_month(2001, 2)
+            ),
+        )
+        self.assertEqual(
+            self.supervision_period_3,
+            self.supervision_period_index.get_supervision_period_overlapping_with_date_range(
+                DateRange.for_month(2020, 2)
+            ),
+        )
+
+    def test_get_supervision_period_overlapping_with_date_range_none(self) -> None:
+        self.assertIsNone(
+            self.supervision_period_index.get_supervision_period_overlapping_with_date_range(
+                DateRange.for_month(1999, 12)
+            )
+        )
+        self.assertIsNone(
+            self.supervision_period_index.get_supervision_period_overlapping_with_date_range(
+                DateRange.for_month(2005, 1)
+            )
+        )
+        self.assertIsNone(
+            self.supervision_period_index.get_supervision_period_overlapping_with_date_range(
+                DateRange.for_month(2009, 12)
+            )
+        )
@@ -183,11 +183,15 @@ class FakeGCSFileSystem(GCSFileSystem):
             return f.read()
 
     def upload_from_string(
-        self, path: GcsfsFilePath, contents: str, content_type: str
+        self, path: GcsfsFilePath, contents: Union[str, bytes], content_type: str
     ) -> None:
         temp_path = generate_random_temp_path()
-        with open(temp_path, "w", encoding="utf-8") as f:
-            f.write(contents)
+        if isinstance(contents, bytes):
+            with open(temp_path, "wb") as f:
+                f.write(contents)
+        else:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                f.write(contents)
 
         self._add_entry(FakeGCSFileSystemEntry(path, temp_path, content_type))
         self.uploaded_paths.add(path)
@@ -0,0 +1,237 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2022 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Tests for the shared GcsfsCsvReaderDelegate implementations."""
+import os
+import tempfile
+import threading
+import time
+import unittest
+from typing import Optional, Union
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from recidiviz.cloud_storage.gcsfs_csv_reader import GcsfsCsvReader
+from recidiviz.cloud_storage.gcsfs_csv_reader_delegates import (
+    ChunkFileFormat,
+    SplittingGcsfsCsvReaderDelegate,
+    dataframe_to_parquet,
+)
+from recidiviz.cloud_storage.gcsfs_path import GcsfsDirectoryPath, GcsfsFilePath
+from recidiviz.tests.cloud_storage.fake_gcs_file_system import FakeGCSFileSystem
+
+_NUM_ROWS = 20
+
+
+class _SlowUploadFakeGCSFileSystem(FakeGCSFileSystem):
+    """FakeGCSFileSystem that adds latency to every upload and tracks how many
+    uploads are in progress at once.
+    """
+
+    def __init__(
+        self, latency_seconds: float, fail_on_path: Optional[GcsfsFilePath] = None
+    ) -> None:
+        super().__init__()
+        self.latency_seconds = latency_seconds
+        self.fail_on_path = fail_on_path
+        self.max_concurrent_uploads = 0
+        self._concurrent_uploads = 0
+        self._upload_lock = threading.Lock()
+
+    def upload_from_string(
+        self, path: GcsfsFilePath, contents: Union[str, bytes], content_type: str
+    ) -> None:
+        with self._upload_lock:
+            self._concurrent_uploads += 1
+            self.max_concurrent_uploads = max(
+                self.max_concurrent_uploads, self._concurrent_uploads
+            )
+        try:
+            time.sleep(self.latency_seconds)
+            if path == self.fail_on_path:
+                raise ValueError(f"Failed to upload [{path.abs_path()}]")
+            super().upload_from_string(path, contents, content_type)
+        finally:
+            with self._upload_lock:
+                self._concurrent_uploads -= 1
+
+
+class _TestSplittingDelegate(SplittingGcsfsCsvReaderDelegate):
+    def transform_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
+        return df.assign(value=df.value.str.upper())
+
+    def get_output_path(self, chunk_num: int) -> GcsfsFilePath:
+        return output_path_for_chunk(chunk_num)
+
+
+def output_path_for_chunk(chunk_num: int) -> GcsfsFilePath:
+    return GcsfsFilePath.from_directory_and_file_name(
+        GcsfsDirectoryPath(bucket_name="temp-bucket"), f"temp_{chunk_num}.csv"
+    )
+
+
+class SplittingGcsfsCsvReaderDelegateTest(unittest.TestCase):
+    """Tests for the SplittingGcsfsCsvReaderDelegate."""
+
+    def setUp(self) -> None:
+        with tempfile.NamedTemporaryFile(
+            "w", suffix=".csv", delete=False, encoding="utf-8"
+        ) as f:
+            f.write("id,value\n")
+            for i in range(_NUM_ROWS):
+                f.write(f"{i},value_{i}\n")
+        self.local_path = f.name
+        self.input_path = GcsfsFilePath.from_absolute_path("input-bucket/input.csv")
+
+    def tearDown(self) -> None:
+        os.remove(self.local_path)
+
+    def _run_read(
+        self, fs: FakeGCSFileSystem, delegate: SplittingGcsfsCsvReaderDelegate
+    ) -> None:
+        fs.test_add_path(self.input_path, self.local_path)
+        GcsfsCsvReader(fs).streaming_read(
+            self.input_path, delegate=delegate, chunk_size=1, dtype=str
+        )
+
+    def test_pipelined_upload_matches_sequential_upload(self) -> None:
+        uploaded_contents = []
+        for num_upload_threads in (0, 3):
+            fs = _SlowUploadFakeGCSFileSystem(latency_seconds=0)
+            delegate = _TestSplittingDelegate(
+                self.input_path,
+                fs,
+                include_header=True,
+                num_upload_threads=num_upload_threads,
+            )
+            self._run_read(fs, delegate)
+
+            self.assertEqual(
+                [output_path_for_chunk(i) for i in range(_NUM_ROWS)],
+                delegate.output_paths,
+            )
+            self.assertEqual(["id", "value"], delegate.output_columns)
+            uploaded_contents.append(
+                [fs.download_as_string(path) for path in delegate.output_paths]
+            )
+
+        sequential_contents, pipelined_contents = uploaded_contents
+        self.assertEqual(sequential_contents, pipelined_contents)
+        self.assertEqual("id,value\n3,VALUE_3\n", pipelined_contents[3])
+
+    def test_pipelined_upload_is_concurrent_and_bounded(self) -> None:
+        fs = _SlowUploadFakeGCSFileSystem(latency_seconds=0.02)
+        delegate = _TestSplittingDelegate(
+            self.input_path,
+            fs,
+            include_header=False,
+            num_upload_threads=8,
+            max_pending_chunks=3,
+        )
+        self._run_read(fs, delegate)
+
+        self.assertEqual(
+            [output_path_for_chunk(i) for i in range(_NUM_ROWS)],
+            delegate.output_paths,
+        )
+        self.assertGreater(fs.max_concurrent_uploads, 1)
+        self.assertLessEqual(fs.max_concurrent_uploads, 3)
+
+    def test_pipelined_upload_failure_cleans_up(self) -> None:
+        fs = _SlowUploadFakeGCSFileSystem(
+            latency_seconds=0.01, fail_on_path=output_path_for_chunk(5)
+        )
+        delegate = _TestSplittingDelegate(
+            self.input_path,
+            fs,
+            include_header=False,
+            num_upload_threads=3,
+        )
+        with self.assertRaisesRegex(ValueError, "Failed to upload"):
+            self._run_read(fs, delegate)
+
+        self.assertEqual([], delegate.output_paths)
+        self.assertEqual([self.input_path], fs.all_paths)
+
+    def test_csv_output_bytes_counts_encoded_bytes(self) -> None:
+        with open(self.local_path, "w", encoding="utf-8") as f:
+            f.write("id,value\n")
+            for i in range(_NUM_ROWS):
+                f.write(f"{i},valué_{i}\n")
+
+        fs = _SlowUploadFakeGCSFileSystem(latency_seconds=0)
+        delegate = _TestSplittingDelegate(
+            self.input_path,
+            fs,
+            include_header=False,
+            num_upload_threads=3,
+        )
+        self._run_read(fs, delegate)
+
+        self.assertEqual(
+            sum(len(fs.download_as_bytes(p)) for p in delegate.output_paths),
+            delegate.output_bytes,
+        )
+        self.assertEqual("3,VALUÉ_3\n", fs.download_as_string(delegate.output_paths[3]))
+
+    def test_parquet_output(self) -> None:
+        for num_upload_threads in (0, 3):
+            fs = _SlowUploadFakeGCSFileSystem(latency_seconds=0)
+            delegate = _TestSplittingDelegate(
+                self.input_path,
+                fs,
+                include_header=False,
+                num_upload_threads=num_upload_threads,
+                output_format=ChunkFileFormat.PARQUET,
+            )
+            self._run_read(fs, delegate)
+
+            self.assertEqual(
+                [output_path_for_chunk(i) for i in range(_NUM_ROWS)],
+                delegate.output_paths,
+            )
+            self.assertEqual(
+                sum(len(fs.download_as_bytes(p)) for p in delegate.output_paths),
+                delegate.output_bytes,
+            )
+            table = pq.read_table(
+                pa.BufferReader(fs.download_as_bytes(delegate.output_paths[3]))
+            )
+            self.assertEqual({"id": ["3"], "value": ["VALUE_3"]}, table.to_pydict())
+
+
+class DataframeToParquetTest(unittest.TestCase):
+    """Tests for dataframe_to_parquet."""
+
+    def test_string_columns_and_nulls(self) -> None:
+        df = pd.DataFrame(
+            {
+                "a": ["x", "", None],
+                "all_null": [None, None, None],
+                "n": [1, 2, 3],
+            }
+        )
+        table = pq.read_table(pa.BufferReader(dataframe_to_parquet(df)))
+
+        self.assertEqual(pa.string(), table.schema.field("a").type)
+        self.assertEqual(pa.string(), table.schema.field("all_null").type)
+        self.assertEqual(pa.int64(), table.schema.field("n").type)
+        self.assertEqual(
+            {"a": ["x", None, None], "all_null": [None] * 3, "n": [1, 2, 3]},
+            table.to_pydict(),
+        )
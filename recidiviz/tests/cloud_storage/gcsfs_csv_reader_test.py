@@ -17,12 +17,12 @@
 """Tests for the GcsfsCsvReader."""
 
 import unittest
-from typing import List, Optional
+from typing import List, Optional, Tuple
+from unittest.mock import patch
 
 import pandas as pd
 
 from recidiviz.cloud_storage.gcsfs_csv_reader import (
-    COMMON_RAW_FILE_ENCODINGS,
     GcsfsCsvReader,
     GcsfsCsvReaderDelegate,
 )
@@ -39,6 +39,7 @@ class _TestGcsfsCsvReaderDelegate(GcsfsCsvReaderDelegate):
         self.encodings_attempted: List[str] = []
         self.normalized_streams = 0
         self.decode_errors = 0
+        self.decode_fallbacks: List[Tuple[str, str, int]] = []
         self.exceptions = 0
         self.successful_encoding: Optional[str] = None
 
@@ -58,6 +59,11 @@ class _TestGcsfsCsvReaderDelegate(GcsfsCsvReaderDelegate):
         self.decode_errors += 1
         return False
 
+    def on_decode_fallback(
+        self, failed_encoding: str, new_encoding: str, bytes_wasted: int
+    ) -> None:
+        self.decode_fallbacks.append((failed_encoding, new_encoding, bytes_wasted))
+
     def on_exception(self, encoding: str, e: Exception) -> bool:
         self.exceptions += 1
         return True
@@ -149,11 +155,11 @@ class GcsfsCsvReaderTest(unittest.TestCase):
                 chunk_size=10,
                 encodings_to_try=encodings_to_try,
             )
-        self.assertEqual(encodings_to_try, delegate.encodings_attempted)
-        self.assertEqual(2, len(delegate.encodings_attempted))
+        # Neither encoding can decode the start of the file, so neither is attempted
+        self.assertEqual([], delegate.encodings_attempted)
         self.assertIsNone(delegate.successful_encoding)
         self.assertEqual(0, len(delegate.dataframes))
-        self.assertEqual(2, delegate.decode_errors)
+        self.assertEqual(0, delegate.decode_errors)
         self.assertEqual(0, delegate.exceptions)
 
     def test_read_with_failure_first(self) -> None:
@@ -164,17 +170,54 @@ class GcsfsCsvReaderTest(unittest.TestCase):
         delegate = _TestGcsfsCsvReaderDelegate()
         self.reader.streaming_read(gcs_path, delegate=delegate, chunk_size=1)
 
-        index = COMMON_RAW_FILE_ENCODINGS.index("ISO-8859-1")
-        self.assertEqual(index + 1, len(delegate.encodings_attempted))
-        self.assertEqual(
-            COMMON_RAW_FILE_ENCODINGS[: (index + 1)], delegate.encodings_attempted
-        )
+        # UTF-8 cannot decode the start of the file, so it is skipped up front
+        self.assertEqual(["ISO-8859-1"], delegate.encodings_attempted)
         self.assertEqual("ISO-8859-1", delegate.successful_encoding)
         self.assertEqual(4, len(delegate.dataframes))
         self.assertEqual(
             {"ISO-8859-1"}, {encoding for encoding, df in delegate.dataframes}
         )
+        self.assertEqual(0, delegate.decode_errors)
+        self.assertEqual([], delegate.decode_fallbacks)
+        self.assertEqual(0, delegate.exceptions)
+
+    @patch("recidiviz.cloud_storage.resumable_decoding_stream.DECODE_BLOCK_SIZE", 8)
+    @patch("recidiviz.cloud_storage.gcsfs_csv_reader.ENCODING_SNIFF_SAMPLE_SIZE", 12)
+    def test_read_with_failure_after_ascii_resumes_in_place(self) -> None:
+        file_path = fixtures.as_filepath("encoded_latin_1.csv")
+        gcs_path = GcsfsFilePath.from_absolute_path(file_path)
+        self.fake_gcs.test_add_path(gcs_path, file_path)
+
+        delegate = _TestGcsfsCsvReaderDelegate()
+        self.reader.streaming_read(gcs_path, delegate=delegate, chunk_size=1)
+
+        self.assertEqual(["UTF-8"], delegate.encodings_attempted)
+        self.assertEqual([("UTF-8", "ISO-8859-1", 0)], delegate.decode_fallbacks)
+        self.assertEqual("ISO-8859-1", delegate.successful_encoding)
+        self.assertEqual(4, len(delegate.dataframes))
+        _, last_df = delegate.dataframes[-1]
+        self.assertEqual(["£"], list(last_df.symbol))
+        self.assertEqual(0, delegate.decode_errors)
+        self.assertEqual(0, delegate.exceptions)
+
+    @patch("recidiviz.cloud_storage.resumable_decoding_stream.DECODE_BLOCK_SIZE", 8)
+    @patch("recidiviz.cloud_storage.gcsfs_csv_reader.ENCODING_SNIFF_SAMPLE_SIZE", 12)
+    def test_read_with_failure_after_non_ascii_restarts(self) -> None:
+        file_path = fixtures.as_filepath("encoded_utf_8_then_latin_1.csv")
+        gcs_path = GcsfsFilePath.from_absolute_path(file_path)
+        self.fake_gcs.test_add_path(gcs_path, file_path)
+
+        delegate = _TestGcsfsCsvReaderDelegate()
+        self.reader.streaming_read(gcs_path, delegate=delegate, chunk_size=1)
+
+        self.assertEqual(["UTF-8", "ISO-8859-1"], delegate.encodings_attempted)
         self.assertEqual(1, delegate.decode_errors)
+        self.assertEqual(1, len(delegate.decode_fallbacks))
+        failed_encoding, new_encoding, bytes_wasted = delegate.decode_fallbacks[0]
+        self.assertEqual(("UTF-8", "ISO-8859-1"), (failed_encoding, new_encoding))
+        # The invalid UTF-8 byte is in the fifth 8-byte block
+        self.assertEqual(40, bytes_wasted)
+        self.assertEqual("ISO-8859-1", delegate.successful_encoding)
         self.assertEqual(0, delegate.exceptions)
 
     def test_read_with_no_failure(self) -> None:
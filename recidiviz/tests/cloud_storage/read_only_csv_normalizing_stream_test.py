@@ -16,6 +16,7 @@
 # =============================================================================
 """Tests for CsvNormalizing IO."""
 import csv
+import io
 import unittest
 from typing import List, Optional
 
@@ -390,3 +391,43 @@ class TestCsvNormalizingIO(unittest.TestCase):
             line_terminator="†",
             delimiter="‡",
         )
+
+    def test_multi_character_line_terminator_split_across_blocks(self) -> None:
+        contents = 'a‡b"c‡‡\nd‡e‡\n‡\nf‡‡g'
+        expected = '"a","b""c",""\n"d","e"\n\n"f","","g"'
+        for block_size in range(1, len(expected) + 1):
+            stream = ReadOnlyCsvNormalizingStream(
+                io.StringIO(contents),
+                delimiter="‡",
+                line_terminator="‡\n",
+                quoting=csv.QUOTE_NONE,
+            )
+            result = ""
+            while block := stream.read(block_size):
+                result += block
+            self.assertEqual(expected, result)
+
+            stream = ReadOnlyCsvNormalizingStream(
+                io.StringIO(contents),
+                delimiter="‡",
+                line_terminator="‡\n",
+                quoting=csv.QUOTE_NONE,
+            )
+            lines = []
+            while line := stream.readline(block_size):
+                lines.append(line)
+            self.assertEqual(expected, "".join(lines))
+            self.assertTrue(all(len(line) <= block_size for line in lines))
+
+    def test_long_line_read_in_small_increments(self) -> None:
+        long_value = "x" * 100000
+        contents = f"{long_value}‡{long_value}‡\nend‡\n"
+        stream = ReadOnlyCsvNormalizingStream(
+            io.StringIO(contents),
+            delimiter="‡",
+            line_terminator="‡\n",
+            quoting=csv.QUOTE_NONE,
+        )
+        self.assertEqual(f'"{long_value}","{long_value}"\n', stream.readline())
+        self.assertEqual('"end"\n', stream.readline())
+        self.assertEqual("", stream.readline())
@@ -0,0 +1,124 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2022 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Tests for ResumableDecodingStream."""
+import io
+import unittest
+from typing import List, Tuple
+
+import pandas as pd
+
+from recidiviz.cloud_storage.resumable_decoding_stream import (
+    ResumableDecodingStream,
+    filter_decodable_encodings,
+    is_ascii_compatible,
+)
+
+
+class ResumableDecodingStreamTest(unittest.TestCase):
+    """Tests for ResumableDecodingStream."""
+
+    def setUp(self) -> None:
+        self.switches: List[Tuple[str, str]] = []
+
+    def _stream(
+        self, contents: bytes, encodings: List[str], block_size: int
+    ) -> ResumableDecodingStream:
+        return ResumableDecodingStream(
+            io.BytesIO(contents),
+            encodings,
+            on_encoding_switch=lambda old, new: self.switches.append((old, new)),
+            block_size=block_size,
+        )
+
+    def test_read_matches_text_io_wrapper(self) -> None:
+        contents = "a,b\r\nc,é\rd,€\n\r\n".encode("UTF-8")
+        expected = io.TextIOWrapper(io.BytesIO(contents), encoding="UTF-8").read()
+        for block_size in range(1, len(contents) + 1):
+            stream = self._stream(contents, ["UTF-8"], block_size)
+            self.assertEqual(expected, stream.read())
+
+            stream = self._stream(contents, ["UTF-8"], block_size)
+            self.assertEqual(expected.splitlines(keepends=True), list(stream))
+
+            stream = self._stream(contents, ["UTF-8"], block_size)
+            result = ""
+            while chunk := stream.read(3):
+                result += chunk
+            self.assertEqual(expected, result)
+        self.assertEqual([], self.switches)
+
+    def test_readline_with_size(self) -> None:
+        stream = self._stream(b"abcdef\ngh\n", ["UTF-8"], block_size=2)
+        self.assertEqual("abcd", stream.readline(4))
+        self.assertEqual("ef\n", stream.readline(4))
+        self.assertEqual("gh\n", stream.readline())
+        self.assertEqual("", stream.readline())
+
+    def test_switch_encoding_after_ascii(self) -> None:
+        stream = self._stream(
+            b"symbol,name\r\n\xa3,pound\n", ["UTF-8", "ISO-8859-1"], block_size=13
+        )
+        self.assertEqual("symbol,name\n£,pound\n", stream.read())
+        self.assertEqual("ISO-8859-1", stream.encoding)
+        self.assertEqual(1, stream.num_encoding_switches)
+        self.assertEqual([("UTF-8", "ISO-8859-1")], self.switches)
+
+    def test_no_switch_after_non_ascii(self) -> None:
+        stream = self._stream(
+            b"\xc2\xa3,pound\n\xa3,pound\n", ["UTF-8", "ISO-8859-1"], block_size=4
+        )
+        with self.assertRaises(UnicodeDecodeError):
+            stream.read()
+        self.assertEqual("UTF-8", stream.encoding)
+        self.assertEqual([], self.switches)
+
+    def test_no_switch_to_ascii_incompatible_encoding(self) -> None:
+        stream = self._stream(b"abc\n\xff\n", ["UTF-8", "UTF-16"], block_size=4)
+        with self.assertRaises(UnicodeDecodeError):
+            stream.read()
+        self.assertEqual([], self.switches)
+
+    def test_read_csv(self) -> None:
+        stream = self._stream(
+            b"symbol,name\n?,question mark\n\x80,euro\n",
+            ["UTF-8", "WINDOWS-1252"],
+            block_size=5,
+        )
+        df = pd.read_csv(stream, dtype=str)
+        self.assertEqual(["?", "€"], list(df.symbol))
+        self.assertEqual([("UTF-8", "WINDOWS-1252")], self.switches)
+
+    def test_filter_decodable_encodings(self) -> None:
+        # A multibyte character cut off at the end of an incomplete sample is fine
+        sample = "abé".encode("UTF-8")[:-1]
+        self.assertEqual(
+            ["UTF-8", "ISO-8859-1"],
+            filter_decodable_encodings(
+                sample, ["UTF-8", "ISO-8859-1"], is_complete=False
+            ),
+        )
+        self.assertEqual(
+            ["ISO-8859-1"],
+            filter_decodable_encodings(
+                sample, ["UTF-8", "ISO-8859-1"], is_complete=True
+            ),
+        )
+
+    def test_is_ascii_compatible(self) -> None:
+        self.assertTrue(is_ascii_compatible("UTF-8"))
+        self.assertTrue(is_ascii_compatible("WINDOWS-1252"))
+        self.assertFalse(is_ascii_compatible("UTF-16"))
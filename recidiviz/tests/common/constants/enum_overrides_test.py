@@ -21,7 +21,10 @@ import unittest
 from recidiviz.common.constants.county.bond import BondStatus, BondType
 from recidiviz.common.constants.county.charge import ChargeClass, ChargeDegree
 from recidiviz.common.constants.county.person_characteristics import Ethnicity, Race
-from recidiviz.common.constants.enum_overrides import EnumOverrides
+from recidiviz.common.constants.enum_overrides import (
+    EnumOverrides,
+    pure_enum_parsing_fn,
+)
 
 
 class EnumOverridesTest(unittest.TestCase):
@@ -142,3 +145,54 @@ class EnumOverridesTest(unittest.TestCase):
         self.assertEqual(
             overrides.parse("A", ChargeDegree), overrides.parse("a", ChargeDegree)
         )
+
+    def test_is_cacheable(self) -> None:
+        @pure_enum_parsing_fn
+        def pure_mapper(_label: str) -> BondStatus:
+            return BondStatus.PENDING
+
+        overrides_builder = EnumOverrides.Builder()
+        overrides_builder.add("A", ChargeDegree.FIRST)
+        overrides_builder.ignore("X", ChargeDegree)
+        overrides_builder.add_mapper_fn(lambda s: BondStatus.PENDING, BondType)
+        overrides_builder.add_mapper_fn(pure_mapper, BondStatus)
+        overrides_builder.ignore_with_predicate(lambda s: s.startswith("X"), Race)
+
+        overrides = overrides_builder.build()
+
+        self.assertTrue(overrides.is_cacheable(ChargeDegree))
+        self.assertFalse(overrides.is_cacheable(BondType))
+        self.assertTrue(overrides.is_cacheable(BondStatus))
+        self.assertFalse(overrides.is_cacheable(Race))
+        self.assertTrue(overrides.is_cacheable(Ethnicity))
+
+    def test_pure_mapper_fn_results_cached(self) -> None:
+        labels_seen = []
+
+        @pure_enum_parsing_fn
+        def pure_mapper(label: str) -> BondStatus:
+            labels_seen.append(label)
+            return BondStatus.PENDING
+
+        def impure_mapper(label: str) -> BondStatus:
+            labels_seen.append(label)
+            return BondStatus.PENDING
+
+        pure_overrides = (
+            EnumOverrides.Builder().add_mapper_fn(pure_mapper, BondStatus).build()
+        )
+        for _ in range(3):
+            self.assertEqual(
+                BondStatus.PENDING, pure_overrides.parse("PENDING", BondStatus)
+            )
+        self.assertEqual(["PENDING"], labels_seen)
+
+        labels_seen.clear()
+        impure_overrides = (
+            EnumOverrides.Builder().add_mapper_fn(impure_mapper, BondStatus).build()
+        )
+        for _ in range(3):
+            self.assertEqual(
+                BondStatus.PENDING, impure_overrides.parse("PENDING", BondStatus)
+            )
+        self.assertEqual(["PENDING"] * 3, labels_seen)
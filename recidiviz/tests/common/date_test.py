@@ -21,6 +21,7 @@ import unittest
 from recidiviz.common.date import (
     DateRange,
     DateRangeDiff,
+    DateRangeUnion,
     NonNegativeDateRange,
     is_date_str,
     munge_date_string,
@@ -182,6 +183,79 @@ class TestNonNegativeDateRange(unittest.TestCase):
             )
 
 
+class TestDateRangeUnion(unittest.TestCase):
+    """Tests for DateRangeUnion"""
+
+    def test_from_ranges_merges_overlapping_and_adjacent(self) -> None:
+        union = DateRangeUnion.from_ranges(
+            [
+                DateRange(datetime.date(2019, 3, 1), datetime.date(2019, 3, 10)),
+                DateRange(datetime.date(2019, 1, 1), datetime.date(2019, 2, 1)),
+                DateRange(datetime.date(2019, 1, 15), datetime.date(2019, 1, 20)),
+                DateRange(datetime.date(2019, 2, 1), datetime.date(2019, 2, 5)),
+                DateRange(datetime.date(2019, 3, 5), datetime.date(2019, 4, 1)),
+            ]
+        )
+
+        self.assertEqual(
+            [
+                DateRange(datetime.date(2019, 1, 1), datetime.date(2019, 2, 5)),
+                DateRange(datetime.date(2019, 3, 1), datetime.date(2019, 4, 1)),
+            ],
+            union.merged_ranges,
+        )
+
+    def test_from_ranges_ignores_empty_ranges(self) -> None:
+        union = DateRangeUnion.from_ranges(
+            [DateRange(datetime.date(2019, 3, 1), datetime.date(2019, 3, 1))]
+        )
+
+        self.assertEqual([], union.merged_ranges)
+        self.assertFalse(union.contains_day(datetime.date(2019, 3, 1)))
+
+    def test_contains_day(self) -> None:
+        union = DateRangeUnion.from_ranges(
+            [
+                DateRange(datetime.date(2019, 1, 1), datetime.date(2019, 2, 1)),
+                DateRange(datetime.date(2019, 3, 1), datetime.date(2019, 4, 1)),
+            ]
+        )
+
+        self.assertFalse(union.contains_day(datetime.date(2018, 12, 31)))
+        self.assertTrue(union.contains_day(datetime.date(2019, 1, 1)))
+        self.assertTrue(union.contains_day(datetime.date(2019, 1, 31)))
+        self.assertFalse(union.contains_day(datetime.date(2019, 2, 1)))
+        self.assertTrue(union.contains_day(datetime.date(2019, 3, 15)))
+        self.assertFalse(union.contains_day(datetime.date(2019, 4, 1)))
+
+    def test_covers_range(self) -> None:
+        union = DateRangeUnion.from_ranges(
+            [
+                DateRange(datetime.date(2019, 1, 1), datetime.date(2019, 2, 1)),
+                DateRange(datetime.date(2019, 2, 1), datetime.date(2019, 3, 1)),
+                DateRange(datetime.date(2019, 4, 1), datetime.date(2019, 5, 1)),
+            ]
+        )
+
+        self.assertTrue(union.covers_range(DateRange.for_month(2019, 1)))
+        self.assertTrue(
+            union.covers_range(
+                DateRange(datetime.date(2019, 1, 15), datetime.date(2019, 2, 15))
+            )
+        )
+        self.assertFalse(union.covers_range(DateRange.for_month(2019, 3)))
+        self.assertFalse(
+            union.covers_range(
+                DateRange(datetime.date(2019, 2, 15), datetime.date(2019, 4, 15))
+            )
+        )
+        self.assertFalse(
+            union.covers_range(
+                DateRange(datetime.date(2019, 1, 15), datetime.date(2019, 1, 15))
+            )
+        )
+
+
 class TestDateRangeDiff(unittest.TestCase):
     """Tests for DateRangeDiff"""
 
@@ -0,0 +1,384 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2022 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Tests for IngestViewProcessorImpl."""
+import csv
+import datetime
+import os
+import tempfile
+import unittest
+from typing import Any, Callable, Dict, Iterator, List
+from unittest.mock import MagicMock, patch
+
+from recidiviz.common.constants.states import StateCode
+from recidiviz.common.ingest_metadata import IngestMetadata, SystemLevel
+from recidiviz.common.io.local_file_contents_handle import LocalFileContentsHandle
+from recidiviz.ingest.direct.controllers.ingest_view_processor import (
+    IngestViewProcessorImpl,
+)
+from recidiviz.ingest.direct.ingest_mappings.ingest_view_results_parser import (
+    IngestViewResultsParser,
+)
+from recidiviz.ingest.direct.types.cloud_task_args import ExtractAndMergeArgs
+from recidiviz.ingest.direct.types.direct_ingest_instance import DirectIngestInstance
+from recidiviz.persistence import persistence
+from recidiviz.persistence.database.sqlalchemy_database_key import SQLAlchemyDatabaseKey
+from recidiviz.persistence.entity.base_entity import Entity
+from recidiviz.persistence.entity.county import entities as county_entities
+from recidiviz.persistence.entity.state import entities as state_entities
+from recidiviz.persistence.entity_matching.entity_matching_types import MatchedEntities
+from recidiviz.utils.environment import GCP_PROJECT_STAGING
+
+_STATE_CODE = StateCode.US_XX.value
+_ID_TYPE = "US_XX_ID_TYPE"
+_INGEST_TIME = datetime.datetime(2022, 3, 4, 5, 6, 7)
+
+
+class _FakeIngestViewResultsParser(IngestViewResultsParser):
+    """Fake parser that builds one person per row from the row's PERSON_ID column,
+    using |build_person|.
+    """
+
+    def __init__(self, build_person: Callable[[str], Entity]):
+        super().__init__(delegate=MagicMock())
+        self.build_person = build_person
+
+    def iter_parse(
+        self, *, ingest_view_name: str, contents_iterator: Iterator[Dict[str, str]]
+    ) -> Iterator[Entity]:
+        for row in contents_iterator:
+            yield self.build_person(row["PERSON_ID"])
+
+
+def _build_state_person(person_id: str) -> Entity:
+    return state_entities.StatePerson.new_with_defaults(
+        state_code=_STATE_CODE,
+        external_ids=[
+            state_entities.StatePersonExternalId.new_with_defaults(
+                state_code=_STATE_CODE, external_id=person_id, id_type=_ID_TYPE
+            )
+        ],
+    )
+
+
+def _build_county_person(person_id: str) -> Entity:
+    return county_entities.Person.new_with_defaults(
+        external_id=person_id or None,
+        region="us_xx_county",
+        jurisdiction_id="01234567",
+    )
+
+
+def _person_id(person: Entity) -> str:
+    if isinstance(person, state_entities.StatePerson):
+        return person.external_ids[0].external_id
+    if isinstance(person, county_entities.Person):
+        return person.external_id or ""
+    raise ValueError(f"Unexpected entity type [{type(person)}]")
+
+
+def _contents_handle(person_ids: List[str]) -> LocalFileContentsHandle:
+    fd, path = tempfile.mkstemp(suffix=".csv")
+    with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["PERSON_ID"])
+        writer.writerows([person_id] for person_id in person_ids)
+    return LocalFileContentsHandle(path, cleanup_file=True)
+
+
+def _run_parse_and_persist(
+    processor: IngestViewProcessorImpl,
+    person_ids: List[str],
+    system_level: SystemLevel,
+) -> bool:
+    return processor.parse_and_persist_contents(
+        args=ExtractAndMergeArgs(
+            ingest_time=_INGEST_TIME,
+            ingest_view_name="ingest_view",
+            ingest_instance=DirectIngestInstance.PRIMARY,
+            upper_bound_datetime_inclusive=_INGEST_TIME,
+            batch_number=0,
+        ),
+        contents_handle=_contents_handle(person_ids),
+        ingest_metadata=IngestMetadata(
+            region=_STATE_CODE.lower(),
+            ingest_time=_INGEST_TIME,
+            system_level=system_level,
+            database_key=SQLAlchemyDatabaseKey.canonical_for_schema(
+                system_level.schema_type()
+            ),
+        ),
+    )
+
+
+class IngestViewProcessorImplTest(unittest.TestCase):
+    """Tests for IngestViewProcessorImpl."""
+
+    def setUp(self) -> None:
+        self.write_entities_patcher = patch(
+            "recidiviz.persistence.persistence.write_entities", return_value=True
+        )
+        self.mock_write_entities = self.write_entities_patcher.start()
+
+    def tearDown(self) -> None:
+        self.write_entities_patcher.stop()
+
+    def _persisted_person_ids_by_call(self) -> List[List[str]]:
+        return [
+            [_person_id(person) for person in call.kwargs["conversion_result"].people]
+            for call in self.mock_write_entities.call_args_list
+        ]
+
+    def test_parse_and_persist_contents(self) -> None:
+        processor = IngestViewProcessorImpl(
+            ingest_view_file_parser=_FakeIngestViewResultsParser(_build_state_person)
+        )
+
+        self.assertTrue(
+            _run_parse_and_persist(processor, ["1", "1", "2", "3"], SystemLevel.STATE)
+        )
+
+        self.assertEqual([["1", "1", "2", "3"]], self._persisted_person_ids_by_call())
+        self.assertEqual(4, self.mock_write_entities.call_args.kwargs["total_people"])
+
+    def test_parse_and_persist_contents_batched_state(self) -> None:
+        processor = IngestViewProcessorImpl(
+            ingest_view_file_parser=_FakeIngestViewResultsParser(_build_state_person),
+            persist_batch_size=2,
+        )
+
+        self.assertTrue(
+            _run_parse_and_persist(
+                processor, ["1", "1", "2", "3", "3", "3", "4"], SystemLevel.STATE
+            )
+        )
+
+        # Adjacent people with the same external ids are never split across batches
+        self.assertEqual(
+            [["1", "1"], ["2", "3", "3", "3"], ["4"]],
+            self._persisted_person_ids_by_call(),
+        )
+        self.assertEqual(
+            [2, 4, 1],
+            [
+                call.kwargs["total_people"]
+                for call in self.mock_write_entities.call_args_list
+            ],
+        )
+
+    def test_parse_and_persist_contents_batched_county(self) -> None:
+        processor = IngestViewProcessorImpl(
+            ingest_view_file_parser=_FakeIngestViewResultsParser(_build_county_person),
+            persist_batch_size=2,
+        )
+
+        self.assertTrue(
+            _run_parse_and_persist(
+                processor, ["1", "1", "2", "3", "3", "3", "4"], SystemLevel.COUNTY
+            )
+        )
+
+        self.assertEqual(
+            [["1", "1"], ["2", "3", "3", "3"], ["4"]],
+            self._persisted_person_ids_by_call(),
+        )
+
+    def test_parse_and_persist_contents_batched_county_no_external_ids(self) -> None:
+        processor = IngestViewProcessorImpl(
+            ingest_view_file_parser=_FakeIngestViewResultsParser(_build_county_person),
+            persist_batch_size=2,
+        )
+
+        self.assertTrue(
+            _run_parse_and_persist(processor, ["", "", ""], SystemLevel.COUNTY)
+        )
+
+        # People without external ids are not grouped together
+        self.assertEqual(
+            [["", ""], [""]],
+            self._persisted_person_ids_by_call(),
+        )
+
+    def test_parse_and_persist_contents_batched_stops_after_failed_batch(
+        self,
+    ) -> None:
+        self.mock_write_entities.side_effect = [True, False, True]
+        processor = IngestViewProcessorImpl(
+            ingest_view_file_parser=_FakeIngestViewResultsParser(_build_state_person),
+            persist_batch_size=1,
+        )
+
+        self.assertFalse(
+            _run_parse_and_persist(processor, ["1", "2", "3"], SystemLevel.STATE)
+        )
+
+        self.assertEqual([["1"], ["2"]], self._persisted_person_ids_by_call())
+
+
+class IngestViewProcessorImplShardedPersistTest(unittest.TestCase):
+    """Tests for IngestViewProcessorImpl with sharded writes, running the real
+    persistence.write_entities() with its database collaborators faked out.
+    """
+
+    def setUp(self) -> None:
+        self.invariant_errors_by_shard: Dict[int, int] = {}
+        self.entity_matching_errors_per_shard = 0
+        self.matched_person_ids_by_shard: List[List[str]] = []
+
+        def fake_match(
+            _session: Any,
+            _region: str,
+            people: List[state_entities.StatePerson],
+            _ingest_metadata: IngestMetadata,
+        ) -> MatchedEntities:
+            self.matched_person_ids_by_shard.append(
+                [_person_id(person) for person in people]
+            )
+            return MatchedEntities(
+                people=people,
+                orphaned_entities=[],
+                error_count=self.entity_matching_errors_per_shard,
+                total_root_entities=len(people),
+            )
+
+        def fake_validate_invariants(*_args: Any) -> int:
+            return self.invariant_errors_by_shard.get(
+                len(self.matched_person_ids_by_shard) - 1, 0
+            )
+
+        self.patchers = [
+            patch(
+                "recidiviz.utils.metadata.project_id",
+                MagicMock(return_value=GCP_PROJECT_STAGING),
+            ),
+            patch(
+                "recidiviz.persistence.persistence.should_persist",
+                MagicMock(return_value=True),
+            ),
+            patch(
+                "recidiviz.persistence.persistence.SessionFactory.using_database",
+                MagicMock(),
+            ),
+            patch(
+                "recidiviz.persistence.persistence.entity_matching.match",
+                side_effect=fake_match,
+            ),
+            patch(
+                "recidiviz.persistence.persistence.database_invariant_validator"
+                ".validate_invariants",
+                side_effect=fake_validate_invariants,
+            ),
+        ]
+        for patcher in self.patchers:
+            patcher.start()
+        self.write_people_patcher = patch(
+            "recidiviz.persistence.persistence.database.write_people"
+        )
+        self.mock_write_people = self.write_people_patcher.start()
+
+    def tearDown(self) -> None:
+        for patcher in self.patchers:
+            patcher.stop()
+        self.write_people_patcher.stop()
+
+    def _written_person_ids_by_shard(self) -> List[List[str]]:
+        return [
+            [_person_id(person) for person in call.args[1]]
+            for call in self.mock_write_people.call_args_list
+        ]
+
+    def test_parse_and_persist_contents_sharded(self) -> None:
+        processor = IngestViewProcessorImpl(
+            ingest_view_file_parser=_FakeIngestViewResultsParser(_build_state_person),
+            persist_shard_size=2,
+        )
+
+        self.assertTrue(
+            _run_parse_and_persist(
+                processor, ["1", "2", "1", "3", "4"], SystemLevel.STATE
+            )
+        )
+
+        # People that share external ids are always written in the same shard
+        self.assertEqual(
+            [["1", "1"], ["2", "3"], ["4"]], self.matched_person_ids_by_shard
+        )
+        self.assertEqual(
+            self.matched_person_ids_by_shard, self._written_person_ids_by_shard()
+        )
+
+    def test_parse_and_persist_contents_sharded_multiple_workers(self) -> None:
+        processor = IngestViewProcessorImpl(
+            ingest_view_file_parser=_FakeIngestViewResultsParser(_build_state_person),
+            persist_shard_size=1,
+            num_persist_shard_workers=3,
+        )
+
+        self.assertTrue(
+            _run_parse_and_persist(
+                processor, ["1", "2", "3", "4", "5"], SystemLevel.STATE
+            )
+        )
+
+        self.assertEqual(
+            [["1"], ["2"], ["3"], ["4"], ["5"]],
+            sorted(self._written_person_ids_by_shard()),
+        )
+
+    def test_parse_and_persist_contents_sharded_skips_shards_after_abort(
+        self,
+    ) -> None:
+        self.invariant_errors_by_shard = {1: 1}
+        processor = IngestViewProcessorImpl(
+            ingest_view_file_parser=_FakeIngestViewResultsParser(_build_state_person),
+            persist_shard_size=1,
+        )
+
+        self.assertFalse(
+            _run_parse_and_persist(processor, ["1", "2", "3"], SystemLevel.STATE)
+        )
+
+        # The first shard was already committed, the second exceeded the database
+        # invariant error threshold and the third was never started.
+        self.assertEqual([["1"], ["2"]], self.matched_person_ids_by_shard)
+        self.assertEqual([["1"]], self._written_person_ids_by_shard())
+
+    def test_parse_and_persist_contents_sharded_even_errors_commit_nothing(
+        self,
+    ) -> None:
+        # Every shard has a 10% entity matching error rate, above the 5% threshold
+        self.entity_matching_errors_per_shard = 1
+        processor = IngestViewProcessorImpl(
+            ingest_view_file_parser=_FakeIngestViewResultsParser(_build_state_person),
+            persist_shard_size=10,
+        )
+
+        with patch.dict(
+            persistence.STATE_CODE_TO_ENTITY_MATCHING_THRESHOLD_OVERRIDE,
+            {GCP_PROJECT_STAGING: {_STATE_CODE: 0.05}},
+        ), patch.dict(persistence.SYSTEM_TYPE_TO_ERROR_THRESHOLD[SystemLevel.STATE]):
+            self.assertFalse(
+                _run_parse_and_persist(
+                    processor, [str(i) for i in range(40)], SystemLevel.STATE
+                )
+            )
+
+        # The error ratio is measured against the shards matched so far, so the write
+        # is aborted before any shard is committed.
+        self.assertEqual(
+            [[str(i) for i in range(10)]], self.matched_person_ids_by_shard
+        )
+        self.assertEqual([], self._written_person_ids_by_shard())
@@ -16,6 +16,7 @@
 # =============================================================================
 """Custom enum parser functions for use in ingest_view_file_parser_test.py."""
 
+from recidiviz.common.constants.enum_overrides import pure_enum_parsing_fn
 from recidiviz.tests.ingest.direct.ingest_mappings.fixtures.ingest_view_file_parser.fake_schema.entities import (
     FakeRace,
 )
@@ -30,6 +31,7 @@ def flip_black_and_white(raw_text: str) -> FakeRace:
     raise ValueError(f"Unexpected raw_text value: [{raw_text}]")
 
 
+@pure_enum_parsing_fn
 def race_two_parts(raw_text: str) -> FakeRace:
     # No normalization of raw text values before they are passed to this custom parser.
     pt1, pt2 = raw_text.split("$$")
@@ -20,16 +20,22 @@ import datetime
 import os
 import unittest
 from enum import Enum
-from typing import Callable, Dict, List, Optional, Type
+from typing import Callable, Dict, Iterator, List, Optional, Type
+from unittest.mock import patch
+
+from more_itertools import one
 
 from recidiviz.common.constants.enum_parser import EnumParsingError
 from recidiviz.common.constants.states import StateCode
+from recidiviz.common.constants.strict_enum_parser import StrictEnumParser
 from recidiviz.common.io.local_file_contents_handle import LocalFileContentsHandle
 from recidiviz.ingest.direct.ingest_mappings.custom_function_registry import (
     CustomFunctionRegistry,
 )
 from recidiviz.ingest.direct.ingest_mappings.ingest_view_manifest import (
     EntityTreeManifest,
+    EnumMappingManifest,
+    ListRelationshipFieldManifest,
 )
 from recidiviz.ingest.direct.ingest_mappings.ingest_view_results_parser import (
     IngestViewResultsParser,
@@ -2234,6 +2240,244 @@ class IngestViewFileParserTest(unittest.TestCase):
         ):
             _ = self._run_parse_for_ingest_view("extra_csv_column")
 
+    def test_compiled_row_evaluator_matches_build_from_row(self) -> None:
+        fixtures_dir = os.path.dirname(ingest_view_files.__file__)
+        num_rows_compared = 0
+        for file_name in sorted(os.listdir(fixtures_dir)):
+            ingest_view_name, extension = os.path.splitext(file_name)
+            if extension != ".csv":
+                continue
+            try:
+                manifest = self._run_parse_manifest_for_ingest_view(ingest_view_name)
+            except ValueError:
+                # Some fixtures exist to test invalid manifests
+                continue
+            build_output_tree = manifest.compile_row_evaluator()
+
+            with open(os.path.join(fixtures_dir, file_name), encoding="utf-8") as f:
+                for row in csv.DictReader(f):
+                    try:
+                        expected_output_tree = manifest.build_from_row(dict(row))
+                    except Exception as e:
+                        with self.assertRaises(type(e)):
+                            build_output_tree(dict(row))
+                        continue
+                    self.assertEqual(
+                        expected_output_tree,
+                        build_output_tree(dict(row)),
+                        f"Compiled output differs for [{ingest_view_name}] row {row}",
+                    )
+                    num_rows_compared += 1
+
+        self.assertGreater(num_rows_compared, 100)
+
+    def test_extra_column_in_later_row(self) -> None:
+        parser = IngestViewResultsParser(
+            FakeSchemaIngestViewResultsParserDelegate(
+                DirectIngestInstance.SECONDARY, is_production=False
+            )
+        )
+        with self.assertRaisesRegex(
+            ValueError,
+            r"Found columns in input results row \[1\] not present in manifest "
+            r"\|input_columns\| list: {'SSN'}",
+        ):
+            _ = parser.parse(
+                ingest_view_name="simple_enums",
+                contents_iterator=iter(
+                    [
+                        {"PERSONID": "1", "GENDER": "F"},
+                        {"PERSONID": "2", "GENDER": "M", "SSN": "123"},
+                    ]
+                ),
+            )
+
+    @staticmethod
+    def _simple_enums_rows(person_ids: List[str]) -> Iterator[Dict[str, str]]:
+        for person_id in person_ids:
+            yield {"PERSONID": person_id, "GENDER": "F"}
+
+    @staticmethod
+    def _person_ids(people: List[Entity]) -> List[str]:
+        return [
+            one(person.external_ids).external_id
+            for person in people
+            if isinstance(person, FakePerson)
+        ]
+
+    def test_iter_parse(self) -> None:
+        parser = IngestViewResultsParser(
+            FakeSchemaIngestViewResultsParserDelegate(
+                DirectIngestInstance.SECONDARY, is_production=False
+            )
+        )
+        rows = self._simple_enums_rows(["1", "2", "3"])
+
+        parsed_iterator = parser.iter_parse(
+            ingest_view_name="simple_enums", contents_iterator=rows
+        )
+
+        first_person = next(parsed_iterator)
+        self.assertEqual(["1"], self._person_ids([first_person]))
+        # Rows are only consumed as results are requested
+        self.assertEqual({"PERSONID": "2", "GENDER": "F"}, next(rows))
+        self.assertEqual(["3"], self._person_ids(list(parsed_iterator)))
+
+    def test_parse_batches(self) -> None:
+        parser = IngestViewResultsParser(
+            FakeSchemaIngestViewResultsParserDelegate(
+                DirectIngestInstance.SECONDARY, is_production=False
+            )
+        )
+
+        batches = list(
+            parser.parse_batches(
+                ingest_view_name="simple_enums",
+                contents_iterator=self._simple_enums_rows(["1", "2", "3", "4", "5"]),
+                batch_size=2,
+            )
+        )
+
+        self.assertEqual(
+            [["1", "2"], ["3", "4"], ["5"]],
+            [self._person_ids(batch) for batch in batches],
+        )
+
+    def test_parse_batches_with_key(self) -> None:
+        parser = IngestViewResultsParser(
+            FakeSchemaIngestViewResultsParserDelegate(
+                DirectIngestInstance.SECONDARY, is_production=False
+            )
+        )
+
+        batches = list(
+            parser.parse_batches(
+                ingest_view_name="simple_enums",
+                contents_iterator=self._simple_enums_rows(
+                    ["1", "2", "2", "2", "3", "4", "4"]
+                ),
+                batch_size=2,
+                batch_key_fn=lambda person: one(self._person_ids([person])),
+            )
+        )
+
+        # Trees with the same key are never split across batches
+        self.assertEqual(
+            [["1", "2", "2", "2"], ["3", "4", "4"]],
+            [self._person_ids(batch) for batch in batches],
+        )
+
+    def test_parse_batches_empty(self) -> None:
+        parser = IngestViewResultsParser(
+            FakeSchemaIngestViewResultsParserDelegate(
+                DirectIngestInstance.SECONDARY, is_production=False
+            )
+        )
+
+        batches = list(
+            parser.parse_batches(
+                ingest_view_name="simple_enums",
+                contents_iterator=self._simple_enums_rows([]),
+                batch_size=2,
+            )
+        )
+
+        self.assertEqual([], batches)
+
+    def test_parse_batches_is_lazy(self) -> None:
+        parser = IngestViewResultsParser(
+            FakeSchemaIngestViewResultsParserDelegate(
+                DirectIngestInstance.SECONDARY, is_production=False
+            )
+        )
+        num_rows_read = 0
+
+        def rows() -> Iterator[Dict[str, str]]:
+            nonlocal num_rows_read
+            for row in self._simple_enums_rows([str(i) for i in range(100)]):
+                num_rows_read += 1
+                yield row
+
+        batches = parser.parse_batches(
+            ingest_view_name="simple_enums", contents_iterator=rows(), batch_size=10
+        )
+
+        self.assertEqual(0, num_rows_read)
+        self.assertEqual([str(i) for i in range(10)], self._person_ids(next(batches)))
+        # Only one row past the end of the batch is read, to find where it ends
+        self.assertEqual(11, num_rows_read)
+        self.assertEqual(
+            [str(i) for i in range(10, 20)], self._person_ids(next(batches))
+        )
+        self.assertEqual(21, num_rows_read)
+
+    def test_enum_mapping_parsed_values_cached(self) -> None:
+        manifest = self._run_parse_manifest_for_ingest_view("simple_enums")
+        gender_manifest = manifest.field_manifests["gender"]
+        assert isinstance(gender_manifest, EnumMappingManifest)
+
+        with patch(
+            "recidiviz.ingest.direct.ingest_mappings.ingest_view_manifest.StrictEnumParser",
+            wraps=StrictEnumParser,
+        ) as mock_parser:
+            for raw_text in ["F", "M", "F", "MA", "M", "U", "U"]:
+                gender_manifest.build_from_row({"PERSONID": "1", "GENDER": raw_text})
+
+            self.assertEqual(
+                FakeGender.MALE, gender_manifest.build_from_row({"GENDER": "MA"})
+            )
+            self.assertIsNone(gender_manifest.build_from_row({"GENDER": "U"}))
+
+        # Each distinct raw text value is only parsed once
+        self.assertEqual(4, mock_parser.call_count)
+        cache_info = gender_manifest.parsing_cache_info()
+        assert cache_info is not None
+        self.assertEqual(5, cache_info.hits)
+        self.assertEqual(4, cache_info.misses)
+
+    def test_enum_pure_custom_parser_parsed_values_cached(self) -> None:
+        manifest = self._run_parse_manifest_for_ingest_view(
+            "enum_custom_parser_concatenated_raw"
+        )
+        races_manifest = manifest.field_manifests["races"]
+        assert isinstance(races_manifest, ListRelationshipFieldManifest)
+        race_entity_manifest = one(races_manifest.child_manifests)
+        assert isinstance(race_entity_manifest, EntityTreeManifest)
+        race_manifest = race_entity_manifest.field_manifests["race"]
+        assert isinstance(race_manifest, EnumMappingManifest)
+
+        for _ in range(3):
+            self.assertEqual(
+                FakeRace.BLACK,
+                race_manifest.build_from_row(
+                    {"PERSONID": "1", "RACE": "B", "RACE_SUFFIX": "x"}
+                ),
+            )
+
+        cache_info = race_manifest.parsing_cache_info()
+        assert cache_info is not None
+        self.assertEqual(2, cache_info.hits)
+        self.assertEqual(1, cache_info.misses)
+
+    def test_enum_custom_parser_parsed_values_not_cached(self) -> None:
+        manifest = self._run_parse_manifest_for_ingest_view("enum_custom_parser")
+        races_manifest = manifest.field_manifests["races"]
+        assert isinstance(races_manifest, ListRelationshipFieldManifest)
+        race_entity_manifest = one(races_manifest.child_manifests)
+        assert isinstance(race_entity_manifest, EntityTreeManifest)
+        race_manifest = race_entity_manifest.field_manifests["race"]
+        assert isinstance(race_manifest, EnumMappingManifest)
+
+        with patch(
+            "recidiviz.ingest.direct.ingest_mappings.ingest_view_manifest.StrictEnumParser",
+            wraps=StrictEnumParser,
+        ) as mock_parser:
+            for _ in range(3):
+                race_manifest.build_from_row({"PERSONID": "1", "RACE": "W"})
+
+        self.assertEqual(3, mock_parser.call_count)
+        self.assertIsNone(race_manifest.parsing_cache_info())
+
     def test_unused_col_not_in_input_cols_list(self) -> None:
         with self.assertRaisesRegex(
             ValueError,
@@ -0,0 +1,257 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2022 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Tests for direct_ingest_raw_file_import_manager.py."""
+import datetime
+import os
+import tempfile
+import unittest
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytz
+from google.cloud import bigquery
+
+from recidiviz.cloud_storage.gcsfs_csv_reader import GcsfsCsvReader
+from recidiviz.cloud_storage.gcsfs_csv_reader_delegates import ChunkFileFormat
+from recidiviz.cloud_storage.gcsfs_path import GcsfsDirectoryPath, GcsfsFilePath
+from recidiviz.ingest.direct.gcs.direct_ingest_gcs_file_system import (
+    DirectIngestGCSFileSystem,
+    to_normalized_unprocessed_raw_file_path,
+)
+from recidiviz.ingest.direct.raw_data.direct_ingest_raw_file_import_manager import (
+    FILE_ID_COL_NAME,
+    UPDATE_DATETIME_COL_NAME,
+    DirectIngestRawDataSplittingGcsfsCsvReaderDelegate,
+    DirectIngestRawFileConfig,
+    DirectIngestRawFileImportManager,
+    strip_whitespace_and_drop_empty_rows,
+)
+from recidiviz.persistence.entity.operations.entities import DirectIngestRawFileMetadata
+from recidiviz.tests.cloud_storage.fake_gcs_file_system import FakeGCSFileSystem
+from recidiviz.utils.yaml_dict import YAMLDict
+
+# Arrow types that BigQuery loads into each of the column types used in raw data
+# tables.
+_ARROW_TYPE_FOR_BQ_TYPE = {
+    bigquery.enums.SqlTypeNames.STRING.value: pa.string(),
+    bigquery.enums.SqlTypeNames.INTEGER.value: pa.int64(),
+    # BigQuery loads timestamps that are not adjusted to UTC as DATETIME.
+    bigquery.enums.SqlTypeNames.DATETIME.value: pa.timestamp("us"),
+}
+
+
+def _strip_whitespace_and_drop_empty_rows_per_cell(df: pd.DataFrame) -> pd.DataFrame:
+    """Reference implementation that strips and checks every cell individually."""
+    df = df.applymap(lambda x: x.strip())
+    return df[~pd.isnull(df.applymap(lambda x: None if x == "" else x)).all(axis=1)]
+
+
+class StripWhitespaceAndDropEmptyRowsTest(unittest.TestCase):
+    """Tests for strip_whitespace_and_drop_empty_rows()."""
+
+    def test_strip_and_drop_empty_rows(self) -> None:
+        df = pd.DataFrame(
+            {
+                "COL1": [" A ", "", "  ", "B\t", "\x1c\n"],
+                "COL2": ["", "", "\t", " C", "D\xa0"],
+            },
+            dtype=str,
+        )
+
+        result = strip_whitespace_and_drop_empty_rows(df)
+
+        expected = pd.DataFrame(
+            {"COL1": ["A", "B", ""], "COL2": ["", "C", "D"]},
+            index=[0, 3, 4],
+            dtype=str,
+        )
+        pd.testing.assert_frame_equal(expected, result)
+        pd.testing.assert_frame_equal(
+            _strip_whitespace_and_drop_empty_rows_per_cell(df), result
+        )
+
+    def test_matches_per_cell_implementation(self) -> None:
+        rng = np.random.default_rng(seed=0)
+        values = np.array(
+            ["", " ", "A", " B ", "LONGER VALUE  ", "\t\r\n", "1234", "　X"],
+            dtype=object,
+        )
+        df = pd.DataFrame(
+            {f"COL{i}": values[rng.integers(0, len(values), 500)] for i in range(10)}
+        )
+
+        pd.testing.assert_frame_equal(
+            _strip_whitespace_and_drop_empty_rows_per_cell(df),
+            strip_whitespace_and_drop_empty_rows(df),
+        )
+
+    def test_all_rows_empty(self) -> None:
+        df = pd.DataFrame({"COL1": ["", " "], "COL2": ["\t", ""]}, dtype=str)
+
+        result = strip_whitespace_and_drop_empty_rows(df)
+
+        self.assertEqual(0, result.shape[0])
+        self.assertEqual(["COL1", "COL2"], list(result.columns))
+
+    def test_null_values(self) -> None:
+        df = pd.DataFrame({"COL1": [" A", None, None], "COL2": ["B ", "", " C "]})
+
+        result = strip_whitespace_and_drop_empty_rows(df)
+
+        expected = pd.DataFrame(
+            {"COL1": ["A", None], "COL2": ["B", "C"]}, index=[0, 2], dtype=object
+        )
+        pd.testing.assert_frame_equal(expected, result)
+
+
+class ImportTempFileFormatConfigTest(unittest.TestCase):
+    """Tests for parsing the import_temp_file_format raw file config option."""
+
+    @staticmethod
+    def _parse(
+        file_format: Optional[str], default_file_format: Optional[str]
+    ) -> DirectIngestRawFileConfig:
+        file_config_dict = {
+            "primary_key_cols": ["COL1"],
+            "file_description": "Test file",
+            "data_classification": "source",
+            "columns": [{"name": "COL1"}],
+        }
+        if file_format is not None:
+            file_config_dict["import_temp_file_format"] = file_format
+        return DirectIngestRawFileConfig.from_yaml_dict(
+            "tagA",
+            "path/to/us_xx_tagA.yaml",
+            "UTF-8",
+            ",",
+            None,
+            False,
+            False,
+            None,
+            YAMLDict(file_config_dict),
+            "us_xx_tagA.yaml",
+            default_file_format,
+        )
+
+    def test_defaults_to_csv(self) -> None:
+        self.assertEqual(
+            ChunkFileFormat.CSV, self._parse(None, None).import_temp_file_format
+        )
+
+    def test_region_default(self) -> None:
+        self.assertEqual(
+            ChunkFileFormat.PARQUET,
+            self._parse(None, "parquet").import_temp_file_format,
+        )
+
+    def test_file_overrides_region_default(self) -> None:
+        self.assertEqual(
+            ChunkFileFormat.CSV, self._parse("csv", "parquet").import_temp_file_format
+        )
+
+    def test_invalid_format(self) -> None:
+        with self.assertRaises(ValueError):
+            self._parse("avro", None)
+
+
+class DirectIngestRawDataSplittingGcsfsCsvReaderDelegateTest(unittest.TestCase):
+    """Tests for the DirectIngestRawDataSplittingGcsfsCsvReaderDelegate."""
+
+    def setUp(self) -> None:
+        with tempfile.NamedTemporaryFile(
+            "w", suffix=".csv", delete=False, encoding="utf-8"
+        ) as f:
+            f.write("COL1,COL2\n")
+            f.write("A, 1\n")
+            f.write(",\n")
+            f.write("B,\n")
+        self.local_path = f.name
+        self.upload_dt = datetime.datetime(2022, 3, 4, 5, 6, 7, 891011, tzinfo=pytz.UTC)
+        self.input_path = GcsfsFilePath.from_absolute_path(
+            to_normalized_unprocessed_raw_file_path(
+                "bucket/us_xx_tagA.csv", dt=self.upload_dt
+            )
+        )
+        fake_fs = FakeGCSFileSystem()
+        fake_fs.test_add_path(self.input_path, self.local_path)
+        self.fs = DirectIngestGCSFileSystem(fake_fs)
+
+    def tearDown(self) -> None:
+        os.remove(self.local_path)
+
+    def test_parquet_output_matches_bq_schema(self) -> None:
+        file_metadata = DirectIngestRawFileMetadata(
+            file_id=123,
+            region_code="us_xx",
+            file_tag="tagA",
+            normalized_file_name=self.input_path.file_name,
+            discovery_time=self.upload_dt,
+            processed_time=None,
+            datetimes_contained_upper_bound_inclusive=self.upload_dt,
+        )
+        delegate = DirectIngestRawDataSplittingGcsfsCsvReaderDelegate(
+            self.input_path,
+            self.fs,
+            file_metadata,
+            GcsfsDirectoryPath(bucket_name="temp-bucket"),
+            output_format=ChunkFileFormat.PARQUET,
+        )
+
+        GcsfsCsvReader(self.fs).streaming_read(
+            self.input_path, delegate=delegate, chunk_size=2, dtype=str
+        )
+
+        self.assertEqual(2, len(delegate.output_paths))
+        self.assertEqual(
+            sum(len(self.fs.download_as_bytes(p)) for p in delegate.output_paths),
+            delegate.output_bytes,
+        )
+        assert delegate.output_columns is not None
+        schema = DirectIngestRawFileImportManager._create_raw_table_schema_from_columns(
+            delegate.output_columns
+        )
+        self.assertEqual(
+            ["COL1", "COL2", FILE_ID_COL_NAME, UPDATE_DATETIME_COL_NAME],
+            [field.name for field in schema],
+        )
+
+        tables = [
+            pq.read_table(pa.BufferReader(self.fs.download_as_bytes(p)))
+            for p in delegate.output_paths
+        ]
+        for table in tables:
+            self.assertEqual([field.name for field in schema], table.schema.names)
+            for field in schema:
+                self.assertEqual(
+                    _ARROW_TYPE_FOR_BQ_TYPE[field.field_type],
+                    table.schema.field(field.name).type,
+                    f"Unexpected type for column [{field.name}]",
+                )
+
+        upload_datetime = self.upload_dt.replace(tzinfo=None)
+        self.assertEqual(
+            {
+                "COL1": ["A", "B"],
+                "COL2": ["1", None],
+                FILE_ID_COL_NAME: [123, 123],
+                UPDATE_DATETIME_COL_NAME: [upload_datetime, upload_datetime],
+            },
+            pa.concat_tables(tables).to_pydict(),
+        )
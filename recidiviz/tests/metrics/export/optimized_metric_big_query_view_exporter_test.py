@@ -21,9 +21,9 @@ import unittest
 from typing import Any, Callable, Dict, List, Set
 
 from google.cloud import bigquery
-from mock import call, create_autospec, patch
+from mock import MagicMock, call, create_autospec, patch
 
-from recidiviz.big_query.big_query_client import BigQueryClient
+from recidiviz.big_query.big_query_client import BigQueryClient, BigQueryClientImpl
 from recidiviz.big_query.big_query_utils import transform_dict_to_bigquery_row
 from recidiviz.big_query.export.export_query_config import ExportBigQueryViewConfig
 from recidiviz.cloud_storage.gcsfs_path import GcsfsDirectoryPath
@@ -37,6 +37,9 @@ from recidiviz.metrics.export.optimized_metric_big_query_view_exporter import (
     OptimizedMetricRepresentation,
 )
 from recidiviz.metrics.metric_big_query_view import MetricBigQueryViewBuilder
+from recidiviz.tests.big_query.fakes.fake_big_query_page_reader import (
+    FakeBigQueryPageReader,
+)
 
 _DATA_POINTS = [
     {
@@ -468,7 +471,12 @@ class ConvertQueryResultsTest(unittest.TestCase):
             query_job: bigquery.QueryJob,
             _page_size: int,
             process_page_fn: Callable[[List[bigquery.table.Row]], None],
+            num_prefetch_pages: int,
         ) -> None:
+            self.assertEqual(
+                optimized_metric_big_query_view_exporter.QUERY_NUM_PREFETCH_PAGES,
+                num_prefetch_pages,
+            )
             rows: List[bigquery.table.Row] = []
             for row in query_job.result(
                 max_results=optimized_metric_big_query_view_exporter.QUERY_PAGE_SIZE,
@@ -527,6 +535,75 @@ class ConvertQueryResultsTest(unittest.TestCase):
         mock_bq_client.dataset_ref_for_id.assert_called()
         mock_bq_client.get_table.assert_called()
 
+    @patch(
+        "recidiviz.metrics.export.optimized_metric_big_query_view_exporter.QUERY_PAGE_SIZE",
+        2,
+    )
+    @patch("recidiviz.big_query.big_query_client.client")
+    def test_convert_prefetches_pages(self, mock_client_fn: MagicMock) -> None:
+        mock_dataset_ref = create_autospec(bigquery.DatasetReference)
+        table = bigquery.Table(
+            bigquery.TableReference(mock_dataset_ref, "test_view"),
+            [
+                bigquery.SchemaField("district", "STRING"),
+                bigquery.SchemaField("year", "STRING"),
+                bigquery.SchemaField("month", "STRING"),
+                bigquery.SchemaField("supervision_type", "STRING"),
+                bigquery.SchemaField("total_revocations", "STRING"),
+            ],
+        )
+        mock_client_fn.return_value.get_table.return_value = table
+
+        # Serve the query results from a fake page reader that sleeps before returning
+        # each page, so that pages are only read concurrently if they are prefetched.
+        page_reader = FakeBigQueryPageReader(
+            [transform_dict_to_bigquery_row(data_point) for data_point in _DATA_POINTS],
+            latency_seconds=0.02,
+        )
+        mock_query_job = create_autospec(bigquery.QueryJob)
+        mock_query_job.result.side_effect = (
+            lambda max_results, start_index: page_reader.read_page(
+                start_index, max_results
+            )
+        )
+
+        view_exporter = OptimizedMetricBigQueryViewExporter(
+            BigQueryClientImpl(),
+            create_autospec(OptimizedMetricBigQueryViewExportValidator),
+        )
+        export_config = ExportBigQueryViewConfig(
+            view=MetricBigQueryViewBuilder(
+                dataset_id="test_dataset",
+                view_id="test_view",
+                description="test_view description",
+                view_query_template="you know",
+                dimensions=("district", "year", "month", "supervision_type"),
+            ).build(),
+            view_filter_clause="WHERE state_code = 'US_XX'",
+            intermediate_table_name="tubular",
+            output_directory=GcsfsDirectoryPath.from_absolute_path("gs://gnarly/blob"),
+        )
+
+        optimized_representation = (
+            view_exporter.convert_query_results_to_optimized_value_matrix(
+                mock_query_job, export_config
+            )
+        )
+
+        self.assertEqual(
+            OptimizedMetricRepresentation(
+                value_matrix=_DATA_VALUES,
+                dimension_manifest=_DIMENSION_MANIFEST,
+                value_keys=_VALUE_KEYS,
+            ),
+            optimized_representation,
+        )
+        self.assertGreater(page_reader.max_concurrent_reads, 1)
+        self.assertLessEqual(
+            page_reader.max_concurrent_reads,
+            optimized_metric_big_query_view_exporter.QUERY_NUM_PREFETCH_PAGES,
+        )
+
 
 class TestInitializeDimensionManifest(unittest.TestCase):
     """Tests the _initialize_dimension_manifest function."""
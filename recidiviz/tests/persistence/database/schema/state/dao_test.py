@@ -26,6 +26,9 @@ import pytest
 from recidiviz.common.constants.state import external_id_types
 from recidiviz.common.constants.state.state_sentence import StateSentenceStatus
 from recidiviz.persistence.database.schema.state import dao, schema
+from recidiviz.persistence.database.schema_entity_converter import (
+    schema_entity_converter as converter,
+)
 from recidiviz.persistence.database.schema_utils import SchemaType
 from recidiviz.persistence.database.session_factory import SessionFactory
 from recidiviz.persistence.database.sqlalchemy_database_key import SQLAlchemyDatabaseKey
@@ -564,6 +567,109 @@ class TestDao(TestCase):
 
             self.assertCountEqual(people, expected_people)
 
+    def test_readPeopleByExternalIds_entireTreeLoaded(self) -> None:
+        # Arrange
+        agent = schema.StateAgent(
+            agent_id=1, agent_type="JUDGE", state_code=_STATE_CODE
+        )
+        people = []
+        for person_id in [1, 2]:
+            person = schema.StatePerson(person_id=person_id, state_code=_STATE_CODE)
+            person.external_ids = [
+                schema.StatePersonExternalId(
+                    person_external_id_id=person_id,
+                    external_id=f"{_EXTERNAL_ID}_{person_id}",
+                    id_type=external_id_types.US_ND_SID,
+                    state_code=_STATE_CODE,
+                )
+            ]
+            court_case = schema.StateCourtCase(
+                court_case_id=person_id,
+                state_code=_STATE_CODE,
+                judge=agent,
+                person=person,
+            )
+            charges = [
+                schema.StateCharge(
+                    charge_id=person_id * 10 + i,
+                    status=StateSentenceStatus.PRESENT_WITHOUT_INFO.value,
+                    state_code=_STATE_CODE,
+                    court_case=court_case,
+                    person=person,
+                )
+                for i in range(2)
+            ]
+            person.incarceration_sentences = [
+                schema.StateIncarcerationSentence(
+                    incarceration_sentence_id=person_id,
+                    status=StateSentenceStatus.PRESENT_WITHOUT_INFO.value,
+                    state_code=_STATE_CODE,
+                    charges=charges,
+                    person=person,
+                )
+            ]
+            person.supervision_sentences = [
+                schema.StateSupervisionSentence(
+                    supervision_sentence_id=person_id,
+                    status=StateSentenceStatus.PRESENT_WITHOUT_INFO.value,
+                    state_code=_STATE_CODE,
+                    charges=charges[1:],
+                    person=person,
+                )
+            ]
+            person.supervision_violations = [
+                schema.StateSupervisionViolation(
+                    supervision_violation_id=person_id,
+                    state_code=_STATE_CODE,
+                    person=person,
+                    supervision_violation_responses=[
+                        schema.StateSupervisionViolationResponse(
+                            supervision_violation_response_id=person_id,
+                            state_code=_STATE_CODE,
+                            person=person,
+                            decision_agents=[agent],
+                        )
+                    ],
+                )
+            ]
+            people.append(person)
+
+        with SessionFactory.using_database(self.database_key) as session:
+            for person in people:
+                session.add(person)
+
+        with SessionFactory.using_database(
+            self.database_key, autocommit=False
+        ) as session:
+            expected_people = converter.convert_schema_objects_to_entity(
+                [person for person in dao.read_people(session) if person.person_id == 2]
+            )
+
+        with SessionFactory.using_database(
+            self.database_key, autocommit=False
+        ) as session:
+            ingested_person = entities.StatePerson.new_with_defaults(
+                state_code=_STATE_CODE,
+                external_ids=[
+                    entities.StatePersonExternalId.new_with_defaults(
+                        external_id=f"{_EXTERNAL_ID}_2",
+                        id_type=external_id_types.US_ND_SID,
+                        state_code=_STATE_CODE,
+                    )
+                ],
+            )
+
+            # Act
+            result = dao.read_people_by_external_ids(
+                session, _REGION, [ingested_person]
+            )
+
+            # Assert
+            self.assertEqual(
+                expected_people, converter.convert_schema_objects_to_entity(result)
+            )
+            self.assertFalse(session.dirty)
+
     def test_readObjsWithExternalIdMatch(self) -> None:
         person_1 = schema.StatePerson(person_id=1, state_code=_STATE_CODE)
         incarceration_sentence_1 = schema.StateIncarcerationSentence(
@@ -16,8 +16,9 @@
 # =============================================================================
 """Tests for entity_utils.py"""
 import datetime
+import pickle
 from typing import Dict, List, Type
-from unittest import TestCase
+from unittest import TestCase, mock
 
 import attr
 
@@ -195,6 +196,45 @@ class TestCoreEntityFieldIndex(TestCase):
             ),
         )
 
+    def test_getAllCoreEntityFields_emptyFieldTypeIsCached(self) -> None:
+        entity = StateCharge.new_with_defaults(
+            state_code="US_XX", status=StateChargeStatus.PRESENT_WITHOUT_INFO
+        )
+        self.assertEqual(
+            frozenset(),
+            self.field_index.get_all_core_entity_fields(
+                entity, EntityFieldType.FOREIGN_KEYS
+            ),
+        )
+
+        # Every field type for the class is now cached, even empty ones, and the
+        # cache is shared with other instances.
+        with mock.patch.object(
+            CoreEntityFieldIndex,
+            "_get_fields_by_type_slow",
+            side_effect=AssertionError("Fields should be cached"),
+        ):
+            other_field_index = CoreEntityFieldIndex()
+            for field_type in EntityFieldType:
+                self.assertEqual(
+                    self.field_index.get_all_core_entity_fields(entity, field_type),
+                    other_field_index.get_all_core_entity_fields(entity, field_type),
+                )
+
+    def test_pickle(self) -> None:
+        entity = schema.StateSupervisionSentence(
+            state_code="US_XX",
+            charges=[schema.StateCharge()],
+            person_id=_ID,
+        )
+        self.field_index.get_all_core_entity_fields(entity, EntityFieldType.ALL)
+
+        field_index = pickle.loads(pickle.dumps(self.field_index))
+        self.assertEqual(
+            {"charges", "person_id", "state_code"},
+            field_index.get_fields_with_non_empty_values(entity, EntityFieldType.ALL),
+        )
+
 
 PLACEHOLDER_ENTITY_EXAMPLES: Dict[Type[DatabaseEntity], List[DatabaseEntity]] = {
     schema.StateAgent: [schema.StateAgent(state_code=StateCode.US_XX.value)],
@@ -21,10 +21,15 @@ from unittest import TestCase
 import attr
 
 from recidiviz.common.constants.county.booking import CustodyStatus
+from recidiviz.persistence.database.schema.state import schema
 from recidiviz.persistence.entity.county import entities as county_entities
 from recidiviz.persistence.entity.entity_utils import CoreEntityFieldIndex
 from recidiviz.persistence.entity_matching.county import county_matching_utils
-from recidiviz.persistence.entity_matching.entity_matching_utils import get_only_match
+from recidiviz.persistence.entity_matching.entity_matching_types import EntityTree
+from recidiviz.persistence.entity_matching.entity_matching_utils import (
+    ExternalIdMatchIndex,
+    get_only_match,
+)
 
 _DATE = datetime(2018, 12, 13)
 _DATE_OTHER = datetime(2017, 12, 13)
@@ -71,3 +76,64 @@ class TestEntityMatchingUtils(TestCase):
             ),
             person,
         )
+
+
+class TestExternalIdMatchIndex(TestCase):
+    """Tests for ExternalIdMatchIndex"""
+
+    def setUp(self) -> None:
+        self.ip_1 = schema.StateIncarcerationPeriod(
+            state_code="US_XX", external_id="ip1"
+        )
+        self.ip_2 = schema.StateIncarcerationPeriod(
+            state_code="US_XX", external_id="ip2"
+        )
+        self.ip_1_duplicate = schema.StateIncarcerationPeriod(
+            state_code="US_XX", external_id="ip1"
+        )
+        self.ip_placeholder = schema.StateIncarcerationPeriod(state_code="US_XX")
+        self.db_entity_trees = [
+            EntityTree(entity=entity, ancestor_chain=[])
+            for entity in [
+                self.ip_1,
+                self.ip_placeholder,
+                self.ip_2,
+                self.ip_1_duplicate,
+            ]
+        ]
+
+    def test_get_candidates(self) -> None:
+        index = ExternalIdMatchIndex(self.db_entity_trees)
+
+        ingested_ip = schema.StateIncarcerationPeriod(
+            state_code="US_XX", external_id="ip1"
+        )
+        candidates = index.get_candidates(ingested_ip)
+
+        self.assertEqual(4, index.num_db_entity_trees)
+        self.assertIsNotNone(candidates)
+        self.assertEqual(
+            [self.ip_1, self.ip_1_duplicate],
+            [tree.entity for tree in candidates or []],
+        )
+
+    def test_get_candidates_no_match(self) -> None:
+        index = ExternalIdMatchIndex(self.db_entity_trees)
+
+        ingested_ip = schema.StateIncarcerationPeriod(
+            state_code="US_XX", external_id="ip3"
+        )
+        self.assertEqual([], index.get_candidates(ingested_ip))
+
+        # Entities of a different class with the same external id are not
+        # candidates
+        ingested_sp = schema.StateSupervisionPeriod(
+            state_code="US_XX", external_id="ip1"
+        )
+        self.assertEqual([], index.get_candidates(ingested_sp))
+
+    def test_get_candidates_no_external_id(self) -> None:
+        index = ExternalIdMatchIndex(self.db_entity_trees)
+
+        ingested_placeholder = schema.StateIncarcerationPeriod(state_code="US_XX")
+        self.assertIsNone(index.get_candidates(ingested_placeholder))
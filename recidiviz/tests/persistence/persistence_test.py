@@ -785,3 +785,45 @@ def _get_run_transaction_fn(transaction_id: int):
         return True
 
     return run_transaction
+
+
+class TestShardPeopleByExternalIds(TestCase):
+    """Tests for persistence.shard_people_by_external_ids()."""
+
+    @staticmethod
+    def _person(*external_ids: str) -> StatePerson:
+        return StatePerson.new_with_defaults(
+            state_code=STATE_CODE,
+            external_ids=[
+                StatePersonExternalId.new_with_defaults(
+                    state_code=STATE_CODE, external_id=external_id, id_type=FAKE_ID_TYPE
+                )
+                for external_id in external_ids
+            ],
+        )
+
+    def test_shard_people_by_external_ids(self) -> None:
+        person_1 = self._person("1")
+        person_2 = self._person("2")
+        person_1_and_3 = self._person("1", "3")
+        person_3 = self._person("3")
+        person_no_ids = self._person()
+
+        people = [person_1, person_2, person_1_and_3, person_3, person_no_ids]
+
+        self.assertEqual(
+            [[person_1, person_1_and_3, person_3], [person_2, person_no_ids]],
+            persistence.shard_people_by_external_ids(people, max_people_per_shard=2),
+        )
+        self.assertEqual(
+            [[person_1, person_1_and_3, person_3], [person_2], [person_no_ids]],
+            persistence.shard_people_by_external_ids(people, max_people_per_shard=1),
+        )
+        self.assertEqual(
+            [[person_1, person_1_and_3, person_3, person_2, person_no_ids]],
+            persistence.shard_people_by_external_ids(people, max_people_per_shard=10),
+        )
+
+    def test_shard_people_by_external_ids_invalid_size(self) -> None:
+        with self.assertRaises(ValueError):
+            persistence.shard_people_by_external_ids([], max_people_per_shard=0)
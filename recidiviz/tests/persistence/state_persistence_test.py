@@ -39,6 +39,9 @@ from recidiviz.persistence.entity_matching.entity_matching_types import (
     EntityTree,
     IndividualMatchResult,
 )
+from recidiviz.persistence.entity_matching.entity_matching_utils import (
+    ExternalIdMatchIndex,
+)
 from recidiviz.persistence.entity_matching.state.state_entity_matcher import (
     StateEntityMatcher,
 )
@@ -120,6 +123,7 @@ class _PatchedStateEntityMatcher(StateEntityMatcher):
         *,
         ingested_entity_tree: EntityTree,
         db_entity_trees: List[EntityTree],
+        db_entity_tree_index: Optional[ExternalIdMatchIndex],
         matched_entities_by_db_ids: Dict[int, List[DatabaseEntity]],
         root_entity_cls: Type
     ) -> IndividualMatchResult:
@@ -135,6 +139,7 @@ class _PatchedStateEntityMatcher(StateEntityMatcher):
         return super()._match_entity_tree(
             ingested_entity_tree=ingested_entity_tree,
             db_entity_trees=db_entity_trees,
+            db_entity_tree_index=db_entity_tree_index,
             matched_entities_by_db_ids=matched_entities_by_db_ids,
             root_entity_cls=root_entity_cls,
         )
@@ -457,3 +462,72 @@ class TestStatePersistence(TestCase):
                 [expected_person, expected_person_2],
                 converter.convert_schema_objects_to_entity(persons),
             )
+
+    @patch(
+        "recidiviz.persistence.persistence.SYSTEM_TYPE_TO_ERROR_THRESHOLD",
+        STATE_ERROR_THRESHOLDS_WITH_FORTY_PERCENT_RATIOS,
+    )
+    @patch(
+        "recidiviz.persistence.persistence.STATE_CODE_TO_ENTITY_MATCHING_THRESHOLD_OVERRIDE",
+        STATE_CODE_TO_ENTITY_MATCHING_THRESHOLD_FORTY_PERCENT,
+    )
+    @patch("recidiviz.persistence.entity_matching.entity_matching._get_matcher")
+    def test_state_shardedWrite_appliesThresholdAcrossShards(self, mock_get_matcher):
+        """Each person is written in its own shard. The entity matching error in the
+        third shard would exceed the threshold on its own, but not across all shards."""
+        # Each shard runs on its own thread, so each needs its own matcher
+        mock_get_matcher.side_effect = lambda *_args: _PatchedStateEntityMatcher(
+            erroring_class=schema.StateIncarcerationPeriod,
+            erroring_external_ids=[INCARCERATION_PERIOD_ID_3],
+        )
+
+        # Arrange
+        parsed_entities = [
+            entities.StatePerson.new_with_defaults(
+                state_code=STATE_CODE,
+                external_ids=[
+                    StatePersonExternalId.new_with_defaults(
+                        state_code=STATE_CODE, external_id=external_id, id_type=ID_TYPE
+                    )
+                ],
+                incarceration_periods=[
+                    entities.StateIncarcerationPeriod.new_with_defaults(
+                        state_code=STATE_CODE,
+                        external_id=incarceration_period_id,
+                        county_code=COUNTY_CODE,
+                    ),
+                ],
+            )
+            for external_id, incarceration_period_id in [
+                (EXTERNAL_ID, INCARCERATION_PERIOD_ID),
+                (EXTERNAL_ID_2, INCARCERATION_PERIOD_ID_2),
+                ("EXTERNAL_ID_3", INCARCERATION_PERIOD_ID_3),
+            ]
+        ]
+
+        # Act
+        result = persistence.write_entities(
+            conversion_result=EntityDeserializationResult(
+                people=parsed_entities,
+                enum_parsing_errors=0,
+                general_parsing_errors=0,
+                protected_class_errors=0,
+            ),
+            ingest_metadata=DEFAULT_METADATA,
+            total_people=len(parsed_entities),
+            max_people_per_shard=1,
+            num_shard_workers=2,
+        )
+
+        # Assert
+        self.assertTrue(result)
+        with SessionFactory.using_database(
+            self.database_key, autocommit=False
+        ) as session:
+            persons = dao.read_people(session)
+            external_ids = {
+                external_id.external_id
+                for person in persons
+                for external_id in person.external_ids
+            }
+        self.assertTrue({EXTERNAL_ID, EXTERNAL_ID_2}.issubset(external_ids))
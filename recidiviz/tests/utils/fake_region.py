@@ -34,6 +34,9 @@ def fake_region(
     region_module: Optional[ModuleType] = None,
     is_direct_ingest: bool = True,
     is_stoppable: Optional[bool] = None,
+    persist_batch_size: Optional[int] = None,
+    persist_shard_size: Optional[int] = None,
+    num_persist_shard_workers: int = 1,
 ) -> Region:
     """Fake Region Object"""
     region = create_autospec(Region)
@@ -45,6 +48,9 @@ def fake_region(
     region.get_scraper.return_value = scraper
     region.is_direct_ingest = is_direct_ingest
     region.is_stoppable = is_stoppable
+    region.persist_batch_size = persist_batch_size
+    region.persist_shard_size = persist_shard_size
+    region.num_persist_shard_workers = num_persist_shard_workers
 
     def fake_is_launched_in_env() -> bool:
         return Region.is_ingest_launched_in_env(region)
@@ -88,6 +88,16 @@ US_MA_MIDDLESEX_CONTENTS = """
     environment: staging
     jurisdiction_id: jid
 """
+US_XX_PERSIST_SHARDS_MANIFEST_CONTENTS = """
+    agency_name: Department of Corrections
+    agency_type: prison
+    timezone: America/New_York
+    environment: staging
+    jurisdiction_id: jid_xx
+    persist_batch_size: 1000
+    persist_shard_size: 100
+    num_persist_shard_workers: 4
+"""
 REGION_TO_MANIFEST = {
     "us_ny": US_NY_MANIFEST_CONTENTS,
     "us_in": US_IN_MANIFEST_CONTENTS,
@@ -96,6 +106,7 @@ REGION_TO_MANIFEST = {
     "bad_env_bool": BAD_ENV_BOOL_MANIFEST_CONTENTS,
     "bad_env_str": BAD_ENV_STR_MANIFEST_CONTENTS,
     "us_ma_middlesex": US_MA_MIDDLESEX_CONTENTS,
+    "us_xx_persist_shards": US_XX_PERSIST_SHARDS_MANIFEST_CONTENTS,
 }
 
 
@@ -139,6 +150,17 @@ class TestRegions(TestCase):
         region = with_manifest(regions.get_region, "us_in")
         assert not region.should_proxy
 
+    def test_get_region_persist_settings(self) -> None:
+        region = with_manifest(regions.get_region, "us_xx_persist_shards")
+        self.assertEqual(1000, region.persist_batch_size)
+        self.assertEqual(100, region.persist_shard_size)
+        self.assertEqual(4, region.num_persist_shard_workers)
+
+        region = with_manifest(regions.get_region, "us_ny")
+        self.assertIsNone(region.persist_batch_size)
+        self.assertIsNone(region.persist_shard_size)
+        self.assertEqual(1, region.num_persist_shard_workers)
+
     def test_get_region_manifest_not_found(self) -> None:
         with self.assertRaises(FileNotFoundError):
             with_manifest(
@@ -0,0 +1,270 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2022 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Tests for validation/validation_input_fingerprints.py."""
+import datetime
+from typing import Any, Dict, List
+from unittest import TestCase
+
+from mock import MagicMock, patch
+
+from recidiviz.big_query.address_overrides import BigQueryAddressOverrides
+from recidiviz.big_query.big_query_address import BigQueryAddress
+from recidiviz.big_query.big_query_view import SimpleBigQueryViewBuilder
+from recidiviz.big_query.big_query_view_dag_walker import BigQueryViewDagWalker
+from recidiviz.validation.checks.existence_check import ExistenceDataValidationCheck
+from recidiviz.validation.validation_input_fingerprints import (
+    compute_validation_input_fingerprints,
+)
+from recidiviz.validation.validation_models import DataValidationJob, ValidationCategory
+
+_RUN_DATE = datetime.date(2022, 3, 1)
+
+
+class ComputeValidationInputFingerprintsTest(TestCase):
+    """Tests for compute_validation_input_fingerprints."""
+
+    def setUp(self) -> None:
+        self.metadata_patcher = patch("recidiviz.utils.metadata.project_id")
+        self.metadata_patcher.start().return_value = "recidiviz-456"
+
+        parent_builder = SimpleBigQueryViewBuilder(
+            dataset_id="parent_dataset",
+            view_id="parent",
+            description="parent description",
+            view_query_template="SELECT * FROM `{project_id}.source_dataset.source_table`",
+            should_materialize=True,
+        )
+        self.validation_builder = SimpleBigQueryViewBuilder(
+            dataset_id="validation_views",
+            view_id="my_validation",
+            description="my_validation description",
+            view_query_template="SELECT * FROM `{project_id}.parent_dataset.parent_materialized`",
+        )
+        self.current_date_validation_builder = SimpleBigQueryViewBuilder(
+            dataset_id="validation_views",
+            view_id="my_current_date_validation",
+            description="my_current_date_validation description",
+            view_query_template="SELECT *, CURRENT_DATE() AS today "
+            "FROM `{project_id}.parent_dataset.parent_materialized`",
+        )
+        self.source_table_validation_builder = SimpleBigQueryViewBuilder(
+            dataset_id="validation_views",
+            view_id="my_source_table_validation",
+            description="my_source_table_validation description",
+            view_query_template="SELECT * FROM `{project_id}.source_dataset.source_table`",
+        )
+        self.dag_walker = BigQueryViewDagWalker(
+            [
+                builder.build()
+                for builder in (
+                    parent_builder,
+                    self.validation_builder,
+                    self.current_date_validation_builder,
+                    self.source_table_validation_builder,
+                )
+            ]
+        )
+
+        self.last_modified_times = {
+            BigQueryAddress(dataset_id="source_dataset", table_id="source_table"): 1,
+            BigQueryAddress(dataset_id="source_dataset", table_id="unrelated"): 2,
+            BigQueryAddress(dataset_id="parent_dataset", table_id="parent"): 3,
+            BigQueryAddress(
+                dataset_id="parent_dataset", table_id="parent_materialized"
+            ): 4,
+            BigQueryAddress(dataset_id="validation_views", table_id="my_validation"): 5,
+            BigQueryAddress(
+                dataset_id="validation_views", table_id="my_current_date_validation"
+            ): 6,
+            BigQueryAddress(
+                dataset_id="validation_views", table_id="my_source_table_validation"
+            ): 7,
+        }
+        self.mock_bq_client = MagicMock()
+        self.mock_bq_client.project_id = "recidiviz-456"
+        self.mock_bq_client.run_query_async.side_effect = self._get_last_modified_rows
+
+    def tearDown(self) -> None:
+        self.metadata_patcher.stop()
+
+    def _get_last_modified_rows(
+        self, _query_str: str, _query_parameters: List
+    ) -> List[Dict[str, Any]]:
+        return [
+            {
+                "dataset_id": address.dataset_id,
+                "table_id": address.table_id,
+                "last_modified_time": last_modified_time,
+            }
+            for address, last_modified_time in self.last_modified_times.items()
+        ]
+
+    def _job(
+        self,
+        view_builder: SimpleBigQueryViewBuilder,
+        region_code: str = "US_XX",
+        hard_num_allowed_rows: int = 0,
+    ) -> DataValidationJob:
+        return DataValidationJob(
+            validation=ExistenceDataValidationCheck(
+                view_builder=view_builder,
+                validation_category=ValidationCategory.INVARIANT,
+                hard_num_allowed_rows=hard_num_allowed_rows,
+            ),
+            region_code=region_code,
+        )
+
+    def _fingerprints(
+        self, jobs: List[DataValidationJob], run_date: datetime.date = _RUN_DATE
+    ) -> Dict[Any, str]:
+        return compute_validation_input_fingerprints(
+            jobs, self.dag_walker, self.mock_bq_client, run_date
+        )
+
+    def test_fingerprint_changes_only_when_upstream_tables_change(self) -> None:
+        jobs = [
+            self._job(self.validation_builder, region_code="US_XX"),
+            self._job(self.validation_builder, region_code="US_YY"),
+        ]
+        fingerprints = self._fingerprints(jobs)
+
+        self.assertEqual(
+            {("my_validation", "US_XX"), ("my_validation", "US_YY")},
+            set(fingerprints),
+        )
+        self.assertNotEqual(
+            fingerprints[("my_validation", "US_XX")],
+            fingerprints[("my_validation", "US_YY")],
+        )
+        self.assertEqual(fingerprints, self._fingerprints(jobs))
+        self.mock_bq_client.run_query_async.assert_called_with(
+            "SELECT dataset_id, table_id, last_modified_time "
+            "FROM `recidiviz-456.parent_dataset.__TABLES__`\n"
+            "UNION ALL\n"
+            "SELECT dataset_id, table_id, last_modified_time "
+            "FROM `recidiviz-456.source_dataset.__TABLES__`\n"
+            "UNION ALL\n"
+            "SELECT dataset_id, table_id, last_modified_time "
+            "FROM `recidiviz-456.validation_views.__TABLES__`",
+            [],
+        )
+
+        self.last_modified_times[
+            BigQueryAddress(dataset_id="source_dataset", table_id="unrelated")
+        ] = 20
+        self.assertEqual(fingerprints, self._fingerprints(jobs))
+
+        self.last_modified_times[
+            BigQueryAddress(dataset_id="parent_dataset", table_id="parent_materialized")
+        ] = 40
+        updated_fingerprints = self._fingerprints(jobs)
+        for job_key, fingerprint in fingerprints.items():
+            self.assertNotEqual(fingerprint, updated_fingerprints[job_key])
+
+    def test_rematerialization_only_changes_jobs_reading_materialized_tables(
+        self,
+    ) -> None:
+        jobs = [
+            self._job(self.validation_builder),
+            self._job(self.source_table_validation_builder),
+        ]
+        fingerprints = self._fingerprints(jobs)
+
+        # Rematerialization rewrites every materialized table, but not views or source
+        # tables
+        self.last_modified_times[
+            BigQueryAddress(dataset_id="parent_dataset", table_id="parent_materialized")
+        ] = 40
+        updated_fingerprints = self._fingerprints(jobs)
+
+        self.assertNotEqual(
+            fingerprints[("my_validation", "US_XX")],
+            updated_fingerprints[("my_validation", "US_XX")],
+        )
+        self.assertEqual(
+            fingerprints[("my_source_table_validation", "US_XX")],
+            updated_fingerprints[("my_source_table_validation", "US_XX")],
+        )
+
+    def test_jobs_with_missing_upstream_tables_are_not_fingerprinted(self) -> None:
+        del self.last_modified_times[
+            BigQueryAddress(dataset_id="source_dataset", table_id="source_table")
+        ]
+        del self.last_modified_times[
+            BigQueryAddress(dataset_id="validation_views", table_id="my_validation")
+        ]
+
+        self.assertEqual(
+            {},
+            self._fingerprints(
+                [
+                    self._job(self.validation_builder),
+                    self._job(self.source_table_validation_builder),
+                ]
+            ),
+        )
+
+    def test_fingerprint_changes_when_check_config_changes(self) -> None:
+        fingerprint = self._fingerprints([self._job(self.validation_builder)])
+        updated_fingerprint = self._fingerprints(
+            [self._job(self.validation_builder, hard_num_allowed_rows=5)]
+        )
+
+        self.assertNotEqual(fingerprint, updated_fingerprint)
+
+    def test_run_date_only_included_for_views_reading_current_date(self) -> None:
+        jobs = [
+            self._job(self.validation_builder),
+            self._job(self.current_date_validation_builder),
+        ]
+        fingerprints = self._fingerprints(jobs)
+        next_day_fingerprints = self._fingerprints(
+            jobs, run_date=_RUN_DATE + datetime.timedelta(days=1)
+        )
+
+        self.assertEqual(
+            fingerprints[("my_validation", "US_XX")],
+            next_day_fingerprints[("my_validation", "US_XX")],
+        )
+        self.assertNotEqual(
+            fingerprints[("my_current_date_validation", "US_XX")],
+            next_day_fingerprints[("my_current_date_validation", "US_XX")],
+        )
+
+    def test_jobs_outside_dag_or_with_overrides_are_not_fingerprinted(self) -> None:
+        view_builder_not_in_dag = SimpleBigQueryViewBuilder(
+            dataset_id="validation_views",
+            view_id="not_deployed",
+            description="not_deployed description",
+            view_query_template="SELECT * FROM `{project_id}.source_dataset.source_table`",
+        )
+        address_overrides = (
+            BigQueryAddressOverrides.Builder(sandbox_prefix="my_prefix")
+            .register_sandbox_override_for_entire_dataset("validation_views")
+            .build()
+        )
+        jobs = [
+            self._job(view_builder_not_in_dag),
+            DataValidationJob(
+                validation=self._job(self.validation_builder).validation,
+                region_code="US_XX",
+                address_overrides=address_overrides,
+            ),
+        ]
+
+        self.assertEqual({}, self._fingerprints(jobs))
+        self.mock_bq_client.run_query_async.assert_not_called()
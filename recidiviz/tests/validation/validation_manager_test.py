@@ -22,7 +22,7 @@ from unittest import TestCase
 
 import attr
 from flask import Flask
-from mock import MagicMock, patch
+from mock import ANY, MagicMock, patch
 
 from recidiviz.big_query.address_overrides import BigQueryAddressOverrides
 from recidiviz.big_query.big_query_view import SimpleBigQueryViewBuilder
@@ -55,6 +55,7 @@ from recidiviz.validation.validation_models import (
     ValidationCheckType,
     ValidationResultStatus,
 )
+from recidiviz.validation.validation_result_storage import PreviousValidationResult
 from recidiviz.validation.views import view_config as validation_view_config
 
 
@@ -223,7 +224,7 @@ class TestHandleRequest(TestCase):
 
         self.assertEqual(5, mock_run_job.call_count)
         for job in self._TEST_VALIDATIONS:
-            mock_run_job.assert_any_call(job)
+            mock_run_job.assert_any_call(job, ANY)
 
         mock_emit_opencensus_failure_events.assert_not_called()
         mock_store_validation_results.assert_called_once()
@@ -281,7 +282,7 @@ class TestHandleRequest(TestCase):
 
         self.assertEqual(5, mock_run_job.call_count)
         for job in self._TEST_VALIDATIONS:
-            mock_run_job.assert_any_call(job)
+            mock_run_job.assert_any_call(job, ANY)
 
         mock_emit_opencensus_failure_events.assert_called_with(
             UnorderedCollection([self._TEST_VALIDATIONS[4]]),
@@ -349,7 +350,7 @@ class TestHandleRequest(TestCase):
 
         self.assertEqual(5, mock_run_job.call_count)
         for job in self._TEST_VALIDATIONS:
-            mock_run_job.assert_any_call(job)
+            mock_run_job.assert_any_call(job, ANY)
 
         mock_emit_opencensus_failure_events.assert_called_with(
             [], UnorderedCollection([first_failure, second_failure])
@@ -413,6 +414,126 @@ class TestHandleRequest(TestCase):
         ((results,), _kwargs) = mock_store_validation_results.call_args
         self.assertEqual(0, len(results))
 
+    @patch("recidiviz.utils.environment.in_gcp", MagicMock(return_value=True))
+    @patch("recidiviz.validation.validation_manager._get_previous_results")
+    @patch("recidiviz.validation.validation_manager._get_input_fingerprints")
+    @patch("recidiviz.validation.validation_manager._emit_opencensus_failure_events")
+    @patch("recidiviz.validation.validation_manager._run_job")
+    @patch("recidiviz.validation.validation_manager._fetch_validation_jobs_to_perform")
+    @patch(
+        "recidiviz.validation.validation_manager.store_validation_results_in_big_query"
+    )
+    def test_handle_request_carries_forward_results_with_unchanged_inputs(
+        self,
+        mock_store_validation_results: MagicMock,
+        mock_fetch_validations: MagicMock,
+        mock_run_job: MagicMock,
+        mock_emit_opencensus_failure_events: MagicMock,
+        mock_get_input_fingerprints: MagicMock,
+        mock_get_previous_results: MagicMock,
+    ) -> None:
+        mock_fetch_validations.return_value = self._TEST_VALIDATIONS
+        job_keys = [
+            (job.validation.validation_name, job.region_code)
+            for job in self._TEST_VALIDATIONS
+        ]
+        mock_get_input_fingerprints.return_value = {
+            job_key: f"fingerprint_{i}" for i, job_key in enumerate(job_keys)
+        }
+        hard_failure_details = FakeValidationResultDetails(
+            validation_status=ValidationResultStatus.FAIL_HARD
+        )
+        mock_get_previous_results.return_value = {
+            job_keys[0]: PreviousValidationResult(
+                run_id="previous_run",
+                input_fingerprint="fingerprint_0",
+                result_details=hard_failure_details,
+            ),
+            job_keys[1]: PreviousValidationResult(
+                run_id="previous_run",
+                input_fingerprint="stale_fingerprint",
+                result_details=hard_failure_details,
+            ),
+        }
+        mock_run_job.side_effect = lambda job, _query_batcher: DataValidationJobResult(
+            validation_job=job,
+            result_details=FakeValidationResultDetails(
+                validation_status=ValidationResultStatus.SUCCESS
+            ),
+        )
+
+        headers = {"X-Appengine-Cron": "test-cron"}
+        response = self.client.get("/validate", headers=headers)
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(4, mock_run_job.call_count)
+        for job in self._TEST_VALIDATIONS[1:]:
+            mock_run_job.assert_any_call(job, ANY)
+
+        carried_forward_result = DataValidationJobResult(
+            validation_job=self._TEST_VALIDATIONS[0],
+            result_details=hard_failure_details,
+        )
+        mock_emit_opencensus_failure_events.assert_called_with(
+            [], [carried_forward_result]
+        )
+        ((results,), _kwargs) = mock_store_validation_results.call_args
+        self.assertEqual(
+            {
+                (job_key, f"fingerprint_{i}", "previous_run" if i == 0 else None)
+                for i, job_key in enumerate(job_keys)
+            },
+            {
+                (
+                    (result.validation_name, result.region_code),
+                    result.input_fingerprint,
+                    result.carried_forward_from_run_id,
+                )
+                for result in results
+            },
+        )
+
+    @patch("recidiviz.utils.environment.in_gcp", MagicMock(return_value=True))
+    @patch("recidiviz.validation.validation_manager._get_previous_results")
+    @patch("recidiviz.validation.validation_manager._get_input_fingerprints")
+    @patch("recidiviz.validation.validation_manager._emit_opencensus_failure_events")
+    @patch("recidiviz.validation.validation_manager._run_job")
+    @patch("recidiviz.validation.validation_manager._fetch_validation_jobs_to_perform")
+    @patch(
+        "recidiviz.validation.validation_manager.store_validation_results_in_big_query"
+    )
+    def test_handle_request_force_full_run(
+        self,
+        mock_store_validation_results: MagicMock,
+        mock_fetch_validations: MagicMock,
+        mock_run_job: MagicMock,
+        _mock_emit_opencensus_failure_events: MagicMock,
+        mock_get_input_fingerprints: MagicMock,
+        mock_get_previous_results: MagicMock,
+    ) -> None:
+        mock_fetch_validations.return_value = self._TEST_VALIDATIONS
+        mock_get_input_fingerprints.return_value = {
+            (job.validation.validation_name, job.region_code): "fingerprint"
+            for job in self._TEST_VALIDATIONS
+        }
+        mock_run_job.return_value = DataValidationJobResult(
+            validation_job=self._TEST_VALIDATIONS[0],
+            result_details=FakeValidationResultDetails(
+                validation_status=ValidationResultStatus.SUCCESS
+            ),
+        )
+
+        headers = {"X-Appengine-Cron": "test-cron"}
+        response = self.client.get("/validate?force_full_run=true", headers=headers)
+
+        self.assertEqual(200, response.status_code)
+        mock_get_previous_results.assert_not_called()
+        self.assertEqual(5, mock_run_job.call_count)
+        ((results,), _kwargs) = mock_store_validation_results.call_args
+        self.assertEqual(
+            ["fingerprint"] * 5, [result.input_fingerprint for result in results]
+        )
+
 
 class TestFetchValidations(TestCase):
     """Tests the _fetch_validation_jobs_to_perform function."""
@@ -0,0 +1,286 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2022 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Tests for validation/validation_query_batcher.py."""
+import gc
+import weakref
+from typing import Any, Dict, Iterator, List
+from unittest import TestCase
+
+from mock import MagicMock, patch
+
+from recidiviz.big_query.big_query_view import SimpleBigQueryViewBuilder
+from recidiviz.utils.types import assert_type
+from recidiviz.validation.checks.existence_check import ExistenceDataValidationCheck
+from recidiviz.validation.checks.sameness_check import (
+    SamenessDataValidationCheck,
+    SamenessDataValidationCheckType,
+    SamenessPerViewValidationResultDetails,
+)
+from recidiviz.validation.validation_models import (
+    DataValidationJob,
+    RowCountSummary,
+    ValidationCategory,
+    ValidationQueryType,
+)
+from recidiviz.validation.validation_query_batcher import ValidationQueryBatcher
+
+_REGION_CODES = ["US_XX", "US_YY", "US_ZZ"]
+
+
+class _FakeRow(Dict[str, Any]):
+    """A query result row that can be weakly referenced, so tests can check that rows
+    are not retained after they have been summarized."""
+
+
+class _FakeQueryJob:
+    """Streams freshly created rows each time it is iterated, like a QueryJob."""
+
+    total_bytes_processed = 1000
+    total_bytes_billed = 1000
+    slot_millis = 20
+
+    def __init__(self, rows: List[Dict[str, Any]]) -> None:
+        self.rows = rows
+        self.row_refs: List[weakref.ref] = []
+
+    def __iter__(self) -> Iterator[_FakeRow]:
+        for row in self.rows:
+            fake_row = _FakeRow(row)
+            self.row_refs.append(weakref.ref(fake_row))
+            yield fake_row
+
+
+class ValidationQueryBatcherTest(TestCase):
+    """Tests for the ValidationQueryBatcher."""
+
+    def setUp(self) -> None:
+        self.metadata_patcher = patch("recidiviz.utils.metadata.project_id")
+        self.metadata_patcher.start().return_value = "project-id"
+        self.client_patcher = patch(
+            "recidiviz.validation.validation_query_batcher.BigQueryClientImpl"
+        )
+        self.mock_client = self.client_patcher.start().return_value
+        self.query_jobs: List[_FakeQueryJob] = []
+
+        view_builder = SimpleBigQueryViewBuilder(
+            dataset_id="my_dataset",
+            view_id="test_view",
+            description="test_view description",
+            view_query_template="select * from literally_anything",
+        )
+        existence_check = ExistenceDataValidationCheck(
+            view_builder=view_builder,
+            validation_category=ValidationCategory.INVARIANT,
+        )
+        sameness_check = SamenessDataValidationCheck(
+            view_builder=view_builder,
+            validation_category=ValidationCategory.CONSISTENCY,
+            comparison_columns=["a", "b"],
+            sameness_check_type=SamenessDataValidationCheckType.PER_VIEW,
+        )
+        self.jobs = [
+            DataValidationJob(validation=check, region_code=region_code)
+            for check in (existence_check, sameness_check)
+            for region_code in _REGION_CODES
+        ]
+
+        self.original_rows = [
+            {"region_code": "US_XX", "a": 1, "b": 1},
+            {"region_code": "US_XX", "a": 1, "b": 2},
+            {"region_code": "US_YY", "a": 3, "b": 3},
+        ]
+        self.error_rows = [{"region_code": "US_XX", "a": 1, "b": 2}]
+
+    def tearDown(self) -> None:
+        self.client_patcher.stop()
+        self.metadata_patcher.stop()
+
+    def _run_query(self, query_str: str, _query_parameters: List) -> _FakeQueryJob:
+        if "test_view_errors" in query_str:
+            query_job = _FakeQueryJob(self.error_rows)
+        else:
+            query_job = _FakeQueryJob(self.original_rows)
+        self.query_jobs.append(query_job)
+        return query_job
+
+    def test_jobs_reading_same_view_share_one_query(self) -> None:
+        self.mock_client.run_query_async.side_effect = self._run_query
+        batcher = ValidationQueryBatcher(self.jobs)
+        self.assertEqual(2, batcher.num_batched_queries)
+
+        summaries_by_job = [
+            batcher.summaries_for_job(
+                job, job.validation.get_checker().required_query_types()
+            )
+            for job in self.jobs
+        ]
+
+        self.assertEqual(2, self.mock_client.run_query_async.call_count)
+        self.mock_client.run_query_async.assert_any_call(
+            "SELECT * FROM `project-id.my_dataset.test_view` "
+            "WHERE region_code IN ('US_XX', 'US_YY', 'US_ZZ');",
+            [],
+        )
+        self.assertEqual(
+            [2, 1, 0],
+            [
+                assert_type(
+                    summaries[ValidationQueryType.ORIGINAL], RowCountSummary
+                ).num_rows
+                for summaries in summaries_by_job[:3]
+            ],
+        )
+        sameness_us_xx = self.jobs[3]
+        result_details = assert_type(
+            sameness_us_xx.validation.get_checker()
+            .get_result_from_summaries(sameness_us_xx, summaries_by_job[3])
+            .result_details,
+            SamenessPerViewValidationResultDetails,
+        )
+        self.assertEqual(1, result_details.num_error_rows)
+        self.assertEqual(2, result_details.total_num_rows)
+
+    def test_results_match_unbatched_checks(self) -> None:
+        self.mock_client.run_query_async.side_effect = self._run_query
+        batcher = ValidationQueryBatcher(self.jobs)
+
+        for job in self.jobs:
+            checker = job.validation.get_checker()
+            batched_result = checker.get_result_from_summaries(
+                job, batcher.summaries_for_job(job, checker.required_query_types())
+            )
+            unbatched_result = checker.get_result_from_rows(
+                job,
+                {
+                    query_type: [
+                        row
+                        for row in self._run_query(job.query_str(query_type), [])
+                        if row["region_code"] == job.region_code
+                    ]
+                    for query_type in checker.required_query_types()
+                },
+            )
+            self.assertEqual(unbatched_result, batched_result)
+
+    def test_rows_are_not_retained(self) -> None:
+        self.mock_client.run_query_async.side_effect = self._run_query
+        batcher = ValidationQueryBatcher(self.jobs)
+
+        for job in self.jobs:
+            batcher.summaries_for_job(
+                job, job.validation.get_checker().required_query_types()
+            )
+
+        gc.collect()
+        row_refs = [ref for query_job in self.query_jobs for ref in query_job.row_refs]
+        self.assertEqual(len(self.original_rows) + len(self.error_rows), len(row_refs))
+        self.assertTrue(all(ref() is None for ref in row_refs))
+
+    def test_failed_batch_query_fails_every_job_in_batch(self) -> None:
+        self.mock_client.run_query_async.side_effect = ValueError("Query failed")
+        batcher = ValidationQueryBatcher(self.jobs[:3])
+
+        for job in self.jobs[:3]:
+            with self.assertRaisesRegex(ValueError, "Query failed"):
+                batcher.summaries_for_job(job, [ValidationQueryType.ORIGINAL])
+        self.mock_client.run_query_async.assert_called_once()
+
+    def test_failed_summary_fails_only_its_job(self) -> None:
+        # The sameness check reads column "b", which is missing for US_YY
+        self.original_rows[2] = {"region_code": "US_YY", "a": 3}
+        self.mock_client.run_query_async.side_effect = self._run_query
+        batcher = ValidationQueryBatcher(self.jobs)
+
+        existence_us_yy, sameness_us_yy = self.jobs[1], self.jobs[4]
+        with self.assertRaises(KeyError):
+            batcher.summaries_for_job(sameness_us_yy, [ValidationQueryType.ORIGINAL])
+        summaries = batcher.summaries_for_job(
+            existence_us_yy, [ValidationQueryType.ORIGINAL]
+        )
+        self.assertEqual(
+            1,
+            assert_type(
+                summaries[ValidationQueryType.ORIGINAL], RowCountSummary
+            ).num_rows,
+        )
+        self.mock_client.run_query_async.assert_called_once()
+
+    def test_unplanned_query_runs_on_its_own(self) -> None:
+        self.mock_client.run_query_async.side_effect = self._run_query
+        batcher = ValidationQueryBatcher([])
+
+        summaries = batcher.summaries_for_job(
+            self.jobs[0], [ValidationQueryType.ORIGINAL]
+        )
+
+        self.mock_client.run_query_async.assert_called_once_with(
+            "SELECT * FROM `project-id.my_dataset.test_view` "
+            "WHERE region_code = 'US_XX';",
+            [],
+        )
+        self.assertEqual(
+            len(self.original_rows),
+            assert_type(
+                summaries[ValidationQueryType.ORIGINAL], RowCountSummary
+            ).num_rows,
+        )
+
+    def test_log_stats_compares_with_per_job_queries(self) -> None:
+        self.mock_client.run_query_async.side_effect = self._run_query
+        self.mock_client.dry_run_query.return_value = MagicMock(
+            total_bytes_processed=400
+        )
+        batcher = ValidationQueryBatcher(self.jobs)
+        for job in self.jobs:
+            batcher.summaries_for_job(
+                job, job.validation.get_checker().required_query_types()
+            )
+
+        with self.assertLogs(level="INFO") as logs:
+            batcher.log_stats()
+
+        # One dry run per distinct (view, region) query
+        self.assertEqual(6, self.mock_client.dry_run_query.call_count)
+        self.mock_client.dry_run_query.assert_any_call(
+            self.jobs[0].query_str(ValidationQueryType.ORIGINAL)
+        )
+        self.assertIn(
+            "Ran [2] batched validation queries in place of [9] per-job queries. "
+            "Processed [2000] bytes, billed [2000] bytes and used [40] slot ms.",
+            logs.output[0],
+        )
+        # The ORIGINAL query replaces 2 per-job queries per region and the ERROR query
+        # replaces 1, each of which processes 400 bytes.
+        self.assertIn(
+            "Per-job validation queries would have processed [3600] bytes (measured "
+            "with dry runs) and used an estimated [72] slot ms. Batching saved [1600] "
+            "bytes processed and an estimated [32] slot ms.",
+            logs.output[1],
+        )
+
+    def test_log_stats_dry_run_failure(self) -> None:
+        self.mock_client.run_query_async.side_effect = self._run_query
+        self.mock_client.dry_run_query.side_effect = ValueError("Dry run failed")
+        batcher = ValidationQueryBatcher(self.jobs[:3])
+        for job in self.jobs[:3]:
+            batcher.summaries_for_job(job, [ValidationQueryType.ORIGINAL])
+
+        with self.assertLogs(level="INFO") as logs:
+            batcher.log_stats()
+
+        self.assertEqual(2, len(logs.output))
+        self.assertIn("Dry run failed", logs.output[1])
@@ -38,7 +38,9 @@ from recidiviz.validation.validation_models import (
     ValidationResultStatus,
 )
 from recidiviz.validation.validation_result_storage import (
+    PreviousValidationResult,
     ValidationResultForStorage,
+    load_previous_validation_results,
     store_validation_results_in_big_query,
 )
 
@@ -124,6 +126,8 @@ class TestValidationResultStorage(unittest.TestCase):
                 "result_details": '{"failed_rows": [], "hard_max_allowed_error": 0.0, "soft_max_allowed_error": 0.0, "dev_mode": false}',
                 "validation_category": "EXTERNAL_AGGREGATE",
                 "exception_log": None,
+                "input_fingerprint": None,
+                "carried_forward_from_run_id": None,
                 "trace_id": result.trace_id,
             },
             result.to_serializable(),
@@ -203,6 +207,8 @@ class TestValidationResultStorage(unittest.TestCase):
                 "result_details": '{"num_error_rows": 0, "total_num_rows": 5, "hard_max_allowed_error": 0.5, "soft_max_allowed_error": 0.5, "dev_mode": false, "non_null_counts_per_column_per_partition": [[["US_XX", "2020-12-01"], {"internal": 5, "external": 5}]]}',
                 "validation_category": "EXTERNAL_INDIVIDUAL",
                 "exception_log": None,
+                "input_fingerprint": None,
+                "carried_forward_from_run_id": None,
                 "trace_id": result.trace_id,
             },
             result.to_serializable(),
@@ -293,6 +299,8 @@ class TestValidationResultStorage(unittest.TestCase):
                 "validation_category": "EXTERNAL_AGGREGATE",
                 "trace_id": result.trace_id,
                 "exception_log": None,
+                "input_fingerprint": None,
+                "carried_forward_from_run_id": None,
             },
             result.to_serializable(),
         )
@@ -359,6 +367,8 @@ class TestValidationResultStorage(unittest.TestCase):
                 "result_details_type": None,
                 "result_details": None,
                 "exception_log": None,
+                "input_fingerprint": None,
+                "carried_forward_from_run_id": None,
                 "trace_id": result.trace_id,
                 "validation_category": "EXTERNAL_AGGREGATE",
             },
@@ -506,6 +516,8 @@ class TestValidationResultStorage(unittest.TestCase):
                     "result_details": '{"failed_rows": [], "hard_max_allowed_error": 0.0, "soft_max_allowed_error": 0.0, "dev_mode": false}',
                     "validation_category": "EXTERNAL_AGGREGATE",
                     "exception_log": None,
+                    "input_fingerprint": None,
+                    "carried_forward_from_run_id": None,
                     "trace_id": storage_result_1.trace_id,
                 },
                 {
@@ -523,6 +535,8 @@ class TestValidationResultStorage(unittest.TestCase):
                     "result_details": '{"failed_rows": [[{"label_values": ["US_XX"], "comparison_values": [5, 10]}, 0.5]], "hard_max_allowed_error": 0.0, "soft_max_allowed_error": 0.0, "dev_mode": false}',
                     "validation_category": "EXTERNAL_AGGREGATE",
                     "exception_log": None,
+                    "input_fingerprint": None,
+                    "carried_forward_from_run_id": None,
                     "trace_id": storage_result_2.trace_id,
                 },
                 {
@@ -540,7 +554,93 @@ class TestValidationResultStorage(unittest.TestCase):
                     "result_details": None,
                     "validation_category": "CONSISTENCY",
                     "exception_log": None,
+                    "input_fingerprint": None,
+                    "carried_forward_from_run_id": None,
                     "trace_id": storage_result_3.trace_id,
                 },
             ],
         )
+
+    @patch("recidiviz.validation.validation_result_storage.BigQueryClientImpl")
+    def test_load_previous_validation_results(
+        self, mock_bigquery_client_class: MagicMock
+    ) -> None:
+        mock_bigquery_client_class.return_value.run_query_async.return_value = [
+            {
+                "validation_name": "test_view",
+                "region_code": "US_XX",
+                "run_id": "abc123",
+                "did_run": True,
+                "input_fingerprint": "fingerprint_1",
+                "carried_forward_from_run_id": None,
+                "result_details_type": "SamenessPerRowValidationResultDetails",
+                "result_details": '{"failed_rows": [[{"label_values": ["US_XX"], "comparison_values": [5, 10]}, 0.5]], "hard_max_allowed_error": 0.0, "soft_max_allowed_error": 0.0, "dev_mode": false}',
+            },
+            {
+                "validation_name": "test_view",
+                "region_code": "US_YY",
+                "run_id": "abc123",
+                "did_run": True,
+                "input_fingerprint": "fingerprint_2",
+                "carried_forward_from_run_id": "abc000",
+                "result_details_type": "SamenessPerViewValidationResultDetails",
+                "result_details": '{"num_error_rows": 1, "total_num_rows": 10, "hard_max_allowed_error": 0.5, "soft_max_allowed_error": 0.2, "dev_mode": false, "non_null_counts_per_column_per_partition": [[["US_YY"], {"a": 10, "b": 9}]]}',
+            },
+            # Results that did not run or have no fingerprint are never carried forward
+            {
+                "validation_name": "test_view",
+                "region_code": "US_ZZ",
+                "run_id": "abc123",
+                "did_run": False,
+                "input_fingerprint": "fingerprint_3",
+                "carried_forward_from_run_id": None,
+                "result_details_type": None,
+                "result_details": None,
+            },
+            {
+                "validation_name": "other_view",
+                "region_code": "US_XX",
+                "run_id": "abc123",
+                "did_run": True,
+                "input_fingerprint": None,
+                "carried_forward_from_run_id": None,
+                "result_details_type": "SamenessPerRowValidationResultDetails",
+                "result_details": '{"failed_rows": [], "hard_max_allowed_error": 0.0, "soft_max_allowed_error": 0.0, "dev_mode": false}',
+            },
+        ]
+
+        self.assertEqual(
+            {
+                ("test_view", "US_XX"): PreviousValidationResult(
+                    run_id="abc123",
+                    input_fingerprint="fingerprint_1",
+                    result_details=SamenessPerRowValidationResultDetails(
+                        failed_rows=[
+                            (
+                                ResultRow(
+                                    label_values=("US_XX",),
+                                    comparison_values=(5.0, 10.0),
+                                ),
+                                0.5,
+                            )
+                        ],
+                        hard_max_allowed_error=0.0,
+                        soft_max_allowed_error=0.0,
+                    ),
+                ),
+                ("test_view", "US_YY"): PreviousValidationResult(
+                    run_id="abc000",
+                    input_fingerprint="fingerprint_2",
+                    result_details=SamenessPerViewValidationResultDetails(
+                        num_error_rows=1,
+                        total_num_rows=10,
+                        hard_max_allowed_error=0.5,
+                        soft_max_allowed_error=0.2,
+                        non_null_counts_per_column_per_partition=[
+                            (("US_YY",), {"a": 10, "b": 9})
+                        ],
+                    ),
+                ),
+            },
+            load_previous_validation_results(max_age_days=7),
+        )
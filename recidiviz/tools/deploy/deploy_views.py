@@ -24,6 +24,11 @@ Run locally with the following command:
 To test the schemas by deploying to an empty sandbox, run:
     python -m recidiviz.tools.deploy.deploy_views --project-id [PROJECT_ID] --test-schema-only
 
+To only deploy views that have changed since the last deploy, run:
+    python -m recidiviz.tools.deploy.deploy_views --project-id [PROJECT_ID] --skip-unchanged-views
+
+To see which views would be deployed without making any changes, add --dry-run.
+
 """
 import argparse
 import logging
@@ -83,6 +88,29 @@ def parse_arguments(argv: List[str]) -> Tuple[argparse.Namespace, List[str]]:
         required=False,
     )
 
+    parser.add_argument(
+        "--skip-unchanged-views",
+        dest="skip_unchanged_views",
+        type=bool,
+        nargs="?",
+        const=True,
+        default=False,
+        help="If set, skips views whose definition and ancestor definitions have "
+        "not changed since they were last deployed, according to the deploy "
+        "manifest.",
+    )
+
+    parser.add_argument(
+        "--dry-run",
+        dest="dry_run",
+        type=bool,
+        nargs="?",
+        const=True,
+        default=False,
+        help="If set, logs which views would be updated according to the deploy "
+        "manifest without making any changes.",
+    )
+
     return parser.parse_known_args(argv)
 
 
@@ -90,6 +118,8 @@ def deploy_views(
     project_id: str,
     test_schema: bool,
     dataset_ids_to_load: Optional[List[str]] = None,
+    skip_unchanged_views: bool = False,
+    dry_run: bool = False,
 ) -> None:
     """Deploys the views.
 
@@ -99,6 +129,9 @@ def deploy_views(
     If |dataset_ids_to_load| is set, only loads views whose dataset_id matches one of
     the listed dataset_ids, or views that are ancestors of the views in the datasets
     listed.
+
+    If |skip_unchanged_views| is True, only deploys views that have changed since the
+    last deploy. If |dry_run| is True, only logs which views would be deployed.
     """
     view_builders_to_update: Sequence[BigQueryViewBuilder] = deployed_view_builders(
         project_id
@@ -150,6 +183,8 @@ def deploy_views(
         # This script does not do any clean up of previously managed views
         historically_managed_datasets_to_clean=None,
         default_table_expiration_for_new_datasets=table_expiration,
+        skip_unchanged_views=skip_unchanged_views,
+        dry_run=dry_run,
     )
 
 
@@ -162,4 +197,6 @@ if __name__ == "__main__":
             known_args.project_id,
             known_args.test_schema_only,
             known_args.dataset_ids_to_load,
+            known_args.skip_unchanged_views,
+            known_args.dry_run,
         )
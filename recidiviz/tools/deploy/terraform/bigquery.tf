@@ -116,6 +116,16 @@ resource "google_bigquery_table" "validation_results" {
         "name": "failure_description",
         "type": "STRING",
         "mode": "NULLABLE"
+    },
+    {
+        "name": "input_fingerprint",
+        "type": "STRING",
+        "mode": "NULLABLE"
+    },
+    {
+        "name": "carried_forward_from_run_id",
+        "type": "STRING",
+        "mode": "NULLABLE"
     }
 ]
 EOF
@@ -0,0 +1,96 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2022 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Measures the throughput of ReadOnlyCsvNormalizingStream on synthetic files with a
+custom delimiter and line terminator, reading via read() (as pandas does) and via
+readline(). Runs against files of increasing size so that non-linear scaling in file
+size is easy to spot.
+
+Example Usage:
+    python -m recidiviz.tools.ingest.development.benchmark_csv_normalizing_stream \
+        --num-rows 100000 --row-length 400
+"""
+import argparse
+import csv
+import io
+import logging
+import time
+from typing import Callable
+
+from recidiviz.cloud_storage.read_only_csv_normalizing_stream import (
+    ReadOnlyCsvNormalizingStream,
+)
+
+DELIMITER = "†"
+LINE_TERMINATOR = "‡\n"
+
+# Matches the chunk size pandas uses when reading from a file-like object
+READ_SIZE = 256 * 1024
+
+
+def _build_file_contents(num_rows: int, row_length: int) -> str:
+    num_columns = 10
+    value = "x" * max(1, row_length // num_columns - 1)
+    row = DELIMITER.join([value] * num_columns)
+    return LINE_TERMINATOR.join([row] * num_rows) + LINE_TERMINATOR
+
+
+def _read_all_with_read(stream: ReadOnlyCsvNormalizingStream) -> None:
+    while stream.read(READ_SIZE):
+        pass
+
+
+def _read_all_with_readline(stream: ReadOnlyCsvNormalizingStream) -> None:
+    while stream.readline():
+        pass
+
+
+def _megabytes_per_second(
+    contents: str, read_all_fn: Callable[[ReadOnlyCsvNormalizingStream], None]
+) -> float:
+    stream = ReadOnlyCsvNormalizingStream(
+        io.StringIO(contents),
+        delimiter=DELIMITER,
+        line_terminator=LINE_TERMINATOR,
+        quoting=csv.QUOTE_NONE,
+    )
+    start = time.perf_counter()
+    read_all_fn(stream)
+    return len(contents) / 2**20 / (time.perf_counter() - start)
+
+
+def main(num_rows: int, row_length: int) -> None:
+    for multiplier in (1, 2, 4):
+        contents = _build_file_contents(num_rows * multiplier, row_length)
+        logging.info(
+            "[%.1f] MB file: read() [%.1f] MB/sec, readline() [%.1f] MB/sec",
+            len(contents) / 2**20,
+            _megabytes_per_second(contents, _read_all_with_read),
+            _megabytes_per_second(contents, _read_all_with_readline),
+        )
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num-rows", type=int, default=100000)
+    parser.add_argument("--row-length", type=int, default=400)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    logging.getLogger().setLevel(logging.INFO)
+    known_args = parse_arguments()
+    main(known_args.num_rows, known_args.row_length)
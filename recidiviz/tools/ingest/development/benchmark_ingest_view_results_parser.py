@@ -0,0 +1,127 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2022 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Benchmarks how quickly ingest view result rows are converted into entity trees by
+recursively walking the manifest tree for each row (ManifestNode.build_from_row())
+versus evaluating the row evaluator compiled once per file
+(ManifestNode.compile_row_evaluator()), using the ingest view manifest fixtures checked
+into recidiviz/tests/ingest/direct/ingest_mappings. Each fixture is repeated until it
+has the requested number of rows, and the rows/sec processed by each approach is
+logged.
+
+Example Usage:
+    python -m recidiviz.tools.ingest.development.benchmark_ingest_view_results_parser \
+        --num-rows 100000
+"""
+import argparse
+import csv
+import logging
+import os
+import time
+from typing import Callable, Dict, List, Optional
+
+from recidiviz.ingest.direct.ingest_mappings.ingest_view_results_parser import (
+    IngestViewResultsParser,
+)
+from recidiviz.ingest.direct.types.direct_ingest_instance import DirectIngestInstance
+from recidiviz.persistence.entity.base_entity import Entity
+from recidiviz.persistence.entity.entity_deserialize import (
+    DeserializableEntityFieldValue,
+)
+from recidiviz.tests.ingest.direct.ingest_mappings.fixtures.ingest_view_file_parser import (
+    ingest_view_files,
+)
+from recidiviz.tests.ingest.direct.ingest_mappings.ingest_view_results_parser_test import (
+    FakeSchemaIngestViewResultsParserDelegate,
+)
+
+
+class _BenchmarkParserDelegate(FakeSchemaIngestViewResultsParserDelegate):
+    def get_common_args(self) -> Dict[str, DeserializableEntityFieldValue]:
+        # The US_XX test state code is only defined when running in tests.
+        return {"fake_state_code": "US_XX"}
+
+
+def _rows_per_second(
+    build_fn: Callable[[Dict[str, str]], Optional[Entity]],
+    rows: List[Dict[str, str]],
+) -> float:
+    start = time.perf_counter()
+    for row in rows:
+        build_fn(row)
+    return len(rows) / (time.perf_counter() - start)
+
+
+def main(num_rows: int) -> None:
+    delegate = _BenchmarkParserDelegate(
+        DirectIngestInstance.SECONDARY, is_production=False
+    )
+    parser = IngestViewResultsParser(delegate)
+    fixtures_dir = os.path.dirname(ingest_view_files.__file__)
+    total_tree_walk_seconds = total_compiled_seconds = 0.0
+    for file_name in sorted(os.listdir(fixtures_dir)):
+        ingest_view_name, extension = os.path.splitext(file_name)
+        if extension != ".csv":
+            continue
+        try:
+            manifest, _ = parser.parse_manifest(
+                delegate.get_ingest_view_manifest_path(ingest_view_name)
+            )
+            with open(os.path.join(fixtures_dir, file_name), encoding="utf-8") as f:
+                fixture_rows = list(csv.DictReader(f))
+            for row in fixture_rows:
+                manifest.build_from_row(row)
+        except Exception:
+            # Some fixtures exist to test invalid manifests or rows
+            continue
+        if not fixture_rows:
+            continue
+        num_copies = -(-num_rows // len(fixture_rows))
+        rows = (fixture_rows * num_copies)[:num_rows]
+
+        tree_walk = _rows_per_second(manifest.build_from_row, rows)
+        compiled = _rows_per_second(manifest.compile_row_evaluator(), rows)
+        total_tree_walk_seconds += len(rows) / tree_walk
+        total_compiled_seconds += len(rows) / compiled
+        logging.info(
+            "[%s]: tree walk [%.0f] rows/sec, compiled [%.0f] rows/sec (%.2fx)",
+            ingest_view_name,
+            tree_walk,
+            compiled,
+            compiled / tree_walk,
+        )
+    logging.info(
+        "Total: tree walk [%.1f] sec, compiled [%.1f] sec (%.2fx)",
+        total_tree_walk_seconds,
+        total_compiled_seconds,
+        total_tree_walk_seconds / total_compiled_seconds,
+    )
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--num-rows",
+        type=int,
+        default=100000,
+        help="Number of rows to benchmark for each fixture ingest view.",
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    logging.getLogger().setLevel(logging.INFO)
+    main(parse_arguments().num_rows)
@@ -0,0 +1,125 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2022 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Benchmarks the peak memory used to parse ingest view results into entity trees
+all at once (IngestViewResultsParser.parse()) versus in batches
+(IngestViewResultsParser.parse_batches()), which only holds one batch of parsed trees
+in memory at a time. Rows for the `simple_enums` fake schema fixture ingest view are
+generated for the requested number of people, and the peak memory traced by
+tracemalloc for each approach is logged.
+
+Example Usage:
+    python -m recidiviz.tools.ingest.development.benchmark_ingest_view_results_parser_memory \
+        --num-rows 100000 --batch-size 1000
+"""
+import argparse
+import logging
+import tracemalloc
+from typing import Callable, Dict, Iterator
+
+from recidiviz.ingest.direct.ingest_mappings.ingest_view_results_parser import (
+    IngestViewResultsParser,
+)
+from recidiviz.ingest.direct.types.direct_ingest_instance import DirectIngestInstance
+from recidiviz.persistence.entity.entity_deserialize import (
+    DeserializableEntityFieldValue,
+)
+from recidiviz.tests.ingest.direct.ingest_mappings.ingest_view_results_parser_test import (
+    FakeSchemaIngestViewResultsParserDelegate,
+)
+
+_INGEST_VIEW_NAME = "simple_enums"
+
+
+class _BenchmarkParserDelegate(FakeSchemaIngestViewResultsParserDelegate):
+    def get_common_args(self) -> Dict[str, DeserializableEntityFieldValue]:
+        # The US_XX test state code is only defined when running in tests.
+        return {"fake_state_code": "US_XX"}
+
+
+def _rows(num_rows: int) -> Iterator[Dict[str, str]]:
+    for i in range(num_rows):
+        yield {"PERSONID": str(i), "GENDER": "F"}
+
+
+def _peak_memory_bytes(parse_fn: Callable[[], int], num_rows: int) -> int:
+    tracemalloc.start()
+    try:
+        num_parsed = parse_fn()
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    if num_parsed != num_rows:
+        raise ValueError(f"Expected [{num_rows}] trees, parsed [{num_parsed}].")
+    return peak_bytes
+
+
+def main(num_rows: int, batch_size: int) -> None:
+    parser = IngestViewResultsParser(
+        _BenchmarkParserDelegate(DirectIngestInstance.SECONDARY, is_production=False)
+    )
+
+    list_peak_bytes = _peak_memory_bytes(
+        lambda: len(
+            parser.parse(
+                ingest_view_name=_INGEST_VIEW_NAME, contents_iterator=_rows(num_rows)
+            )
+        ),
+        num_rows,
+    )
+    batched_peak_bytes = _peak_memory_bytes(
+        lambda: sum(
+            len(batch)
+            for batch in parser.parse_batches(
+                ingest_view_name=_INGEST_VIEW_NAME,
+                contents_iterator=_rows(num_rows),
+                batch_size=batch_size,
+            )
+        ),
+        num_rows,
+    )
+    logging.info(
+        "Peak memory for [%s] rows: parse() [%.1f] MiB, parse_batches(batch_size=%s) "
+        "[%.1f] MiB (%.1fx less)",
+        num_rows,
+        list_peak_bytes / 2**20,
+        batch_size,
+        batched_peak_bytes / 2**20,
+        list_peak_bytes / batched_peak_bytes,
+    )
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--num-rows",
+        type=int,
+        default=100000,
+        help="Number of rows to parse.",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=1000,
+        help="Number of entity trees per batch for parse_batches().",
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    logging.getLogger().setLevel(logging.INFO)
+    args = parse_arguments()
+    main(args.num_rows, args.batch_size)
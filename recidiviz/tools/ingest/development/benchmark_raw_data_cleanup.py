@@ -0,0 +1,104 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2022 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Benchmarks the white space stripping / empty row filtering step of raw data import
+(strip_whitespace_and_drop_empty_rows()) against the previous per-cell implementation,
+using CSV fixture files checked into recidiviz/tests/ingest/direct. Each fixture is
+repeated until it has the requested number of rows, and the rows/sec processed by each
+implementation is logged.
+
+Example Usage:
+    python -m recidiviz.tools.ingest.development.benchmark_raw_data_cleanup \
+        --num-rows 250000
+"""
+import argparse
+import glob
+import logging
+import os
+import time
+from typing import Callable, List
+
+import pandas as pd
+
+from recidiviz.ingest.direct.raw_data.direct_ingest_raw_file_import_manager import (
+    strip_whitespace_and_drop_empty_rows,
+)
+from recidiviz.tests.ingest import direct as direct_ingest_tests
+
+
+def _strip_whitespace_and_drop_empty_rows_per_cell(df: pd.DataFrame) -> pd.DataFrame:
+    """The previous implementation, which calls back into Python for every cell."""
+    df = df.applymap(lambda x: x.strip())
+    return df[~pd.isnull(df.applymap(lambda x: None if x == "" else x)).all(axis=1)]
+
+
+def _rows_per_second(
+    cleanup_fn: Callable[[pd.DataFrame], pd.DataFrame], df: pd.DataFrame
+) -> float:
+    start = time.perf_counter()
+    cleanup_fn(df)
+    return df.shape[0] / (time.perf_counter() - start)
+
+
+def _fixture_paths() -> List[str]:
+    return sorted(
+        glob.glob(
+            os.path.join(os.path.dirname(direct_ingest_tests.__file__), "**", "*.csv"),
+            recursive=True,
+        )
+    )
+
+
+def main(num_rows: int) -> None:
+    for path in _fixture_paths():
+        fixture_df = pd.read_csv(path, dtype=str, keep_default_na=False)
+        if fixture_df.empty:
+            continue
+        num_copies = -(-num_rows // fixture_df.shape[0])
+        df = pd.concat([fixture_df] * num_copies, ignore_index=True).head(num_rows)
+
+        per_cell_result = _strip_whitespace_and_drop_empty_rows_per_cell(df)
+        vectorized_result = strip_whitespace_and_drop_empty_rows(df)
+        if not per_cell_result.equals(vectorized_result):
+            raise ValueError(f"Found differing cleanup results for fixture [{path}]")
+
+        before = _rows_per_second(_strip_whitespace_and_drop_empty_rows_per_cell, df)
+        after = _rows_per_second(strip_whitespace_and_drop_empty_rows, df)
+        logging.info(
+            "[%s] (%d columns): per-cell [%.0f] rows/sec, vectorized [%.0f] rows/sec "
+            "(%.1fx)",
+            os.path.basename(path),
+            df.shape[1],
+            before,
+            after,
+            after / before,
+        )
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--num-rows",
+        type=int,
+        default=250000,
+        help="Number of rows to benchmark for each fixture file.",
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    logging.getLogger().setLevel(logging.INFO)
+    main(parse_arguments().num_rows)
@@ -0,0 +1,175 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2022 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Measures how long StateEntityMatcher.run_match() takes to match a single synthetic
+person with a very large entity tree against an identical copy of that person that has
+already been written to a local on-disk Postgres database. The first run is logged
+separately since it also pays the one-time cost of building the CoreEntityFieldIndex
+field caches.
+
+Example Usage:
+    python -m recidiviz.tools.ingest.development.benchmark_state_entity_matching \
+        --num-children 500 --num-runs 5
+"""
+import argparse
+import datetime
+import logging
+import time
+from typing import List
+
+from recidiviz.common.constants.state.state_charge import StateChargeStatus
+from recidiviz.common.constants.state.state_sentence import StateSentenceStatus
+from recidiviz.common.ingest_metadata import IngestMetadata, SystemLevel
+from recidiviz.persistence.database.schema_entity_converter.schema_entity_converter import (
+    convert_entity_people_to_schema_people,
+)
+from recidiviz.persistence.database.schema_utils import SchemaType
+from recidiviz.persistence.database.session_factory import SessionFactory
+from recidiviz.persistence.database.sqlalchemy_database_key import SQLAlchemyDatabaseKey
+from recidiviz.persistence.entity.state import entities
+from recidiviz.persistence.entity_matching.state.base_state_matching_delegate import (
+    BaseStateMatchingDelegate,
+)
+from recidiviz.persistence.entity_matching.state.state_entity_matcher import (
+    StateEntityMatcher,
+)
+from recidiviz.tools.postgres import local_postgres_helpers
+
+_STATE_CODE = "US_XX"
+
+
+def _build_person(num_children: int) -> entities.StatePerson:
+    """Builds a person with |num_children| entities of each of several types, some of
+    which have children of their own.
+    """
+    person = entities.StatePerson.new_with_defaults(state_code=_STATE_CODE)
+    person.external_ids = [
+        entities.StatePersonExternalId.new_with_defaults(
+            state_code=_STATE_CODE, external_id="BENCHMARK_ID", id_type="ID_TYPE"
+        )
+    ]
+    start_date = datetime.date(2000, 1, 1)
+    for i in range(num_children):
+        date = start_date + datetime.timedelta(days=i)
+        person.incarceration_periods.append(
+            entities.StateIncarcerationPeriod.new_with_defaults(
+                state_code=_STATE_CODE, external_id=f"IP_{i}", admission_date=date
+            )
+        )
+        person.supervision_periods.append(
+            entities.StateSupervisionPeriod.new_with_defaults(
+                state_code=_STATE_CODE, external_id=f"SP_{i}", start_date=date
+            )
+        )
+        person.supervision_sentences.append(
+            entities.StateSupervisionSentence.new_with_defaults(
+                state_code=_STATE_CODE,
+                external_id=f"SS_{i}",
+                status=StateSentenceStatus.SERVING,
+                charges=[
+                    entities.StateCharge.new_with_defaults(
+                        state_code=_STATE_CODE,
+                        external_id=f"CHARGE_{i}",
+                        status=StateChargeStatus.PRESENT_WITHOUT_INFO,
+                    )
+                ],
+            )
+        )
+        person.supervision_violations.append(
+            entities.StateSupervisionViolation.new_with_defaults(
+                state_code=_STATE_CODE,
+                external_id=f"SV_{i}",
+                violation_date=date,
+                supervision_violation_responses=[
+                    entities.StateSupervisionViolationResponse.new_with_defaults(
+                        state_code=_STATE_CODE,
+                        external_id=f"SVR_{i}",
+                        response_date=date,
+                    )
+                ],
+            )
+        )
+    return person
+
+
+def _run_match_seconds(
+    database_key: SQLAlchemyDatabaseKey, ingested_people: List[entities.StatePerson]
+) -> float:
+    ingest_metadata = IngestMetadata(
+        region=_STATE_CODE.lower(),
+        ingest_time=datetime.datetime.now(),
+        system_level=SystemLevel.STATE,
+        database_key=database_key,
+    )
+    matcher = StateEntityMatcher(
+        BaseStateMatchingDelegate(_STATE_CODE.lower(), ingest_metadata)
+    )
+    with SessionFactory.using_database(database_key, autocommit=False) as session:
+        start = time.perf_counter()
+        matcher.run_match(session, _STATE_CODE, ingested_people)
+        seconds = time.perf_counter() - start
+        session.rollback()
+    return seconds
+
+
+def main(num_children: int, num_runs: int) -> None:
+    database_key = SQLAlchemyDatabaseKey.canonical_for_schema(SchemaType.STATE)
+    db_dir = local_postgres_helpers.start_on_disk_postgresql_database()
+    try:
+        local_postgres_helpers.use_on_disk_postgresql_database(database_key)
+        with SessionFactory.using_database(database_key) as session:
+            session.add_all(
+                convert_entity_people_to_schema_people(
+                    [_build_person(num_children)], populate_back_edges=True
+                )
+            )
+
+        for run in range(num_runs):
+            seconds = _run_match_seconds(database_key, [_build_person(num_children)])
+            logging.info(
+                "Run [%d]%s: matched person with [%d] children of each type in "
+                "[%.2f] seconds",
+                run,
+                " (cold caches)" if run == 0 else "",
+                num_children,
+                seconds,
+            )
+    finally:
+        local_postgres_helpers.teardown_on_disk_postgresql_database(database_key)
+        local_postgres_helpers.stop_and_clear_on_disk_postgresql_database(db_dir)
+
+
+def _parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--num-children",
+        type=int,
+        default=500,
+        help="The number of entities of each child type to give the synthetic person.",
+    )
+    parser.add_argument(
+        "--num-runs",
+        type=int,
+        default=5,
+        help="The number of times to run entity matching.",
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    args = _parse_arguments()
+    main(args.num_children, args.num_runs)
@@ -136,6 +136,7 @@ class TagKey:
     INGEST_VIEW_EXPORT_TAG = "ingest_view_export_tag"
     INGEST_VIEW_MATERIALIZATION_TAG = "ingest_view_materialization_tag"
     RAW_DATA_IMPORT_TAG = "raw_data_import_tag"
+    RAW_DATA_TEMP_FILE_FORMAT = "raw_data_temp_file_format"
 
     # Bigquery related tags
     VALIDATION_CHECK_TYPE = "validation_check_type"
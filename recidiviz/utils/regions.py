@@ -85,6 +85,14 @@ class Region:
         stripe: (string) Stripe to which this region belongs to. This is used
             further divide up a timezone
         facility_id: (string) Default facility ID for region
+        persist_batch_size: (int) Optional number of person trees from an ingest
+            view file to persist per transaction, for direct ingest regions. If
+            unset, the whole file is persisted in one transaction.
+        persist_shard_size: (int) Optional max number of people per sharded
+            transaction within each persisted batch, for direct ingest state
+            regions. If unset, each batch is written in one transaction.
+        num_persist_shard_workers: (int) Number of threads used to write shards
+            when persist_shard_size is set.
     """
 
     region_code: str = attr.ib(converter=_to_lower)
@@ -104,6 +112,9 @@ class Region:
     is_direct_ingest: bool = attr.ib(default=True)
     stripe: Optional[str] = attr.ib(default="0")
     facility_id: Optional[str] = attr.ib(default=None)
+    persist_batch_size: Optional[int] = attr.ib(default=None)
+    persist_shard_size: Optional[int] = attr.ib(default=None)
+    num_persist_shard_workers: int = attr.ib(default=1)
 
     @region_code.validator
     def validate_region_code(self, _attr: attr.Attribute, region_code: str) -> None:
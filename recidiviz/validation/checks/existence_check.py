@@ -18,22 +18,25 @@
 """Models an existence check, which identifies a validation issue by observing that there is any row returned
 in a given validation result set."""
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 import attr
-import more_itertools
 
 from recidiviz.big_query.big_query_client import BigQueryClientImpl
 from recidiviz.big_query.big_query_view import SimpleBigQueryViewBuilder
+from recidiviz.utils.types import assert_type
 from recidiviz.validation.validation_config import ValidationRegionConfig
 from recidiviz.validation.validation_models import (
     DataValidationCheck,
     DataValidationJob,
     DataValidationJobResult,
     DataValidationJobResultDetails,
+    RowCountSummary,
     ValidationChecker,
     ValidationCheckType,
+    ValidationQueryType,
     ValidationResultStatus,
+    ValidationRowsSummary,
     validate_result_status,
 )
 
@@ -175,10 +178,35 @@ class ExistenceValidationChecker(ValidationChecker[ExistenceDataValidationCheck]
             validation_job.original_builder_query_str(), []
         )
 
+        return cls.get_result_from_rows(
+            validation_job, {ValidationQueryType.ORIGINAL: query_job}
+        )
+
+    @classmethod
+    def required_query_types(cls) -> List[ValidationQueryType]:
+        return [ValidationQueryType.ORIGINAL]
+
+    @classmethod
+    def new_rows_summary(
+        cls,
+        validation_job: DataValidationJob[ExistenceDataValidationCheck],
+        query_type: ValidationQueryType,
+    ) -> ValidationRowsSummary:
+        return RowCountSummary()
+
+    @classmethod
+    def get_result_from_summaries(
+        cls,
+        validation_job: DataValidationJob[ExistenceDataValidationCheck],
+        summaries_by_query_type: Dict[ValidationQueryType, ValidationRowsSummary],
+    ) -> DataValidationJobResult:
         return DataValidationJobResult(
             validation_job=validation_job,
             result_details=ExistenceValidationResultDetails(
-                num_invalid_rows=more_itertools.ilen(query_job),
+                num_invalid_rows=assert_type(
+                    summaries_by_query_type[ValidationQueryType.ORIGINAL],
+                    RowCountSummary,
+                ).num_rows,
                 dev_mode=validation_job.validation.dev_mode,
                 hard_num_allowed_rows=validation_job.validation.hard_num_allowed_rows,
                 soft_num_allowed_rows=validation_job.validation.soft_num_allowed_rows,
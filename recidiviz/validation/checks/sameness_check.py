@@ -19,22 +19,26 @@
 columns are not the same."""
 
 from enum import Enum
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import attr
 from google.cloud.bigquery.table import Row
 
 from recidiviz.big_query.big_query_client import BigQueryClientImpl
 from recidiviz.big_query.big_query_view import SimpleBigQueryViewBuilder
+from recidiviz.utils.types import assert_type
 from recidiviz.validation.validation_config import ValidationRegionConfig
 from recidiviz.validation.validation_models import (
     DataValidationCheck,
     DataValidationJob,
     DataValidationJobResult,
     DataValidationJobResultDetails,
+    RowCountSummary,
     ValidationChecker,
     ValidationCheckType,
+    ValidationQueryType,
     ValidationResultStatus,
+    ValidationRowsSummary,
     validate_result_status,
 )
 
@@ -416,6 +420,48 @@ class SamenessPerRowValidationResultDetails(DataValidationJobResultDetails):
         )
 
 
+class _SamenessPerRowErrorRowsSummary(ValidationRowsSummary):
+    """Collects the values and error rate of each row returned by a PerRow sameness
+    check's error query."""
+
+    def __init__(self, validation: SamenessDataValidationCheck) -> None:
+        self.validation = validation
+        self.failed_rows: List[Tuple[ResultRow, float]] = []
+
+    def add_row(self, row: Row) -> None:
+        label_values: List[str] = []
+        comparison_values: List[Optional[float]] = []
+
+        for column, value in row.items():
+            if column in ["error_rate", "error_type"]:
+                continue
+            if column in self.validation.comparison_columns:
+                if value is None:
+                    comparison_values.append(None)
+                else:
+                    try:
+                        float_value = float(value)
+                    except ValueError as e:
+                        raise ValueError(
+                            f"Could not cast value [{value}] in column [{column}] to a float in validation "
+                            f"[{self.validation.validation_name}]."
+                        ) from e
+                    comparison_values.append(float_value)
+            else:
+                label_values.append(str(value))
+
+        error = float(row.get("error_rate"))
+        self.failed_rows.append(
+            (
+                ResultRow(
+                    label_values=tuple(label_values),
+                    comparison_values=tuple(comparison_values),
+                ),
+                error,
+            )
+        )
+
+
 class SamenessPerRowValidationChecker(ValidationChecker[SamenessDataValidationCheck]):
     """
     Performs the validation check for sameness check type PerRow.
@@ -427,53 +473,42 @@ class SamenessPerRowValidationChecker(ValidationChecker[SamenessDataValidationCh
     def run_check(
         cls, validation_job: DataValidationJob[SamenessDataValidationCheck]
     ) -> DataValidationJobResult:
-        comparison_columns = validation_job.validation.comparison_columns
-        validation = validation_job.validation
-
         error_query_job = BigQueryClientImpl().run_query_async(
             validation_job.error_builder_query_str(), []
         )
 
-        failed_rows: List[Tuple[ResultRow, float]] = []
-
-        row: Row
-        for row in error_query_job:
-            label_values: List[str] = []
-            comparison_values: List[Optional[float]] = []
-
-            for column, value in row.items():
-                if column in ["error_rate", "error_type"]:
-                    continue
-                if column in comparison_columns:
-                    if value is None:
-                        comparison_values.append(None)
-                    else:
-                        try:
-                            float_value = float(value)
-                        except ValueError as e:
-                            raise ValueError(
-                                f"Could not cast value [{value}] in column [{column}] to a float in validation "
-                                f"[{validation.validation_name}]."
-                            ) from e
-                        comparison_values.append(float_value)
-                else:
-                    label_values.append(str(value))
-
-            error = float(row.get("error_rate"))
-            failed_rows.append(
-                (
-                    ResultRow(
-                        label_values=tuple(label_values),
-                        comparison_values=tuple(comparison_values),
-                    ),
-                    error,
-                )
-            )
+        return cls.get_result_from_rows(
+            validation_job, {ValidationQueryType.ERROR: error_query_job}
+        )
+
+    @classmethod
+    def required_query_types(cls) -> List[ValidationQueryType]:
+        return [ValidationQueryType.ERROR]
+
+    @classmethod
+    def new_rows_summary(
+        cls,
+        validation_job: DataValidationJob[SamenessDataValidationCheck],
+        query_type: ValidationQueryType,
+    ) -> ValidationRowsSummary:
+        return _SamenessPerRowErrorRowsSummary(validation_job.validation)
+
+    @classmethod
+    def get_result_from_summaries(
+        cls,
+        validation_job: DataValidationJob[SamenessDataValidationCheck],
+        summaries_by_query_type: Dict[ValidationQueryType, ValidationRowsSummary],
+    ) -> DataValidationJobResult:
+        validation = validation_job.validation
+        error_rows_summary = assert_type(
+            summaries_by_query_type[ValidationQueryType.ERROR],
+            _SamenessPerRowErrorRowsSummary,
+        )
 
         return DataValidationJobResult(
             validation_job=validation_job,
             result_details=SamenessPerRowValidationResultDetails(
-                failed_rows=failed_rows,
+                failed_rows=error_rows_summary.failed_rows,
                 dev_mode=validation.dev_mode,
                 hard_max_allowed_error=validation.hard_max_allowed_error,
                 soft_max_allowed_error=validation.soft_max_allowed_error,
@@ -566,6 +601,37 @@ class SamenessPerRowValidationChecker(ValidationChecker[SamenessDataValidationCh
     """
 
 
+class _SamenessPerViewRowsSummary(ValidationRowsSummary):
+    """Counts the rows in a PerView sameness check's view, along with the number of
+    non-null values in each comparison column for each partition."""
+
+    def __init__(self, validation: SamenessDataValidationCheck) -> None:
+        self.validation = validation
+        self.num_rows = 0
+        self.non_null_counts_per_column_per_partition: Dict[
+            Tuple[str, ...], Dict[str, int]
+        ] = {}
+
+    def add_row(self, row: Row) -> None:
+        self.num_rows += 1
+        partition_key = (
+            tuple(str(row.get(column)) for column in self.validation.partition_columns)
+            if self.validation.partition_columns
+            else tuple()
+        )
+        if partition_key not in self.non_null_counts_per_column_per_partition:
+            self.non_null_counts_per_column_per_partition[partition_key] = {
+                column: 0 for column in self.validation.comparison_columns
+            }
+        non_null_counts_per_column = self.non_null_counts_per_column_per_partition[
+            partition_key
+        ]
+
+        for column in self.validation.comparison_columns:
+            if row[column] is not None:
+                non_null_counts_per_column[column] += 1
+
+
 class SamenessPerViewValidationChecker(ValidationChecker[SamenessDataValidationCheck]):
     """
     Performs the validation check for sameness check type PerView.
@@ -576,9 +642,6 @@ class SamenessPerViewValidationChecker(ValidationChecker[SamenessDataValidationC
     def run_check(
         cls, validation_job: DataValidationJob[SamenessDataValidationCheck]
     ) -> DataValidationJobResult:
-        comparison_columns = validation_job.validation.comparison_columns
-        validation = validation_job.validation
-
         error_query_job = BigQueryClientImpl().run_query_async(
             validation_job.error_builder_query_str(), []
         )
@@ -586,47 +649,53 @@ class SamenessPerViewValidationChecker(ValidationChecker[SamenessDataValidationC
             validation_job.original_builder_query_str(), []
         )
 
-        num_errors = len(list(error_query_job))
-        num_rows = 0
-        non_null_counts_per_column_per_partition: Dict[
-            Tuple[str, ...], Dict[str, int]
-        ] = {}
+        return cls.get_result_from_rows(
+            validation_job,
+            {
+                ValidationQueryType.ERROR: error_query_job,
+                ValidationQueryType.ORIGINAL: original_query_job,
+            },
+        )
 
-        row: Row
-        for row in original_query_job:
-            num_rows += 1
-            unique_values: Set[Any] = set()
-            partition_key = (
-                tuple(str(row.get(column)) for column in validation.partition_columns)
-                if validation.partition_columns
-                else tuple()
-            )
-            if partition_key not in non_null_counts_per_column_per_partition:
-                non_null_counts_per_column_per_partition[partition_key] = {
-                    column: 0 for column in comparison_columns
-                }
-            non_null_counts_per_column = non_null_counts_per_column_per_partition[
-                partition_key
-            ]
+    @classmethod
+    def required_query_types(cls) -> List[ValidationQueryType]:
+        return [ValidationQueryType.ERROR, ValidationQueryType.ORIGINAL]
 
-            for column in comparison_columns:
-                value = row[column]
-                if value is None:
-                    unique_values.add(None)
-                else:
-                    non_null_counts_per_column[column] += 1
-                    unique_values.add(value)
+    @classmethod
+    def new_rows_summary(
+        cls,
+        validation_job: DataValidationJob[SamenessDataValidationCheck],
+        query_type: ValidationQueryType,
+    ) -> ValidationRowsSummary:
+        if query_type == ValidationQueryType.ERROR:
+            return RowCountSummary()
+        return _SamenessPerViewRowsSummary(validation_job.validation)
+
+    @classmethod
+    def get_result_from_summaries(
+        cls,
+        validation_job: DataValidationJob[SamenessDataValidationCheck],
+        summaries_by_query_type: Dict[ValidationQueryType, ValidationRowsSummary],
+    ) -> DataValidationJobResult:
+        validation = validation_job.validation
+        error_rows_summary = assert_type(
+            summaries_by_query_type[ValidationQueryType.ERROR], RowCountSummary
+        )
+        original_rows_summary = assert_type(
+            summaries_by_query_type[ValidationQueryType.ORIGINAL],
+            _SamenessPerViewRowsSummary,
+        )
 
         return DataValidationJobResult(
             validation_job=validation_job,
             result_details=SamenessPerViewValidationResultDetails(
-                num_error_rows=num_errors,
-                total_num_rows=num_rows,
+                num_error_rows=error_rows_summary.num_rows,
+                total_num_rows=original_rows_summary.num_rows,
                 dev_mode=validation.dev_mode,
                 hard_max_allowed_error=validation.hard_max_allowed_error,
                 soft_max_allowed_error=validation.soft_max_allowed_error,
                 non_null_counts_per_column_per_partition=list(
-                    non_null_counts_per_column_per_partition.items()
+                    original_rows_summary.non_null_counts_per_column_per_partition.items()
                 ),
             ),
         )
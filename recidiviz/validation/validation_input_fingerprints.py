@@ -0,0 +1,193 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2022 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Computes a fingerprint of everything a validation job's result depends on, so that
+validation runs can skip jobs whose inputs have not changed since their last run.
+
+A job's fingerprint covers the configuration of its check, the deployed system
+version, and the last-modified time of every view, materialized table and source
+table upstream of the views it queries. If any view it depends on (without a
+materialized table in between) reads the current date or time, the run date is
+included as well, since those views can return different rows each day without any of
+their inputs changing.
+
+Every rematerialization rewrites every materialized table, and every view deploy (unless
+run with skip_unchanged_views) updates every view, even when their contents are the
+same. A job is therefore only skipped if nothing upstream of it was rematerialized,
+redeployed or written to since its last run. In practice this means:
+  - when validations are re-run (e.g. retried) with no rematerialization, deploy or
+    source data change in between, any job whose views don't read the current date
+    can be skipped.
+  - after the rematerialization that precedes each scheduled validation run, only jobs
+    with no materialized view upstream of them, reading source tables that have not
+    changed, can be skipped.
+"""
+import datetime
+import hashlib
+import json
+import re
+from typing import Dict, List, Set, Tuple
+
+import attr
+
+from recidiviz.big_query.big_query_address import BigQueryAddress
+from recidiviz.big_query.big_query_client import BigQueryClient
+from recidiviz.big_query.big_query_view_dag_walker import BigQueryViewDagWalker, DagKey
+from recidiviz.utils import environment
+from recidiviz.validation.validation_models import DataValidationJob
+
+_CURRENT_DATE_OR_TIME_REGEX = re.compile(
+    r"\bCURRENT_(DATE|DATETIME|TIME|TIMESTAMP)\b", re.IGNORECASE
+)
+
+
+@attr.s(frozen=True, kw_only=True)
+class _ViewInputs:
+    """The tables a single validation view reads from, directly or indirectly."""
+
+    # Addresses of all upstream views, materialized tables and source tables, plus
+    # the view itself and its materialized table
+    addresses: Set[BigQueryAddress] = attr.ib()
+
+    # Whether this view or an upstream view reads the current date or time at query
+    # time
+    reads_current_date: bool = attr.ib()
+
+
+def _inputs_for_view_key(
+    dag_walker: BigQueryViewDagWalker, view_key: DagKey
+) -> _ViewInputs:
+    addresses: Set[BigQueryAddress] = set()
+    reads_current_date = False
+    for key in dag_walker.ancestor_keys_for_key(view_key) | {view_key}:
+        addresses.add(key.view_address)
+        if key not in dag_walker.nodes_by_key:
+            # Source table
+            continue
+        view = dag_walker.view_for_key(key)
+        if view.materialized_address:
+            addresses.add(view.materialized_address)
+        if _CURRENT_DATE_OR_TIME_REGEX.search(view.view_query):
+            reads_current_date = True
+    return _ViewInputs(addresses=addresses, reads_current_date=reads_current_date)
+
+
+def _load_last_modified_times(
+    bq_client: BigQueryClient, dataset_ids: Set[str]
+) -> Dict[BigQueryAddress, int]:
+    """Returns the last-modified time (in ms since epoch) of every table and view in
+    the given datasets, read from the __TABLES__ metadata of each dataset in a single
+    query."""
+    query_str = "\nUNION ALL\n".join(
+        f"SELECT dataset_id, table_id, last_modified_time "
+        f"FROM `{bq_client.project_id}.{dataset_id}.__TABLES__`"
+        for dataset_id in sorted(dataset_ids)
+    )
+    return {
+        BigQueryAddress(dataset_id=row["dataset_id"], table_id=row["table_id"]): row[
+            "last_modified_time"
+        ]
+        for row in bq_client.run_query_async(query_str, [])
+    }
+
+
+def _check_config_str(job: DataValidationJob) -> str:
+    return json.dumps(
+        attr.asdict(
+            job.validation,
+            filter=lambda attribute, _value: attribute.name != "view_builder",
+        ),
+        default=str,
+        sort_keys=True,
+    )
+
+
+def compute_validation_input_fingerprints(
+    validation_jobs: List[DataValidationJob],
+    dag_walker: BigQueryViewDagWalker,
+    bq_client: BigQueryClient,
+    run_date: datetime.date,
+) -> Dict[Tuple[str, str], str]:
+    """Returns the input fingerprint for each job, keyed by (validation_name,
+    region_code). Jobs that read a view that is not in the DAG, that use address
+    overrides, or that depend on a table or view whose last-modified time could not be
+    found, are left out and should always be run.
+    """
+    view_keys_by_job: Dict[Tuple[str, str], List[DagKey]] = {}
+    for job in validation_jobs:
+        if job.address_overrides:
+            continue
+        query_types = job.validation.get_checker().required_query_types()
+        view_keys = [
+            DagKey.for_view(job.view_for_query_type(query_type))
+            for query_type in query_types
+        ]
+        if all(key in dag_walker.nodes_by_key for key in view_keys):
+            view_keys_by_job[
+                (job.validation.validation_name, job.region_code)
+            ] = view_keys
+
+    inputs_by_view_key: Dict[DagKey, _ViewInputs] = {}
+    for view_keys in view_keys_by_job.values():
+        for view_key in view_keys:
+            if view_key not in inputs_by_view_key:
+                inputs_by_view_key[view_key] = _inputs_for_view_key(
+                    dag_walker, view_key
+                )
+
+    if not inputs_by_view_key:
+        return {}
+
+    last_modified_times = _load_last_modified_times(
+        bq_client,
+        {
+            address.dataset_id
+            for view_inputs in inputs_by_view_key.values()
+            for address in view_inputs.addresses
+        },
+    )
+
+    jobs_by_key = {
+        (job.validation.validation_name, job.region_code): job
+        for job in validation_jobs
+    }
+    fingerprints: Dict[Tuple[str, str], str] = {}
+    for job_key, view_keys in view_keys_by_job.items():
+        view_inputs = [inputs_by_view_key[view_key] for view_key in view_keys]
+        addresses = set().union(*(inputs.addresses for inputs in view_inputs))
+        if not addresses.issubset(last_modified_times):
+            # We can't tell whether a missing table has changed, so the job is always
+            # run.
+            continue
+        reads_current_date = any(inputs.reads_current_date for inputs in view_inputs)
+        fingerprint_inputs = {
+            "check_config": _check_config_str(jobs_by_key[job_key]),
+            "region_code": job_key[1],
+            "system_version": environment.get_version(),
+            "last_modified_times": sorted(
+                (
+                    address.dataset_id,
+                    address.table_id,
+                    last_modified_times[address],
+                )
+                for address in addresses
+            ),
+            "run_date": run_date.isoformat() if reads_current_date else None,
+        }
+        fingerprints[job_key] = hashlib.sha256(
+            json.dumps(fingerprint_inputs, sort_keys=True).encode()
+        ).hexdigest()
+    return fingerprints
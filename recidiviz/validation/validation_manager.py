@@ -25,24 +25,33 @@ from http import HTTPStatus
 from typing import Any, Dict, List, Optional, Pattern, Tuple
 
 import pytz
-from flask import Blueprint
+from flask import Blueprint, request
 from opencensus.stats import aggregation, measure, view
 
 from recidiviz.big_query.address_overrides import BigQueryAddressOverrides
-from recidiviz.utils import metadata, monitoring, structured_logging
+from recidiviz.big_query.big_query_client import BigQueryClientImpl
+from recidiviz.big_query.big_query_view_dag_walker import BigQueryViewDagWalker
+from recidiviz.utils import environment, metadata, monitoring, structured_logging
 from recidiviz.utils.auth.gae import requires_gae_auth
+from recidiviz.utils.params import get_bool_param_value
 from recidiviz.validation.configured_validations import (
     get_all_validations,
     get_validation_global_config,
     get_validation_region_configs,
 )
+from recidiviz.validation.validation_input_fingerprints import (
+    compute_validation_input_fingerprints,
+)
 from recidiviz.validation.validation_models import (
     DataValidationJob,
     DataValidationJobResult,
     ValidationResultStatus,
 )
+from recidiviz.validation.validation_query_batcher import ValidationQueryBatcher
 from recidiviz.validation.validation_result_storage import (
+    PreviousValidationResult,
     ValidationResultForStorage,
+    load_previous_validation_results,
     store_validation_results_in_big_query,
 )
 from recidiviz.view_registry.address_overrides_factory import (
@@ -86,6 +95,9 @@ failed_validations_view = view.View(
 
 monitoring.register_views([failed_validations_view, failed_to_run_validations_view])
 
+# Results older than this are never carried forward, even if their inputs are unchanged
+MAX_CARRIED_FORWARD_RESULT_AGE_DAYS = 7
+
 
 validation_manager_blueprint = Blueprint("validation_manager", __name__)
 
@@ -93,8 +105,13 @@ validation_manager_blueprint = Blueprint("validation_manager", __name__)
 @validation_manager_blueprint.route("/validate")
 @requires_gae_auth
 def handle_validation_request() -> Tuple[str, HTTPStatus]:
-    """API endpoint to service data validation requests."""
-    execute_validation()
+    """API endpoint to service data validation requests.
+
+    Jobs whose inputs are unchanged since their last run are skipped and their
+    previous result is carried forward, unless the `force_full_run` param is set.
+    """
+    force_full_run = get_bool_param_value("force_full_run", request.args, default=False)
+    execute_validation(force_full_run=force_full_run)
 
     return "", HTTPStatus.OK
 
@@ -103,12 +120,16 @@ def execute_validation(
     region_code_filter: Optional[str] = None,
     validation_name_filter: Optional[Pattern] = None,
     sandbox_dataset_prefix: Optional[str] = None,
+    force_full_run: bool = False,
 ) -> None:
     """Executes all validation checks.
     If |region_code_filter| is supplied, limits validations to just that region.
     If |validation_name_filter| is supplied, only performs validations on those
     that have a regex match.
     If |sandbox_dataset_prefix| is supplied, performs validation using sandbox dataset
+    When running in GCP without a sandbox, jobs whose inputs have not changed since
+    their last stored result are not re-run and that result is carried forward,
+    unless |force_full_run| is set.
     """
 
     # Fetch collection of validation jobs to perform
@@ -127,32 +148,92 @@ def execute_validation(
         run_id,
     )
 
+    # Fingerprints are stored with every result, including on full runs, so that the
+    # next run can tell which jobs' inputs have changed since.
+    input_fingerprints: Dict[Tuple[str, str], str] = {}
+    previous_results: Dict[Tuple[str, str], PreviousValidationResult] = {}
+    if environment.in_gcp() and not sandbox_dataset_prefix:
+        input_fingerprints = _get_input_fingerprints(validation_jobs, run_datetime)
+        if not force_full_run:
+            previous_results = _get_previous_results()
+
+    jobs_to_run: List[DataValidationJob] = []
+    carried_forward_results: List[Tuple[DataValidationJobResult, str]] = []
+    for job in validation_jobs:
+        previous_result = previous_results.get(_job_key(job))
+        if (
+            previous_result
+            and previous_result.input_fingerprint
+            == input_fingerprints.get(_job_key(job))
+        ):
+            carried_forward_results.append(
+                (
+                    DataValidationJobResult(
+                        validation_job=job,
+                        result_details=previous_result.result_details,
+                    ),
+                    previous_result.run_id,
+                )
+            )
+        else:
+            jobs_to_run.append(job)
+    if carried_forward_results:
+        logging.info(
+            "Carrying forward results for [%s] validation jobs whose inputs are "
+            "unchanged, running the remaining [%s].",
+            len(carried_forward_results),
+            len(jobs_to_run),
+        )
+
+    # Jobs that read the same view share a single query for all of their regions
+    query_batcher = ValidationQueryBatcher(jobs_to_run)
+    logging.info(
+        "Planned [%s] batched queries for [%s] validation jobs.",
+        query_batcher.num_batched_queries,
+        len(jobs_to_run),
+    )
+
     # Perform all validations and track failures
     failed_to_run_validations: List[DataValidationJob] = []
     failed_soft_validations: List[DataValidationJobResult] = []
     failed_hard_validations: List[DataValidationJobResult] = []
     results_to_store: List[ValidationResultForStorage] = []
+
+    def record_result(
+        result: DataValidationJobResult,
+        carried_forward_from_run_id: Optional[str] = None,
+    ) -> None:
+        results_to_store.append(
+            ValidationResultForStorage.from_validation_result(
+                run_id=run_id,
+                run_datetime=run_datetime,
+                result=result,
+                input_fingerprint=input_fingerprints.get(
+                    _job_key(result.validation_job)
+                ),
+                carried_forward_from_run_id=carried_forward_from_run_id,
+            )
+        )
+        if result.validation_result_status == ValidationResultStatus.FAIL_HARD:
+            failed_hard_validations.append(result)
+        if result.validation_result_status == ValidationResultStatus.FAIL_SOFT:
+            failed_soft_validations.append(result)
+
+    for result, carried_forward_from_run_id in carried_forward_results:
+        record_result(result, carried_forward_from_run_id)
+
     with futures.ThreadPoolExecutor() as executor:
         future_to_jobs = {
-            executor.submit(structured_logging.with_context(_run_job), job): job
-            for job in validation_jobs
+            executor.submit(
+                structured_logging.with_context(_run_job), job, query_batcher
+            ): job
+            for job in jobs_to_run
         }
 
         for future in futures.as_completed(future_to_jobs):
             job = future_to_jobs[future]
             try:
-                result: DataValidationJobResult = future.result()
-                results_to_store.append(
-                    ValidationResultForStorage.from_validation_result(
-                        run_id=run_id,
-                        run_datetime=run_datetime,
-                        result=result,
-                    )
-                )
-                if result.validation_result_status == ValidationResultStatus.FAIL_HARD:
-                    failed_hard_validations.append(result)
-                if result.validation_result_status == ValidationResultStatus.FAIL_SOFT:
-                    failed_soft_validations.append(result)
+                record_result(future.result())
                 logging.info(
                     "Finished job [%s] for region [%s]",
                     job.validation.validation_name,
@@ -170,10 +251,12 @@ def execute_validation(
                         run_datetime=run_datetime,
                         job=job,
                         exception_log=e,
+                        input_fingerprint=input_fingerprints.get(_job_key(job)),
                     )
                 )
                 failed_to_run_validations.append(job)
 
+    query_batcher.log_stats()
     store_validation_results_in_big_query(results_to_store)
     if failed_to_run_validations or failed_hard_validations:
         # Emit metrics for all hard and total failures
@@ -197,6 +280,50 @@ def execute_validation(
     )
 
 
+def _job_key(job: DataValidationJob) -> Tuple[str, str]:
+    return job.validation.validation_name, job.region_code
+
+
+def _get_input_fingerprints(
+    validation_jobs: List[DataValidationJob], run_datetime: datetime.datetime
+) -> Dict[Tuple[str, str], str]:
+    """Returns the input fingerprint for each job that one could be computed for. If
+    fingerprinting fails entirely, returns no fingerprints so that every job is run.
+    """
+    try:
+        dag_walker = BigQueryViewDagWalker(
+            [
+                builder.build()
+                for builder in deployed_view_builders(metadata.project_id())
+            ]
+        )
+        return compute_validation_input_fingerprints(
+            validation_jobs,
+            dag_walker,
+            BigQueryClientImpl(),
+            run_datetime.date(),
+        )
+    except Exception as e:
+        logging.warning(
+            "Could not compute validation input fingerprints, running all jobs: %s", e
+        )
+        return {}
+
+
+def _get_previous_results() -> Dict[Tuple[str, str], PreviousValidationResult]:
+    """Returns the previous result for each job that may be carried forward. If they
+    cannot be loaded, returns no results so that every job is run."""
+    try:
+        return load_previous_validation_results(
+            max_age_days=MAX_CARRIED_FORWARD_RESULT_AGE_DAYS
+        )
+    except Exception as e:
+        logging.warning(
+            "Could not load previous validation results, running all jobs: %s", e
+        )
+        return {}
+
+
 def _get_validations_jobs(
     region_code_filter: Optional[str] = None,
     validation_name_filter: Optional[Pattern] = None,
@@ -256,8 +383,14 @@ def _log_results(
         logging.info("Found no failed validations...")
 
 
-def _run_job(job: DataValidationJob) -> DataValidationJobResult:
-    return job.validation.get_checker().run_check(job)
+def _run_job(
+    job: DataValidationJob, query_batcher: ValidationQueryBatcher
+) -> DataValidationJobResult:
+    checker = job.validation.get_checker()
+    summaries_by_query_type = query_batcher.summaries_for_job(
+        job, checker.required_query_types()
+    )
+    return checker.get_result_from_summaries(job, summaries_by_query_type)
 
 
 def _fetch_validation_jobs_to_perform(
@@ -18,9 +18,10 @@
 """Models representing data validation."""
 import abc
 from enum import Enum
-from typing import Generic, List, Optional, TypeVar
+from typing import Dict, Generic, Iterable, List, Optional, TypeVar
 
 import attr
+from google.cloud.bigquery.table import Row
 
 from recidiviz.big_query.address_overrides import BigQueryAddressOverrides
 from recidiviz.big_query.big_query_view import BigQueryView, SimpleBigQueryViewBuilder
@@ -41,6 +42,13 @@ class ValidationCategory(Enum):
     FRESHNESS = "FRESHNESS"
 
 
+class ValidationQueryType(Enum):
+    # Query against the view the validation was configured with
+    ORIGINAL = "ORIGINAL"
+    # Query against the view that returns only the rows with validation errors
+    ERROR = "ERROR"
+
+
 class ValidationResultStatus(Enum):
     # Validation was successful and is within the desired error threshold (less than or equal to the soft threshold)
     SUCCESS = "SUCCESS"
@@ -120,17 +128,25 @@ class DataValidationJob(Generic[DataValidationType], BuildableAttr):
     # Optional dataset overrides to change which datasets will be used for query
     address_overrides: Optional[BigQueryAddressOverrides] = attr.ib(default=None)
 
-    def original_builder_query_str(self) -> str:
-        view = self.validation.view_builder.build(
-            address_overrides=self.address_overrides
+    def view_for_query_type(self, query_type: ValidationQueryType) -> BigQueryView:
+        if query_type == ValidationQueryType.ORIGINAL:
+            builder = self.validation.view_builder
+        elif query_type == ValidationQueryType.ERROR:
+            builder = self.validation.error_view_builder
+        else:
+            raise ValueError(f"Unexpected query_type [{query_type}]")
+        return builder.build(address_overrides=self.address_overrides)
+
+    def query_str(self, query_type: ValidationQueryType) -> str:
+        return _query_str_for_region_code(
+            view=self.view_for_query_type(query_type), region_code=self.region_code
         )
-        return _query_str_for_region_code(view=view, region_code=self.region_code)
+
+    def original_builder_query_str(self) -> str:
+        return self.query_str(ValidationQueryType.ORIGINAL)
 
     def error_builder_query_str(self) -> str:
-        view = self.validation.error_view_builder.build(
-            address_overrides=self.address_overrides
-        )
-        return _query_str_for_region_code(view=view, region_code=self.region_code)
+        return self.query_str(ValidationQueryType.ERROR)
 
 
 def validate_result_status(
@@ -218,6 +234,26 @@ class DataValidationJobResult:
         )
 
 
+class ValidationRowsSummary:
+    """Summarizes the rows returned by one of a validation job's queries as they are
+    read, keeping only what is needed to evaluate the job rather than the rows
+    themselves."""
+
+    @abc.abstractmethod
+    def add_row(self, row: Row) -> None:
+        """Adds a single row from the query results to the summary."""
+
+
+class RowCountSummary(ValidationRowsSummary):
+    """Counts the rows returned by a query."""
+
+    def __init__(self) -> None:
+        self.num_rows = 0
+
+    def add_row(self, row: Row) -> None:
+        self.num_rows += 1
+
+
 # pylint: disable=unused-argument
 class ValidationChecker(Generic[DataValidationType]):
     """Defines the interface for performing a particular kind of check."""
@@ -229,6 +265,48 @@ class ValidationChecker(Generic[DataValidationType]):
     ) -> DataValidationJobResult:
         pass
 
+    @classmethod
+    @abc.abstractmethod
+    def required_query_types(cls) -> List[ValidationQueryType]:
+        """Returns the queries whose rows are needed to evaluate a job, in the order
+        they are run by run_check()."""
+
+    @classmethod
+    @abc.abstractmethod
+    def new_rows_summary(
+        cls,
+        validation_job: DataValidationJob[DataValidationType],
+        query_type: ValidationQueryType,
+    ) -> ValidationRowsSummary:
+        """Returns an empty summary for the rows returned for this job's region by the
+        |query_type| query."""
+
+    @classmethod
+    @abc.abstractmethod
+    def get_result_from_summaries(
+        cls,
+        validation_job: DataValidationJob[DataValidationType],
+        summaries_by_query_type: Dict[ValidationQueryType, ValidationRowsSummary],
+    ) -> DataValidationJobResult:
+        """Evaluates a job from the summaries of the rows returned for this job's
+        region by each of the queries in required_query_types()."""
+
+    @classmethod
+    def get_result_from_rows(
+        cls,
+        validation_job: DataValidationJob[DataValidationType],
+        rows_by_query_type: Dict[ValidationQueryType, Iterable[Row]],
+    ) -> DataValidationJobResult:
+        """Evaluates a job from the rows returned for this job's region by each of the
+        queries in required_query_types()."""
+        summaries_by_query_type: Dict[ValidationQueryType, ValidationRowsSummary] = {}
+        for query_type, rows in rows_by_query_type.items():
+            summary = cls.new_rows_summary(validation_job, query_type)
+            for row in rows:
+                summary.add_row(row)
+            summaries_by_query_type[query_type] = summary
+        return cls.get_result_from_summaries(validation_job, summaries_by_query_type)
+
     @classmethod
     def get_validation_query_str(cls, validation_check: DataValidationType) -> str:
         return ""
@@ -0,0 +1,284 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2022 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Plans and runs the queries for a set of validation jobs so that every view is
+scanned at most once per validation run.
+
+Each validation job reads one or more views filtered down to a single region, and
+many jobs read the same view (every region runs every validation, and several checks
+may be configured against the same view). Rather than querying the view once per job,
+all jobs that read the same view are served by a single query that selects the rows
+for every region they need. The results are streamed and each row is added to the
+summary (see ValidationRowsSummary) of every job that reads that row's region, so only
+the per-job summaries are held in memory, never the rows themselves.
+"""
+import logging
+import threading
+from collections import Counter, defaultdict
+from concurrent import futures
+from typing import Dict, List, Optional, Set, Tuple
+
+from recidiviz.big_query.big_query_client import BigQueryClientImpl
+from recidiviz.validation.validation_models import (
+    DataValidationJob,
+    ValidationQueryType,
+    ValidationRowsSummary,
+)
+
+# Max number of dry run queries to issue at once when comparing the batched queries to
+# the per-job queries they replace.
+_DRY_RUN_MAX_WORKERS = 8
+
+
+class _BatchedValidationQuery:
+    """A single query that returns the rows of one view for all regions that any
+    validation job needs from that view. The query is run the first time any of those
+    jobs asks for its summary.
+    """
+
+    def __init__(self, view_select_query: str) -> None:
+        # Query that selects every row from the view, without a region filter
+        self.view_select_query = view_select_query
+
+        # The number of (job, query type) pairs served by this query for each region,
+        # each of which would otherwise have been its own query
+        self.num_job_queries_by_region: Dict[str, int] = Counter()
+
+        self.total_bytes_processed: Optional[int] = None
+        self.total_bytes_billed: Optional[int] = None
+        self.slot_millis: Optional[int] = None
+
+        self._lock = threading.Lock()
+        self._has_run = False
+        self._error: Optional[Exception] = None
+        self._summaries_by_region: Dict[str, List[ValidationRowsSummary]] = defaultdict(
+            list
+        )
+        # Errors raised while adding rows to a single job's summary, keyed by the id()
+        # of that summary. These fail only that job, not every job in the batch.
+        self._summary_errors: Dict[int, Exception] = {}
+
+    @property
+    def region_codes(self) -> Set[str]:
+        return set(self.num_job_queries_by_region)
+
+    @property
+    def num_job_queries(self) -> int:
+        return sum(self.num_job_queries_by_region.values())
+
+    def add_job_query(self, region_code: str, summary: ValidationRowsSummary) -> None:
+        self.num_job_queries_by_region[region_code] += 1
+        self._summaries_by_region[region_code].append(summary)
+
+    def query_str(self) -> str:
+        region_codes_str = ", ".join(
+            f"'{region_code}'" for region_code in sorted(self.region_codes)
+        )
+        return f"{self.view_select_query} WHERE region_code IN ({region_codes_str});"
+
+    def query_str_for_region(self, region_code: str) -> str:
+        """Returns the query a single job would run on its own to read this view for
+        |region_code|, matching DataValidationJob.query_str()."""
+        return f"{self.view_select_query} WHERE region_code = '{region_code}';"
+
+    def get_summary(self, summary: ValidationRowsSummary) -> ValidationRowsSummary:
+        """Returns |summary| (one of the summaries added with add_job_query()) once
+        every row for its region has been added to it, running the query if it has not
+        been run yet.
+        """
+        with self._lock:
+            if not self._has_run:
+                self._has_run = True
+                try:
+                    self._run()
+                except Exception as e:
+                    self._error = e
+                # Every summary has been filled in, so the batch no longer needs to
+                # hold onto them.
+                self._summaries_by_region = defaultdict(list)
+            if self._error:
+                raise self._error
+            summary_error = self._summary_errors.pop(id(summary), None)
+        if summary_error:
+            raise summary_error
+        return summary
+
+    def _run(self) -> None:
+        query_job = BigQueryClientImpl().run_query_async(self.query_str(), [])
+        for row in query_job:
+            for summary in self._summaries_by_region.get(row.get("region_code"), []):
+                if id(summary) in self._summary_errors:
+                    continue
+                try:
+                    summary.add_row(row)
+                except Exception as e:
+                    self._summary_errors[id(summary)] = e
+        self.total_bytes_processed = query_job.total_bytes_processed
+        self.total_bytes_billed = query_job.total_bytes_billed
+        self.slot_millis = query_job.slot_millis
+
+
+class ValidationQueryBatcher:
+    """Serves the row summaries that each validation job needs from a shared set of
+    batched queries, one per distinct view read by the jobs. Safe to use from multiple
+    threads.
+    """
+
+    def __init__(self, validation_jobs: List[DataValidationJob]) -> None:
+        self._batches: Dict[str, _BatchedValidationQuery] = {}
+        self._batch_for_job_query: Dict[
+            Tuple[int, ValidationQueryType],
+            Tuple[_BatchedValidationQuery, ValidationRowsSummary],
+        ] = {}
+        self._lock = threading.Lock()
+
+        for job in validation_jobs:
+            try:
+                checker = job.validation.get_checker()
+                select_query_by_type = {
+                    query_type: job.view_for_query_type(query_type).select_query
+                    for query_type in checker.required_query_types()
+                }
+            except Exception as e:
+                # Jobs whose views cannot be built are left out of the plan and
+                # queried on their own, so that the error is raised for (and only
+                # for) that job when it runs.
+                logging.warning(
+                    "Could not plan batched queries for validation job [%s]: %s",
+                    job,
+                    e,
+                )
+                continue
+
+            for query_type, select_query in select_query_by_type.items():
+                if select_query not in self._batches:
+                    self._batches[select_query] = _BatchedValidationQuery(select_query)
+                batch = self._batches[select_query]
+                summary = checker.new_rows_summary(job, query_type)
+                batch.add_job_query(job.region_code, summary)
+                self._batch_for_job_query[(id(job), query_type)] = (batch, summary)
+
+    @property
+    def num_batched_queries(self) -> int:
+        return len(self._batches)
+
+    def summaries_for_job(
+        self, job: DataValidationJob, query_types: List[ValidationQueryType]
+    ) -> Dict[ValidationQueryType, ValidationRowsSummary]:
+        """Returns the summaries of the rows for this job's region from each of the
+        |query_types| queries. Each job should only ask for each query type once; any
+        query that was not planned (or that has already been read) is run on its own.
+        """
+        checker = job.validation.get_checker()
+        summaries_by_query_type: Dict[ValidationQueryType, ValidationRowsSummary] = {}
+        for query_type in query_types:
+            with self._lock:
+                planned = self._batch_for_job_query.pop((id(job), query_type), None)
+            if planned is None:
+                summary = checker.new_rows_summary(job, query_type)
+                for row in BigQueryClientImpl().run_query_async(
+                    job.query_str(query_type), []
+                ):
+                    summary.add_row(row)
+                summaries_by_query_type[query_type] = summary
+            else:
+                batch, summary = planned
+                summaries_by_query_type[query_type] = batch.get_summary(summary)
+        return summaries_by_query_type
+
+    def log_stats(self) -> None:
+        """Logs the bytes processed, bytes billed and slot time of the batched queries
+        that have run, alongside the bytes that the per-job queries they replace would
+        have processed. The latter are measured with (unbilled) dry runs of each
+        distinct per-job query. Dry runs do not report slot time, so the per-job slot
+        time is estimated by scaling each batched query's slot time by the share of its
+        bytes that each per-job query would have processed.
+        """
+        run_batches = [
+            batch
+            for batch in self._batches.values()
+            if batch.total_bytes_processed is not None
+        ]
+        if not run_batches:
+            return
+        bytes_processed = sum(batch.total_bytes_processed or 0 for batch in run_batches)
+        bytes_billed = sum(batch.total_bytes_billed or 0 for batch in run_batches)
+        slot_millis = sum(batch.slot_millis or 0 for batch in run_batches)
+        logging.info(
+            "Ran [%d] batched validation queries in place of [%d] per-job queries. "
+            "Processed [%d] bytes, billed [%d] bytes and used [%d] slot ms.",
+            len(run_batches),
+            sum(batch.num_job_queries for batch in run_batches),
+            bytes_processed,
+            bytes_billed,
+            slot_millis,
+        )
+
+        try:
+            per_job_bytes_processed, per_job_slot_millis = self._per_job_query_costs(
+                run_batches
+            )
+        except Exception as e:
+            logging.warning(
+                "Could not measure the cost of per-job validation queries: %s", e
+            )
+            return
+        logging.info(
+            "Per-job validation queries would have processed [%d] bytes (measured "
+            "with dry runs) and used an estimated [%d] slot ms. Batching saved [%d] "
+            "bytes processed and an estimated [%d] slot ms.",
+            per_job_bytes_processed,
+            per_job_slot_millis,
+            per_job_bytes_processed - bytes_processed,
+            per_job_slot_millis - slot_millis,
+        )
+
+    @staticmethod
+    def _per_job_query_costs(
+        run_batches: List[_BatchedValidationQuery],
+    ) -> Tuple[int, int]:
+        """Returns the total bytes processed and estimated slot ms of the per-job
+        queries that |run_batches| replaced. Jobs in a batch that read the same region
+        run the same query, so each distinct query is only dry run once."""
+        bq_client = BigQueryClientImpl()
+        with futures.ThreadPoolExecutor(max_workers=_DRY_RUN_MAX_WORKERS) as executor:
+            dry_run_futures = {
+                (id(batch), region_code): executor.submit(
+                    bq_client.dry_run_query, batch.query_str_for_region(region_code)
+                )
+                for batch in run_batches
+                for region_code in batch.region_codes
+            }
+
+        per_job_bytes_processed = 0
+        per_job_slot_millis = 0.0
+        for batch in run_batches:
+            for region_code, num_job_queries in batch.num_job_queries_by_region.items():
+                region_bytes_processed = (
+                    dry_run_futures[(id(batch), region_code)]
+                    .result()
+                    .total_bytes_processed
+                    or 0
+                )
+                per_job_bytes_processed += region_bytes_processed * num_job_queries
+                if batch.total_bytes_processed:
+                    per_job_slot_millis += (
+                        (batch.slot_millis or 0)
+                        * region_bytes_processed
+                        / batch.total_bytes_processed
+                        * num_job_queries
+                    )
+        return per_job_bytes_processed, round(per_job_slot_millis)
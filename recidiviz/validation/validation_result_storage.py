@@ -18,7 +18,7 @@
 import datetime
 import json
 import logging
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, Dict, List, Optional, Tuple, Type, cast
 
 import attr
 import cattr
@@ -28,6 +28,11 @@ from recidiviz.big_query.big_query_address import BigQueryAddress
 from recidiviz.big_query.big_query_client import BigQueryClientImpl
 from recidiviz.common import serialization
 from recidiviz.utils import environment
+from recidiviz.validation.checks.existence_check import ExistenceValidationResultDetails
+from recidiviz.validation.checks.sameness_check import (
+    SamenessPerRowValidationResultDetails,
+    SamenessPerViewValidationResultDetails,
+)
 from recidiviz.validation.validation_models import (
     DataValidationJob,
     DataValidationJobResult,
@@ -65,6 +70,14 @@ class ValidationResultForStorage:
     validation_category: Optional[ValidationCategory] = attr.ib()
     exception_log: Optional[Exception] = attr.ib()
 
+    # Fingerprint of the inputs to this validation job, used to skip the job in later
+    # runs if its inputs have not changed. None if it could not be computed.
+    input_fingerprint: Optional[str] = attr.ib(default=None)
+
+    # Set if the job was not re-run because its inputs were unchanged, in which case
+    # the result was carried forward from the run with this id.
+    carried_forward_from_run_id: Optional[str] = attr.ib(default=None)
+
     @trace_id.default
     def _trace_id_factory(self) -> str:
         return execution_context.get_opencensus_tracer().span_context.trace_id
@@ -81,6 +94,8 @@ class ValidationResultForStorage:
         run_id: str,
         run_datetime: datetime.datetime,
         result: DataValidationJobResult,
+        input_fingerprint: Optional[str] = None,
+        carried_forward_from_run_id: Optional[str] = None,
     ) -> "ValidationResultForStorage":
         return cls(
             run_id=run_id,
@@ -97,6 +112,8 @@ class ValidationResultForStorage:
             result_details=result.result_details,
             validation_category=result.validation_job.validation.validation_category,
             exception_log=None,
+            input_fingerprint=input_fingerprint,
+            carried_forward_from_run_id=carried_forward_from_run_id,
         )
 
     @classmethod
@@ -106,6 +123,7 @@ class ValidationResultForStorage:
         run_datetime: datetime.datetime,
         job: DataValidationJob,
         exception_log: Optional[Exception],
+        input_fingerprint: Optional[str] = None,
     ) -> "ValidationResultForStorage":
         return cls(
             run_id=run_id,
@@ -122,6 +140,7 @@ class ValidationResultForStorage:
             result_details=None,
             validation_category=job.validation.validation_category,
             exception_log=exception_log,
+            input_fingerprint=input_fingerprint,
         )
 
     def to_serializable(self) -> Dict[str, Any]:
@@ -166,3 +185,86 @@ def store_validation_results_in_big_query(
         VALIDATION_RESULTS_BIGQUERY_ADDRESS.table_id,
         [result.to_serializable() for result in validation_results],
     )
+
+
+_RESULT_DETAILS_CLASSES: Dict[str, Type[DataValidationJobResultDetails]] = {
+    cls.__name__: cls
+    for cls in (
+        ExistenceValidationResultDetails,
+        SamenessPerRowValidationResultDetails,
+        SamenessPerViewValidationResultDetails,
+    )
+}
+
+
+@attr.s(frozen=True, kw_only=True)
+class PreviousValidationResult:
+    """The most recent stored result for a validation job, which can be carried
+    forward to a new run if the job's inputs have not changed since."""
+
+    # The run the result was originally computed in
+    run_id: str = attr.ib()
+    input_fingerprint: str = attr.ib()
+    result_details: DataValidationJobResultDetails = attr.ib()
+
+
+def load_previous_validation_results(
+    max_age_days: int,
+) -> Dict[Tuple[str, str], PreviousValidationResult]:
+    """Returns the most recent stored result for each (validation_name, region_code)
+    from the last |max_age_days| days, if that result ran successfully and has an input
+    fingerprint."""
+    bq_client = BigQueryClientImpl()
+    query_job = bq_client.run_query_async(
+        f"""
+        SELECT
+            validation_name,
+            region_code,
+            run_id,
+            did_run,
+            input_fingerprint,
+            carried_forward_from_run_id,
+            result_details_type,
+            result_details
+        FROM `{bq_client.project_id}.{VALIDATION_RESULTS_BIGQUERY_ADDRESS.dataset_id}.{VALIDATION_RESULTS_BIGQUERY_ADDRESS.table_id}`
+        WHERE run_date >= DATE_SUB(CURRENT_DATE(), INTERVAL {max_age_days} DAY)
+        QUALIFY ROW_NUMBER() OVER (
+            PARTITION BY validation_name, region_code
+            ORDER BY run_datetime DESC
+        ) = 1
+        """,
+        [],
+    )
+
+    converter = serialization.with_datetime_hooks(cattr.Converter())
+    previous_results: Dict[Tuple[str, str], PreviousValidationResult] = {}
+    for row in query_job:
+        details_cls = _RESULT_DETAILS_CLASSES.get(row["result_details_type"])
+        if (
+            not row["did_run"]
+            or not row["input_fingerprint"]
+            or not row["result_details"]
+            or details_cls is None
+        ):
+            continue
+        try:
+            result_details = converter.structure(
+                json.loads(row["result_details"]), details_cls
+            )
+        except Exception as e:
+            logging.warning(
+                "Could not load result details for [%s] in [%s] from run [%s]: %s",
+                row["validation_name"],
+                row["region_code"],
+                row["run_id"],
+                e,
+            )
+            continue
+        previous_results[
+            (row["validation_name"], row["region_code"])
+        ] = PreviousValidationResult(
+            run_id=row["carried_forward_from_run_id"] or row["run_id"],
+            input_fingerprint=row["input_fingerprint"],
+            result_details=result_details,
+        )
+    return previous_results